@@ -120,6 +120,8 @@ class AsyncV1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -229,6 +231,11 @@ class AsyncV1SocketClient(EventEmitterMixin):
         """
         Send a Pydantic model to the websocket connection.
         """
+        wire_frame = getattr(data, "wire_frame", None)
+        if isinstance(wire_frame, str):
+            # Precompiled message (deepgram.helpers.CompiledAgentMessage): already sanitized and serialized.
+            await self._send(wire_frame)
+            return
         await self._send(_sanitize_numeric_types(data.dict()))
 
 
@@ -267,6 +274,8 @@ class V1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -376,4 +385,9 @@ class V1SocketClient(EventEmitterMixin):
         """
         Send a Pydantic model to the websocket connection.
         """
+        wire_frame = getattr(data, "wire_frame", None)
+        if isinstance(wire_frame, str):
+            # Precompiled message (deepgram.helpers.CompiledAgentMessage): already sanitized and serialized.
+            self._send(wire_frame)
+            return
         self._send(_sanitize_numeric_types(data.dict()))
@@ -6,6 +6,12 @@ Adds support for:
   - If `access_token` is provided, it takes precedence and sets `Authorization: bearer <token>`
   - When `access_token` is used, `api_key` is forced to "token" to satisfy the generator,
     but the Authorization header is overridden for all HTTP and WebSocket requests.
+  - `access_token` may also be a callable returning the current token (e.g.
+    `deepgram.helpers.AccessTokenProvider`); it is read for every request and
+    websocket connection, and a provider with `invalidate()` gets one
+    refresh-and-retry when an HTTP request is rejected with 401.
+- `response_cache` (a `deepgram.helpers.ResponseCache`) to answer repeated GET
+  requests from memory; mutating requests invalidate the affected paths.
 - `session_id` as a header sent with every request and websocket connection:
   - If `session_id` is provided, it will be used; otherwise, a UUID is auto-generated
   - The session_id is sent as the `x-deepgram-session-id` header
@@ -22,10 +28,13 @@ Adds support for:
   reconnect logic.
 """
 
+import asyncio
 import types
 import uuid
-from typing import Any, Callable, Dict, Optional
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Union
 
+import httpx
 from ._secure_logging import install_websocket_log_redaction
 from .base_client import AsyncBaseClient, BaseClient
 from .transport import install_transport
@@ -33,18 +42,26 @@ from .transport import install_transport
 from deepgram.core.client_wrapper import BaseClientWrapper
 
 
-def _apply_bearer_authorization_override(client_wrapper: BaseClientWrapper, bearer_token: str) -> None:
+def _apply_bearer_authorization_override(
+    client_wrapper: BaseClientWrapper, bearer_token: Union[str, Callable[[], str]]
+) -> None:
     """Override header providers to always use a Bearer authorization token.
 
-    This updates both:
+    ``bearer_token`` is either a fixed token or a zero-argument callable (such
+    as ``deepgram.helpers.AccessTokenProvider``) that is called for every
+    request and websocket connection to read the current token.
+
+    This updates:
     - client_wrapper.get_headers() used by WebSocket clients
     - client_wrapper.httpx_client.base_headers used by HTTP clients
+    - client_wrapper.httpx_client.async_base_headers used by async HTTP clients
     """
     original_get_headers = client_wrapper.get_headers
+    read_token: Callable[[], str] = bearer_token if callable(bearer_token) else (lambda: bearer_token)  # type: ignore[assignment,return-value]
 
     def _get_headers_with_bearer(_self: Any) -> Dict[str, str]:
         headers = original_get_headers()
-        headers["Authorization"] = f"bearer {bearer_token}"
+        headers["Authorization"] = f"bearer {read_token()}"
         return headers
 
     # Override on wrapper for WebSockets
@@ -54,15 +71,175 @@ def _apply_bearer_authorization_override(client_wrapper: BaseClientWrapper, bear
     if hasattr(client_wrapper, "httpx_client") and hasattr(client_wrapper.httpx_client, "base_headers"):
         client_wrapper.httpx_client.base_headers = client_wrapper.get_headers
 
+    # Async HTTP clients read headers through an awaitable, so a token refresh
+    # never runs on the event loop
+    if hasattr(client_wrapper, "httpx_client") and hasattr(client_wrapper.httpx_client, "async_base_headers"):
+
+        async def _async_get_headers_with_bearer() -> Dict[str, str]:
+            headers = original_get_headers()
+            headers["Authorization"] = f"bearer {await _read_token_async(bearer_token)}"
+            return headers
+
+        client_wrapper.httpx_client.async_base_headers = _async_get_headers_with_bearer
+
+
+async def _read_token_async(bearer_token: Union[str, Callable[[], str]]) -> str:
+    """Read a bearer token without blocking the event loop.
+
+    Providers with an ``atoken()`` coroutine (``AccessTokenProvider``) are
+    awaited; other callables run on the loop's default executor.
+    """
+    if not callable(bearer_token):
+        return bearer_token
+    atoken = getattr(bearer_token, "atoken", None)
+    if callable(atoken):
+        return await atoken()
+    return await asyncio.get_running_loop().run_in_executor(None, bearer_token)
+
+
+def _rejected_bearer_token(response: httpx.Response) -> Optional[str]:
+    """Return the bearer token a 401 response rejected, or None for any other response."""
+    if response.status_code != 401:
+        return None
+    authorization = response.request.headers.get("Authorization", "") if response.request is not None else ""
+    scheme, _, token = authorization.partition(" ")
+    return token if scheme.lower() == "bearer" and token else None
+
+
+def _is_replayable(kwargs: Dict[str, Any]) -> bool:
+    # Streamed bodies and file uploads may already be consumed and cannot be sent twice.
+    content = kwargs.get("content")
+    return kwargs.get("retries", 0) == 0 and not kwargs.get("files") and (content is None or isinstance(content, bytes))
+
+
+def _install_unauthorized_retry(http_client: Any, token_provider: Any) -> None:
+    """Retry a request once with a fresh token when a token provider's token gets a 401.
+
+    The rejected token is passed to ``token_provider.invalidate`` so concurrent
+    401s for the same token trigger a single refresh.
+    """
+    original_request = http_client.request
+    original_stream = http_client.stream
+
+    def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        response = original_request(*args, **kwargs)
+        rejected = _rejected_bearer_token(response)
+        if rejected is None or not _is_replayable(kwargs):
+            return response
+        token_provider.invalidate(rejected)
+        return original_request(*args, **kwargs)
+
+    @contextmanager
+    def stream(*args: Any, **kwargs: Any) -> Iterator[httpx.Response]:
+        with ExitStack() as stack:
+            response = stack.enter_context(original_stream(*args, **kwargs))
+            rejected = _rejected_bearer_token(response)
+            if rejected is not None and _is_replayable(kwargs):
+                stack.close()
+                token_provider.invalidate(rejected)
+                response = stack.enter_context(original_stream(*args, **kwargs))
+            yield response
+
+    http_client.request = request
+    http_client.stream = stream
+
+
+def _install_async_unauthorized_retry(http_client: Any, token_provider: Any) -> None:
+    """Async counterpart of :func:`_install_unauthorized_retry`."""
+    original_request = http_client.request
+    original_stream = http_client.stream
+
+    async def _refresh(rejected: str) -> None:
+        # Refresh off the event loop so a slow grant never blocks other tasks.
+        token_provider.invalidate(rejected)
+        await _read_token_async(token_provider)
+
+    async def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        response = await original_request(*args, **kwargs)
+        rejected = _rejected_bearer_token(response)
+        if rejected is None or not _is_replayable(kwargs):
+            return response
+        await _refresh(rejected)
+        return await original_request(*args, **kwargs)
+
+    @asynccontextmanager
+    async def stream(*args: Any, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        async with AsyncExitStack() as stack:
+            response = await stack.enter_async_context(original_stream(*args, **kwargs))
+            rejected = _rejected_bearer_token(response)
+            if rejected is not None and _is_replayable(kwargs):
+                await stack.aclose()
+                await _refresh(rejected)
+                response = await stack.enter_async_context(original_stream(*args, **kwargs))
+            yield response
+
+    http_client.request = request
+    http_client.stream = stream
+
+
+def _request_path(args: Any, kwargs: Dict[str, Any]) -> Optional[str]:
+    return args[0] if args else kwargs.get("path")
+
+
+def _with_etag(kwargs: Dict[str, Any], etag: Optional[str]) -> Dict[str, Any]:
+    if etag is None:
+        return kwargs
+    return {**kwargs, "headers": {**(kwargs.get("headers") or {}), "If-None-Match": etag}}
+
+
+def _install_response_cache(http_client: Any, cache: Any) -> None:
+    """Serve GET requests from a ``ResponseCache`` and invalidate it on mutating requests."""
+    original_request = http_client.request
+
+    def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        path = _request_path(args, kwargs)
+        if str(kwargs.get("method", "GET")).upper() != "GET":
+            try:
+                return original_request(*args, **kwargs)
+            finally:
+                cache.invalidate(path)
+        lookup = cache.lookup(http_client, path, kwargs)
+        if lookup.response is not None:
+            return lookup.response
+        return cache.store(lookup, original_request(*args, **_with_etag(kwargs, lookup.etag)))
+
+    http_client.request = request
+
+
+def _install_async_response_cache(http_client: Any, cache: Any) -> None:
+    """Async counterpart of :func:`_install_response_cache`."""
+    original_request = http_client.request
+
+    async def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        path = _request_path(args, kwargs)
+        if str(kwargs.get("method", "GET")).upper() != "GET":
+            try:
+                return await original_request(*args, **kwargs)
+            finally:
+                cache.invalidate(path)
+        lookup = cache.lookup(http_client, path, kwargs)
+        if lookup.response is not None:
+            return lookup.response
+        return cache.store(lookup, await original_request(*args, **_with_etag(kwargs, lookup.etag)))
+
+    http_client.request = request
+
 
 class DeepgramClient(BaseClient):
     """
     Custom Deepgram client that extends the generated BaseClient.
 
     Supports:
+    - `response_cache`: Optional ``deepgram.helpers.ResponseCache``. GET responses are served
+                        from it until their TTL expires (then revalidated with ``If-None-Match``
+                        when the server sent an ``ETag``); mutating requests invalidate the
+                        cached entries of the same resource path.
     - `session_id`: Optional session identifier. If not provided, a UUID is auto-generated.
                      Sent as `x-deepgram-session-id` header in all requests and websocket connections.
     - `access_token`: Alternative to `api_key`. If provided, uses Bearer token authentication.
+                      Either a token string or a callable returning the current token (e.g.
+                      ``deepgram.helpers.AccessTokenProvider``); a provider with ``invalidate()``
+                      also gets one refresh-and-retry when an HTTP request is rejected with 401.
     - `transport_factory`: Custom sync WebSocket transport factory. A callable
                            ``factory(url, headers) -> transport`` whose return value must support
                            ``send()``, ``recv()``, iteration, and ``close()``.
@@ -80,8 +257,9 @@ class DeepgramClient(BaseClient):
     """
 
     def __init__(self, *args, **kwargs) -> None:
-        access_token: Optional[str] = kwargs.pop("access_token", None)
+        access_token: Optional[Union[str, Callable[[], str]]] = kwargs.pop("access_token", None)
         session_id: Optional[str] = kwargs.pop("session_id", None)
+        response_cache: Optional[Any] = kwargs.pop("response_cache", None)
         transport_factory: Optional[Callable] = kwargs.pop("transport_factory", None)
         reconnect: bool = bool(kwargs.pop("reconnect", True))
         redact_credentials_in_logs: bool = bool(kwargs.pop("redact_credentials_in_logs", True))
@@ -121,6 +299,12 @@ class DeepgramClient(BaseClient):
         # Override Authorization header to use Bearer token if access_token was provided
         if access_token is not None:
             _apply_bearer_authorization_override(self._client_wrapper, access_token)
+            if callable(getattr(access_token, "invalidate", None)):
+                _install_unauthorized_retry(self._client_wrapper.httpx_client, access_token)
+
+        # Cache GET responses; installed last so cache hits skip the retry wrappers
+        if response_cache is not None:
+            _install_response_cache(self._client_wrapper.httpx_client, response_cache)
 
         # Install custom WebSocket transport if provided. Auto-disable
         # `reconnect`: a custom transport owns its retry lifecycle, so flip
@@ -139,9 +323,16 @@ class AsyncDeepgramClient(AsyncBaseClient):
     Custom async Deepgram client that extends the generated AsyncBaseClient.
 
     Supports:
+    - `response_cache`: Optional ``deepgram.helpers.ResponseCache``. GET responses are served
+                        from it until their TTL expires (then revalidated with ``If-None-Match``
+                        when the server sent an ``ETag``); mutating requests invalidate the
+                        cached entries of the same resource path.
     - `session_id`: Optional session identifier. If not provided, a UUID is auto-generated.
                      Sent as `x-deepgram-session-id` header in all requests and websocket connections.
     - `access_token`: Alternative to `api_key`. If provided, uses Bearer token authentication.
+                      Either a token string or a callable returning the current token (e.g.
+                      ``deepgram.helpers.AccessTokenProvider``); a provider with ``invalidate()``
+                      also gets one refresh-and-retry when an HTTP request is rejected with 401.
     - `transport_factory`: Custom async WebSocket transport factory. A callable
                            ``factory(url, headers) -> transport`` whose return value must support
                            ``send()``, ``recv()``, async iteration, and ``close()``.
@@ -159,8 +350,9 @@ class AsyncDeepgramClient(AsyncBaseClient):
     """
 
     def __init__(self, *args, **kwargs) -> None:
-        access_token: Optional[str] = kwargs.pop("access_token", None)
+        access_token: Optional[Union[str, Callable[[], str]]] = kwargs.pop("access_token", None)
         session_id: Optional[str] = kwargs.pop("session_id", None)
+        response_cache: Optional[Any] = kwargs.pop("response_cache", None)
         transport_factory: Optional[Callable] = kwargs.pop("transport_factory", None)
         reconnect: bool = bool(kwargs.pop("reconnect", True))
         redact_credentials_in_logs: bool = bool(kwargs.pop("redact_credentials_in_logs", True))
@@ -200,6 +392,12 @@ class AsyncDeepgramClient(AsyncBaseClient):
         # Override Authorization header to use Bearer token if access_token was provided
         if access_token is not None:
             _apply_bearer_authorization_override(self._client_wrapper, access_token)
+            if callable(getattr(access_token, "invalidate", None)):
+                _install_async_unauthorized_retry(self._client_wrapper.httpx_client, access_token)
+
+        # Cache GET responses; installed last so cache hits skip the retry wrappers
+        if response_cache is not None:
+            _install_async_response_cache(self._client_wrapper.httpx_client, response_cache)
 
         # Install custom WebSocket transport if provided. Auto-disable
         # `reconnect`: a custom transport owns its retry lifecycle, so flip
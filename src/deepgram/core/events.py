@@ -1,9 +1,14 @@
-# This file was auto-generated by Fern from our API Definition.
+# Hand-maintained: listed in .fernignore, so Fern no longer regenerates this file.
+# Started from the generated EventType/EventEmitterMixin and extended with typed
+# per-message-type subscriptions; keep changes here in sync with the socket clients.
 
 import inspect
 import typing
 from enum import Enum
 
+import pydantic
+from .pydantic_utilities import _get_field_default, _get_model_fields
+
 
 class EventType(str, Enum):
     OPEN = "open"
@@ -12,23 +17,81 @@ class EventType(str, Enum):
     CLOSE = "close"
 
 
+# Key under which subscriptions to binary (audio) frames are stored.
+_BINARY = bytes
+
+
+def _message_key(event_name: typing.Any) -> typing.Any:
+    """Resolve a typed subscription target to the wire ``type`` it is dispatched on."""
+    if event_name is bytes:
+        return _BINARY
+    if isinstance(event_name, str):
+        return event_name
+    if inspect.isclass(event_name) and issubclass(event_name, pydantic.BaseModel):
+        field = _get_model_fields(event_name).get("type")
+        wire_type = _get_field_default(field) if field is not None else None
+        if isinstance(wire_type, str):
+            return wire_type
+    raise TypeError(
+        f"Cannot subscribe to {event_name!r}: expected an EventType, a message type name, "
+        "a message model class with a literal `type` field, or bytes"
+    )
+
+
 class EventEmitterMixin:
     """
     Simple mixin for registering and emitting events.
+
+    Besides the connection lifecycle events in ``EventType``, callbacks can be
+    subscribed to a single server message type, either by wire ``type``
+    (``on("ConversationText", cb)``), by message model class
+    (``on(AgentV1ConversationText, cb)``) or to binary audio frames
+    (``on(bytes, cb)``). Typed subscriptions are dispatched from a dict keyed
+    by the wire ``type``; when no ``EventType.MESSAGE`` callback is registered,
+    messages without a typed subscriber are skipped before model construction.
     """
 
     def __init__(self) -> None:
         self._callbacks: typing.Dict[EventType, typing.List[typing.Callable]] = {}
+        self._message_callbacks: typing.Dict[typing.Any, typing.List[typing.Callable]] = {}
+
+    def on(self, event_name: typing.Any, callback: typing.Callable[[typing.Any], typing.Any]) -> None:
+        if isinstance(event_name, str) and event_name in EventType._value2member_map_:
+            event_name = EventType(event_name)
+            if event_name not in self._callbacks:
+                self._callbacks[event_name] = []
+            self._callbacks[event_name].append(callback)
+            return
+        key = _message_key(event_name)
+        if inspect.isclass(event_name) and event_name is not bytes:
+            # Several models can share a wire type (e.g. the History variants); only deliver matching instances.
+            callback = _filter_instances(event_name, callback)
+        self._message_callbacks.setdefault(key, []).append(callback)
+
+    def _wants_message(self, json_data: typing.Any) -> bool:
+        """Whether a decoded JSON message has any subscriber and must be constructed."""
+        if EventType.MESSAGE in self._callbacks:
+            return True
+        return isinstance(json_data, dict) and json_data.get("type") in self._message_callbacks
 
-    def on(self, event_name: EventType, callback: typing.Callable[[typing.Any], typing.Any]) -> None:
-        if event_name not in self._callbacks:
-            self._callbacks[event_name] = []
-        self._callbacks[event_name].append(callback)
+    def _typed_callbacks(self, data: typing.Any) -> typing.List[typing.Callable]:
+        if not self._message_callbacks:
+            return []
+        if isinstance(data, (bytes, bytearray)):
+            key: typing.Any = _BINARY
+        elif isinstance(data, dict):
+            key = data.get("type")
+        else:
+            key = getattr(data, "type", None)
+        return self._message_callbacks.get(key, [])
 
     def _emit(self, event_name: EventType, data: typing.Any) -> None:
         if event_name in self._callbacks:
             for cb in self._callbacks[event_name]:
                 cb(data)
+        if event_name == EventType.MESSAGE:
+            for cb in self._typed_callbacks(data):
+                cb(data)
 
     async def _emit_async(self, event_name: EventType, data: typing.Any) -> None:
         if event_name in self._callbacks:
@@ -36,3 +99,19 @@ class EventEmitterMixin:
                 res = cb(data)
                 if inspect.isawaitable(res):
                     await res
+        if event_name == EventType.MESSAGE:
+            for cb in self._typed_callbacks(data):
+                res = cb(data)
+                if inspect.isawaitable(res):
+                    await res
+
+
+def _filter_instances(
+    model: typing.Type[typing.Any], callback: typing.Callable[[typing.Any], typing.Any]
+) -> typing.Callable[[typing.Any], typing.Any]:
+    def _callback(data: typing.Any) -> typing.Any:
+        if isinstance(data, model):
+            return callback(data)
+        return None
+
+    return _callback
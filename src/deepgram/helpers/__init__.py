@@ -4,6 +4,87 @@ Deepgram Helper Utilities
 Custom helper functions and classes for working with Deepgram APIs.
 """
 
+from .access_tokens import AccessTokenProvider
+from .agent_audio import (
+    AgentAudioPump,
+    AgentAudioPumpStats,
+    AudioRingBuffer,
+    agent_frame_bytes,
+)
+from .agent_functions import AgentFunctionRouter, AsyncAgentFunctionRouter
+from .agent_history import AgentHistoryStore
+from .agent_injection import AgentInjectionQueue, AsyncAgentInjectionQueue, InjectionRefusedError
+from .agent_latency import AgentLatencyAggregator, AgentLatencyStats, AgentLatencyTracker
+from .agent_pool import AgentSessionPool, AgentSettingsError, AsyncAgentSessionPool
+from .agent_settings import CompiledAgentMessage, CompiledAgentSettings, compile_updates
+from .audio_gate import VoiceActivityGate, VoiceActivityGateStats
+from .audio_sink import (
+    AudioFrameAssembler,
+    RawFileSink,
+    SpeakAudioSink,
+    WavFileSink,
+    aiter_audio_frames,
+    iter_audio_frames,
+    sample_width_for_encoding,
+)
+from .audio_stream import AsyncAudioStream, AudioStream, AudioStreamPolicy
+from .bulk_admin import (
+    AsyncBulkProjectAdmin,
+    BulkItemResult,
+    BulkOperationError,
+    BulkProjectAdmin,
+    BulkReport,
+)
+from .captions import (
+    CaptionBuilder,
+    CaptionCue,
+    astream_captions,
+    format_srt_cue,
+    format_webvtt_cue,
+    response_captions,
+    srt_blocks,
+    stream_captions,
+    to_srt,
+    to_webvtt,
+    webvtt_blocks,
+)
+from .flux_tuning import AsyncFluxThresholdTuner, FluxThresholdTuner, FluxTuningStats
+from .flux_turns import (
+    AsyncFluxTurnAssembler,
+    CancellationToken,
+    FluxTurn,
+    FluxTurnAssembler,
+    FluxTurnStats,
+    Speculation,
+    SpeculationCancelledError,
+)
+from .latency_histogram import LatencyHistogram
+from .multichannel import (
+    AsyncMultichannelAudioFeeder,
+    ChannelSegment,
+    ChannelTranscript,
+    MultichannelAudioFeeder,
+    MultichannelFeederStats,
+    MultichannelTranscripts,
+    channel_view,
+    interleave,
+)
+from .request_logs import (
+    aiter_requests,
+    iter_requests,
+    split_time_range,
+)
+from .response_cache import ResponseCache, ResponseCacheStats
+from .speak_batch import (
+    AsyncSpeakBatchSubmitter,
+    DirectoryAudioStorage,
+    SpeakBatchJob,
+    SpeakBatchRegistry,
+    SpeakBatchSubmitter,
+    SpeakCallbackReceiver,
+)
+from .speak_metrics import SpeakLatencyStats, SpeakUtteranceMetrics, SpeakV2LatencyTracker
+from .speak_pool import AsyncSpeakSessionPool, SpeakSessionPool
 from .text_builder import (
     TextBuilder,
     add_pronunciation,
@@ -11,11 +92,120 @@ from .text_builder import (
     validate_ipa,
     validate_pause,
 )
+from .transcript_assembler import (
+    InterimSegment,
+    TimelineWord,
+    TranscriptAssembler,
+    TranscriptSegment,
+    TranscriptSnapshot,
+    WordTimeline,
+)
+from .usage_breakdown import (
+    BreakdownTable,
+    afetch_billing_breakdown,
+    afetch_usage_breakdown,
+    fetch_billing_breakdown,
+    fetch_usage_breakdown,
+)
 
 __all__ = [
+    "AccessTokenProvider",
+    "AgentAudioPump",
+    "AgentAudioPumpStats",
+    "AgentFunctionRouter",
+    "AgentHistoryStore",
+    "AgentInjectionQueue",
+    "AgentLatencyAggregator",
+    "AgentLatencyStats",
+    "AgentLatencyTracker",
+    "AgentSessionPool",
+    "AgentSettingsError",
+    "AsyncAgentFunctionRouter",
+    "AsyncAgentInjectionQueue",
+    "AsyncAgentSessionPool",
+    "AsyncAudioStream",
+    "AsyncBulkProjectAdmin",
+    "AsyncFluxThresholdTuner",
+    "AsyncFluxTurnAssembler",
+    "AsyncMultichannelAudioFeeder",
+    "AsyncSpeakBatchSubmitter",
+    "AsyncSpeakSessionPool",
+    "AudioFrameAssembler",
+    "AudioRingBuffer",
+    "AudioStream",
+    "AudioStreamPolicy",
+    "BreakdownTable",
+    "BulkItemResult",
+    "BulkOperationError",
+    "BulkProjectAdmin",
+    "BulkReport",
+    "CancellationToken",
+    "CaptionBuilder",
+    "CaptionCue",
+    "ChannelSegment",
+    "ChannelTranscript",
+    "CompiledAgentMessage",
+    "CompiledAgentSettings",
+    "DirectoryAudioStorage",
+    "FluxThresholdTuner",
+    "FluxTuningStats",
+    "FluxTurn",
+    "FluxTurnAssembler",
+    "FluxTurnStats",
+    "InjectionRefusedError",
+    "InterimSegment",
+    "LatencyHistogram",
+    "MultichannelAudioFeeder",
+    "MultichannelFeederStats",
+    "MultichannelTranscripts",
+    "RawFileSink",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "SpeakAudioSink",
+    "SpeakBatchJob",
+    "SpeakBatchRegistry",
+    "SpeakBatchSubmitter",
+    "SpeakCallbackReceiver",
+    "SpeakLatencyStats",
+    "SpeakSessionPool",
+    "SpeakUtteranceMetrics",
+    "SpeakV2LatencyTracker",
+    "Speculation",
+    "SpeculationCancelledError",
     "TextBuilder",
+    "TimelineWord",
+    "TranscriptAssembler",
+    "TranscriptSegment",
+    "TranscriptSnapshot",
+    "VoiceActivityGate",
+    "VoiceActivityGateStats",
+    "WavFileSink",
+    "WordTimeline",
     "add_pronunciation",
+    "afetch_billing_breakdown",
+    "afetch_usage_breakdown",
+    "agent_frame_bytes",
+    "aiter_audio_frames",
+    "aiter_requests",
+    "astream_captions",
+    "channel_view",
+    "compile_updates",
+    "fetch_billing_breakdown",
+    "fetch_usage_breakdown",
+    "format_srt_cue",
+    "format_webvtt_cue",
+    "interleave",
+    "iter_audio_frames",
+    "iter_requests",
+    "response_captions",
+    "sample_width_for_encoding",
+    "split_time_range",
+    "srt_blocks",
     "ssml_to_deepgram",
+    "stream_captions",
+    "to_srt",
+    "to_webvtt",
     "validate_ipa",
     "validate_pause",
+    "webvtt_blocks",
 ]
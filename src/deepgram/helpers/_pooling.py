@@ -0,0 +1,57 @@
+"""
+Shared building blocks of the speak and agent session pools.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+SessionKey = Tuple[Tuple[str, Hashable], ...]
+
+
+class PooledSession:
+    """An open socket together with the context that owns its connection."""
+
+    __slots__ = ("socket", "key", "created_at", "idle_since", "_exit_stack")
+
+    def __init__(self, socket: Any, key: SessionKey, exit_stack: Any):
+        self.socket = socket
+        self.key = key
+        self.created_at = time.monotonic()
+        self.idle_since = self.created_at
+        self._exit_stack = exit_stack
+
+    def is_stale(self, max_age: Optional[float], max_idle: Optional[float]) -> bool:
+        now = time.monotonic()
+        if max_age is not None and now - self.created_at > max_age:
+            return True
+        return max_idle is not None and now - self.idle_since > max_idle
+
+
+def run_with_timeout(step: Callable[[], None], timeout: float, what: str) -> None:
+    """
+    Run a blocking socket exchange with a deadline.
+
+    Sync socket clients' ``recv`` takes no timeout, so ``step`` runs on a
+    helper thread. On timeout the caller is expected to close the socket,
+    which ends the blocked ``recv`` and the thread with it.
+
+    Raises:
+        TimeoutError: If ``step`` has not finished within ``timeout`` seconds
+        Exception: Whatever ``step`` raised
+    """
+    errors: List[BaseException] = []
+
+    def _run() -> None:
+        try:
+            step()
+        except BaseException as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=_run, name="deepgram-pool-wait", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"{what} within {timeout} seconds")
+    if errors:
+        raise errors[0]
@@ -0,0 +1,29 @@
+"""
+Small utilities shared by the audio and transcript helpers.
+"""
+
+from typing import Any, Mapping
+
+# Bytes per sample for the fixed-width encodings of the speak, listen and agent sockets.
+SAMPLE_WIDTHS = {
+    "linear16": 2,
+    "linear32": 4,
+    "mulaw": 1,
+    "alaw": 1,
+}
+
+
+def get_field(obj: Any, name: str) -> Any:
+    """Read ``name`` from a socket message given either as a dict or as a typed model."""
+    if isinstance(obj, Mapping):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def load_numpy() -> Any:
+    """Return the ``numpy`` module, or None when it is not installed."""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,249 @@
+"""
+Auto-Refreshing Access Tokens
+
+Keeps a short-lived access token from ``auth.v1.tokens.grant`` fresh for a
+long-running ``DeepgramClient`` / ``AsyncDeepgramClient``: the token is
+renewed in the background before it expires, concurrent refreshes are
+collapsed into one grant call, and readers get the current token without
+waiting on a refresh.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+def _grant_fields(grant: Any) -> Tuple[str, float]:
+    if isinstance(grant, dict):
+        token, expires_in = grant.get("access_token"), grant.get("expires_in")
+    else:
+        token, expires_in = getattr(grant, "access_token", None), getattr(grant, "expires_in", None)
+    if not token:
+        raise ValueError("Token grant did not return an access_token")
+    return token, float(expires_in) if expires_in is not None else 30.0
+
+
+class AccessTokenProvider:
+    """
+    Access token source for ``DeepgramClient(access_token=provider)``.
+
+    ``grant`` is called to obtain a token (typically
+    ``client.auth.v1.tokens.grant`` on an API-key client); its result must
+    have ``access_token`` and ``expires_in``. The token is renewed once
+    ``refresh_before`` seconds (at most half the TTL) remain:
+
+    - reads (:meth:`token`, or calling the provider) return the current token
+      immediately and start a background refresh when it is due; they only
+      block when there is no unexpired token yet (:meth:`atoken` awaits that
+      refresh off the event loop instead)
+    - with ``proactive`` (the default) a timer refreshes the token ahead of
+      expiry if it was used since the last grant, so busy clients never wait
+      and idle ones stop granting tokens
+    - concurrent refreshes from any thread or task share a single grant call
+    - :meth:`invalidate` (used by the clients when a request gets a 401)
+      forces the next read to fetch a new token, once per rejected token
+
+    Example:
+        tokens = AccessTokenProvider.from_api_key(os.environ["DEEPGRAM_API_KEY"], ttl_seconds=60)
+        client = DeepgramClient(access_token=tokens)
+    """
+
+    def __init__(
+        self,
+        grant: Callable[[], Any],
+        *,
+        refresh_before: float = 5.0,
+        proactive: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the provider. No token is fetched until the first read or :meth:`refresh`.
+
+        Args:
+            grant: Callable returning a ``GrantV1Response`` (or a dict with
+                ``access_token`` and ``expires_in``)
+            refresh_before: Seconds before expiry at which a token is renewed
+            proactive: Renew used tokens on a background timer ahead of expiry
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if refresh_before < 0:
+            raise ValueError("refresh_before must be non-negative")
+        self._grant = grant
+        self.refresh_before = refresh_before
+        self.proactive = proactive
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._used = False
+        self._in_flight: Optional["Future[str]"] = None
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        self.grants = 0
+
+    @classmethod
+    def from_api_key(cls, api_key: str, *, ttl_seconds: Optional[float] = None, **kwargs: Any) -> "AccessTokenProvider":
+        """
+        Create a provider that grants tokens with an API key.
+
+        Args:
+            api_key: Deepgram API key with Member or higher authorization
+            ttl_seconds: Requested token lifetime (the API defaults to 30 seconds)
+            **kwargs: Other ``AccessTokenProvider`` arguments
+
+        Returns:
+            A new AccessTokenProvider
+        """
+        from ..client import DeepgramClient
+
+        tokens = DeepgramClient(api_key=api_key).auth.v1.tokens
+
+        def _grant() -> Any:
+            if ttl_seconds is None:
+                return tokens.grant()
+            return tokens.grant(ttl_seconds=ttl_seconds)
+
+        return cls(_grant, **kwargs)
+
+    @property
+    def expires_in(self) -> Optional[float]:
+        """Seconds until the current token expires, or None when there is none."""
+        with self._lock:
+            if self._token is None:
+                return None
+            return self._expires_at - self._clock()
+
+    def __call__(self) -> str:
+        return self.token()
+
+    def token(self) -> str:
+        """
+        Return a valid token, starting a background refresh when one is due.
+
+        Blocks only when no unexpired token is available.
+
+        Raises:
+            Exception: Whatever the grant call raised, when a blocking refresh fails
+        """
+        token = self._current()
+        if token is None:
+            token = self.refresh()
+            self._mark_used()
+        return token
+
+    async def atoken(self) -> str:
+        """
+        Async counterpart of :meth:`token`.
+
+        A refresh that has to be waited for runs the grant on the event loop's
+        default executor, so other tasks keep running while it is in flight.
+
+        Raises:
+            Exception: Whatever the grant call raised, when a blocking refresh fails
+        """
+        token = self._current()
+        if token is None:
+            token = await asyncio.get_running_loop().run_in_executor(None, self.refresh)
+            self._mark_used()
+        return token
+
+    def refresh(self) -> str:
+        """Fetch a new token now (joining a refresh already in progress) and return it."""
+        future, leader = self._begin_refresh()
+        if leader:
+            self._run_refresh(future)
+        return future.result()
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Mark a token as rejected so the next read fetches a new one.
+
+        Args:
+            token: The token that was rejected; ignored if the provider has
+                already moved on to a newer token (None invalidates the current one)
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._expires_at = 0.0
+                self._refresh_at = 0.0
+
+    def close(self) -> None:
+        """Stop the proactive refresh timer."""
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _current(self) -> Optional[str]:
+        # The unexpired token (starting a background refresh when one is due), or None.
+        now = self._clock()
+        with self._lock:
+            token = self._token
+            usable = token is not None and now < self._expires_at
+            due = now >= self._refresh_at
+            self._used = True
+        if not usable:
+            return None
+        if due:
+            self._refresh_in_background()
+        return token
+
+    def _mark_used(self) -> None:
+        with self._lock:
+            self._used = True
+
+    def _begin_refresh(self) -> Tuple["Future[str]", bool]:
+        with self._lock:
+            if self._in_flight is not None:
+                return self._in_flight, False
+            self._in_flight = Future()
+            return self._in_flight, True
+
+    def _refresh_in_background(self) -> None:
+        future, leader = self._begin_refresh()
+        if leader:
+            threading.Thread(
+                target=self._run_refresh, args=(future,), name="deepgram-token-refresh", daemon=True
+            ).start()
+
+    def _run_refresh(self, future: "Future[str]") -> None:
+        try:
+            token, expires_in = _grant_fields(self._grant())
+        except BaseException as exc:
+            _logger.warning("Access token refresh failed: %s", exc)
+            with self._lock:
+                self._in_flight = None
+            future.set_exception(exc)
+            return
+        now = self._clock()
+        with self._lock:
+            self._token = token
+            self._expires_at = now + expires_in
+            self._refresh_at = now + max(expires_in - self.refresh_before, expires_in / 2)
+            self._used = False
+            self._in_flight = None
+            self.grants += 1
+            self._schedule_locked(self._refresh_at - now)
+        future.set_result(token)
+
+    def _schedule_locked(self, delay: float) -> None:
+        if not self.proactive or self._closed:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(max(0.0, delay), self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            used = self._used and not self._closed
+        if used:
+            self._refresh_in_background()
@@ -0,0 +1,405 @@
+"""
+Full-Duplex Audio Pump for Voice Agents
+
+Runs microphone capture -> ``send_media`` and agent audio -> playback on
+independent worker threads around a sync ``agent.v1`` socket, decoupled by
+bounded single-producer/single-consumer ring buffers sized from the
+Settings' ``audio.input`` / ``audio.output``, with underrun and overrun
+counters.
+"""
+
+import dataclasses
+import logging
+import threading
+from typing import Any, Callable, List, Optional, Union
+
+from ..core.events import EventType
+from ._utils import SAMPLE_WIDTHS, get_field
+
+_logger = logging.getLogger(__name__)
+
+# Byte value of digital silence per encoding.
+_SILENCE = {
+    "linear16": 0x00,
+    "linear32": 0x00,
+    "mulaw": 0xFF,
+    "alaw": 0xD5,
+}
+
+# Agent API defaults when audio.output is omitted from Settings.
+DEFAULT_OUTPUT_ENCODING = "linear16"
+DEFAULT_OUTPUT_SAMPLE_RATE = 24000
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def agent_frame_bytes(encoding: str, sample_rate: int, frame_ms: int, channels: int = 1) -> int:
+    """
+    Return the byte size of one ``frame_ms`` frame of agent audio.
+
+    Args:
+        encoding: ``audio.input`` / ``audio.output`` encoding
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame duration in milliseconds
+        channels: Channel count
+
+    Returns:
+        Frame size in bytes (sample aligned)
+
+    Raises:
+        ValueError: If the encoding is not a fixed-width PCM encoding or the frame is empty
+    """
+    try:
+        width = SAMPLE_WIDTHS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported encoding '{encoding}'. Expected one of: {', '.join(sorted(SAMPLE_WIDTHS))}"
+        ) from None
+    samples = sample_rate * frame_ms // 1000
+    if samples <= 0:
+        raise ValueError("frame_ms is too short for the sample rate")
+    return samples * width * channels
+
+
+class AudioRingBuffer:
+    """
+    Bounded byte ring buffer for exactly one writer thread and one reader thread.
+
+    Each side only advances its own monotonically increasing position, so no
+    lock is taken on the data path. Writes that do not fit are truncated and
+    the dropped bytes are reported to the caller.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Size in bytes
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._written = 0
+        self._read = 0
+        self._discard_to = 0
+        self.readable = threading.Event()
+
+    @property
+    def available(self) -> int:
+        """Bytes ready to read."""
+        return self._written - max(self._read, self._discard_to)
+
+    def write(self, data: BytesLike) -> int:
+        """
+        Append as much of ``data`` as fits (writer side).
+
+        Returns:
+            Number of bytes written (less than ``len(data)`` on overrun)
+        """
+        source = memoryview(data).cast("B")
+        free = self.capacity - (self._written - self._read)
+        count = min(len(source), free)
+        start = self._written % self.capacity
+        first = min(count, self.capacity - start)
+        self._view[start : start + first] = source[:first]
+        self._view[: count - first] = source[first:count]
+        self._written += count
+        if count:
+            self.readable.set()
+        return count
+
+    def readinto(self, buffer: BytesLike) -> int:
+        """
+        Move up to ``len(buffer)`` bytes into ``buffer`` (reader side).
+
+        Returns:
+            Number of bytes read
+        """
+        if self._discard_to > self._read:
+            self._read = self._discard_to
+        target = memoryview(buffer).cast("B")
+        count = min(len(target), self._written - self._read)
+        start = self._read % self.capacity
+        first = min(count, self.capacity - start)
+        target[:first] = self._view[start : start + first]
+        target[first:count] = self._view[: count - first]
+        self._read += count
+        if self._written == self._read:
+            self.readable.clear()
+            # Re-check so a concurrent write between the compare and clear is not missed.
+            if self._written != self._read:
+                self.readable.set()
+        return count
+
+    def discard(self) -> None:
+        """Drop everything written so far; safe to call from the writer side."""
+        self._discard_to = self._written
+
+
+@dataclasses.dataclass
+class AgentAudioPumpStats:
+    """Counters for an ``AgentAudioPump``."""
+
+    frames_sent: int = 0
+    frames_played: int = 0
+    capture_overrun_bytes: int = 0
+    playback_overrun_bytes: int = 0
+    playback_underruns: int = 0
+    send_errors: int = 0
+    barge_ins: int = 0
+
+
+class AgentAudioPump:
+    """
+    Full-duplex audio pump for a sync agent ``V1SocketClient``.
+
+    Three workers run independently:
+
+    - capture: calls ``capture(frame_bytes)`` (e.g. ``pyaudio_stream.read``) and
+      writes into the capture ring; alternatively feed the ring from an audio
+      callback with :meth:`push_capture` and pass ``capture=None``
+    - sender: sends whole input frames from the capture ring with ``send_media``
+    - playback: passes whole output frames from the playback ring to
+      ``playback(frame)`` (e.g. ``pyaudio_stream.write``)
+
+    Agent audio arriving on the socket's MESSAGE event is written into the
+    playback ring; ``UserStartedSpeaking`` (barge-in) discards queued playback.
+    A capture overrun means the network send fell behind; a playback overrun
+    means the speaker fell behind; a playback underrun means agent audio
+    arrived too slowly mid-response (silence is played instead when
+    ``fill_silence`` is set).
+
+    Example:
+        with client.agent.v1.connect() as socket:
+            pump = AgentAudioPump.from_settings(socket, settings, capture=mic.read, playback=speaker.write)
+            pump.start()
+            socket.send_settings(settings)
+            socket.start_listening()
+            pump.stop()
+    """
+
+    def __init__(
+        self,
+        socket_client: Any,
+        *,
+        capture: Optional[Callable[[int], Optional[BytesLike]]] = None,
+        playback: Optional[Callable[[memoryview], Any]] = None,
+        input_encoding: str = "linear16",
+        input_sample_rate: int = 16000,
+        output_encoding: str = DEFAULT_OUTPUT_ENCODING,
+        output_sample_rate: int = DEFAULT_OUTPUT_SAMPLE_RATE,
+        frame_ms: int = 20,
+        capture_buffer_ms: int = 500,
+        playback_buffer_ms: int = 5000,
+        prebuffer_ms: int = 60,
+        fill_silence: bool = False,
+    ):
+        """
+        Initialize the pump.
+
+        Args:
+            socket_client: ``V1SocketClient`` from ``client.agent.v1.connect()``
+            capture: Blocking read of one input frame (None when using push_capture)
+            playback: Blocking write of one output frame (None to only send audio)
+            input_encoding: ``audio.input.encoding``
+            input_sample_rate: ``audio.input.sample_rate``
+            output_encoding: ``audio.output.encoding``
+            output_sample_rate: ``audio.output.sample_rate``
+            frame_ms: Frame duration for both directions in milliseconds
+            capture_buffer_ms: Capture ring capacity in milliseconds of audio
+            playback_buffer_ms: Playback ring capacity in milliseconds of audio
+            prebuffer_ms: Agent audio to buffer before playback of a response starts
+            fill_silence: Play silence frames on underrun instead of waiting
+
+        Raises:
+            ValueError: If an encoding is not a fixed-width PCM encoding
+        """
+        self._socket = socket_client
+        self._capture = capture
+        self._playback = playback
+        self.input_frame_bytes = agent_frame_bytes(input_encoding, input_sample_rate, frame_ms)
+        self.output_frame_bytes = agent_frame_bytes(output_encoding, output_sample_rate, frame_ms)
+        self._frame_seconds = frame_ms / 1000
+        self.capture_ring = AudioRingBuffer(
+            max(self.input_frame_bytes, capture_buffer_ms // frame_ms * self.input_frame_bytes)
+        )
+        self.playback_ring = AudioRingBuffer(
+            max(self.output_frame_bytes, playback_buffer_ms // frame_ms * self.output_frame_bytes)
+        )
+        self._prebuffer_bytes = prebuffer_ms // frame_ms * self.output_frame_bytes
+        self._silence = bytes([_SILENCE[output_encoding]]) * self.output_frame_bytes
+        self._fill_silence = fill_silence
+        self.stats = AgentAudioPumpStats()
+        self._stop = threading.Event()
+        self._stop_capture = threading.Event()
+        self._capture_done = threading.Event()
+        self._response_active = False
+        self._response_done = False
+        self._threads: List[threading.Thread] = []
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self._stop.set())
+
+    @classmethod
+    def from_settings(cls, socket_client: Any, settings: Any, **kwargs: Any) -> "AgentAudioPump":
+        """
+        Create a pump whose frame sizes match an agent Settings message.
+
+        Args:
+            socket_client: ``V1SocketClient`` from ``client.agent.v1.connect()``
+            settings: ``AgentV1Settings`` (or the equivalent dict) to be sent
+            **kwargs: Other ``AgentAudioPump`` arguments
+
+        Returns:
+            A new AgentAudioPump
+        """
+        audio = get_field(settings, "audio")
+        audio_input = get_field(audio, "input")
+        audio_output = get_field(audio, "output")
+        kwargs.setdefault("input_encoding", get_field(audio_input, "encoding"))
+        kwargs.setdefault("input_sample_rate", get_field(audio_input, "sample_rate"))
+        kwargs.setdefault("output_encoding", get_field(audio_output, "encoding") or DEFAULT_OUTPUT_ENCODING)
+        kwargs.setdefault("output_sample_rate", get_field(audio_output, "sample_rate") or DEFAULT_OUTPUT_SAMPLE_RATE)
+        return cls(socket_client, **kwargs)
+
+    def start(self) -> "AgentAudioPump":
+        """Start the worker threads. Returns self for chaining."""
+        targets = [("sender", self._send_loop)]
+        if self._capture is not None:
+            targets.append(("capture", self._capture_loop))
+        if self._playback is not None:
+            targets.append(("playback", self._playback_loop))
+        for name, target in targets:
+            thread = threading.Thread(target=target, name=f"deepgram-agent-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """Stop capturing, send any captured audio still buffered, then stop the workers."""
+        self._stop_capture.set()
+        self._join("capture", timeout)
+        self._capture_done.set()
+        self.capture_ring.readable.set()
+        self._join("sender", timeout)
+        self._stop.set()
+        self.playback_ring.readable.set()
+        self._join("playback", timeout)
+        self._threads = []
+
+    def _join(self, name: str, timeout: Optional[float]) -> None:
+        for thread in self._threads:
+            if thread.name == f"deepgram-agent-{name}":
+                thread.join(timeout)
+
+    def push_capture(self, data: BytesLike) -> None:
+        """Queue captured audio for sending (call from one capture thread or audio callback)."""
+        dropped = len(data) - self.capture_ring.write(data)
+        if dropped:
+            self.stats.capture_overrun_bytes += dropped
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        if isinstance(message, (bytes, bytearray)):
+            self._response_active = True
+            self._response_done = False
+            dropped = len(message) - self.playback_ring.write(message)
+            if dropped:
+                self.stats.playback_overrun_bytes += dropped
+            return
+        message_type = getattr(message, "type", None)
+        if message_type == "AgentAudioDone":
+            self._response_done = True
+            self.playback_ring.readable.set()
+        elif message_type == "UserStartedSpeaking" and self._response_active:
+            self.stats.barge_ins += 1
+            self._response_active = False
+            self.playback_ring.discard()
+
+    def _capture_loop(self) -> None:
+        assert self._capture is not None
+        try:
+            while not self._stop_capture.is_set() and not self._stop.is_set():
+                data = self._capture(self.input_frame_bytes)
+                if not data:
+                    break
+                self.push_capture(data)
+        except Exception as exc:
+            _logger.warning("Audio capture failed: %s", exc)
+        finally:
+            self._capture_done.set()
+            self.capture_ring.readable.set()
+
+    def _send_loop(self) -> None:
+        frame = bytearray(self.input_frame_bytes)
+        ring = self.capture_ring
+        while not self._stop.is_set():
+            if ring.available >= self.input_frame_bytes:
+                ring.readinto(frame)
+                self._send(bytes(frame))
+            elif self._capture_done.is_set():
+                # Send the final partial frame once capture has ended.
+                count = ring.readinto(frame)
+                if count:
+                    self._send(bytes(frame[:count]))
+                return
+            else:
+                self._wait(ring)
+
+    def _wait(self, ring: AudioRingBuffer) -> None:
+        if ring.available:
+            # A partial frame is buffered; poll until the rest arrives.
+            self._stop.wait(self._frame_seconds / 4)
+        else:
+            ring.readable.wait(self._frame_seconds)
+
+    def _send(self, data: bytes) -> None:
+        try:
+            self._socket.send_media(data)
+            self.stats.frames_sent += 1
+        except Exception as exc:
+            self.stats.send_errors += 1
+            _logger.warning("send_media failed: %s", exc)
+
+    def _playback_loop(self) -> None:
+        assert self._playback is not None
+        frame = bytearray(self.output_frame_bytes)
+        view = memoryview(frame)
+        ring = self.playback_ring
+        started = False
+        starving = False
+        while not self._stop.is_set():
+            available = ring.available
+            if not started:
+                started = bool(available) and (available >= self._prebuffer_bytes or self._response_done)
+                if not started:
+                    self._wait(ring)
+                    continue
+            if available >= self.output_frame_bytes or (available and self._response_done):
+                starving = False
+                count = ring.readinto(frame)
+                self._play(view[:count])
+            elif self._response_done or not self._response_active:
+                # Response finished or interrupted: the next one starts with a fresh prebuffer.
+                started = False
+            else:
+                if not starving:
+                    self.stats.playback_underruns += 1
+                    starving = not self._fill_silence
+                if self._fill_silence:
+                    self._play(memoryview(self._silence))
+                else:
+                    self._wait(ring)
+
+    def _play(self, frame: memoryview) -> None:
+        try:
+            assert self._playback is not None
+            self._playback(frame)
+            self.stats.frames_played += 1
+        except Exception as exc:
+            _logger.warning("Audio playback failed: %s", exc)
@@ -0,0 +1,320 @@
+"""
+Concurrent Function-Call Dispatch for Voice Agents
+
+Routes ``AgentV1FunctionCallRequest`` messages from an ``agent.v1`` socket to
+registered handlers, runs independent calls concurrently (thread pool or event
+loop) with per-function timeouts, and sends each result back with
+``send_function_call_response`` as soon as it completes, so slow tools never
+block the socket's read loop.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from ..agent.v1.types.agent_v1send_function_call_response import AgentV1SendFunctionCallResponse
+from ..core.events import EventType
+
+_logger = logging.getLogger(__name__)
+
+FunctionHandler = Callable[[Dict[str, Any]], Any]
+
+
+def _parse_arguments(arguments: Optional[str]) -> Dict[str, Any]:
+    if not arguments:
+        return {}
+    parsed = json.loads(arguments)
+    return parsed if isinstance(parsed, dict) else {"value": parsed}
+
+
+def _encode_result(result: Any) -> str:
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, default=str)
+
+
+def _error_content(message: str) -> str:
+    return json.dumps({"error": message})
+
+
+class _FunctionRegistry:
+    def __init__(self, default_timeout: Optional[float]):
+        self._default_timeout = default_timeout
+        self._handlers: Dict[str, Tuple[FunctionHandler, Optional[float]]] = {}
+
+    def register(self, name: str, handler: Optional[FunctionHandler] = None, *, timeout: Optional[float] = None) -> Any:
+        """
+        Register a handler for a client-side function. Usable as a decorator.
+
+        The handler receives the parsed JSON ``arguments`` as a dict and may be
+        sync or async. A ``str`` result is sent as-is; anything else is JSON-encoded.
+
+        Args:
+            name: Function name as declared in the agent's think settings
+            handler: Callable taking the arguments dict (omit to use as a decorator)
+            timeout: Seconds before an error response is sent instead (defaults to the router's)
+
+        Returns:
+            The handler (so the decorator form leaves the function unchanged)
+        """
+
+        def _register(func: FunctionHandler) -> FunctionHandler:
+            self._handlers[name] = (func, timeout if timeout is not None else self._default_timeout)
+            return func
+
+        if handler is None:
+            return _register
+        return _register(handler)
+
+    def lookup(self, name: str) -> Optional[Tuple[FunctionHandler, Optional[float]]]:
+        return self._handlers.get(name)
+
+
+class AgentFunctionRouter(_FunctionRegistry):
+    """
+    Dispatches agent function calls for a sync ``V1SocketClient`` on a thread pool.
+
+    Only ``client_side`` function calls are dispatched. Every call in a
+    ``FunctionCallRequest`` is started immediately and answered independently;
+    unknown functions, handler exceptions and timeouts are answered with a JSON
+    ``{"error": ...}`` content so the agent is never left waiting.
+
+    Example:
+        router = AgentFunctionRouter(max_workers=8, default_timeout=10)
+
+        @router.register("get_weather")
+        def get_weather(arguments):
+            return {"forecast": lookup(arguments["city"])}
+
+        with client.agent.v1.connect() as socket:
+            router.attach(socket)
+            socket.send_settings(settings)
+            socket.start_listening()
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 8,
+        default_timeout: Optional[float] = None,
+        on_error: Optional[Callable[[str, BaseException], Any]] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            max_workers: Thread pool size for sync handlers
+            default_timeout: Default per-function timeout in seconds (None for no timeout)
+            on_error: Called with ``(function_name, exception)`` when a handler fails or times out
+        """
+        super().__init__(default_timeout)
+        self._on_error = on_error
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deepgram-agent-fn")
+        self._socket: Any = None
+        self._send_lock = threading.Lock()
+
+    def attach(self, socket_client: Any) -> "AgentFunctionRouter":
+        """
+        Listen for function calls on an agent socket client. Returns self for chaining.
+
+        Args:
+            socket_client: ``V1SocketClient`` from ``client.agent.v1.connect()``
+
+        Returns:
+            Self for method chaining
+        """
+        self._socket = socket_client
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self.close(wait=False))
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        if getattr(message, "type", None) != "FunctionCallRequest":
+            return
+        for call in message.functions:
+            if call.client_side:
+                self.dispatch(call)
+
+    def dispatch(self, call: Any) -> "Future[Any]":
+        """
+        Start one function call and answer it when it finishes, fails or times out.
+
+        Args:
+            call: An ``AgentV1FunctionCallRequestFunctionsItem``
+
+        Returns:
+            Future resolving to the handler's result
+        """
+        entry = self.lookup(call.name)
+        if entry is None:
+            self._respond(call, _error_content(f"Unknown function: {call.name}"))
+            failed: "Future[Any]" = Future()
+            failed.set_exception(KeyError(call.name))
+            return failed
+        handler, timeout = entry
+        answered = threading.Lock()
+        future = self._executor.submit(self._invoke, handler, call.arguments)
+        timer: Optional[threading.Timer] = None
+
+        def _answer(content: str) -> None:
+            # Whichever of completion and timeout comes first answers the call.
+            if answered.acquire(blocking=False):
+                self._respond(call, content)
+
+        def _done(done: "Future[Any]") -> None:
+            if timer is not None:
+                timer.cancel()
+            exc = done.exception()
+            if exc is not None:
+                self._report(call.name, exc)
+                _answer(_error_content(str(exc) or type(exc).__name__))
+            else:
+                _answer(_encode_result(done.result()))
+
+        def _timeout() -> None:
+            if not answered.locked():
+                self._report(call.name, TimeoutError(f"{call.name} timed out after {timeout}s"))
+                _answer(_error_content(f"Function {call.name} timed out"))
+
+        if timeout is not None:
+            timer = threading.Timer(timeout, _timeout)
+            timer.daemon = True
+            timer.start()
+        future.add_done_callback(_done)
+        return future
+
+    @staticmethod
+    def _invoke(handler: FunctionHandler, arguments: Optional[str]) -> Any:
+        result = handler(_parse_arguments(arguments))
+        if inspect.isawaitable(result):
+            return asyncio.run(_await(result))
+        return result
+
+    def _respond(self, call: Any, content: str) -> None:
+        if self._socket is None:
+            return
+        response = AgentV1SendFunctionCallResponse(
+            type="FunctionCallResponse", id=call.id, name=call.name, content=content
+        )
+        try:
+            with self._send_lock:
+                self._socket.send_function_call_response(response)
+        except Exception as exc:
+            _logger.warning("Failed to send function call response for %s: %s", call.name, exc)
+
+    def _report(self, name: str, exc: BaseException) -> None:
+        _logger.warning("Agent function %s failed: %s", name, exc)
+        if self._on_error is not None:
+            self._on_error(name, exc)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting calls and shut down the thread pool."""
+        self._executor.shutdown(wait=wait)
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class AsyncAgentFunctionRouter(_FunctionRegistry):
+    """
+    Dispatches agent function calls for an ``AsyncV1SocketClient`` on the event loop.
+
+    Async handlers run as tasks; sync handlers run in the loop's default
+    executor. Each call is answered as soon as it completes, so the socket's
+    ``start_listening`` loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_timeout: Optional[float] = None,
+        on_error: Optional[Callable[[str, BaseException], Any]] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            default_timeout: Default per-function timeout in seconds (None for no timeout)
+            on_error: Called with ``(function_name, exception)`` when a handler fails or times out
+        """
+        super().__init__(default_timeout)
+        self._on_error = on_error
+        self._socket: Any = None
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    def attach(self, socket_client: Any) -> "AsyncAgentFunctionRouter":
+        """Listen for function calls on an async agent socket client. Returns self for chaining."""
+        self._socket = socket_client
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        if getattr(message, "type", None) != "FunctionCallRequest":
+            return
+        for call in message.functions:
+            if call.client_side:
+                self.dispatch(call)
+
+    def dispatch(self, call: Any) -> "asyncio.Task[Any]":
+        """Start one function call as a task that answers it when done."""
+        task = asyncio.ensure_future(self._run(call))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(self, call: Any) -> Any:
+        entry = self.lookup(call.name)
+        if entry is None:
+            await self._respond(call, _error_content(f"Unknown function: {call.name}"))
+            return None
+        handler, timeout = entry
+        try:
+            result = await asyncio.wait_for(self._invoke(handler, call.arguments), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._report(call.name, TimeoutError(f"{call.name} timed out after {timeout}s"))
+            await self._respond(call, _error_content(f"Function {call.name} timed out"))
+            return None
+        except Exception as exc:
+            self._report(call.name, exc)
+            await self._respond(call, _error_content(str(exc) or type(exc).__name__))
+            return None
+        await self._respond(call, _encode_result(result))
+        return result
+
+    @staticmethod
+    async def _invoke(handler: FunctionHandler, arguments: Optional[str]) -> Any:
+        parsed = _parse_arguments(arguments)
+        if inspect.iscoroutinefunction(handler):
+            return await handler(parsed)
+        result = await asyncio.get_running_loop().run_in_executor(None, handler, parsed)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _respond(self, call: Any, content: str) -> None:
+        if self._socket is None:
+            return
+        response = AgentV1SendFunctionCallResponse(
+            type="FunctionCallResponse", id=call.id, name=call.name, content=content
+        )
+        try:
+            await self._socket.send_function_call_response(response)
+        except Exception as exc:
+            _logger.warning("Failed to send function call response for %s: %s", call.name, exc)
+
+    def _report(self, name: str, exc: BaseException) -> None:
+        _logger.warning("Agent function %s failed: %s", name, exc)
+        if self._on_error is not None:
+            self._on_error(name, exc)
+
+    async def wait(self) -> None:
+        """Wait for every in-flight function call to be answered."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
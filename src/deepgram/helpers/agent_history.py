@@ -0,0 +1,219 @@
+"""
+Bounded Conversation History for Voice Agents
+
+Records the ``History`` and ``ConversationText`` messages of an ``agent.v1``
+socket into a store with a rolling character (or token) budget, hands turns
+that fall out of the budget to an optional summarization hook, and builds the
+``agent.context.messages`` payload needed to resume the conversation on a new
+connection.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from ..agent.v1.types.agent_v1settings import AgentV1Settings
+from ..agent.v1.types.agent_v1settings_agent_context_context import AgentV1SettingsAgentContextContext
+from ..agent.v1.types.conversation_history_message import ConversationHistoryMessage
+from ..agent.v1.types.function_call_history_message import FunctionCallHistoryMessage
+from ..core.events import EventType
+from ..core.pydantic_utilities import parse_obj_as
+
+HistoryEntry = Union[ConversationHistoryMessage, FunctionCallHistoryMessage]
+
+# Called with (evicted entries oldest first, previous summary or None); returns the new summary.
+Summarizer = Callable[[List[HistoryEntry], Optional[str]], Optional[str]]
+
+
+def _entry_text(entry: HistoryEntry) -> str:
+    if isinstance(entry, FunctionCallHistoryMessage):
+        return "".join(f"{call.name}{call.arguments}{call.response}" for call in entry.function_calls)
+    return entry.content
+
+
+class AgentHistoryStore:
+    """
+    Rolling conversation history for one agent conversation.
+
+    Text turns come from ``History`` messages (sent when the Settings'
+    ``flags.history`` is enabled) and from ``ConversationText`` messages; a
+    turn reported by both is stored once. Function calls come from
+    ``History`` messages. When the stored history exceeds ``budget`` (as
+    measured by ``measure``, characters by default), the oldest entries are
+    evicted and passed to ``summarize`` together with the previous summary;
+    the returned summary is kept and prepended to the reconnect context
+    (the summary is not counted against the budget, so the hook should keep
+    it short). Without a hook, evicted entries are dropped.
+
+    Example:
+        history = AgentHistoryStore(budget=8000, summarize=my_llm_summarizer)
+        with client.agent.v1.connect() as socket:
+            history.attach(socket)
+            socket.send_settings(settings)
+            socket.start_listening()
+
+        # Later, on a new connection:
+        new_socket.send_settings(history.reconnect_settings(settings))
+    """
+
+    def __init__(
+        self,
+        *,
+        budget: int = 16000,
+        measure: Callable[[str], int] = len,
+        summarize: Optional[Summarizer] = None,
+        summary_role: str = "user",
+        summary_prefix: str = "Summary of the conversation so far: ",
+        keep_recent: int = 2,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            budget: Maximum size of the stored history, in ``measure`` units
+            measure: Size of a piece of text (``len`` for characters, or a tokenizer's count)
+            summarize: Hook producing a summary from evicted entries and the previous summary
+            summary_role: Role of the summary message in the reconnect context
+            summary_prefix: Text placed before the summary in the reconnect context
+            keep_recent: Number of most recent entries never evicted, even over budget
+
+        Raises:
+            ValueError: If budget is not positive or keep_recent is negative
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        if keep_recent < 0:
+            raise ValueError("keep_recent must be non-negative")
+        self.budget = budget
+        self._measure = measure
+        self._summarize = summarize
+        self._summary_role = summary_role
+        self._summary_prefix = summary_prefix
+        self._keep_recent = keep_recent
+        self._entries: Deque[Tuple[HistoryEntry, int]] = deque()
+        self._size = 0
+        self._last_text: Optional[Tuple[str, str, str]] = None
+        self._lock = threading.Lock()
+        self.summary: Optional[str] = None
+        self.evicted = 0
+
+    @property
+    def size(self) -> int:
+        """Current size of the stored entries, in ``measure`` units."""
+        return self._size
+
+    def attach(self, socket_client: Any) -> "AgentHistoryStore":
+        """
+        Record history from an agent socket client (sync or async). Returns self for chaining.
+
+        Args:
+            socket_client: ``V1SocketClient`` or ``AsyncV1SocketClient`` from ``agent.v1.connect``
+
+        Returns:
+            Self for method chaining
+        """
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        message_type = getattr(message, "type", None)
+        if isinstance(message, FunctionCallHistoryMessage):
+            self.append(message)
+        elif message_type == "History" and getattr(message, "content", None) is not None:
+            self.add_text(message.role, message.content, source="History")
+        elif message_type == "ConversationText":
+            self.add_text(message.role, message.content, source="ConversationText")
+
+    def add_text(self, role: str, content: str, *, source: str = "manual") -> None:
+        """
+        Record a spoken turn.
+
+        A turn identical to the previous one but reported by a different source
+        (``History`` and ``ConversationText`` both describe the same turn) is ignored.
+
+        Args:
+            role: ``"user"`` or ``"assistant"``
+            content: The statement
+            source: Where the turn came from
+        """
+        with self._lock:
+            last = self._last_text
+            if last is not None and last[:2] == (role, content) and last[2] != source:
+                self._last_text = None
+                return
+            self._last_text = (role, content, source)
+        self.append(ConversationHistoryMessage(type="History", role=role, content=content))
+
+    def append(self, entry: HistoryEntry) -> None:
+        """Record an entry and evict (and summarize) the oldest entries while over budget."""
+        entry_size = self._measure(_entry_text(entry))
+        evicted: List[HistoryEntry] = []
+        with self._lock:
+            self._entries.append((entry, entry_size))
+            self._size += entry_size
+            while self._size > self.budget and len(self._entries) > self._keep_recent:
+                old, old_size = self._entries.popleft()
+                self._size -= old_size
+                evicted.append(old)
+            self.evicted += len(evicted)
+            previous = self.summary
+        if evicted and self._summarize is not None:
+            summary = self._summarize(evicted, previous)
+            with self._lock:
+                self.summary = summary
+
+    def entries(self) -> List[HistoryEntry]:
+        """Return the stored entries, oldest first."""
+        with self._lock:
+            return [entry for entry, _ in self._entries]
+
+    def clear(self) -> None:
+        """Forget every entry and the summary."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._last_text = None
+            self.summary = None
+
+    def context_messages(self) -> List[HistoryEntry]:
+        """Return the messages for ``agent.context.messages``: the summary (if any) then the stored entries."""
+        messages: List[HistoryEntry] = []
+        if self.summary:
+            messages.append(
+                ConversationHistoryMessage(
+                    type="History", role=self._summary_role, content=f"{self._summary_prefix}{self.summary}"
+                )
+            )
+        messages.extend(self.entries())
+        return messages
+
+    def context(self) -> AgentV1SettingsAgentContextContext:
+        """Return the conversation context to place under ``agent.context``."""
+        return AgentV1SettingsAgentContextContext(messages=self.context_messages())
+
+    def reconnect_settings(self, settings: Any, *, drop_greeting: bool = True) -> AgentV1Settings:
+        """
+        Return a copy of ``settings`` whose agent context carries the stored history.
+
+        Args:
+            settings: The ``AgentV1Settings`` used for the original connection
+            drop_greeting: Remove ``agent.greeting`` so a resumed call is not greeted again
+
+        Returns:
+            AgentV1Settings ready for ``send_settings`` on the new connection
+
+        Raises:
+            ValueError: If ``settings.agent`` is a stored agent id rather than an inline configuration
+        """
+        data: Dict[str, Any] = settings.dict() if hasattr(settings, "dict") else dict(settings)
+        agent = data.get("agent")
+        if not isinstance(agent, dict):
+            raise ValueError("reconnect_settings requires an inline agent configuration")
+        agent = dict(agent)
+        agent.pop("messages", None)
+        if drop_greeting:
+            agent.pop("greeting", None)
+        agent["context"] = self.context().dict()
+        data["agent"] = agent
+        return parse_obj_as(AgentV1Settings, data)
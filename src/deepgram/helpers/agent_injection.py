@@ -0,0 +1,471 @@
+"""
+Ordered Message Injection for Voice Agents
+
+Serializes ``InjectUserMessage`` / ``InjectAgentMessage`` sends on an
+``agent.v1`` socket, waits for the agent and user to be idle (as implied by
+``AgentStartedSpeaking`` / ``AgentAudioDone`` / ``UserStartedSpeaking``)
+before each send, retries ``InjectionRefused`` replies with exponential
+backoff, and resolves one future per injection.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Optional
+
+from ..agent.v1.types.agent_v1inject_agent_message import AgentV1InjectAgentMessage
+from ..agent.v1.types.agent_v1inject_user_message import AgentV1InjectUserMessage
+from ..core.events import EventType
+
+_logger = logging.getLogger(__name__)
+
+_REFUSED = "refused"
+_CONFIRMED = "confirmed"
+
+
+class InjectionRefusedError(Exception):
+    """Raised (through the injection's future) when every attempt was refused."""
+
+    def __init__(self, reason: str, attempts: int):
+        super().__init__(f"Injection refused after {attempts} attempt(s): {reason}")
+        self.reason = reason
+        self.attempts = attempts
+
+
+class _Injection:
+    __slots__ = ("message", "future", "attempts", "outcome", "reason", "confirmation")
+
+    def __init__(self, message: Any, future: Any):
+        self.message = message
+        self.future = future
+        self.attempts = 0
+        self.outcome: Optional[str] = None
+        self.reason = ""
+        self.confirmation: Any = None
+
+    @property
+    def is_user(self) -> bool:
+        return self.message.type == "InjectUserMessage"
+
+    @property
+    def text(self) -> str:
+        return self.message.content if self.is_user else self.message.message
+
+    @property
+    def waits_for_idle(self) -> bool:
+        # "queue" and "interrupt" agent injections are never refused, so they are sent right away.
+        return self.is_user or getattr(self.message, "behavior", None) in (None, "default")
+
+
+def _as_injection_message(message: Any) -> Any:
+    if getattr(message, "type", None) not in ("InjectUserMessage", "InjectAgentMessage"):
+        raise TypeError("Expected an AgentV1InjectUserMessage or AgentV1InjectAgentMessage")
+    return message
+
+
+class _InjectionState:
+    """Speaking state and in-flight bookkeeping shared by the sync and async queues."""
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        initial_backoff: float,
+        max_backoff: float,
+        backoff_multiplier: float,
+        refusal_window: float,
+        idle_timeout: Optional[float],
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if initial_backoff < 0 or max_backoff < initial_backoff or backoff_multiplier < 1:
+            raise ValueError("Backoff must satisfy 0 <= initial_backoff <= max_backoff and backoff_multiplier >= 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.refusal_window = refusal_window
+        self.idle_timeout = idle_timeout
+        self.agent_speaking = False
+        self.user_speaking = False
+        self._queue: Deque[_Injection] = deque()
+        self._in_flight: Optional[_Injection] = None
+        self._closed = False
+        self._socket: Any = None
+
+    @property
+    def idle(self) -> bool:
+        """Whether neither the agent nor the user is mid-turn."""
+        return not (self.agent_speaking or self.user_speaking)
+
+    @property
+    def pending(self) -> int:
+        """Number of injections waiting to be sent (excluding the one in flight)."""
+        return len(self._queue)
+
+    def _update(self, message: Any) -> bool:
+        """Apply one server message; returns whether anything a waiter cares about changed."""
+        message_type = getattr(message, "type", None)
+        if message_type == "AgentStartedSpeaking":
+            self.agent_speaking = True
+        elif message_type == "AgentAudioDone":
+            self.agent_speaking = False
+        elif message_type == "UserStartedSpeaking":
+            self.user_speaking = True
+        elif message_type == "AgentThinking" or (
+            message_type == "ConversationText" and getattr(message, "role", None) == "user"
+        ):
+            self.user_speaking = False
+        elif message_type not in ("InjectionRefused", "ConversationText"):
+            return False
+
+        injection = self._in_flight
+        if injection is not None and injection.outcome is None:
+            if message_type == "InjectionRefused":
+                injection.outcome = _REFUSED
+                injection.reason = getattr(message, "message", "")
+            elif (
+                message_type == "ConversationText"
+                and getattr(message, "role", None) == ("user" if injection.is_user else "assistant")
+                and getattr(message, "content", None) == injection.text
+            ):
+                injection.outcome = _CONFIRMED
+                injection.confirmation = message
+        elif message_type == "InjectionRefused":
+            _logger.debug("InjectionRefused with no injection in flight: %s", getattr(message, "message", ""))
+        return True
+
+    def _next_delay(self, delay: float) -> float:
+        return min(self.max_backoff, delay * self.backoff_multiplier)
+
+    @staticmethod
+    def _send_method(socket_client: Any, injection: _Injection) -> Callable[[Any], Any]:
+        if injection.is_user:
+            return socket_client.send_inject_user_message
+        return socket_client.send_inject_agent_message
+
+
+class AgentInjectionQueue(_InjectionState):
+    """
+    Injection queue for a sync agent ``V1SocketClient``.
+
+    Injections are sent one at a time, in submission order, from a worker
+    thread. Before each send the queue waits until the agent is not speaking
+    and the user is not mid-turn; after it, it waits up to ``refusal_window``
+    seconds for an ``InjectionRefused`` reply (or the ``ConversationText``
+    echo that confirms it). Refused injections are retried after an
+    exponential backoff, once the agent is idle again, up to ``max_attempts``
+    times. Agent injections with ``behavior="queue"`` or ``"interrupt"`` are
+    never refused and are sent without waiting for idle.
+
+    Each submission returns a ``concurrent.futures.Future`` that resolves to
+    the confirming ``ConversationText`` (or None if none arrived within the
+    window) and fails with ``InjectionRefusedError`` when every attempt was
+    refused.
+
+    Example:
+        queue = AgentInjectionQueue(max_attempts=4).attach(socket)
+        done = queue.inject_agent_message("Your order has shipped.")
+        threading.Thread(target=socket.start_listening, daemon=True).start()
+        done.result(timeout=30)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 5,
+        initial_backoff: float = 0.25,
+        max_backoff: float = 4.0,
+        backoff_multiplier: float = 2.0,
+        refusal_window: float = 1.0,
+        idle_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            max_attempts: Sends per injection before giving up on refusals
+            initial_backoff: Seconds to wait after the first refusal
+            max_backoff: Upper bound for the backoff in seconds
+            backoff_multiplier: Backoff growth factor per refusal
+            refusal_window: Seconds to wait for a refusal or confirmation after each send
+            idle_timeout: Seconds to wait for the agent to become idle before failing
+                the injection with ``TimeoutError`` (None waits indefinitely)
+
+        Raises:
+            ValueError: If the retry settings are invalid
+        """
+        super().__init__(
+            max_attempts=max_attempts,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+            backoff_multiplier=backoff_multiplier,
+            refusal_window=refusal_window,
+            idle_timeout=idle_timeout,
+        )
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def attach(self, socket_client: Any) -> "AgentInjectionQueue":
+        """
+        Track speaking state on an agent socket client and start sending. Returns self for chaining.
+
+        Args:
+            socket_client: ``V1SocketClient`` from ``client.agent.v1.connect()``
+
+        Returns:
+            Self for method chaining
+        """
+        self._socket = socket_client
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self.close())
+        self._worker = threading.Thread(target=self._run, name="deepgram-agent-inject", daemon=True)
+        self._worker.start()
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        with self._cond:
+            if self._update(message):
+                self._cond.notify_all()
+
+    def inject_user_message(self, content: str) -> "Future[Any]":
+        """Queue an ``InjectUserMessage``."""
+        return self.submit(AgentV1InjectUserMessage(type="InjectUserMessage", content=content))
+
+    def inject_agent_message(self, message: str, behavior: Optional[str] = None) -> "Future[Any]":
+        """Queue an ``InjectAgentMessage`` (``behavior`` is ``default``, ``queue`` or ``interrupt``)."""
+        kwargs = {"behavior": behavior} if behavior is not None else {}
+        return self.submit(AgentV1InjectAgentMessage(type="InjectAgentMessage", message=message, **kwargs))
+
+    def submit(self, message: Any) -> "Future[Any]":
+        """
+        Queue an injection message model.
+
+        Args:
+            message: ``AgentV1InjectUserMessage`` or ``AgentV1InjectAgentMessage``
+
+        Returns:
+            Future for the injection's outcome
+
+        Raises:
+            RuntimeError: If the queue is closed
+            TypeError: If the message is not an injection
+        """
+        future: "Future[Any]" = Future()
+        injection = _Injection(_as_injection_message(message), future)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Injection queue is closed")
+            self._queue.append(injection)
+            self._cond.notify_all()
+        return future
+
+    def close(self) -> None:
+        """Stop sending; queued injections are cancelled."""
+        with self._cond:
+            self._closed = True
+            queued, self._queue = list(self._queue), deque()
+            self._cond.notify_all()
+        for injection in queued:
+            injection.future.cancel()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                injection = self._queue.popleft()
+            if injection.future.set_running_or_notify_cancel():
+                try:
+                    self._deliver(injection)
+                except Exception as exc:
+                    if not injection.future.done():
+                        injection.future.set_exception(exc)
+
+    def _deliver(self, injection: _Injection) -> None:
+        delay = self.initial_backoff
+        while True:
+            with self._cond:
+                if injection.waits_for_idle and not self._cond.wait_for(
+                    lambda: self._closed or self.idle, timeout=self.idle_timeout
+                ):
+                    raise TimeoutError(f"Agent did not become idle within {self.idle_timeout}s")
+                if self._closed:
+                    raise RuntimeError("Injection queue closed before the message was sent")
+                injection.attempts += 1
+                injection.outcome = None
+                self._in_flight = injection
+            try:
+                self._send_method(self._socket, injection)(injection.message)
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._closed or injection.outcome is not None, timeout=self.refusal_window
+                    )
+            finally:
+                with self._cond:
+                    self._in_flight = None
+            if injection.outcome != _REFUSED:
+                injection.future.set_result(injection.confirmation)
+                return
+            if injection.attempts >= self.max_attempts:
+                raise InjectionRefusedError(injection.reason, injection.attempts)
+            _logger.debug("Injection refused (%s); retrying in %.2fs", injection.reason, delay)
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=delay)
+            delay = self._next_delay(delay)
+
+
+class AsyncAgentInjectionQueue(_InjectionState):
+    """
+    Injection queue for an ``AsyncV1SocketClient``.
+
+    Same ordering, idle-waiting and refusal retry as :class:`AgentInjectionQueue`,
+    driven by a task on the event loop; submissions return ``asyncio.Future``
+    objects.
+
+    Example:
+        queue = AsyncAgentInjectionQueue().attach(socket)
+        listener = asyncio.create_task(socket.start_listening())
+        await queue.inject_user_message("What's my balance?")
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 5,
+        initial_backoff: float = 0.25,
+        max_backoff: float = 4.0,
+        backoff_multiplier: float = 2.0,
+        refusal_window: float = 1.0,
+        idle_timeout: Optional[float] = None,
+    ):
+        """Initialize the queue (see :class:`AgentInjectionQueue` for the arguments)."""
+        super().__init__(
+            max_attempts=max_attempts,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+            backoff_multiplier=backoff_multiplier,
+            refusal_window=refusal_window,
+            idle_timeout=idle_timeout,
+        )
+        self._changed = asyncio.Event()
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    def attach(self, socket_client: Any) -> "AsyncAgentInjectionQueue":
+        """Track speaking state on an async agent socket client and start sending. Returns self for chaining."""
+        self._socket = socket_client
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self._shutdown())
+        self._worker = asyncio.ensure_future(self._run())
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        if self._update(message):
+            self._changed.set()
+
+    def inject_user_message(self, content: str) -> "asyncio.Future[Any]":
+        """Queue an ``InjectUserMessage``."""
+        return self.submit(AgentV1InjectUserMessage(type="InjectUserMessage", content=content))
+
+    def inject_agent_message(self, message: str, behavior: Optional[str] = None) -> "asyncio.Future[Any]":
+        """Queue an ``InjectAgentMessage`` (``behavior`` is ``default``, ``queue`` or ``interrupt``)."""
+        kwargs = {"behavior": behavior} if behavior is not None else {}
+        return self.submit(AgentV1InjectAgentMessage(type="InjectAgentMessage", message=message, **kwargs))
+
+    def submit(self, message: Any) -> "asyncio.Future[Any]":
+        """
+        Queue an injection message model.
+
+        Args:
+            message: ``AgentV1InjectUserMessage`` or ``AgentV1InjectAgentMessage``
+
+        Returns:
+            Future for the injection's outcome
+
+        Raises:
+            RuntimeError: If the queue is closed
+            TypeError: If the message is not an injection
+        """
+        if self._closed:
+            raise RuntimeError("Injection queue is closed")
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._queue.append(_Injection(_as_injection_message(message), future))
+        self._changed.set()
+        return future
+
+    async def close(self) -> None:
+        """Stop sending; queued injections are cancelled."""
+        self._shutdown()
+        if self._worker is not None:
+            await asyncio.gather(self._worker, return_exceptions=True)
+
+    def _shutdown(self) -> None:
+        self._closed = True
+        queued, self._queue = list(self._queue), deque()
+        for injection in queued:
+            injection.future.cancel()
+        self._changed.set()
+
+    async def _wait_for(self, predicate: Callable[[], bool], timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not predicate():
+            self._changed.clear()
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return predicate()
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await self._wait_for(lambda: bool(self._queue) or self._closed, None)
+            if self._closed:
+                return
+            injection = self._queue.popleft()
+            if injection.future.cancelled():
+                continue
+            try:
+                await self._deliver(injection)
+            except Exception as exc:
+                if not injection.future.done():
+                    injection.future.set_exception(exc)
+
+    async def _deliver(self, injection: _Injection) -> None:
+        delay = self.initial_backoff
+        while True:
+            if injection.waits_for_idle and not await self._wait_for(
+                lambda: self._closed or self.idle, self.idle_timeout
+            ):
+                raise TimeoutError(f"Agent did not become idle within {self.idle_timeout}s")
+            if self._closed:
+                raise RuntimeError("Injection queue closed before the message was sent")
+            injection.attempts += 1
+            injection.outcome = None
+            self._in_flight = injection
+            try:
+                await self._send_method(self._socket, injection)(injection.message)
+                await self._wait_for(lambda: self._closed or injection.outcome is not None, self.refusal_window)
+            finally:
+                self._in_flight = None
+            if injection.future.done():
+                return
+            if injection.outcome != _REFUSED:
+                injection.future.set_result(injection.confirmation)
+                return
+            if injection.attempts >= self.max_attempts:
+                raise InjectionRefusedError(injection.reason, injection.attempts)
+            _logger.debug("Injection refused (%s); retrying in %.2fs", injection.reason, delay)
+            await self._wait_for(lambda: self._closed, delay)
+            delay = self._next_delay(delay)
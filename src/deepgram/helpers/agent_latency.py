@@ -0,0 +1,360 @@
+"""
+Voice Agent Latency Telemetry
+
+Aggregates the per-turn ``AgentV1LatencyReport`` messages of an ``agent.v1``
+socket, plus SDK-side timings such as last ``send_media`` to first agent audio
+byte, into streaming percentile histograms per session and across sessions
+(keyed by labels such as the think provider and model). Snapshots export as a
+plain dict or, optionally, as OpenTelemetry histogram metrics.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ..core.events import EventType
+from ._utils import get_field
+from .latency_histogram import LatencyHistogram
+
+# LatencyReport fields (seconds on the wire), recorded in milliseconds.
+REPORT_FIELDS = (
+    "ttt_token_latency",
+    "ttt_text_latency",
+    "ttt_tool_latency",
+    "ttt_thinking_latency",
+    "tts_latency",
+    "total_latency",
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def think_labels(settings: Any) -> Dict[str, str]:
+    """
+    Extract ``think_provider`` / ``think_model`` labels from agent Settings.
+
+    Accepts an ``AgentV1Settings`` model or the equivalent dict. When several
+    think providers are configured (fallbacks), the first one is used.
+
+    Args:
+        settings: The Settings message sent with ``send_settings``
+
+    Returns:
+        Dict of labels (empty when the settings carry no think provider)
+    """
+    think = get_field(get_field(settings, "agent"), "think")
+    if isinstance(think, (list, tuple)):
+        think = think[0] if think else None
+    provider = get_field(think, "provider")
+    labels: Dict[str, str] = {}
+    provider_type = get_field(provider, "type")
+    model = get_field(provider, "model")
+    if provider_type is not None:
+        labels["think_provider"] = str(provider_type)
+    if model is not None:
+        labels["think_model"] = str(model)
+    return labels
+
+
+class AgentLatencyStats:
+    """
+    Histograms of voice agent latencies, in milliseconds.
+
+    ``<field>_ms`` metrics come from the server's LatencyReport; the SDK-side
+    metrics are:
+
+    - ``media_to_first_audio_ms``: last ``send_media`` before a response to its
+      first audio byte (most meaningful when the client stops sending audio
+      during silence, e.g. behind a VAD gate)
+    - ``started_speaking_to_first_audio_ms``: ``AgentStartedSpeaking`` to the
+      first audio byte of that response
+    - ``settings_applied_ms``: ``send_settings`` to ``SettingsApplied``
+    """
+
+    METRICS = tuple(f"{name}_ms" for name in REPORT_FIELDS) + (
+        "media_to_first_audio_ms",
+        "started_speaking_to_first_audio_ms",
+        "settings_applied_ms",
+    )
+
+    def __init__(self, relative_error: float = 0.01):
+        self.histograms: Dict[str, LatencyHistogram] = {name: LatencyHistogram(relative_error) for name in self.METRICS}
+
+    def record(self, metric: str, value_ms: float) -> None:
+        """Record one value (milliseconds) for a metric in ``METRICS``."""
+        self.histograms[metric].record(value_ms)
+
+    def record_report(self, report: Any) -> Dict[str, float]:
+        """
+        Record every latency present in a LatencyReport.
+
+        Args:
+            report: An ``AgentV1LatencyReport``
+
+        Returns:
+            The recorded ``{metric: milliseconds}`` values
+        """
+        recorded = {}
+        for name in REPORT_FIELDS:
+            seconds = getattr(report, name, None)
+            if seconds is not None:
+                recorded[f"{name}_ms"] = seconds * 1000
+        for metric, value in recorded.items():
+            self.record(metric, value)
+        return recorded
+
+    def merge(self, other: "AgentLatencyStats") -> None:
+        """Add every histogram of ``other`` into this one."""
+        for name, histogram in other.histograms.items():
+            self.histograms[name].merge(histogram)
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return ``{metric: {count, min, max, mean, p50, p95, p99}}``."""
+        return {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+
+
+class AgentLatencyAggregator:
+    """
+    Cross-session agent latency statistics, one ``AgentLatencyStats`` per label set.
+
+    Share one aggregator between every ``AgentLatencyTracker`` in a process to
+    compare think providers and models over time.
+
+    Example:
+        aggregator = AgentLatencyAggregator()
+        aggregator.instrument_opentelemetry()  # optional
+
+        with client.agent.v1.connect() as socket:
+            AgentLatencyTracker(aggregator=aggregator).attach(socket)
+            socket.send_settings(settings)
+            ...
+
+        for entry in aggregator.snapshot():
+            print(entry["labels"], entry["metrics"]["total_latency_ms"]["p95"])
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        """
+        Initialize the aggregator.
+
+        Args:
+            relative_error: Relative accuracy of the percentile histograms
+        """
+        self._relative_error = relative_error
+        self._stats: Dict[LabelKey, AgentLatencyStats] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, float, Dict[str, str]], Any]] = []
+
+    @staticmethod
+    def _key(labels: Optional[Mapping[str, Any]]) -> LabelKey:
+        return tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items()))
+
+    def stats_for(self, labels: Optional[Mapping[str, Any]] = None) -> AgentLatencyStats:
+        """Return (creating if needed) the statistics for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = AgentLatencyStats(self._relative_error)
+            return stats
+
+    def record(self, metric: str, value_ms: float, labels: Optional[Mapping[str, Any]] = None) -> None:
+        """Record one value for a label set and forward it to any exporters."""
+        self.stats_for(labels).record(metric, value_ms)
+        attributes = dict(self._key(labels))
+        for listener in list(self._listeners):
+            listener(metric, value_ms, attributes)
+
+    def add_listener(self, listener: Callable[[str, float, Dict[str, str]], Any]) -> None:
+        """Call ``listener(metric, value_ms, labels)`` for every value recorded from now on."""
+        self._listeners.append(listener)
+
+    def combined(self) -> AgentLatencyStats:
+        """Return statistics merged across every label set."""
+        combined = AgentLatencyStats(self._relative_error)
+        with self._lock:
+            stats = list(self._stats.values())
+        for entry in stats:
+            combined.merge(entry)
+        return combined
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return ``[{"labels": {...}, "metrics": {metric: {count, ..., p99}}}]``, one entry per label set."""
+        with self._lock:
+            items = list(self._stats.items())
+        return [{"labels": dict(key), "metrics": stats.snapshot()} for key, stats in items]
+
+    def instrument_opentelemetry(self, meter: Any = None, *, prefix: str = "deepgram.agent") -> Dict[str, Any]:
+        """
+        Export every recorded value as an OpenTelemetry histogram measurement.
+
+        One ``Histogram`` instrument (unit ``ms``) is created per metric, named
+        ``<prefix>.<metric without _ms>``; the label set becomes the
+        measurement attributes. Percentiles are then computed by the
+        OpenTelemetry backend.
+
+        Args:
+            meter: OpenTelemetry ``Meter`` (defaults to ``metrics.get_meter("deepgram")``)
+            prefix: Instrument name prefix
+
+        Returns:
+            Dict of metric name to the created instrument
+
+        Raises:
+            RuntimeError: If ``opentelemetry-api`` is not installed and no meter is given
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics  # type: ignore[import-not-found]
+            except ImportError:
+                raise RuntimeError(
+                    "To export agent latency metrics, install OpenTelemetry: pip install opentelemetry-api"
+                ) from None
+            meter = metrics.get_meter("deepgram")
+
+        instruments = {
+            name: meter.create_histogram(
+                f"{prefix}.{name[: -len('_ms')]}", unit="ms", description=f"Voice agent {name[: -len('_ms')]}"
+            )
+            for name in AgentLatencyStats.METRICS
+        }
+
+        def _export(metric: str, value_ms: float, labels: Dict[str, str]) -> None:
+            instruments[metric].record(value_ms, attributes=labels)
+
+        self.add_listener(_export)
+        return instruments
+
+
+class AgentLatencyTracker:
+    """
+    Collects latency telemetry from one agent socket client (sync or async).
+
+    ``attach`` wraps ``send_settings`` and ``send_media`` to timestamp them and
+    registers a ``EventType.MESSAGE`` handler. Every value is recorded into the
+    tracker's per-session ``session`` statistics and, when given, the shared
+    aggregator under the tracker's labels. Unless labels are passed explicitly,
+    they are taken from the think provider of the Settings message.
+
+    Example:
+        tracker = AgentLatencyTracker(aggregator=aggregator, on_report=print)
+        with client.agent.v1.connect() as socket:
+            tracker.attach(socket)
+            socket.send_settings(settings)
+            socket.start_listening()
+        tracker.session.snapshot()["total_latency_ms"]["p50"]
+    """
+
+    def __init__(
+        self,
+        *,
+        aggregator: Optional[AgentLatencyAggregator] = None,
+        labels: Optional[Mapping[str, Any]] = None,
+        on_report: Optional[Callable[[Dict[str, float]], Any]] = None,
+        relative_error: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            aggregator: Cross-session aggregator to record into (optional)
+            labels: Fixed labels for this session (default: derived from Settings)
+            on_report: Called with the ``{metric: milliseconds}`` values of each LatencyReport
+            relative_error: Relative accuracy of the per-session histograms
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.aggregator = aggregator
+        self.labels: Dict[str, Any] = dict(labels or {})
+        self._auto_labels = labels is None
+        self.on_report = on_report
+        self.session = AgentLatencyStats(relative_error)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._settings_sent_at: Optional[float] = None
+        self._last_media_at: Optional[float] = None
+        self._started_speaking_at: Optional[float] = None
+        self._awaiting_audio = True
+
+    def attach(self, socket_client: Any) -> "AgentLatencyTracker":
+        """
+        Instrument an agent socket client. Returns self for chaining.
+
+        Args:
+            socket_client: ``V1SocketClient`` or ``AsyncV1SocketClient`` from ``agent.v1.connect``
+
+        Returns:
+            Self for method chaining
+        """
+        send_settings = socket_client.send_settings
+        send_media = socket_client.send_media
+
+        def _send_settings(message: Any) -> Any:
+            self.on_settings(message)
+            return send_settings(message)
+
+        def _send_media(message: Any) -> Any:
+            self.on_media()
+            return send_media(message)
+
+        socket_client.send_settings = _send_settings
+        socket_client.send_media = _send_media
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        return self
+
+    def on_settings(self, settings: Any) -> None:
+        """Record an outgoing Settings message."""
+        with self._lock:
+            self._settings_sent_at = self._clock()
+            if self._auto_labels:
+                self.labels = think_labels(settings)
+
+    def on_media(self) -> None:
+        """Record an outgoing audio chunk."""
+        now = self._clock()
+        with self._lock:
+            self._last_media_at = now
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        now = self._clock()
+        recorded: Dict[str, float] = {}
+        if isinstance(message, (bytes, bytearray)):
+            with self._lock:
+                if not self._awaiting_audio:
+                    return
+                self._awaiting_audio = False
+                if self._last_media_at is not None:
+                    recorded["media_to_first_audio_ms"] = (now - self._last_media_at) * 1000
+                if self._started_speaking_at is not None:
+                    recorded["started_speaking_to_first_audio_ms"] = (now - self._started_speaking_at) * 1000
+                    self._started_speaking_at = None
+            self._record(recorded)
+            return
+
+        message_type = getattr(message, "type", None)
+        if message_type == "LatencyReport":
+            recorded = self.session.record_report(message)
+            if self.aggregator is not None:
+                for metric, value in recorded.items():
+                    self.aggregator.record(metric, value, self.labels)
+            if self.on_report is not None:
+                self.on_report(recorded)
+            return
+        with self._lock:
+            if message_type == "SettingsApplied" and self._settings_sent_at is not None:
+                recorded["settings_applied_ms"] = (now - self._settings_sent_at) * 1000
+                self._settings_sent_at = None
+            elif message_type == "AgentStartedSpeaking":
+                self._started_speaking_at = now
+                self._awaiting_audio = True
+            elif message_type in ("AgentAudioDone", "UserStartedSpeaking"):
+                # The next audio byte belongs to a new response.
+                self._awaiting_audio = True
+        self._record(recorded)
+
+    def _record(self, recorded: Dict[str, float]) -> None:
+        for metric, value in recorded.items():
+            self.session.record(metric, value)
+            if self.aggregator is not None:
+                self.aggregator.record(metric, value, self.labels)
@@ -0,0 +1,547 @@
+"""
+Pre-negotiated Voice Agent Session Pools
+
+Opens ``agent.v1.connect`` sockets ahead of demand and applies a Settings
+template to each, handing out sessions only once ``SettingsApplied`` has been
+received, so the connect / Welcome / Settings round-trips are not part of a
+call's time-to-greeting. Per-call changes are applied with
+``send_update_prompt`` / ``send_update_think`` / ``send_update_speak`` /
+``send_update_listen``.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..agent.v1.types.agent_v1update_listen import AgentV1UpdateListen
+from ..agent.v1.types.agent_v1update_prompt import AgentV1UpdatePrompt
+from ..agent.v1.types.agent_v1update_speak import AgentV1UpdateSpeak
+from ..agent.v1.types.agent_v1update_think import AgentV1UpdateThink
+from ._pooling import PooledSession, run_with_timeout
+
+_logger = logging.getLogger(__name__)
+
+
+class _PooledAgentSession(PooledSession):
+    """A pooled agent socket plus the request id from its ``Welcome`` message."""
+
+    __slots__ = ("request_id",)
+
+    def __init__(self, socket: Any, exit_stack: Any):
+        super().__init__(socket, (), exit_stack)
+        self.request_id: Optional[str] = None
+
+
+class AgentSettingsError(RuntimeError):
+    """Raised when the server rejects the pool's Settings with an ``Error`` message."""
+
+    def __init__(self, code: Optional[str], description: Optional[str]):
+        super().__init__(f"Agent settings rejected: {code}: {description}")
+        self.code = code
+        self.description = description
+
+
+def _check_setup_message(message: Any, pooled: "_PooledAgentSession") -> bool:
+    """Inspect one setup message; returns True once the settings are applied."""
+    message_type = getattr(message, "type", None)
+    if message_type == "Welcome":
+        pooled.request_id = getattr(message, "request_id", None)
+    elif message_type == "Error":
+        raise AgentSettingsError(getattr(message, "code", None), getattr(message, "description", None))
+    return message_type == "SettingsApplied"
+
+
+def _updates(prompt: Optional[str], think: Any, speak: Any, listen: Any) -> List[Tuple[str, Any]]:
+    updates: List[Tuple[str, Any]] = []
+    if prompt is not None:
+        updates.append(("send_update_prompt", AgentV1UpdatePrompt(type="UpdatePrompt", prompt=prompt)))
+    if think is not None:
+        updates.append(("send_update_think", AgentV1UpdateThink(type="UpdateThink", think=think)))
+    if speak is not None:
+        updates.append(("send_update_speak", AgentV1UpdateSpeak(type="UpdateSpeak", speak=speak)))
+    if listen is not None:
+        updates.append(("send_update_listen", AgentV1UpdateListen(type="UpdateListen", listen=listen)))
+    return updates
+
+
+class AgentSessionPool:
+    """
+    Pool of sync agent sessions with the Settings template already applied.
+
+    Up to ``size`` ready sessions are kept open. Each is opened in the
+    background, sent ``settings`` and drained until ``SettingsApplied``; the
+    ``Welcome`` request id is kept as ``request_id`` on the leased session.
+    Agent sessions carry conversation state, so a session is used for one
+    conversation and closed afterwards; a replacement is opened as soon as a
+    session is leased. Idle sessions are kept alive with ``KeepAlive`` every
+    ``keep_alive_interval`` seconds and recycled after ``max_age`` seconds. A
+    session whose ``SettingsApplied`` does not arrive within
+    ``settings_timeout`` seconds is closed.
+
+    Messages the server sends after ``SettingsApplied`` (such as the greeting)
+    stay queued on the socket and are delivered once the caller starts
+    listening.
+
+    Example:
+        pool = AgentSessionPool(client.agent.v1, settings, size=2)
+        pool.warm()
+
+        with pool.session(prompt="You are helping Alice with her order.") as socket:
+            socket.on(EventType.MESSAGE, on_message)
+            socket.start_listening()
+
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        agent_client: Any,
+        settings: Any,
+        *,
+        size: int = 1,
+        max_age: Optional[float] = 300.0,
+        keep_alive_interval: Optional[float] = 5.0,
+        max_workers: int = 4,
+        settings_timeout: float = 10.0,
+        connect_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            agent_client: ``client.agent.v1`` (anything with a ``connect`` context manager)
+            settings: ``AgentV1Settings`` applied to every session
+            size: Number of ready sessions to keep open
+            max_age: Recycle ready sessions older than this many seconds (None to disable)
+            keep_alive_interval: Seconds between KeepAlive messages on ready sessions (None to disable)
+            max_workers: Threads used to open sessions in the background
+            settings_timeout: Seconds to wait for ``SettingsApplied``
+            connect_kwargs: Keyword arguments for ``connect`` (e.g. ``request_options``)
+        """
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self._agent_client = agent_client
+        self.settings = settings
+        self._size = size
+        self._max_age = max_age
+        self._keep_alive_interval = keep_alive_interval
+        self._settings_timeout = settings_timeout
+        self._connect_kwargs = dict(connect_kwargs or {})
+        self._idle: Deque[_PooledAgentSession] = deque()
+        self._opening = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deepgram-agent-pool")
+        self._closed = threading.Event()
+        self._maintainer: Optional[threading.Thread] = None
+
+    def warm(self) -> None:
+        """Open sessions until ``size`` ready sessions are available. Blocks until they are ready."""
+        with self._lock:
+            missing = max(self._size - len(self._idle) - self._opening, 0)
+            self._opening += missing
+        futures = [self._executor.submit(self._open_into_pool) for _ in range(missing)]
+        for future in futures:
+            future.result()
+        self._start_maintainer()
+
+    @contextlib.contextmanager
+    def session(
+        self,
+        *,
+        prompt: Optional[str] = None,
+        think: Any = None,
+        speak: Any = None,
+        listen: Any = None,
+    ) -> Iterator[Any]:
+        """
+        Lease a ready session for one conversation; it is closed when the block exits.
+
+        Args:
+            prompt: New system prompt, sent with ``send_update_prompt``
+            think: New think settings, sent with ``send_update_think``
+            speak: New speak settings, sent with ``send_update_speak``
+            listen: New listen settings, sent with ``send_update_listen``
+
+        Yields:
+            An agent socket client with the pool's settings applied
+        """
+        pooled = self.acquire(prompt=prompt, think=think, speak=speak, listen=listen)
+        try:
+            yield pooled.socket
+        finally:
+            self.release(pooled)
+
+    def acquire(
+        self,
+        *,
+        prompt: Optional[str] = None,
+        think: Any = None,
+        speak: Any = None,
+        listen: Any = None,
+    ) -> _PooledAgentSession:
+        """
+        Take a ready session out of the pool, opening one if none is ready.
+
+        Pair every call with :meth:`release`; prefer :meth:`session`.
+        """
+        if self._closed.is_set():
+            raise RuntimeError("AgentSessionPool is closed")
+        pooled: Optional[_PooledAgentSession] = None
+        stale = []
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.popleft()
+                if candidate.is_stale(self._max_age, None):
+                    stale.append(candidate)
+                    continue
+                pooled = candidate
+                break
+        for candidate in stale:
+            self._close_session(candidate)
+        if pooled is None:
+            pooled = self._open()
+        self._replenish()
+        self._start_maintainer()
+        try:
+            for method, message in _updates(prompt, think, speak, listen):
+                getattr(pooled.socket, method)(message)
+        except BaseException:
+            self._close_session(pooled)
+            raise
+        return pooled
+
+    def release(self, pooled: _PooledAgentSession) -> None:
+        """Close a leased session once its conversation is over."""
+        self._close_session(pooled)
+
+    def ready_count(self) -> int:
+        """Number of ready sessions currently held."""
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """Close every ready session and stop background work."""
+        self._closed.set()
+        self._executor.shutdown(wait=True)
+        if self._maintainer is not None:
+            self._maintainer.join()
+        with self._lock:
+            sessions = list(self._idle)
+            self._idle.clear()
+        for pooled in sessions:
+            self._close_session(pooled)
+
+    def __enter__(self) -> "AgentSessionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _open(self) -> _PooledAgentSession:
+        exit_stack = contextlib.ExitStack()
+        try:
+            socket = exit_stack.enter_context(self._agent_client.connect(**self._connect_kwargs))
+            pooled = _PooledAgentSession(socket, exit_stack)
+            socket.send_settings(self.settings)
+            run_with_timeout(lambda: self._wait_applied(pooled), self._settings_timeout, "agent settings not applied")
+        except BaseException:
+            exit_stack.close()
+            raise
+        pooled.created_at = pooled.idle_since = time.monotonic()
+        return pooled
+
+    @staticmethod
+    def _wait_applied(pooled: _PooledAgentSession) -> None:
+        while not _check_setup_message(pooled.socket.recv(), pooled):
+            pass
+
+    def _open_into_pool(self) -> None:
+        try:
+            pooled = self._open()
+        except Exception as exc:
+            _logger.warning("Failed to pre-open agent session: %s", exc)
+            with self._lock:
+                self._opening -= 1
+            return
+        with self._lock:
+            self._opening -= 1
+            if not self._closed.is_set() and len(self._idle) < self._size:
+                self._idle.append(pooled)
+                pooled = None  # type: ignore[assignment]
+        if pooled is not None:
+            self._close_session(pooled)
+
+    def _replenish(self) -> None:
+        with self._lock:
+            if self._closed.is_set():
+                return
+            missing = self._size - len(self._idle) - self._opening
+            if missing <= 0:
+                return
+            self._opening += missing
+        for _ in range(missing):
+            self._executor.submit(self._open_into_pool)
+
+    def _start_maintainer(self) -> None:
+        with self._lock:
+            if self._maintainer is not None or self._keep_alive_interval is None:
+                return
+            self._maintainer = threading.Thread(
+                target=self._maintain, name="deepgram-agent-pool-keepalive", daemon=True
+            )
+        self._maintainer.start()
+
+    def _maintain(self) -> None:
+        assert self._keep_alive_interval is not None
+        while not self._closed.wait(self._keep_alive_interval):
+            self.maintain()
+
+    def maintain(self) -> None:
+        """Send KeepAlive on ready sessions, recycling stale or broken ones (runs periodically)."""
+        with self._lock:
+            sessions = list(self._idle)
+        for pooled in sessions:
+            if pooled.is_stale(self._max_age, None):
+                self._evict(pooled)
+                continue
+            try:
+                pooled.socket.send_keep_alive()
+            except Exception as exc:
+                _logger.debug("Recycling agent session that failed keep-alive: %s", exc)
+                self._evict(pooled)
+
+    def _evict(self, pooled: _PooledAgentSession) -> None:
+        with self._lock:
+            try:
+                self._idle.remove(pooled)
+            except ValueError:
+                return  # Leased in the meantime.
+        self._close_session(pooled)
+        self._replenish()
+
+    @staticmethod
+    def _close_session(pooled: _PooledAgentSession) -> None:
+        try:
+            pooled._exit_stack.close()
+        except Exception as exc:
+            _logger.debug("Error while closing pooled agent session: %s", exc)
+
+
+class AsyncAgentSessionPool:
+    """
+    Async analogue of :class:`AgentSessionPool` for ``AsyncDeepgramClient``.
+
+    Sessions are opened as background tasks on the running event loop; the
+    wait for ``SettingsApplied`` is bounded by ``settings_timeout``.
+
+    Example:
+        pool = AsyncAgentSessionPool(client.agent.v1, settings, size=2)
+        await pool.warm()
+
+        async with pool.session(prompt="You are helping Alice.") as socket:
+            socket.on(EventType.MESSAGE, on_message)
+            await socket.start_listening()
+
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        agent_client: Any,
+        settings: Any,
+        *,
+        size: int = 1,
+        max_age: Optional[float] = 300.0,
+        keep_alive_interval: Optional[float] = 5.0,
+        settings_timeout: float = 10.0,
+        connect_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            agent_client: ``client.agent.v1`` of an ``AsyncDeepgramClient``
+            settings: ``AgentV1Settings`` applied to every session
+            size: Number of ready sessions to keep open
+            max_age: Recycle ready sessions older than this many seconds (None to disable)
+            keep_alive_interval: Seconds between KeepAlive messages on ready sessions (None to disable)
+            settings_timeout: Seconds to wait for ``SettingsApplied``
+            connect_kwargs: Keyword arguments for ``connect`` (e.g. ``request_options``)
+        """
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self._agent_client = agent_client
+        self.settings = settings
+        self._size = size
+        self._max_age = max_age
+        self._keep_alive_interval = keep_alive_interval
+        self._settings_timeout = settings_timeout
+        self._connect_kwargs = dict(connect_kwargs or {})
+        self._idle: Deque[_PooledAgentSession] = deque()
+        self._opening = 0
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._maintainer: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+    async def warm(self) -> None:
+        """Open sessions until ``size`` ready sessions are available."""
+        missing = max(self._size - len(self._idle) - self._opening, 0)
+        self._opening += missing
+        await asyncio.gather(*(self._open_into_pool() for _ in range(missing)))
+        self._start_maintainer()
+
+    @contextlib.asynccontextmanager
+    async def session(
+        self,
+        *,
+        prompt: Optional[str] = None,
+        think: Any = None,
+        speak: Any = None,
+        listen: Any = None,
+    ) -> AsyncIterator[Any]:
+        """Lease a ready session for one conversation; it is closed when the block exits."""
+        pooled = await self.acquire(prompt=prompt, think=think, speak=speak, listen=listen)
+        try:
+            yield pooled.socket
+        finally:
+            await self.release(pooled)
+
+    async def acquire(
+        self,
+        *,
+        prompt: Optional[str] = None,
+        think: Any = None,
+        speak: Any = None,
+        listen: Any = None,
+    ) -> _PooledAgentSession:
+        """Take a ready session out of the pool, opening one if none is ready."""
+        if self._closed:
+            raise RuntimeError("AsyncAgentSessionPool is closed")
+        pooled: Optional[_PooledAgentSession] = None
+        while self._idle:
+            candidate = self._idle.popleft()
+            if candidate.is_stale(self._max_age, None):
+                await self._close_session(candidate)
+                continue
+            pooled = candidate
+            break
+        if pooled is None:
+            pooled = await self._open()
+        self._replenish()
+        self._start_maintainer()
+        try:
+            for method, message in _updates(prompt, think, speak, listen):
+                await getattr(pooled.socket, method)(message)
+        except BaseException:
+            await self._close_session(pooled)
+            raise
+        return pooled
+
+    async def release(self, pooled: _PooledAgentSession) -> None:
+        """Close a leased session once its conversation is over."""
+        await self._close_session(pooled)
+
+    def ready_count(self) -> int:
+        """Number of ready sessions currently held."""
+        return len(self._idle)
+
+    async def close(self) -> None:
+        """Close every ready session and cancel background work."""
+        self._closed = True
+        tasks = list(self._tasks) + ([self._maintainer] if self._maintainer is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        sessions = list(self._idle)
+        self._idle.clear()
+        for pooled in sessions:
+            await self._close_session(pooled)
+
+    async def __aenter__(self) -> "AsyncAgentSessionPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _open(self) -> _PooledAgentSession:
+        exit_stack = contextlib.AsyncExitStack()
+        try:
+            socket = await exit_stack.enter_async_context(self._agent_client.connect(**self._connect_kwargs))
+            pooled = _PooledAgentSession(socket, exit_stack)
+            await socket.send_settings(self.settings)
+            await asyncio.wait_for(self._wait_applied(pooled), timeout=self._settings_timeout)
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+        pooled.created_at = pooled.idle_since = time.monotonic()
+        return pooled
+
+    @staticmethod
+    async def _wait_applied(pooled: _PooledAgentSession) -> None:
+        while not _check_setup_message(await pooled.socket.recv(), pooled):
+            pass
+
+    async def _open_into_pool(self) -> None:
+        try:
+            pooled = await self._open()
+        except Exception as exc:
+            _logger.warning("Failed to pre-open agent session: %s", exc)
+            return
+        finally:
+            self._opening -= 1
+        if not self._closed and len(self._idle) < self._size:
+            self._idle.append(pooled)
+        else:
+            await self._close_session(pooled)
+
+    def _replenish(self) -> None:
+        if self._closed:
+            return
+        missing = self._size - len(self._idle) - self._opening
+        for _ in range(max(missing, 0)):
+            self._opening += 1
+            task = asyncio.ensure_future(self._open_into_pool())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _start_maintainer(self) -> None:
+        if self._maintainer is None and self._keep_alive_interval is not None and not self._closed:
+            self._maintainer = asyncio.ensure_future(self._maintain())
+
+    async def _maintain(self) -> None:
+        assert self._keep_alive_interval is not None
+        while not self._closed:
+            await asyncio.sleep(self._keep_alive_interval)
+            await self.maintain()
+
+    async def maintain(self) -> None:
+        """Send KeepAlive on ready sessions, recycling stale or broken ones (runs periodically)."""
+        for pooled in list(self._idle):
+            if pooled.is_stale(self._max_age, None):
+                await self._evict(pooled)
+                continue
+            try:
+                await pooled.socket.send_keep_alive()
+            except Exception as exc:
+                _logger.debug("Recycling agent session that failed keep-alive: %s", exc)
+                await self._evict(pooled)
+
+    async def _evict(self, pooled: _PooledAgentSession) -> None:
+        try:
+            self._idle.remove(pooled)
+        except ValueError:
+            return  # Leased in the meantime.
+        await self._close_session(pooled)
+        self._replenish()
+
+    @staticmethod
+    async def _close_session(pooled: _PooledAgentSession) -> None:
+        try:
+            await pooled._exit_stack.aclose()
+        except Exception as exc:
+            _logger.debug("Error while closing pooled agent session: %s", exc)
@@ -0,0 +1,251 @@
+"""
+Precompiled Agent Settings and Update Diffing
+
+Serializes an ``AgentV1Settings`` tree once (``.dict()``, numeric
+sanitization and JSON encoding) into a reusable frame that the agent socket
+clients send as-is, derives per-session variants without rebuilding pydantic
+models, and turns the difference between two settings into the minimal
+``UpdatePrompt`` / ``UpdateThink`` / ``UpdateSpeak`` / ``UpdateListen``
+messages.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..agent.v1.socket_client import _sanitize_numeric_types
+
+# Settings fields that can be changed mid-session, in the order updates are sent.
+_UPDATABLE = (
+    ("prompt", "UpdatePrompt", "send_update_prompt"),
+    ("think", "UpdateThink", "send_update_think"),
+    ("speak", "UpdateSpeak", "send_update_speak"),
+    ("listen", "UpdateListen", "send_update_listen"),
+)
+
+_SEND_METHODS = {"Settings": "send_settings", **{message: method for _, message, method in _UPDATABLE}}
+
+
+def _to_payload(value: Any) -> Any:
+    if hasattr(value, "dict"):
+        value = value.dict()
+    elif isinstance(value, list):
+        value = [item.dict() if hasattr(item, "dict") else item for item in value]
+    return _sanitize_numeric_types(value)
+
+
+def _prompt_of(think: Any) -> Optional[str]:
+    first = think[0] if isinstance(think, list) and think else think
+    return first.get("prompt") if isinstance(first, dict) else None
+
+
+def _without_prompt(think: Any) -> Any:
+    if isinstance(think, list):
+        return [_without_prompt(item) for item in think]
+    if isinstance(think, dict):
+        return {key: value for key, value in think.items() if key != "prompt"}
+    return think
+
+
+def _with_prompt(think: Any, prompt: str) -> Any:
+    if isinstance(think, list):
+        return [_with_prompt(item, prompt) for item in think]
+    if isinstance(think, dict):
+        return {**think, "prompt": prompt}
+    return think
+
+
+class CompiledAgentMessage:
+    """
+    An outgoing agent message serialized once.
+
+    Passing it to the matching ``send_*`` method of an agent socket client
+    (or calling :meth:`send`) sends :attr:`wire_frame` without re-serializing.
+    The payload is shared; treat it as read-only.
+    """
+
+    __slots__ = ("payload", "wire_frame")
+
+    def __init__(self, payload: Dict[str, Any]):
+        """
+        Initialize from a sanitized JSON-compatible payload.
+
+        Args:
+            payload: Message dict including its ``type``
+        """
+        self.payload = payload
+        self.wire_frame = json.dumps(payload)
+
+    @property
+    def type(self) -> str:
+        """The message's wire ``type``."""
+        return self.payload["type"]
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:
+        """Return the payload (compatible with code that serializes models via ``.dict()``)."""
+        return self.payload
+
+    def send(self, socket_client: Any) -> Any:
+        """
+        Send with the socket method matching the message type.
+
+        Returns:
+            The send method's result (a coroutine for async socket clients)
+        """
+        return getattr(socket_client, _SEND_METHODS[self.type])(self)
+
+    def __repr__(self) -> str:
+        return f"CompiledAgentMessage({self.wire_frame})"
+
+
+class CompiledAgentSettings(CompiledAgentMessage):
+    """
+    ``AgentV1Settings`` compiled into a reusable wire frame.
+
+    Compile a template once and share it between every session that uses it;
+    :meth:`derive` produces per-session variants (prompt, greeting, providers)
+    by copying the payload instead of rebuilding pydantic models, and
+    :meth:`updates_to` computes the mid-session update messages needed to move
+    a live session from one settings to another.
+
+    Example:
+        template = CompiledAgentSettings(settings)
+
+        with client.agent.v1.connect() as socket:
+            socket.send_settings(template.derive(prompt=f"You are helping {caller}."))
+            ...
+            for update in template.updates_to(escalated_settings):
+                update.send(socket)
+    """
+
+    __slots__ = ()
+
+    def __init__(self, settings: Any):
+        """
+        Compile settings.
+
+        Args:
+            settings: ``AgentV1Settings`` model, or an already sanitized Settings dict
+        """
+        payload = _to_payload(settings) if not isinstance(settings, dict) else dict(settings)
+        payload.setdefault("type", "Settings")
+        super().__init__(payload)
+
+    @property
+    def agent(self) -> Dict[str, Any]:
+        """The compiled ``agent`` section (read-only)."""
+        agent = self.payload.get("agent")
+        if not isinstance(agent, dict):
+            raise ValueError("Settings reference a stored agent id; there is no inline agent configuration")
+        return agent
+
+    def derive(
+        self,
+        *,
+        prompt: Optional[str] = None,
+        greeting: Optional[str] = None,
+        think: Any = None,
+        speak: Any = None,
+        listen: Any = None,
+        context: Any = None,
+    ) -> "CompiledAgentSettings":
+        """
+        Return a new compiled settings with some agent fields replaced.
+
+        Unchanged sections are shared with this template, not copied.
+
+        Args:
+            prompt: New ``agent.think.prompt`` (applied to every think provider)
+            greeting: New ``agent.greeting``
+            think: New ``agent.think`` (model or dict)
+            speak: New ``agent.speak`` (model or dict)
+            listen: New ``agent.listen`` (model or dict)
+            context: New ``agent.context`` (model or dict)
+
+        Returns:
+            A CompiledAgentSettings
+        """
+        agent = dict(self.agent)
+        for name, value in (("think", think), ("speak", speak), ("listen", listen), ("context", context)):
+            if value is not None:
+                agent[name] = _to_payload(value)
+        if greeting is not None:
+            agent["greeting"] = greeting
+        if prompt is not None:
+            agent["think"] = _with_prompt(agent.get("think"), prompt)
+        return CompiledAgentSettings({**self.payload, "agent": agent})
+
+    def updates_to(self, target: Any, *, strict: bool = True) -> List[CompiledAgentMessage]:
+        """
+        Compute the update messages that move a session from these settings to ``target``.
+
+        A prompt-only change becomes a single ``UpdatePrompt``; other think
+        changes become ``UpdateThink``; speak and listen changes become
+        ``UpdateSpeak`` / ``UpdateListen``.
+
+        Args:
+            target: The desired settings (``AgentV1Settings``, dict or CompiledAgentSettings)
+            strict: Raise if anything that cannot be updated mid-session differs
+
+        Returns:
+            Compiled update messages (empty when nothing changed)
+
+        Raises:
+            ValueError: If ``strict`` and fields outside think/speak/listen differ
+        """
+        if not isinstance(target, CompiledAgentSettings):
+            target = CompiledAgentSettings(target)
+        old_agent, new_agent = self.agent, target.agent
+
+        if strict:
+            fixed = self._fixed_differences(target)
+            if fixed:
+                raise ValueError(f"Settings differ in fields that cannot be updated mid-session: {', '.join(fixed)}")
+
+        updates: List[CompiledAgentMessage] = []
+        old_think, new_think = old_agent.get("think"), new_agent.get("think")
+        new_prompt = _prompt_of(new_think)
+        if _without_prompt(old_think) != _without_prompt(new_think):
+            updates.append(CompiledAgentMessage({"type": "UpdateThink", "think": new_think}))
+        elif new_prompt is not None and _prompt_of(old_think) != new_prompt:
+            updates.append(CompiledAgentMessage({"type": "UpdatePrompt", "prompt": new_prompt}))
+        for field, message_type, _ in _UPDATABLE[2:]:
+            new_value = new_agent.get(field)
+            if new_value is not None and old_agent.get(field) != new_value:
+                updates.append(CompiledAgentMessage({"type": message_type, field: new_value}))
+        return updates
+
+    def _fixed_differences(self, target: "CompiledAgentSettings") -> List[str]:
+        differences: List[str] = []
+        for key in sorted(set(self.payload) | set(target.payload)):
+            if key != "agent" and self.payload.get(key) != target.payload.get(key):
+                differences.append(key)
+        updatable = {field for field, _, _ in _UPDATABLE}
+        old_agent, new_agent = self.agent, target.agent
+        for key in sorted(set(old_agent) | set(new_agent)):
+            # The greeting only plays at the start of a session, so a changed greeting is harmless mid-session.
+            if key not in updatable and key != "greeting" and old_agent.get(key) != new_agent.get(key):
+                differences.append(f"agent.{key}")
+        return differences
+
+
+def compile_updates(*pairs: Tuple[str, Any]) -> List[CompiledAgentMessage]:
+    """
+    Compile explicit updates, e.g. ``compile_updates(("prompt", "Be brief."), ("speak", speak_settings))``.
+
+    Args:
+        *pairs: ``(field, value)`` with field one of prompt, think, speak, listen
+
+    Returns:
+        Compiled update messages
+
+    Raises:
+        ValueError: If a field cannot be updated mid-session
+    """
+    by_field = {field: message_type for field, message_type, _ in _UPDATABLE}
+    updates = []
+    for field, value in pairs:
+        if field not in by_field:
+            raise ValueError(f"'{field}' cannot be updated mid-session")
+        payload_value = value if field == "prompt" else _to_payload(value)
+        updates.append(CompiledAgentMessage({"type": by_field[field], field: payload_value}))
+    return updates
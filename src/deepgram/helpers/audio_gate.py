@@ -0,0 +1,377 @@
+"""
+Voice Activity Gating for Streaming Audio
+
+Sits in front of ``send_media`` on agent and listen socket clients and only
+forwards audio while someone is speaking. Each fixed-size frame is classified
+by its energy; speech frames (plus a hangover after speech ends and a pre-roll
+of the audio just before it starts) are sent, while silence is replaced by
+periodic ``KeepAlive`` messages or low-level comfort-noise frames.
+"""
+
+import dataclasses
+import inspect
+import math
+import random
+import sys
+from array import array
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+from ._utils import get_field, load_numpy
+from .agent_audio import agent_frame_bytes
+
+SILENCE_KEEP_ALIVE = "keep_alive"
+SILENCE_COMFORT_NOISE = "comfort_noise"
+SILENCE_DROP = "drop"
+_SILENCE_MODES = (SILENCE_KEEP_ALIVE, SILENCE_COMFORT_NOISE, SILENCE_DROP)
+
+# Full-scale power of a 16-bit sample; mu-law / A-law are decoded to the same 16-bit range.
+_FULL_SCALE_POWER = 32768.0**2
+_MIN_LEVEL_DB = -120.0
+
+
+def _mulaw_to_linear(code: int) -> int:
+    code = ~code & 0xFF
+    magnitude = (((code & 0x0F) << 3) + 0x84) << ((code >> 4) & 0x07)
+    magnitude -= 0x84
+    return -magnitude if code & 0x80 else magnitude
+
+
+def _alaw_to_linear(code: int) -> int:
+    code ^= 0x55
+    exponent = (code >> 4) & 0x07
+    magnitude = ((code & 0x0F) << 4) + 8
+    if exponent:
+        magnitude = (magnitude + 0x100) << (exponent - 1)
+    return magnitude if code & 0x80 else -magnitude
+
+
+# Squared decoded sample value for every 8-bit code.
+_SQUARES = {
+    "mulaw": [_mulaw_to_linear(code) ** 2 for code in range(256)],
+    "alaw": [_alaw_to_linear(code) ** 2 for code in range(256)],
+}
+
+# Codes closest to zero amplitude, used to synthesize comfort noise.
+_QUIET_CODES = {
+    "mulaw": bytes([0xFF, 0x7F, 0xFE, 0x7E]),
+    "alaw": bytes([0xD5, 0x55]),
+}
+
+GATE_ENCODINGS = ("linear16", "mulaw", "alaw")
+
+
+@dataclasses.dataclass
+class VoiceActivityGateStats:
+    """Counters for a ``VoiceActivityGate``."""
+
+    frames_in: int = 0
+    frames_sent: int = 0
+    bytes_in: int = 0
+    bytes_sent: int = 0
+    speech_segments: int = 0
+    keep_alives: int = 0
+    comfort_noise_frames: int = 0
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of input audio bytes that were not sent."""
+        return 1.0 - self.bytes_sent / self.bytes_in if self.bytes_in else 0.0
+
+
+class VoiceActivityGate:
+    """
+    Energy-based voice activity gate for outgoing streaming audio.
+
+    Audio is re-framed into ``frame_ms`` frames. A frame whose level is at or
+    above ``threshold_db`` (dBFS) opens the gate; it stays open for
+    ``hangover_ms`` after the last such frame so word endings and short pauses
+    are kept, and when it opens the most recent ``pre_roll_ms`` of gated audio
+    is sent first so speech onsets are not clipped. While closed, silence is
+    handled according to ``silence``:
+
+    - ``"keep_alive"``: send ``KeepAlive`` every ``keep_alive_interval`` seconds
+      of gated audio (agent and listen v1 sockets)
+    - ``"comfort_noise"``: send one low-level noise frame every
+      ``comfort_noise_interval`` seconds of gated audio (any socket, including
+      listen v2, which has no KeepAlive)
+    - ``"drop"``: send nothing
+
+    Gated audio is not sent, so server-side timestamps only count the audio
+    that was actually forwarded. Energy is computed with NumPy when it is
+    installed and with pure Python otherwise.
+
+    Example:
+        gate = VoiceActivityGate.from_settings(settings).attach(socket)
+        socket.send_media(chunk)  # forwarded only around speech
+        ...
+        gate.finish()
+        print(f"saved {gate.stats.reduction:.0%} of upstream audio")
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: str = "linear16",
+        sample_rate: int = 16000,
+        frame_ms: int = 20,
+        threshold_db: float = -45.0,
+        hangover_ms: int = 300,
+        pre_roll_ms: int = 200,
+        silence: str = SILENCE_KEEP_ALIVE,
+        keep_alive_interval: float = 5.0,
+        comfort_noise_interval: float = 1.0,
+        use_numpy: Optional[bool] = None,
+    ):
+        """
+        Initialize the gate.
+
+        Args:
+            encoding: Input encoding (linear16, mulaw or alaw)
+            sample_rate: Input sample rate in Hz
+            frame_ms: Analysis frame duration in milliseconds
+            threshold_db: Frame level in dBFS at or above which a frame counts as speech
+            hangover_ms: How long the gate stays open after the last speech frame
+            pre_roll_ms: Gated audio sent ahead of a speech onset
+            silence: ``"keep_alive"``, ``"comfort_noise"`` or ``"drop"``
+            keep_alive_interval: Seconds of gated audio between KeepAlive messages
+            comfort_noise_interval: Seconds of gated audio between comfort-noise frames
+            use_numpy: Force (True) or disable (False) NumPy; None uses it when installed
+
+        Raises:
+            ValueError: If the encoding, silence mode or a duration is invalid
+            RuntimeError: If ``use_numpy`` is True and NumPy is not installed
+        """
+        if encoding not in GATE_ENCODINGS:
+            raise ValueError(f"Unsupported encoding '{encoding}'. Expected one of: {', '.join(GATE_ENCODINGS)}")
+        if silence not in _SILENCE_MODES:
+            raise ValueError(f"Unknown silence mode '{silence}'. Expected one of: {', '.join(_SILENCE_MODES)}")
+        if hangover_ms < 0 or pre_roll_ms < 0:
+            raise ValueError("hangover_ms and pre_roll_ms must be non-negative")
+        if keep_alive_interval <= 0 or comfort_noise_interval <= 0:
+            raise ValueError("keep_alive_interval and comfort_noise_interval must be positive")
+        self._np = load_numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise RuntimeError("NumPy is not installed. Install it with: pip install numpy")
+
+        self.encoding = encoding
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = agent_frame_bytes(encoding, sample_rate, frame_ms)
+        self.threshold_db = threshold_db
+        self.silence = silence
+        self.stats = VoiceActivityGateStats()
+        self._hangover_frames = -(-hangover_ms // frame_ms)
+        self._silence_interval_frames = max(
+            1,
+            round((keep_alive_interval if silence == SILENCE_KEEP_ALIVE else comfort_noise_interval) * 1000 / frame_ms),
+        )
+        self._pre_roll: Deque[bytes] = deque(maxlen=-(-pre_roll_ms // frame_ms) or None)
+        self._pre_roll_enabled = pre_roll_ms > 0
+        self._pending = bytearray()
+        self._open = False
+        self._hangover_left = 0
+        self._gated_frames = 0
+        self._contiguous = False
+        self._comfort_noise = self._make_comfort_noise()
+        self._square_table = (
+            self._np.asarray(_SQUARES[encoding], dtype=self._np.float64)
+            if self._np is not None and encoding in _SQUARES
+            else None
+        )
+        self._send_media: Any = None
+        self._send_keep_alive: Any = None
+
+    @classmethod
+    def from_settings(cls, settings: Any, **kwargs: Any) -> "VoiceActivityGate":
+        """
+        Create a gate matching the ``audio.input`` of an agent Settings message.
+
+        Args:
+            settings: ``AgentV1Settings`` (or the equivalent dict)
+            **kwargs: Other ``VoiceActivityGate`` arguments
+
+        Returns:
+            A new VoiceActivityGate
+        """
+        audio_input = get_field(get_field(settings, "audio"), "input")
+        kwargs.setdefault("encoding", get_field(audio_input, "encoding"))
+        kwargs.setdefault("sample_rate", int(get_field(audio_input, "sample_rate")))
+        return cls(**kwargs)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether audio is currently being forwarded."""
+        return self._open
+
+    def level_db(self, frame: bytes) -> float:
+        """Return the level of a frame in dBFS."""
+        if not frame:
+            return _MIN_LEVEL_DB
+        power = self._mean_power(frame)
+        if power <= 0:
+            return _MIN_LEVEL_DB
+        return max(_MIN_LEVEL_DB, 10.0 * math.log10(power / _FULL_SCALE_POWER))
+
+    def process(self, chunk: bytes) -> List[Optional[bytes]]:
+        """
+        Feed captured audio through the gate.
+
+        Args:
+            chunk: Audio bytes of any length in the gate's encoding
+
+        Returns:
+            What to send, in order: audio bytes for ``send_media`` (consecutive
+            frames coalesced) and None for each ``KeepAlive``
+        """
+        self._pending += chunk
+        self.stats.bytes_in += len(chunk)
+        out: List[Optional[bytearray]] = []
+        self._contiguous = False
+        size = self.frame_bytes
+        offset = 0
+        while len(self._pending) - offset >= size:
+            self._frame(bytes(self._pending[offset : offset + size]), out)
+            offset += size
+        del self._pending[:offset]
+        return [None if part is None else bytes(part) for part in out]
+
+    def flush(self) -> List[Optional[bytes]]:
+        """Return the trailing partial frame for sending if the gate is open, and reset the buffer."""
+        tail, self._pending = bytes(self._pending), bytearray()
+        if tail and self.is_open:
+            self.stats.frames_sent += 1
+            self.stats.bytes_sent += len(tail)
+            return [tail]
+        return []
+
+    def attach(self, socket_client: Any) -> "VoiceActivityGate":
+        """
+        Gate ``send_media`` on an agent or listen socket client. Returns self for chaining.
+
+        Works with sync and async socket clients; for async clients the
+        wrapped ``send_media`` remains a coroutine function.
+
+        Args:
+            socket_client: Socket client from ``agent.v1.connect`` or ``listen.v1/v2.connect``
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If ``silence="keep_alive"`` and the socket has no ``send_keep_alive``
+        """
+        send_keep_alive = getattr(socket_client, "send_keep_alive", None)
+        if self.silence == SILENCE_KEEP_ALIVE and send_keep_alive is None:
+            raise ValueError("This socket client has no send_keep_alive; use silence='comfort_noise' or 'drop'")
+        self._send_media = socket_client.send_media
+        self._send_keep_alive = send_keep_alive
+
+        if inspect.iscoroutinefunction(self._send_media):
+
+            async def _async_send_media(message: bytes) -> None:
+                await self._async_send(self.process(message))
+
+            socket_client.send_media = _async_send_media
+        else:
+
+            def _send_media(message: bytes) -> None:
+                self._sync_send(self.process(message))
+
+            socket_client.send_media = _send_media
+        return self
+
+    def finish(self) -> Any:
+        """
+        Send the trailing partial frame through the attached socket (see :meth:`flush`).
+
+        Returns:
+            None, or a coroutine to await for async socket clients
+        """
+        if inspect.iscoroutinefunction(self._send_media):
+            return self._async_send(self.flush())
+        self._sync_send(self.flush())
+        return None
+
+    def _sync_send(self, actions: List[Optional[bytes]]) -> None:
+        for action in actions:
+            if action is None:
+                self._send_keep_alive()
+            else:
+                self._send_media(action)
+
+    async def _async_send(self, actions: List[Optional[bytes]]) -> None:
+        for action in actions:
+            if action is None:
+                await self._send_keep_alive()
+            else:
+                await self._send_media(action)
+
+    def _frame(self, frame: bytes, out: List[Optional[bytearray]]) -> None:
+        self.stats.frames_in += 1
+        if self.level_db(frame) >= self.threshold_db:
+            if not self._open:
+                self._open = True
+                self.stats.speech_segments += 1
+                for buffered in self._pre_roll:
+                    self._emit(buffered, out)
+                self._pre_roll.clear()
+            self._hangover_left = self._hangover_frames
+            self._gated_frames = 0
+            self._emit(frame, out)
+        elif self._open and self._hangover_left > 0:
+            self._hangover_left -= 1
+            self._emit(frame, out)
+        else:
+            self._open = False
+            self._contiguous = False
+            if self._pre_roll_enabled:
+                self._pre_roll.append(frame)
+            self._gated_frames += 1
+            if self.silence != SILENCE_DROP and self._gated_frames % self._silence_interval_frames == 0:
+                if self.silence == SILENCE_KEEP_ALIVE:
+                    self.stats.keep_alives += 1
+                    out.append(None)
+                else:
+                    self.stats.comfort_noise_frames += 1
+                    self._emit(self._comfort_noise, out)
+                    self._contiguous = False
+
+    def _emit(self, frame: bytes, out: List[Optional[bytearray]]) -> None:
+        # Consecutive frames are coalesced in place and converted to bytes once per chunk.
+        self.stats.frames_sent += 1
+        self.stats.bytes_sent += len(frame)
+        last = out[-1] if self._contiguous and out else None
+        if last is not None:
+            last += frame
+        else:
+            out.append(bytearray(frame))
+        self._contiguous = True
+
+    def _mean_power(self, frame: bytes) -> float:
+        if self.encoding == "linear16":
+            usable = len(frame) - len(frame) % 2
+            if self._np is not None:
+                samples = self._np.frombuffer(frame, dtype="<i2", count=usable // 2).astype(self._np.float64)
+                return float(self._np.dot(samples, samples)) / len(samples)
+            values = array("h", frame[:usable])
+            if sys.byteorder == "big":
+                values.byteswap()
+            return sum(value * value for value in values) / len(values)
+        squares = _SQUARES[self.encoding]
+        np, square_table = self._np, self._square_table
+        if np is not None and square_table is not None:
+            codes = np.frombuffer(frame, dtype=np.uint8)
+            return float(square_table[codes].mean())
+        return sum(squares[code] for code in frame) / len(frame)
+
+    def _make_comfort_noise(self) -> bytes:
+        # Deterministic noise well below any sensible threshold (about -70 dBFS).
+        rng = random.Random(0)
+        if self.encoding == "linear16":
+            values = array("h", (rng.randint(-10, 10) for _ in range(self.frame_bytes // 2)))
+            if sys.byteorder == "big":
+                values.byteswap()
+            return values.tobytes()
+        codes = _QUIET_CODES[self.encoding]
+        return bytes(rng.choice(codes) for _ in range(self.frame_bytes))
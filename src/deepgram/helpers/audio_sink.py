@@ -0,0 +1,396 @@
+"""
+TTS Audio Frame Assembly and Sinks
+
+Assembles the arbitrarily sized binary frames produced by the speak WebSocket
+(``speak.v1.connect`` / ``speak.v2.connect``) into fixed-duration,
+sample-aligned buffers and routes them to a WAV file, a raw file or an
+iterator without per-frame copies.
+"""
+
+import os
+import wave
+from typing import IO, Any, AsyncIterator, Iterator, Optional, Union
+
+from ..core.events import EventType
+from ._utils import SAMPLE_WIDTHS
+
+# Encodings the ``wave`` module can write: it always emits a PCM header.
+_WAV_ENCODINGS = ("linear16", "linear32")
+
+
+def sample_width_for_encoding(encoding: str) -> int:
+    """
+    Return the number of bytes per sample for a speak WebSocket encoding.
+
+    Args:
+        encoding: Encoding passed to ``speak.v1.connect`` / ``speak.v2.connect``
+
+    Returns:
+        Bytes per sample
+
+    Raises:
+        ValueError: If the encoding is not a fixed-width PCM encoding
+    """
+    try:
+        return SAMPLE_WIDTHS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported encoding '{encoding}'. Expected one of: {', '.join(sorted(SAMPLE_WIDTHS))}"
+        ) from None
+
+
+class AudioFrameAssembler:
+    """
+    Re-frames a stream of audio chunks into fixed-duration, sample-aligned frames.
+
+    Incoming chunks are sliced with ``memoryview``. Whole frames that lie entirely
+    inside an incoming chunk are yielded as views of that chunk (no copy); only
+    frames that straddle chunk boundaries are staged in a preallocated
+    ``bytearray`` ring of ``ring_frames`` slots. A yielded view stays valid until
+    the ring wraps around, i.e. for at least ``ring_frames - 1`` further frames.
+
+    Example:
+        assembler = AudioFrameAssembler(sample_rate=24000, frame_duration_ms=20)
+        for chunk in chunks:
+            for frame in assembler.feed(chunk):
+                sink.write(frame)
+        tail = assembler.flush()
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        channels: int = 1,
+        sample_width: int = 2,
+        frame_duration_ms: int = 20,
+        ring_frames: int = 8,
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            sample_rate: Sample rate of the stream in Hz
+            channels: Number of interleaved channels
+            sample_width: Bytes per sample (2 for linear16, 1 for mulaw/alaw)
+            frame_duration_ms: Duration of each emitted frame in milliseconds
+            ring_frames: Number of staging slots in the ring buffer
+
+        Raises:
+            ValueError: If any argument is out of range
+        """
+        if sample_rate <= 0 or channels <= 0 or sample_width <= 0:
+            raise ValueError("sample_rate, channels and sample_width must be positive")
+        if frame_duration_ms <= 0:
+            raise ValueError("frame_duration_ms must be positive")
+        if ring_frames < 2:
+            raise ValueError("ring_frames must be at least 2")
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.block_align = channels * sample_width
+        samples_per_frame = max(1, sample_rate * frame_duration_ms // 1000)
+        self.frame_bytes = samples_per_frame * self.block_align
+
+        self._ring = bytearray(self.frame_bytes * ring_frames)
+        self._ring_view = memoryview(self._ring)
+        self._ring_frames = ring_frames
+        self._slot = 0
+        self._fill = 0
+
+    @classmethod
+    def for_encoding(cls, encoding: str, sample_rate: int, **kwargs: Any) -> "AudioFrameAssembler":
+        """
+        Build an assembler from the ``encoding`` / ``sample_rate`` used to open the socket.
+
+        Args:
+            encoding: Speak WebSocket encoding (e.g. ``"linear16"``)
+            sample_rate: Sample rate in Hz
+            **kwargs: Forwarded to the constructor
+
+        Returns:
+            A configured AudioFrameAssembler
+        """
+        return cls(sample_rate=sample_rate, sample_width=sample_width_for_encoding(encoding), **kwargs)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Number of bytes staged but not yet emitted as a frame."""
+        return self._fill
+
+    def _slot_view(self) -> memoryview:
+        start = self._slot * self.frame_bytes
+        return self._ring_view[start : start + self.frame_bytes]
+
+    def _advance(self) -> None:
+        self._slot = (self._slot + 1) % self._ring_frames
+        self._fill = 0
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> Iterator[memoryview]:
+        """
+        Add a chunk of audio and yield every frame it completes.
+
+        Args:
+            data: Raw audio bytes received from the socket
+
+        Yields:
+            Read-only ``memoryview`` objects of exactly ``frame_bytes`` bytes
+        """
+        view = memoryview(data).cast("B")
+        size = len(view)
+        frame_bytes = self.frame_bytes
+        offset = 0
+
+        # Top up a partially staged frame first.
+        if self._fill:
+            take = min(frame_bytes - self._fill, size)
+            slot = self._slot_view()
+            slot[self._fill : self._fill + take] = view[:take]
+            self._fill += take
+            offset = take
+            if self._fill < frame_bytes:
+                return
+            self._advance()
+            yield slot.toreadonly()
+
+        # Whole frames inside the chunk are emitted as zero-copy views.
+        while size - offset >= frame_bytes:
+            yield view[offset : offset + frame_bytes].toreadonly()
+            offset += frame_bytes
+
+        # Stage the remainder (which may split a sample) for the next chunk.
+        if offset < size:
+            remaining = size - offset
+            self._slot_view()[:remaining] = view[offset:]
+            self._fill = remaining
+
+    def flush(self) -> Optional[memoryview]:
+        """
+        Emit the staged partial frame, truncated to a whole number of samples.
+
+        A trailing partial sample, if any, is discarded.
+
+        Returns:
+            The partial frame, or None when nothing complete is staged
+        """
+        aligned = self._fill - (self._fill % self.block_align)
+        if aligned == 0:
+            self._fill = 0
+            return None
+        frame = self._slot_view()[:aligned].toreadonly()
+        self._advance()
+        return frame
+
+    def reset(self) -> None:
+        """Drop any staged audio (e.g. after ``send_clear``)."""
+        self._fill = 0
+
+
+class RawFileSink:
+    """
+    Writes frames to a raw (headerless) audio file.
+
+    Args:
+        file: A path or a binary file object opened for writing
+    """
+
+    def __init__(self, file: Union[str, "os.PathLike[str]", IO[bytes]]):
+        if isinstance(file, (str, os.PathLike)):
+            self._file: IO[bytes] = open(file, "wb")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self.bytes_written = 0
+
+    def write(self, frame: memoryview) -> None:
+        """Write one frame."""
+        self._file.write(frame)
+        self.bytes_written += len(frame)
+
+    def close(self) -> None:
+        """Flush and close the file if this sink opened it."""
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+class WavFileSink:
+    """
+    Writes frames to a PCM WAV file.
+
+    The RIFF header sizes are patched when the sink is closed, so the output
+    can be any length. Only linear PCM can be written; store ``mulaw`` /
+    ``alaw`` audio with :class:`RawFileSink` instead.
+
+    Args:
+        file: A path or a seekable binary file object opened for writing
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+        encoding: ``"linear16"`` or ``"linear32"``
+
+    Raises:
+        ValueError: If the encoding is not linear PCM
+    """
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        sample_rate: int,
+        channels: int = 1,
+        encoding: str = "linear16",
+    ):
+        if encoding not in _WAV_ENCODINGS:
+            raise ValueError(
+                f"WAV output needs a linear PCM encoding ({', '.join(_WAV_ENCODINGS)}), got '{encoding}'; "
+                "write companded audio with RawFileSink"
+            )
+        self._wave = wave.open(os.fspath(file) if isinstance(file, os.PathLike) else file, "wb")
+        self._wave.setnchannels(channels)
+        self._wave.setsampwidth(SAMPLE_WIDTHS[encoding])
+        self._wave.setframerate(sample_rate)
+        self.bytes_written = 0
+
+    def write(self, frame: memoryview) -> None:
+        """Write one frame."""
+        self._wave.writeframesraw(frame)
+        self.bytes_written += len(frame)
+
+    def close(self) -> None:
+        """Finalize the WAV header and close the writer."""
+        self._wave.close()
+
+
+class SpeakAudioSink:
+    """
+    Routes binary audio from a speak socket client into a sink in fixed-size frames.
+
+    Attach it to a ``speak.v1`` or ``speak.v2`` socket client (sync or async); it
+    registers ``EventType.MESSAGE`` / ``EventType.CLOSE`` handlers, emits the
+    staged tail on every ``Flushed`` message, drops it on ``Cleared`` and closes
+    the sink when the connection closes.
+
+    Example:
+        with client.speak.v1.connect(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000) as socket:
+            sink = SpeakAudioSink(WavFileSink("out.wav", sample_rate=24000), sample_rate=24000)
+            sink.attach(socket)
+            socket.send_text(SpeakV1Text(text="Hello"))
+            socket.send_flush()
+            socket.start_listening()
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        *,
+        sample_rate: int,
+        encoding: str = "linear16",
+        channels: int = 1,
+        frame_duration_ms: int = 20,
+        close_sink: bool = True,
+    ):
+        """
+        Initialize the socket sink.
+
+        Args:
+            sink: Object with ``write(frame)`` and ``close()`` (e.g. WavFileSink, RawFileSink)
+            sample_rate: Sample rate requested on the socket
+            encoding: Encoding requested on the socket
+            channels: Number of interleaved channels
+            frame_duration_ms: Duration of each frame handed to the sink
+            close_sink: Close the sink when the socket closes
+        """
+        self._sink = sink
+        self._close_sink = close_sink
+        self._closed = False
+        self.assembler = AudioFrameAssembler.for_encoding(
+            encoding, sample_rate, channels=channels, frame_duration_ms=frame_duration_ms
+        )
+
+    def attach(self, socket_client: Any) -> "SpeakAudioSink":
+        """
+        Register this sink on a speak socket client. Returns self for chaining.
+
+        Args:
+            socket_client: A speak v1/v2 ``V1SocketClient`` / ``V2SocketClient`` (sync or async)
+
+        Returns:
+            Self for method chaining
+        """
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self.close())
+        return self
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            self.write(message)
+        elif getattr(message, "type", None) == "Flushed":
+            self.flush()
+        elif getattr(message, "type", None) == "Cleared":
+            self.assembler.reset()
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Feed raw audio and forward every completed frame to the sink."""
+        for frame in self.assembler.feed(data):
+            self._sink.write(frame)
+
+    def flush(self) -> None:
+        """Forward the staged partial frame to the sink."""
+        frame = self.assembler.flush()
+        if frame is not None:
+            self._sink.write(frame)
+
+    def close(self) -> None:
+        """Flush the tail and close the underlying sink (once)."""
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        if self._close_sink:
+            self._sink.close()
+
+
+def iter_audio_frames(socket_client: Any, assembler: AudioFrameAssembler) -> Iterator[memoryview]:
+    """
+    Iterate a sync speak socket client and yield fixed-size audio frames.
+
+    Non-audio messages are skipped; the staged tail is emitted on ``Flushed``
+    and when the connection closes.
+
+    Args:
+        socket_client: A sync speak ``V1SocketClient`` / ``V2SocketClient``
+        assembler: The assembler describing the stream format
+
+    Yields:
+        Sample-aligned ``memoryview`` frames
+    """
+    for message in socket_client:
+        if isinstance(message, bytes):
+            yield from assembler.feed(message)
+        elif getattr(message, "type", None) == "Flushed":
+            tail = assembler.flush()
+            if tail is not None:
+                yield tail
+    tail = assembler.flush()
+    if tail is not None:
+        yield tail
+
+
+async def aiter_audio_frames(socket_client: Any, assembler: AudioFrameAssembler) -> AsyncIterator[memoryview]:
+    """
+    Async analogue of :func:`iter_audio_frames` for ``AsyncV1SocketClient`` / ``AsyncV2SocketClient``.
+    """
+    async for message in socket_client:
+        if isinstance(message, bytes):
+            for frame in assembler.feed(message):
+                yield frame
+        elif getattr(message, "type", None) == "Flushed":
+            tail = assembler.flush()
+            if tail is not None:
+                yield tail
+    tail = assembler.flush()
+    if tail is not None:
+        yield tail
@@ -0,0 +1,351 @@
+"""
+Streamed TTS Response Policy
+
+Applies a default chunk size and an optional bounded background read-ahead to
+``speak.v1.audio.generate`` / ``speak.v2.audio.generate`` byte streams and
+exposes them through a ``readinto``-style API that fills caller-provided
+buffers.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Iterator, Optional, Union
+
+Buffer = Union[bytearray, memoryview]
+
+
+class AudioStreamPolicy:
+    """
+    Streaming policy shared by every ``audio.generate`` call made through it.
+
+    Example:
+        policy = AudioStreamPolicy(chunk_size=8192, read_ahead_bytes=256 * 1024)
+        buffer = bytearray(4096)
+        with policy.stream(client.speak.v1.audio, text="Hello", model="aura-2-thalia-en") as audio:
+            while (n := audio.readinto(buffer)):
+                sink.write(memoryview(buffer)[:n])
+    """
+
+    def __init__(self, *, chunk_size: Optional[int] = 8192, read_ahead_bytes: int = 0):
+        """
+        Initialize the policy.
+
+        Args:
+            chunk_size: Default ``chunk_size`` for ``iter_bytes`` when a call does not set one
+                (None keeps httpx's default of yielding data as it arrives)
+            read_ahead_bytes: Byte cap for the background read-ahead buffer (0 disables read-ahead)
+
+        Raises:
+            ValueError: If a value is negative or zero where not allowed
+        """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if read_ahead_bytes < 0:
+            raise ValueError("read_ahead_bytes must be non-negative")
+        self.chunk_size = chunk_size
+        self.read_ahead_bytes = read_ahead_bytes
+
+    def request_options(self, request_options: Optional[Any] = None) -> Any:
+        """Return ``request_options`` with the policy's default ``chunk_size`` filled in."""
+        options = dict(request_options or {})
+        if self.chunk_size is not None:
+            options.setdefault("chunk_size", self.chunk_size)
+        return options
+
+    def stream(self, audio_client: Any, **generate_kwargs: Any) -> "AudioStream":
+        """
+        Start a sync ``generate`` call under this policy.
+
+        Args:
+            audio_client: ``client.speak.v1.audio`` or ``client.speak.v2.audio``
+            **generate_kwargs: Arguments for ``generate`` (text, model, encoding, ...)
+
+        Returns:
+            An AudioStream (also usable as a context manager)
+        """
+        generate_kwargs["request_options"] = self.request_options(generate_kwargs.get("request_options"))
+        return AudioStream(audio_client.generate(**generate_kwargs), read_ahead_bytes=self.read_ahead_bytes)
+
+    def astream(self, audio_client: Any, **generate_kwargs: Any) -> "AsyncAudioStream":
+        """Async analogue of :meth:`stream` for ``AsyncDeepgramClient`` audio clients."""
+        generate_kwargs["request_options"] = self.request_options(generate_kwargs.get("request_options"))
+        return AsyncAudioStream(audio_client.generate(**generate_kwargs), read_ahead_bytes=self.read_ahead_bytes)
+
+
+class _ReadAhead:
+    """Background thread draining a byte iterator into a deque bounded by a byte cap."""
+
+    def __init__(self, source: Iterator[bytes], limit: int):
+        self._source = source
+        self._limit = limit
+        self._chunks: Deque[bytes] = deque()
+        self._buffered = 0
+        self._done = False
+        self._stopped = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="deepgram-audio-read-ahead", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for chunk in self._source:
+                with self._cond:
+                    # Always admit one chunk so a chunk larger than the cap cannot deadlock.
+                    while self._buffered >= self._limit and self._chunks and not self._stopped:
+                        self._cond.wait()
+                    if self._stopped:
+                        break
+                    self._chunks.append(chunk)
+                    self._buffered += len(chunk)
+                    self._cond.notify_all()
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered
+
+    def next_chunk(self) -> Optional[bytes]:
+        with self._cond:
+            while not self._chunks and not self._done:
+                self._cond.wait()
+            if self._chunks:
+                chunk = self._chunks.popleft()
+                self._buffered -= len(chunk)
+                self._cond.notify_all()
+                return chunk
+            if self._error is not None:
+                raise self._error
+            return None
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._chunks.clear()
+            self._buffered = 0
+            self._cond.notify_all()
+
+
+class AudioStream:
+    """
+    Sync streamed audio response with chunk iteration and ``readinto``.
+
+    Use either iteration or ``read`` / ``readinto`` on one stream, not both
+    interleaved with partially consumed chunks in between.
+    """
+
+    def __init__(self, source: Iterator[bytes], *, read_ahead_bytes: int = 0):
+        self._source = source
+        self._read_ahead = _ReadAhead(source, read_ahead_bytes) if read_ahead_bytes > 0 else None
+        self._pending = memoryview(b"")
+        self._eof = False
+        self.bytes_read = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes currently held by the read-ahead buffer."""
+        buffered = len(self._pending)
+        if self._read_ahead is not None:
+            buffered += self._read_ahead.buffered_bytes
+        return buffered
+
+    def _next_chunk(self) -> Optional[bytes]:
+        if self._eof:
+            return None
+        if self._read_ahead is not None:
+            chunk = self._read_ahead.next_chunk()
+        else:
+            chunk = next(self._source, None)
+        if chunk is None:
+            self._eof = True
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._pending:
+            pending = self._pending.tobytes()
+            self._pending = memoryview(b"")
+            self.bytes_read += len(pending)
+            yield pending
+        while True:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def readinto(self, buffer: Buffer) -> int:
+        """
+        Fill ``buffer`` with the next bytes of the stream.
+
+        Blocks until the buffer is full or the stream ends.
+
+        Args:
+            buffer: Writable bytes-like object to fill
+
+        Returns:
+            Number of bytes written (0 at end of stream)
+        """
+        target = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(target):
+            if not self._pending:
+                chunk = self._next_chunk()
+                if chunk is None:
+                    break
+                self._pending = memoryview(chunk)
+            take = min(len(self._pending), len(target) - filled)
+            target[filled : filled + take] = self._pending[:take]
+            self._pending = self._pending[take:]
+            filled += take
+        self.bytes_read += filled
+        return filled
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (all remaining bytes when negative)."""
+        if size < 0:
+            return b"".join(self)
+        buffer = bytearray(size)
+        return bytes(memoryview(buffer)[: self.readinto(buffer)])
+
+    def close(self) -> None:
+        """Stop reading and release the HTTP response."""
+        self._eof = True
+        if self._read_ahead is not None:
+            self._read_ahead.stop()
+        else:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+
+    def __enter__(self) -> "AudioStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncAudioStream:
+    """Async streamed audio response with chunk iteration and ``readinto``."""
+
+    def __init__(self, source: AsyncIterator[bytes], *, read_ahead_bytes: int = 0):
+        self._source = source
+        self._limit = read_ahead_bytes
+        self._chunks: Deque[bytes] = deque()
+        self._buffered = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._pending = memoryview(b"")
+        self._eof = False
+        self.bytes_read = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes currently held by the read-ahead buffer."""
+        return len(self._pending) + self._buffered
+
+    async def _fill(self) -> None:
+        assert self._cond is not None
+        try:
+            async for chunk in self._source:
+                async with self._cond:
+                    await self._cond.wait_for(lambda: self._buffered < self._limit or not self._chunks)
+                    self._chunks.append(chunk)
+                    self._buffered += len(chunk)
+                    self._cond.notify_all()
+        except Exception as exc:
+            self._error = exc
+        finally:
+            async with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        if self._eof:
+            return None
+        if self._limit <= 0:
+            try:
+                chunk: Optional[bytes] = await self._source.__anext__()
+            except StopAsyncIteration:
+                chunk = None
+        else:
+            if self._task is None:
+                self._cond = asyncio.Condition()
+                self._task = asyncio.ensure_future(self._fill())
+            assert self._cond is not None
+            async with self._cond:
+                await self._cond.wait_for(lambda: bool(self._chunks) or self._done)
+                if self._chunks:
+                    chunk = self._chunks.popleft()
+                    self._buffered -= len(chunk)
+                    self._cond.notify_all()
+                elif self._error is not None:
+                    raise self._error
+                else:
+                    chunk = None
+        if chunk is None:
+            self._eof = True
+        return chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._pending:
+            pending = self._pending.tobytes()
+            self._pending = memoryview(b"")
+            self.bytes_read += len(pending)
+            yield pending
+        while True:
+            chunk = await self._next_chunk()
+            if chunk is None:
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    async def readinto(self, buffer: Buffer) -> int:
+        """Fill ``buffer`` with the next bytes of the stream; returns 0 at end of stream."""
+        target = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(target):
+            if not self._pending:
+                chunk = await self._next_chunk()
+                if chunk is None:
+                    break
+                self._pending = memoryview(chunk)
+            take = min(len(self._pending), len(target) - filled)
+            target[filled : filled + take] = self._pending[:take]
+            self._pending = self._pending[take:]
+            filled += take
+        self.bytes_read += filled
+        return filled
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (all remaining bytes when negative)."""
+        if size < 0:
+            return b"".join([chunk async for chunk in self])
+        buffer = bytearray(size)
+        return bytes(memoryview(buffer)[: await self.readinto(buffer)])
+
+    async def aclose(self) -> None:
+        """Stop reading and release the HTTP response."""
+        self._eof = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        close = getattr(self._source, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self) -> "AsyncAudioStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
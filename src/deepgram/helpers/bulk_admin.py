@@ -0,0 +1,450 @@
+"""
+Bulk Project Administration
+
+Runs API key and member administration across many projects concurrently
+with a parallelism cap: creating and deleting keys, updating member scopes
+and rotating keys (create, distribute, delete the old key). Every call
+returns a per-item report, and keys created by a batch that fails midway can
+be removed again with compensating deletes.
+"""
+
+import asyncio
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+ROLLED_BACK = "rolled_back"
+SKIPPED = "skipped"
+
+KeyRequest = Mapping[str, Any]
+KeyRequests = Union[Iterable[str], Mapping[str, KeyRequest]]
+
+
+@dataclasses.dataclass
+class BulkItemResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    ``status`` is ``succeeded``, ``failed``, ``rolled_back`` (it succeeded but
+    was undone by a compensating delete) or ``skipped`` (not started because
+    the batch was stopped after a failure). ``cleaned_up`` is set on a failed
+    item whose partial work (such as a newly created key) was deleted again;
+    ``rollback_error`` holds the error when that cleanup failed.
+    """
+
+    operation: str
+    project_id: str
+    target: Optional[str] = None
+    status: str = SKIPPED
+    result: Any = None
+    error: Optional[BaseException] = None
+    rollback_error: Optional[BaseException] = None
+    cleaned_up: bool = False
+
+
+class BulkOperationError(Exception):
+    """Raised by :meth:`BulkReport.raise_for_failures` when any item failed."""
+
+    def __init__(self, report: "BulkReport"):
+        self.report = report
+        failed = report.failed
+        super().__init__(
+            f"{len(failed)} of {len(report.results)} items failed; first error: {failed[0].error!r}"
+            if failed
+            else "Bulk operation failed"
+        )
+
+
+@dataclasses.dataclass
+class BulkReport:
+    """Per-item results of a bulk operation, in input order."""
+
+    results: List[BulkItemResult]
+
+    def _with_status(self, status: str) -> List[BulkItemResult]:
+        return [item for item in self.results if item.status == status]
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        return self._with_status(SUCCEEDED)
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        return self._with_status(FAILED)
+
+    @property
+    def rolled_back(self) -> List[BulkItemResult]:
+        return self._with_status(ROLLED_BACK)
+
+    @property
+    def skipped(self) -> List[BulkItemResult]:
+        return self._with_status(SKIPPED)
+
+    @property
+    def ok(self) -> bool:
+        """True when every item succeeded."""
+        return all(item.status == SUCCEEDED for item in self.results)
+
+    def summary(self) -> Dict[str, int]:
+        """Number of items per status."""
+        counts = {SUCCEEDED: 0, FAILED: 0, ROLLED_BACK: 0, SKIPPED: 0}
+        for item in self.results:
+            counts[item.status] += 1
+        return counts
+
+    def raise_for_failures(self) -> "BulkReport":
+        """
+        Return the report, or raise if any item failed.
+
+        Raises:
+            BulkOperationError: If any item failed
+        """
+        if self.failed:
+            raise BulkOperationError(self)
+        return self
+
+
+def _key_requests(projects: KeyRequests, request: Optional[KeyRequest]) -> List[Tuple[str, KeyRequest]]:
+    if isinstance(projects, Mapping):
+        return [(project_id, body) for project_id, body in projects.items()]
+    if request is None:
+        raise ValueError("request is required when projects is not a mapping of project id to request")
+    return [(project_id, request) for project_id in projects]
+
+
+def _key_id(created: Any) -> Optional[str]:
+    return getattr(created, "api_key_id", None)
+
+
+def _projects_client(client: Any) -> Any:
+    manage = getattr(client, "manage", None)
+    return manage.v1.projects if manage is not None else client
+
+
+class BulkProjectAdmin:
+    """
+    Concurrent key and member administration for a ``DeepgramClient``.
+
+    At most ``concurrency`` requests run at a time. With ``stop_on_failure``
+    (always on for :meth:`create_keys` with ``rollback``), items that have
+    not started when an item fails are reported as ``skipped``.
+
+    Example:
+        admin = BulkProjectAdmin(client, concurrency=16)
+        report = admin.rotate_keys(
+            old_keys,  # {project_id: old_key_id}
+            request={"comment": "rotated", "scopes": ["usage:write"]},
+            distribute=lambda project_id, key: vault.put(project_id, key.key),
+        )
+        report.raise_for_failures()
+    """
+
+    def __init__(self, client: Any, *, concurrency: int = 8):
+        """
+        Args:
+            client: ``DeepgramClient`` or ``client.manage.v1.projects``
+            concurrency: Maximum number of requests in flight
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._projects = _projects_client(client)
+        self.concurrency = concurrency
+
+    def _run(
+        self,
+        items: Sequence[BulkItemResult],
+        step: Callable[[BulkItemResult], None],
+        stop_on_failure: bool,
+    ) -> BulkReport:
+        stop = threading.Event()
+
+        def _one(item: BulkItemResult) -> None:
+            if stop.is_set():
+                return
+            try:
+                step(item)
+                if item.status == SKIPPED:
+                    item.status = SUCCEEDED
+            except Exception as exc:
+                item.status, item.error = FAILED, exc
+            if item.status == FAILED and stop_on_failure:
+                stop.set()
+
+        if items:
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(items)), thread_name_prefix="deepgram-bulk"
+            ) as pool:
+                list(pool.map(_one, items))
+        return BulkReport(list(items))
+
+    def _compensate(self, items: Iterable[BulkItemResult], **kwargs: Any) -> None:
+        def _delete(item: BulkItemResult) -> None:
+            try:
+                self._projects.keys.delete(item.project_id, item.target, **kwargs)
+                item.status = ROLLED_BACK
+            except Exception as exc:
+                item.rollback_error = exc
+
+        created = [item for item in items if item.status == SUCCEEDED and item.target]
+        if created:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(created))) as pool:
+                list(pool.map(_delete, created))
+
+    def create_keys(
+        self,
+        projects: KeyRequests,
+        request: Optional[KeyRequest] = None,
+        *,
+        rollback: bool = False,
+        **kwargs: Any,
+    ) -> BulkReport:
+        """
+        Create one API key per project.
+
+        Args:
+            projects: Project ids (all using ``request``) or ``{project_id: request}``;
+                a project id listed twice gets two keys
+            request: ``keys.create`` request body shared by all projects
+            rollback: If any creation fails, stop starting new ones and delete
+                the keys this call created
+            **kwargs: Other ``keys.create`` arguments (``request_options``)
+
+        Returns:
+            BulkReport whose ``result`` values are ``CreateKeyV1Response`` and
+            whose ``target`` is the new key id
+        """
+        pairs = [
+            (BulkItemResult("create_key", project_id), body) for project_id, body in _key_requests(projects, request)
+        ]
+        body_of = {id(item): body for item, body in pairs}
+
+        def _create(item: BulkItemResult) -> None:
+            item.result = self._projects.keys.create(item.project_id, request=body_of[id(item)], **kwargs)
+            item.target = _key_id(item.result)
+
+        report = self._run([item for item, _ in pairs], _create, stop_on_failure=rollback)
+        if rollback and report.failed:
+            self._compensate(report.results, **kwargs)
+        return report
+
+    def delete_keys(
+        self, keys: Iterable[Tuple[str, str]], *, stop_on_failure: bool = False, **kwargs: Any
+    ) -> BulkReport:
+        """
+        Delete API keys.
+
+        Args:
+            keys: ``(project_id, key_id)`` pairs
+            stop_on_failure: Skip keys not yet started once a deletion fails
+            **kwargs: Other ``keys.delete`` arguments (``request_options``)
+        """
+        items = [BulkItemResult("delete_key", project_id, key_id) for project_id, key_id in keys]
+
+        def _delete(item: BulkItemResult) -> None:
+            item.result = self._projects.keys.delete(item.project_id, item.target, **kwargs)
+
+        return self._run(items, _delete, stop_on_failure)
+
+    def update_member_scopes(
+        self, updates: Iterable[Tuple[str, str, str]], *, stop_on_failure: bool = False, **kwargs: Any
+    ) -> BulkReport:
+        """
+        Update member scopes.
+
+        Args:
+            updates: ``(project_id, member_id, scope)`` triples
+            stop_on_failure: Skip updates not yet started once one fails
+            **kwargs: Other ``members.scopes.update`` arguments (``request_options``)
+        """
+        pairs = [
+            (BulkItemResult("update_scope", project_id, member_id), scope) for project_id, member_id, scope in updates
+        ]
+        scope_of = {id(item): scope for item, scope in pairs}
+
+        def _update(item: BulkItemResult) -> None:
+            item.result = self._projects.members.scopes.update(
+                item.project_id, item.target, scope=scope_of[id(item)], **kwargs
+            )
+
+        return self._run([item for item, _ in pairs], _update, stop_on_failure)
+
+    def rotate_keys(
+        self,
+        old_keys: Mapping[str, str],
+        *,
+        request: KeyRequest,
+        distribute: Callable[[str, Any], None],
+        **kwargs: Any,
+    ) -> BulkReport:
+        """
+        Replace one key per project: create a new key, hand it to ``distribute``, then delete the old key.
+
+        If creating the key fails nothing changes. If ``distribute`` raises,
+        the item is ``failed``, the old key is kept and the new key is deleted
+        again (``cleaned_up`` when that delete worked, ``rollback_error``
+        otherwise). If deleting the old key fails the item is ``failed`` but
+        the new key stays in place, since it has already been distributed.
+
+        Args:
+            old_keys: ``{project_id: key_id}`` of the keys to replace
+            request: ``keys.create`` body for the new keys
+            distribute: Called with ``(project_id, CreateKeyV1Response)``
+            **kwargs: Other ``keys.create`` / ``keys.delete`` arguments (``request_options``)
+        """
+        items = [BulkItemResult("rotate_key", project_id, key_id) for project_id, key_id in old_keys.items()]
+
+        def _rotate(item: BulkItemResult) -> None:
+            created = self._projects.keys.create(item.project_id, request=request, **kwargs)
+            item.result = created
+            try:
+                distribute(item.project_id, created)
+            except Exception as exc:
+                item.status, item.error = FAILED, exc
+                try:
+                    self._projects.keys.delete(item.project_id, _key_id(created), **kwargs)
+                    item.cleaned_up = True
+                except Exception as rollback_exc:
+                    item.rollback_error = rollback_exc
+                return
+            self._projects.keys.delete(item.project_id, item.target, **kwargs)
+
+        return self._run(items, _rotate, stop_on_failure=False)
+
+
+class AsyncBulkProjectAdmin:
+    """Async counterpart of :class:`BulkProjectAdmin` for ``AsyncDeepgramClient``."""
+
+    def __init__(self, client: Any, *, concurrency: int = 8):
+        """
+        Args:
+            client: ``AsyncDeepgramClient`` or ``client.manage.v1.projects``
+            concurrency: Maximum number of requests in flight
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._projects = _projects_client(client)
+        self.concurrency = concurrency
+
+    async def _run(
+        self,
+        items: Sequence[BulkItemResult],
+        step: Callable[[BulkItemResult], Awaitable[None]],
+        stop_on_failure: bool,
+    ) -> BulkReport:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stop = asyncio.Event()
+
+        async def _one(item: BulkItemResult) -> None:
+            async with semaphore:
+                if stop.is_set():
+                    return
+                try:
+                    await step(item)
+                    if item.status == SKIPPED:
+                        item.status = SUCCEEDED
+                except Exception as exc:
+                    item.status, item.error = FAILED, exc
+                if item.status == FAILED and stop_on_failure:
+                    stop.set()
+
+        await asyncio.gather(*(_one(item) for item in items))
+        return BulkReport(list(items))
+
+    async def _compensate(self, items: Iterable[BulkItemResult], **kwargs: Any) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _delete(item: BulkItemResult) -> None:
+            async with semaphore:
+                try:
+                    await self._projects.keys.delete(item.project_id, item.target, **kwargs)
+                    item.status = ROLLED_BACK
+                except Exception as exc:
+                    item.rollback_error = exc
+
+        await asyncio.gather(*(_delete(item) for item in items if item.status == SUCCEEDED and item.target))
+
+    async def create_keys(
+        self,
+        projects: KeyRequests,
+        request: Optional[KeyRequest] = None,
+        *,
+        rollback: bool = False,
+        **kwargs: Any,
+    ) -> BulkReport:
+        """Async variant of :meth:`BulkProjectAdmin.create_keys`."""
+        pairs = [
+            (BulkItemResult("create_key", project_id), body) for project_id, body in _key_requests(projects, request)
+        ]
+        body_of = {id(item): body for item, body in pairs}
+
+        async def _create(item: BulkItemResult) -> None:
+            item.result = await self._projects.keys.create(item.project_id, request=body_of[id(item)], **kwargs)
+            item.target = _key_id(item.result)
+
+        report = await self._run([item for item, _ in pairs], _create, stop_on_failure=rollback)
+        if rollback and report.failed:
+            await self._compensate(report.results, **kwargs)
+        return report
+
+    async def delete_keys(
+        self, keys: Iterable[Tuple[str, str]], *, stop_on_failure: bool = False, **kwargs: Any
+    ) -> BulkReport:
+        """Async variant of :meth:`BulkProjectAdmin.delete_keys`."""
+        items = [BulkItemResult("delete_key", project_id, key_id) for project_id, key_id in keys]
+
+        async def _delete(item: BulkItemResult) -> None:
+            item.result = await self._projects.keys.delete(item.project_id, item.target, **kwargs)
+
+        return await self._run(items, _delete, stop_on_failure)
+
+    async def update_member_scopes(
+        self, updates: Iterable[Tuple[str, str, str]], *, stop_on_failure: bool = False, **kwargs: Any
+    ) -> BulkReport:
+        """Async variant of :meth:`BulkProjectAdmin.update_member_scopes`."""
+        pairs = [
+            (BulkItemResult("update_scope", project_id, member_id), scope) for project_id, member_id, scope in updates
+        ]
+        scope_of = {id(item): scope for item, scope in pairs}
+
+        async def _update(item: BulkItemResult) -> None:
+            item.result = await self._projects.members.scopes.update(
+                item.project_id, item.target, scope=scope_of[id(item)], **kwargs
+            )
+
+        return await self._run([item for item, _ in pairs], _update, stop_on_failure)
+
+    async def rotate_keys(
+        self,
+        old_keys: Mapping[str, str],
+        *,
+        request: KeyRequest,
+        distribute: Callable[[str, Any], Any],
+        **kwargs: Any,
+    ) -> BulkReport:
+        """
+        Async variant of :meth:`BulkProjectAdmin.rotate_keys`; ``distribute``
+        may be a coroutine function.
+        """
+        items = [BulkItemResult("rotate_key", project_id, key_id) for project_id, key_id in old_keys.items()]
+
+        async def _rotate(item: BulkItemResult) -> None:
+            created = await self._projects.keys.create(item.project_id, request=request, **kwargs)
+            item.result = created
+            try:
+                distributed = distribute(item.project_id, created)
+                if asyncio.iscoroutine(distributed):
+                    await distributed
+            except Exception as exc:
+                item.status, item.error = FAILED, exc
+                try:
+                    await self._projects.keys.delete(item.project_id, _key_id(created), **kwargs)
+                    item.cleaned_up = True
+                except Exception as rollback_exc:
+                    item.rollback_error = rollback_exc
+                return
+            await self._projects.keys.delete(item.project_id, item.target, **kwargs)
+
+        return await self._run(items, _rotate, stop_on_failure=False)
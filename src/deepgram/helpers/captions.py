@@ -0,0 +1,335 @@
+"""
+SRT / WebVTT Captions
+
+Turns word timings into caption cues in a single pass, from either a
+pre-recorded ``listen.v1.media.transcribe_*`` response or a live stream of
+``listen.v1`` ``Results`` (or ``listen.v2`` ``TurnInfo``) messages. Cues are
+yielded as soon as they are complete and can be rendered to SRT and WebVTT
+without walking the transcript again.
+"""
+
+import dataclasses
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional
+
+from ..core.events import EventType
+from ._utils import get_field
+
+_SPEAKER_LABEL_MODES = ("none", "change", "always")
+
+
+@dataclasses.dataclass
+class CaptionCue:
+    """One caption cue: numbered, timed, wrapped text with an optional speaker label."""
+
+    index: int
+    start: float
+    end: float
+    lines: List[str]
+    speaker: Optional[int] = None
+    label: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """The cue's lines joined with newlines."""
+        return "\n".join(self.lines)
+
+
+class CaptionBuilder:
+    """
+    Incrementally groups words into caption cues.
+
+    Words are added in time order. A cue is completed (and returned from the
+    call that completed it) when the next word:
+
+    - does not fit: lines are wrapped greedily at ``max_line_length``
+      characters and a cue holds at most ``max_lines`` lines
+    - would make the cue longer than ``max_cue_duration`` seconds
+    - follows a pause longer than ``max_gap`` seconds
+    - is spoken by a different speaker
+
+    A final ``listen.v1`` result with ``speech_final``, an ``UtteranceEnd``
+    and a Flux ``EndOfTurn`` also complete the current cue, as does
+    :meth:`flush`. Each word is handled once, so building captions is linear
+    in the number of words.
+
+    Speaker labels (``speaker_format`` filled with the speaker number) are
+    added to the first cue of every speaker change with
+    ``speaker_labels="change"``, to every cue with ``"always"``, or never with
+    ``"none"``. They are only available when the transcript was diarized, and
+    do not count towards the line length.
+
+    Example:
+        builder = CaptionBuilder(max_line_length=32)
+        builder.attach(connection, on_cue=lambda cue: out.write(format_webvtt_cue(cue)))
+    """
+
+    def __init__(
+        self,
+        *,
+        max_line_length: int = 42,
+        max_lines: int = 2,
+        max_cue_duration: float = 7.0,
+        max_gap: float = 1.5,
+        speaker_labels: str = "change",
+        speaker_format: str = "Speaker {speaker}",
+    ):
+        """
+        Initialize the builder.
+
+        Args:
+            max_line_length: Maximum characters per line (a longer single word gets a line of its own)
+            max_lines: Maximum lines per cue
+            max_cue_duration: Maximum seconds from the first word's start to the last word's end
+            max_gap: Pause in seconds between words that starts a new cue
+            speaker_labels: ``"change"``, ``"always"`` or ``"none"``
+            speaker_format: Label format; ``{speaker}`` is replaced with the speaker number
+
+        Raises:
+            ValueError: If a limit is not positive or the label mode is unknown
+        """
+        if max_line_length < 1 or max_lines < 1 or max_cue_duration <= 0 or max_gap < 0:
+            raise ValueError("line length, line count and cue duration must be positive and max_gap non-negative")
+        if speaker_labels not in _SPEAKER_LABEL_MODES:
+            raise ValueError(f"speaker_labels must be one of: {', '.join(_SPEAKER_LABEL_MODES)}")
+        self.max_line_length = max_line_length
+        self.max_lines = max_lines
+        self.max_cue_duration = max_cue_duration
+        self.max_gap = max_gap
+        self.speaker_labels = speaker_labels
+        self.speaker_format = speaker_format
+        self.cues_emitted = 0
+        self._cue: Optional[CaptionCue] = None
+        self._line_length = 0
+        self._last_speaker: Optional[int] = None
+
+    def add_word(self, text: str, start: float, end: float, speaker: Optional[int] = None) -> List[CaptionCue]:
+        """
+        Add one word.
+
+        Returns:
+            The cue completed by this word, if any (as a list of zero or one cues)
+        """
+        if not text:
+            return []
+        completed: List[CaptionCue] = []
+        cue = self._cue
+        if cue is not None and (
+            (speaker is not None and cue.speaker is not None and speaker != cue.speaker)
+            or start - cue.end > self.max_gap
+            or end - cue.start > self.max_cue_duration
+        ):
+            completed = self.flush()
+            cue = None
+        if cue is not None and self._line_length + 1 + len(text) > self.max_line_length:
+            if len(cue.lines) >= self.max_lines:
+                completed = self.flush()
+                cue = None
+            else:
+                cue.lines.append(text)
+                self._line_length = len(text)
+                cue.end = max(cue.end, end)
+                return completed
+        if cue is None:
+            self._open(text, start, end, speaker)
+        else:
+            cue.lines[-1] += " " + text
+            self._line_length += 1 + len(text)
+            cue.end = max(cue.end, end)
+        return completed
+
+    def flush(self) -> List[CaptionCue]:
+        """Complete and return the current cue, if any."""
+        cue, self._cue = self._cue, None
+        if cue is None:
+            return []
+        self.cues_emitted += 1
+        return [cue]
+
+    def add_message(self, message: Any) -> List[CaptionCue]:
+        """
+        Add the final words of one socket message.
+
+        Handles ``listen.v1`` ``Results`` (interim results are ignored) and
+        ``UtteranceEnd``, and ``listen.v2`` ``TurnInfo`` ``EndOfTurn`` events.
+
+        Returns:
+            The cues completed by the message
+        """
+        message_type = get_field(message, "type")
+        if message_type == "Results":
+            if not get_field(message, "is_final"):
+                return []
+            alternatives = get_field(get_field(message, "channel"), "alternatives") or []
+            words = (get_field(alternatives[0], "words") or []) if alternatives else []
+            completed = self._add_words(words)
+            if get_field(message, "speech_final"):
+                completed += self.flush()
+            return completed
+        if message_type == "UtteranceEnd":
+            return self.flush()
+        if message_type == "TurnInfo" and get_field(message, "event") == "EndOfTurn":
+            window_start = float(get_field(message, "audio_window_start") or 0.0)
+            window_end = float(get_field(message, "audio_window_end") or window_start)
+            return self._add_words(get_field(message, "words") or [], window_start, window_end) + self.flush()
+        return []
+
+    def attach(self, socket_client: Any, on_cue: Callable[[CaptionCue], Any]) -> "CaptionBuilder":
+        """
+        Build captions from a listen socket's messages. Returns self for chaining.
+
+        Args:
+            socket_client: ``listen.v1`` or ``listen.v2`` socket client (sync or async)
+            on_cue: Called with each completed cue; the last cue is delivered when the socket closes
+        """
+
+        def handle(message: Any) -> None:
+            for cue in self.add_message(message):
+                on_cue(cue)
+
+        def close(_: Any) -> None:
+            for cue in self.flush():
+                on_cue(cue)
+
+        for message_type in ("Results", "UtteranceEnd", "TurnInfo"):
+            socket_client.on(message_type, handle)
+        socket_client.on(EventType.CLOSE, close)
+        return self
+
+    def _add_words(
+        self, words: Iterable[Any], default_start: float = 0.0, default_end: float = 0.0
+    ) -> List[CaptionCue]:
+        completed: List[CaptionCue] = []
+        for word in words:
+            start = get_field(word, "start")
+            end = get_field(word, "end")
+            completed += self.add_word(
+                get_field(word, "punctuated_word") or get_field(word, "word") or "",
+                default_start if start is None else float(start),
+                default_end if end is None else float(end),
+                get_field(word, "speaker"),
+            )
+        return completed
+
+    def _open(self, text: str, start: float, end: float, speaker: Optional[int]) -> None:
+        label = None
+        if speaker is not None and (
+            self.speaker_labels == "always" or (self.speaker_labels == "change" and speaker != self._last_speaker)
+        ):
+            label = self.speaker_format.format(speaker=speaker)
+        if speaker is not None:
+            self._last_speaker = speaker
+        self._cue = CaptionCue(
+            index=self.cues_emitted + 1, start=start, end=end, lines=[text], speaker=speaker, label=label
+        )
+        self._line_length = len(text)
+
+
+def response_captions(response: Any, *, channel: int = 0, **options: Any) -> Iterator[CaptionCue]:
+    """
+    Yield caption cues for a pre-recorded transcription response.
+
+    Uses the response's utterances when it has them (``utterances=True``;
+    every utterance starts a new cue) and the words of the channel's first
+    alternative otherwise.
+
+    Args:
+        response: ``ListenV1Response`` (or its dict form) from ``listen.v1.media.transcribe_*``
+        channel: Channel to caption for multichannel audio
+        **options: :class:`CaptionBuilder` options
+
+    Raises:
+        ValueError: If the response has no results (for example a callback acknowledgement)
+    """
+    results = get_field(response, "results")
+    if results is None:
+        raise ValueError("response has no results to caption")
+    builder = CaptionBuilder(**options)
+    utterances = get_field(results, "utterances")
+    if utterances:
+        for utterance in utterances:
+            utterance_channel = get_field(utterance, "channel")
+            if utterance_channel is not None and utterance_channel != channel:
+                continue
+            words = get_field(utterance, "words") or []
+            start = float(get_field(utterance, "start") or 0.0)
+            yield from builder._add_words(words, start, float(get_field(utterance, "end") or start))
+            yield from builder.flush()
+        return
+    channels = get_field(results, "channels") or []
+    alternatives = get_field(channels[channel], "alternatives") if channel < len(channels) else None
+    if alternatives:
+        yield from builder._add_words(get_field(alternatives[0], "words") or [])
+    yield from builder.flush()
+
+
+def stream_captions(messages: Iterable[Any], **options: Any) -> Iterator[CaptionCue]:
+    """
+    Yield caption cues from live socket messages as soon as each cue is complete.
+
+    Args:
+        messages: Iterable of socket messages, such as a ``listen.v1`` socket client
+        **options: :class:`CaptionBuilder` options
+    """
+    builder = CaptionBuilder(**options)
+    for message in messages:
+        yield from builder.add_message(message)
+    yield from builder.flush()
+
+
+async def astream_captions(messages: AsyncIterable[Any], **options: Any) -> AsyncIterator[CaptionCue]:
+    """Async counterpart of :func:`stream_captions` for async socket clients and async iterables."""
+    builder = CaptionBuilder(**options)
+    async for message in messages:
+        for cue in builder.add_message(message):
+            yield cue
+    for cue in builder.flush():
+        yield cue
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def format_srt_cue(cue: CaptionCue) -> str:
+    """Render one cue as an SRT block (ending with a blank line)."""
+    lines = list(cue.lines)
+    if cue.label:
+        lines[0] = f"[{cue.label}] {lines[0]}"
+    timing = f"{_timestamp(cue.start, ',')} --> {_timestamp(cue.end, ',')}"
+    return f"{cue.index}\n{timing}\n" + "\n".join(lines) + "\n\n"
+
+
+def format_webvtt_cue(cue: CaptionCue) -> str:
+    """Render one cue as a WebVTT block (ending with a blank line); labels become voice spans."""
+    lines = [line.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") for line in cue.lines]
+    if cue.label:
+        lines[0] = f"<v {cue.label}>{lines[0]}"
+    timing = f"{_timestamp(cue.start, '.')} --> {_timestamp(cue.end, '.')}"
+    return f"{cue.index}\n{timing}\n" + "\n".join(lines) + "\n\n"
+
+
+def srt_blocks(cues: Iterable[CaptionCue]) -> Iterator[str]:
+    """Yield the SRT text of each cue, for writing captions as they are produced."""
+    for cue in cues:
+        yield format_srt_cue(cue)
+
+
+def webvtt_blocks(cues: Iterable[CaptionCue]) -> Iterator[str]:
+    """Yield the WebVTT header and then the text of each cue."""
+    yield "WEBVTT\n\n"
+    for cue in cues:
+        yield format_webvtt_cue(cue)
+
+
+def to_srt(cues: Iterable[CaptionCue]) -> str:
+    """Render cues as an SRT document."""
+    return "".join(srt_blocks(cues))
+
+
+def to_webvtt(cues: Iterable[CaptionCue]) -> str:
+    """Render cues as a WebVTT document."""
+    return "".join(webvtt_blocks(cues))
@@ -0,0 +1,298 @@
+"""
+Flux Threshold Auto-Tuning
+
+Adjusts the end-of-turn thresholds of a Flux (``listen.v2``) connection
+mid-session with ``send_configure``. The tuner watches how often an
+``EagerEndOfTurn`` is followed by ``TurnResumed`` (speculative work that was
+thrown away) and how much audio passes between the last word and
+``EndOfTurn``, and moves ``eager_eot_threshold`` / ``eot_threshold`` in small
+steps within the configured bounds.
+"""
+
+import dataclasses
+import statistics
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ._utils import get_field
+
+_EAGER_RANGE = (0.3, 0.9)
+_EOT_RANGE = (0.5, 0.9)
+
+
+def _check_bounds(name: str, bounds: Tuple[float, float], valid: Tuple[float, float]) -> Tuple[float, float]:
+    low, high = bounds
+    if not valid[0] <= low <= high <= valid[1]:
+        raise ValueError(f"{name} must satisfy {valid[0]} <= low <= high <= {valid[1]}")
+    return low, high
+
+
+@dataclasses.dataclass
+class FluxTuningStats:
+    """Counters and the latest measurements of a ``FluxThresholdTuner``."""
+
+    turns: int = 0
+    eager: int = 0
+    resumed: int = 0
+    configures_sent: int = 0
+    configures_applied: int = 0
+    configures_failed: int = 0
+    wasted_rate: Optional[float] = None
+    eot_latency_ms: Optional[float] = None
+    history: List[Dict[str, float]] = dataclasses.field(default_factory=list)
+
+
+class _ThresholdState:
+    def __init__(
+        self,
+        *,
+        eot_threshold: float,
+        eager_eot_threshold: Optional[float],
+        eot_bounds: Tuple[float, float],
+        eager_bounds: Tuple[float, float],
+        target_wasted_rate: float,
+        target_eot_latency_ms: float,
+        window: int,
+        step: float,
+    ):
+        if window < 1 or step <= 0:
+            raise ValueError("window must be at least 1 and step positive")
+        if not 0 < target_wasted_rate < 1:
+            raise ValueError("target_wasted_rate must be between 0 and 1")
+        self.eot_bounds = _check_bounds("eot_bounds", eot_bounds, _EOT_RANGE)
+        self.eager_bounds = _check_bounds("eager_bounds", eager_bounds, _EAGER_RANGE)
+        self.thresholds: Dict[str, float] = {"eot_threshold": eot_threshold}
+        if eager_eot_threshold is not None:
+            self.thresholds["eager_eot_threshold"] = eager_eot_threshold
+        self.target_wasted_rate = target_wasted_rate
+        self.target_eot_latency_ms = target_eot_latency_ms
+        self.window = window
+        self.step = step
+        self.stats = FluxTuningStats()
+        self._pending: Optional[Dict[str, float]] = None
+        self._turns_since_evaluation = 0
+        self._eager_in_turn = False
+        self._eager_outcomes: Deque[bool] = deque(maxlen=window * 2)
+        self._latencies: Deque[float] = deque(maxlen=window * 2)
+
+    def _on_turn_info(self, message: Any) -> Optional[Dict[str, Any]]:
+        """Record a TurnInfo message; returns a Configure message to send, if any."""
+        event = get_field(message, "event")
+        if event == "EagerEndOfTurn":
+            self.stats.eager += 1
+            self._eager_in_turn = True
+        elif event == "TurnResumed" and self._eager_in_turn:
+            self.stats.resumed += 1
+            self._eager_outcomes.append(False)
+            self._eager_in_turn = False
+        elif event == "EndOfTurn":
+            self.stats.turns += 1
+            if self._eager_in_turn:
+                self._eager_outcomes.append(True)
+                self._eager_in_turn = False
+            latency = self._eot_latency_ms(message)
+            if latency is not None:
+                self._latencies.append(latency)
+            self._turns_since_evaluation += 1
+            if self._turns_since_evaluation >= self.window and self._pending is None:
+                self._turns_since_evaluation = 0
+                return self._evaluate()
+        return None
+
+    @staticmethod
+    def _eot_latency_ms(message: Any) -> Optional[float]:
+        words = get_field(message, "words") or []
+        window_end = get_field(message, "audio_window_end")
+        last_end = get_field(words[-1], "end") if words else None
+        if window_end is None or last_end is None:
+            return None
+        return max(0.0, (float(window_end) - float(last_end)) * 1000.0)
+
+    def _evaluate(self) -> Optional[Dict[str, Any]]:
+        proposed = dict(self.thresholds)
+        if self._eager_outcomes and "eager_eot_threshold" in proposed:
+            wasted = self._eager_outcomes.count(False) / len(self._eager_outcomes)
+            self.stats.wasted_rate = wasted
+            eager = proposed["eager_eot_threshold"]
+            if wasted > self.target_wasted_rate:
+                eager += self.step
+            elif wasted < self.target_wasted_rate / 2:
+                eager -= self.step
+            proposed["eager_eot_threshold"] = eager
+        if self._latencies:
+            latency = statistics.median(self._latencies)
+            self.stats.eot_latency_ms = latency
+            eot = proposed["eot_threshold"]
+            if latency > self.target_eot_latency_ms:
+                eot -= self.step
+            elif latency < self.target_eot_latency_ms / 2:
+                eot += self.step
+            proposed["eot_threshold"] = eot
+        proposed = self._clamp(proposed)
+        if all(abs(proposed[name] - self.thresholds[name]) < 1e-9 for name in proposed):
+            return None
+        self._pending = proposed
+        self.stats.configures_sent += 1
+        return {"type": "Configure", "thresholds": dict(proposed)}
+
+    def _clamp(self, thresholds: Dict[str, float]) -> Dict[str, float]:
+        low, high = self.eot_bounds
+        eot = round(min(max(thresholds["eot_threshold"], low), high), 4)
+        clamped = {"eot_threshold": eot}
+        if "eager_eot_threshold" in thresholds:
+            low, high = self.eager_bounds
+            # An eager end of turn must fire before the end of turn it anticipates.
+            clamped["eager_eot_threshold"] = round(min(max(thresholds["eager_eot_threshold"], low), high, eot), 4)
+        return clamped
+
+    def _on_configure_success(self, message: Any) -> None:
+        applied = get_field(message, "thresholds")
+        pending, self._pending = self._pending, None
+        for name in ("eot_threshold", "eager_eot_threshold"):
+            value = get_field(applied, name) if applied is not None else None
+            if value is None and pending is not None:
+                value = pending.get(name)
+            if value is not None and (name in self.thresholds or name in (pending or {})):
+                self.thresholds[name] = float(value)
+        self.stats.configures_applied += 1
+        self.stats.history.append(dict(self.thresholds))
+        # Measure the new thresholds on fresh data only.
+        self._eager_outcomes.clear()
+        self._latencies.clear()
+
+    def _on_configure_failure(self, message: Any) -> None:
+        self._pending = None
+        self.stats.configures_failed += 1
+
+
+class FluxThresholdTuner(_ThresholdState):
+    """
+    Tunes the thresholds of a sync ``listen.v2`` ``V2SocketClient`` while it runs.
+
+    After every ``window`` completed turns the tuner evaluates the recent
+    turns and, when a change is warranted, sends one ``Configure`` message:
+
+    - ``eager_eot_threshold`` goes up by ``step`` when more than
+      ``target_wasted_rate`` of eager end-of-turn events were resumed, and
+      down when fewer than half of that were
+    - ``eot_threshold`` goes down by ``step`` when the median time between
+      the last word and ``EndOfTurn`` exceeds ``target_eot_latency_ms``, and
+      up when it is below half of it
+
+    Values stay within the bounds (and the API's valid ranges), and
+    ``eager_eot_threshold`` never exceeds ``eot_threshold``. The current
+    thresholds are only replaced when ``ConfigureSuccess`` confirms them; a
+    ``ConfigureFailure`` keeps the previous values. The eager threshold is
+    only tuned when the connection was opened with one.
+
+    Example:
+        with client.listen.v2.connect(model="flux-general-en", encoding="linear16", sample_rate=16000,
+                                      eot_threshold=0.7, eager_eot_threshold=0.5) as connection:
+            tuner = FluxThresholdTuner(eot_threshold=0.7, eager_eot_threshold=0.5).attach(connection)
+            connection.start_listening()
+        print(tuner.thresholds, tuner.stats.history)
+    """
+
+    def __init__(
+        self,
+        *,
+        eot_threshold: float = 0.7,
+        eager_eot_threshold: Optional[float] = None,
+        eot_bounds: Tuple[float, float] = _EOT_RANGE,
+        eager_bounds: Tuple[float, float] = _EAGER_RANGE,
+        target_wasted_rate: float = 0.3,
+        target_eot_latency_ms: float = 600.0,
+        window: int = 10,
+        step: float = 0.05,
+    ):
+        """
+        Initialize the tuner.
+
+        Args:
+            eot_threshold: ``eot_threshold`` the connection was opened with
+            eager_eot_threshold: ``eager_eot_threshold`` the connection was opened with, if any
+            eot_bounds: Range the tuner may move ``eot_threshold`` in (within 0.5 - 0.9)
+            eager_bounds: Range the tuner may move ``eager_eot_threshold`` in (within 0.3 - 0.9)
+            target_wasted_rate: Acceptable share of eager end-of-turn events that are resumed
+            target_eot_latency_ms: Acceptable median audio time between the last word and EndOfTurn
+            window: Completed turns between evaluations
+            step: Threshold change per adjustment
+        """
+        super().__init__(
+            eot_threshold=eot_threshold,
+            eager_eot_threshold=eager_eot_threshold,
+            eot_bounds=eot_bounds,
+            eager_bounds=eager_bounds,
+            target_wasted_rate=target_wasted_rate,
+            target_eot_latency_ms=target_eot_latency_ms,
+            window=window,
+            step=step,
+        )
+        self._socket: Any = None
+
+    def attach(self, socket_client: Any) -> "FluxThresholdTuner":
+        """
+        Observe a ``listen.v2`` socket and send ``Configure`` messages on it. Returns self for chaining.
+
+        Args:
+            socket_client: ``V2SocketClient`` from ``listen.v2.connect``
+        """
+        self._socket = socket_client
+        socket_client.on("TurnInfo", self.on_turn_info)
+        socket_client.on("ConfigureSuccess", self._on_configure_success)
+        socket_client.on("ConfigureFailure", self._on_configure_failure)
+        return self
+
+    def on_turn_info(self, message: Any) -> None:
+        """Handle one ``TurnInfo`` message."""
+        configure = self._on_turn_info(message)
+        if configure is not None and self._socket is not None:
+            self._socket.send_configure(configure)
+
+
+class AsyncFluxThresholdTuner(_ThresholdState):
+    """Async counterpart of :class:`FluxThresholdTuner` for ``AsyncV2SocketClient``."""
+
+    def __init__(
+        self,
+        *,
+        eot_threshold: float = 0.7,
+        eager_eot_threshold: Optional[float] = None,
+        eot_bounds: Tuple[float, float] = _EOT_RANGE,
+        eager_bounds: Tuple[float, float] = _EAGER_RANGE,
+        target_wasted_rate: float = 0.3,
+        target_eot_latency_ms: float = 600.0,
+        window: int = 10,
+        step: float = 0.05,
+    ):
+        """Initialize the tuner; arguments as for :class:`FluxThresholdTuner`."""
+        super().__init__(
+            eot_threshold=eot_threshold,
+            eager_eot_threshold=eager_eot_threshold,
+            eot_bounds=eot_bounds,
+            eager_bounds=eager_bounds,
+            target_wasted_rate=target_wasted_rate,
+            target_eot_latency_ms=target_eot_latency_ms,
+            window=window,
+            step=step,
+        )
+        self._socket: Any = None
+
+    def attach(self, socket_client: Any) -> "AsyncFluxThresholdTuner":
+        """
+        Observe a ``listen.v2`` socket and send ``Configure`` messages on it. Returns self for chaining.
+
+        Args:
+            socket_client: ``AsyncV2SocketClient`` from ``listen.v2.connect``
+        """
+        self._socket = socket_client
+        socket_client.on("TurnInfo", self.on_turn_info)
+        socket_client.on("ConfigureSuccess", self._on_configure_success)
+        socket_client.on("ConfigureFailure", self._on_configure_failure)
+        return self
+
+    async def on_turn_info(self, message: Any) -> None:
+        """Handle one ``TurnInfo`` message."""
+        configure = self._on_turn_info(message)
+        if configure is not None and self._socket is not None:
+            await self._socket.send_configure(configure)
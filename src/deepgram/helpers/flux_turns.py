@@ -0,0 +1,453 @@
+"""
+Flux Turn Assembly
+
+Tracks the ``TurnInfo`` messages of a Flux (``listen.v2``) connection and runs
+the eager end-of-turn pipeline: speculative work (typically the LLM request)
+starts on ``EagerEndOfTurn``, is cancelled automatically on ``TurnResumed``,
+and is handed to the final callback on ``EndOfTurn`` when the final
+transcript matches the one the work was started with.
+"""
+
+import asyncio
+import dataclasses
+import inspect
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Union
+
+from ..core.events import EventType
+from ._utils import get_field
+
+_logger = logging.getLogger(__name__)
+
+
+class SpeculationCancelledError(Exception):
+    """Raised by :meth:`CancellationToken.raise_if_cancelled` once a speculation was cancelled."""
+
+
+class CancellationToken:
+    """
+    Cancellation signal handed to speculative work.
+
+    Long-running work should check :attr:`cancelled` (or call
+    :meth:`raise_if_cancelled`) between steps, or register :meth:`on_cancel`
+    to abort a streaming request.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], Any]] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and run its cancel callbacks (once)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                _logger.warning("Cancellation callback failed: %s", exc)
+
+    def on_cancel(self, callback: Callable[[], Any]) -> None:
+        """Run ``callback`` when the token is cancelled (immediately if it already is)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or ``timeout`` elapses; returns whether the token is cancelled."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            SpeculationCancelledError: If the token was cancelled
+        """
+        if self._event.is_set():
+            raise SpeculationCancelledError(self.reason)
+
+
+@dataclasses.dataclass(frozen=True)
+class FluxTurn:
+    """Snapshot of a turn taken from one ``TurnInfo`` message."""
+
+    turn_index: int
+    sequence_id: int
+    event: str
+    transcript: str
+    end_of_turn_confidence: float
+    audio_window_start: float
+    audio_window_end: float
+    words: List[Any] = dataclasses.field(default_factory=list)
+    message: Any = None
+
+    @classmethod
+    def from_message(cls, message: Any) -> "FluxTurn":
+        """Build a snapshot from a ``ListenV2TurnInfo`` model or its decoded dict."""
+        return cls(
+            turn_index=int(get_field(message, "turn_index")),
+            sequence_id=int(get_field(message, "sequence_id")),
+            event=get_field(message, "event"),
+            transcript=get_field(message, "transcript") or "",
+            end_of_turn_confidence=get_field(message, "end_of_turn_confidence") or 0.0,
+            audio_window_start=get_field(message, "audio_window_start") or 0.0,
+            audio_window_end=get_field(message, "audio_window_end") or 0.0,
+            words=list(get_field(message, "words") or ()),
+            message=message,
+        )
+
+
+class Speculation:
+    """
+    Speculative work started for an ``EagerEndOfTurn``.
+
+    ``future`` is a ``concurrent.futures.Future`` for :class:`FluxTurnAssembler`
+    and an ``asyncio.Task`` for :class:`AsyncFluxTurnAssembler`; use
+    :meth:`result` or ``await speculation`` respectively.
+    """
+
+    def __init__(self, turn: FluxTurn, token: CancellationToken, future: Union["Future[Any]", "asyncio.Task[Any]"]):
+        self.turn = turn
+        self.token = token
+        self.future = future
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        self.token.cancel(reason)
+        self.future.cancel()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for and return the result of thread-based speculative work."""
+        if isinstance(self.future, Future):
+            return self.future.result(timeout)
+        return self.future.result()
+
+    def __await__(self) -> Any:
+        return self.future.__await__()  # type: ignore[union-attr]
+
+
+@dataclasses.dataclass
+class FluxTurnStats:
+    """Counters for a turn assembler."""
+
+    turns: int = 0
+    eager: int = 0
+    resumed: int = 0
+    reused: int = 0
+    discarded: int = 0
+    stale_messages: int = 0
+
+
+class _TurnState:
+    def __init__(
+        self,
+        speculate: Optional[Callable[..., Any]],
+        on_end_of_turn: Optional[Callable[..., Any]],
+        on_start_of_turn: Optional[Callable[..., Any]],
+        on_update: Optional[Callable[..., Any]],
+        on_resumed: Optional[Callable[..., Any]],
+    ):
+        self.speculate = speculate
+        self.on_end_of_turn = on_end_of_turn
+        self.on_start_of_turn = on_start_of_turn
+        self.on_update = on_update
+        self.on_resumed = on_resumed
+        self.current: Optional[FluxTurn] = None
+        self.speculation: Optional[Speculation] = None
+        self.completed_turn_index = -1
+        self.last_sequence_id = -1
+        self.stats = FluxTurnStats()
+
+    def _accept(self, turn: FluxTurn) -> bool:
+        # Drop replays and messages for turns that already ended.
+        if turn.sequence_id <= self.last_sequence_id:
+            self.stats.stale_messages += 1
+            return False
+        self.last_sequence_id = turn.sequence_id
+        if turn.turn_index <= self.completed_turn_index:
+            self.stats.stale_messages += 1
+            return False
+        self.current = turn
+        return True
+
+    def _drop_speculation(self, reason: str) -> None:
+        if self.speculation is not None:
+            self.speculation.cancel(reason)
+            self.speculation = None
+            self.stats.discarded += 1
+
+    def _finish(self, turn: FluxTurn) -> Optional[Speculation]:
+        """Close a turn; returns the speculation to hand over when its transcript still matches."""
+        self.stats.turns += 1
+        self.completed_turn_index = turn.turn_index
+        speculation, self.speculation = self.speculation, None
+        if speculation is None:
+            return None
+        if speculation.turn.transcript.strip() == turn.transcript.strip():
+            self.stats.reused += 1
+            return speculation
+        speculation.cancel("transcript changed")
+        self.stats.discarded += 1
+        return None
+
+
+def _call(callback: Optional[Callable[..., Any]], *args: Any) -> Any:
+    if callback is None:
+        return None
+    try:
+        return callback(*args)
+    except Exception as exc:
+        _logger.warning("Flux turn callback failed: %s", exc)
+        return None
+
+
+async def _await_callback(result: Any) -> None:
+    if inspect.isawaitable(result):
+        try:
+            await result
+        except Exception as exc:
+            _logger.warning("Flux turn callback failed: %s", exc)
+
+
+class FluxTurnAssembler(_TurnState):
+    """
+    Eager end-of-turn pipeline for a sync ``listen.v2`` ``V2SocketClient``.
+
+    - ``speculate(turn, token)`` runs on a worker thread when ``EagerEndOfTurn``
+      arrives; ``token`` is cancelled when the user resumes speaking
+      (``TurnResumed``), when a newer eager end of turn replaces it, or when the
+      final transcript differs
+    - ``on_end_of_turn(turn, speculation)`` is called for every
+      ``EndOfTurn``; ``speculation`` is the still-valid :class:`Speculation`
+      (call ``speculation.result()``) or None when there is none to reuse and
+      the response has to be produced from ``turn.transcript`` now
+
+    Messages are ordered by ``sequence_id``; replayed messages and messages for
+    turns that already ended are ignored. Connect with ``eager_eot_threshold``
+    set, otherwise Flux sends no ``EagerEndOfTurn`` and every turn takes the
+    non-speculative path.
+
+    ``on_end_of_turn`` runs on its own worker thread so that waiting on
+    ``speculation.result()`` never stalls the receive loop. Final callbacks run
+    one at a time in turn order; the other callbacks run on the receive thread
+    in message order and may overlap an earlier turn's final callback. Call
+    :meth:`join` to wait for queued final callbacks.
+
+    Example:
+        def speculate(turn, token):
+            return llm.complete(turn.transcript, should_stop=lambda: token.cancelled)
+
+        def on_end_of_turn(turn, speculation):
+            reply = speculation.result() if speculation else llm.complete(turn.transcript)
+            tts.speak(reply)
+
+        with client.listen.v2.connect(model="flux-general-en", encoding="linear16", sample_rate=16000,
+                                      eager_eot_threshold=0.5) as connection:
+            FluxTurnAssembler(speculate=speculate, on_end_of_turn=on_end_of_turn).attach(connection)
+            connection.start_listening()
+    """
+
+    def __init__(
+        self,
+        *,
+        speculate: Optional[Callable[[FluxTurn, CancellationToken], Any]] = None,
+        on_end_of_turn: Optional[Callable[[FluxTurn, Optional[Speculation]], Any]] = None,
+        on_start_of_turn: Optional[Callable[[FluxTurn], Any]] = None,
+        on_update: Optional[Callable[[FluxTurn], Any]] = None,
+        on_resumed: Optional[Callable[[FluxTurn], Any]] = None,
+        max_workers: int = 2,
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            speculate: Speculative work started on ``EagerEndOfTurn``
+            on_end_of_turn: Final callback for ``EndOfTurn``
+            on_start_of_turn: Called on ``StartOfTurn``
+            on_update: Called on ``Update``
+            on_resumed: Called on ``TurnResumed`` after the speculation was cancelled
+            max_workers: Worker threads for speculative work
+        """
+        super().__init__(speculate, on_end_of_turn, on_start_of_turn, on_update, on_resumed)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deepgram-flux-speculate")
+        self._end_of_turn_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deepgram-flux-turn")
+        self._last_end_of_turn: Optional["Future[Any]"] = None
+
+    def attach(self, socket_client: Any) -> "FluxTurnAssembler":
+        """
+        Subscribe to a ``listen.v2`` socket's ``TurnInfo`` messages. Returns self for chaining.
+
+        Args:
+            socket_client: ``V2SocketClient`` from ``listen.v2.connect``
+        """
+        socket_client.on("TurnInfo", self.on_turn_info)
+        socket_client.on(EventType.CLOSE, lambda _: self.close())
+        return self
+
+    def on_turn_info(self, message: Any) -> None:
+        """Handle one ``TurnInfo`` message."""
+        turn = FluxTurn.from_message(message)
+        with self._lock:
+            if not self._accept(turn):
+                return
+            event = turn.event
+            handover: Optional[Speculation] = None
+            if event == "EagerEndOfTurn":
+                self.stats.eager += 1
+                self._drop_speculation("superseded")
+                if self.speculate is not None:
+                    token = CancellationToken()
+                    self.speculation = Speculation(turn, token, self._executor.submit(self.speculate, turn, token))
+            elif event == "TurnResumed":
+                self.stats.resumed += 1
+                self._drop_speculation("turn resumed")
+            elif event == "EndOfTurn":
+                handover = self._finish(turn)
+        if event == "StartOfTurn":
+            _call(self.on_start_of_turn, turn)
+        elif event == "Update":
+            _call(self.on_update, turn)
+        elif event == "TurnResumed":
+            _call(self.on_resumed, turn)
+        elif event == "EndOfTurn" and self.on_end_of_turn is not None:
+            self._last_end_of_turn = self._end_of_turn_executor.submit(_call, self.on_end_of_turn, turn, handover)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the queued ``on_end_of_turn`` callbacks; returns False on timeout."""
+        last = self._last_end_of_turn
+        return last is None or bool(wait([last], timeout).done)
+
+    def close(self) -> None:
+        """Cancel any pending speculation and stop the worker threads once queued callbacks ran."""
+        with self._lock:
+            self._drop_speculation("closed")
+        self._executor.shutdown(wait=False)
+        self._end_of_turn_executor.shutdown(wait=False)
+
+
+class AsyncFluxTurnAssembler(_TurnState):
+    """
+    Async counterpart of :class:`FluxTurnAssembler` for ``AsyncV2SocketClient``.
+
+    ``speculate(turn, token)`` may be a coroutine function; it runs as an
+    ``asyncio`` task that is cancelled together with its token. Callbacks may
+    be coroutine functions. ``on_end_of_turn`` runs as its own task, so
+    awaiting the speculation does not hold up the receive loop; final
+    callbacks still run one at a time in turn order. The other callbacks are
+    awaited in message order within the receive loop and may overlap an
+    earlier turn's final callback. Await :meth:`join` to wait for pending
+    final callbacks (for example before the event loop shuts down).
+
+    Example:
+        async def on_end_of_turn(turn, speculation):
+            reply = await speculation if speculation else await llm.complete(turn.transcript)
+            await tts.speak(reply)
+
+        AsyncFluxTurnAssembler(speculate=lambda turn, token: llm.complete(turn.transcript),
+                               on_end_of_turn=on_end_of_turn).attach(connection)
+    """
+
+    def __init__(
+        self,
+        *,
+        speculate: Optional[Callable[[FluxTurn, CancellationToken], Any]] = None,
+        on_end_of_turn: Optional[Callable[[FluxTurn, Optional[Speculation]], Any]] = None,
+        on_start_of_turn: Optional[Callable[[FluxTurn], Any]] = None,
+        on_update: Optional[Callable[[FluxTurn], Any]] = None,
+        on_resumed: Optional[Callable[[FluxTurn], Any]] = None,
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            speculate: Speculative work started on ``EagerEndOfTurn``
+            on_end_of_turn: Final callback for ``EndOfTurn``
+            on_start_of_turn: Called on ``StartOfTurn``
+            on_update: Called on ``Update``
+            on_resumed: Called on ``TurnResumed`` after the speculation was cancelled
+        """
+        super().__init__(speculate, on_end_of_turn, on_start_of_turn, on_update, on_resumed)
+        self._last_end_of_turn: Optional["asyncio.Future[None]"] = None
+
+    def attach(self, socket_client: Any) -> "AsyncFluxTurnAssembler":
+        """
+        Subscribe to a ``listen.v2`` socket's ``TurnInfo`` messages. Returns self for chaining.
+
+        Args:
+            socket_client: ``AsyncV2SocketClient`` from ``listen.v2.connect``
+        """
+        socket_client.on("TurnInfo", self.on_turn_info)
+        socket_client.on(EventType.CLOSE, lambda _: self.close())
+        return self
+
+    async def _run_speculation(self, turn: FluxTurn, token: CancellationToken) -> Any:
+        result = self.speculate(turn, token)  # type: ignore[misc]
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _run_end_of_turn(
+        self, previous: Optional["asyncio.Future[None]"], turn: FluxTurn, speculation: Optional[Speculation]
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        await _await_callback(_call(self.on_end_of_turn, turn, speculation))
+
+    async def on_turn_info(self, message: Any) -> None:
+        """Handle one ``TurnInfo`` message."""
+        turn = FluxTurn.from_message(message)
+        if not self._accept(turn):
+            return
+        event = turn.event
+        if event == "StartOfTurn":
+            callback_result = _call(self.on_start_of_turn, turn)
+        elif event == "Update":
+            callback_result = _call(self.on_update, turn)
+        elif event == "EagerEndOfTurn":
+            self.stats.eager += 1
+            self._drop_speculation("superseded")
+            if self.speculate is not None:
+                token = CancellationToken()
+                task = asyncio.ensure_future(self._run_speculation(turn, token))
+                self.speculation = Speculation(turn, token, task)
+            callback_result = None
+        elif event == "TurnResumed":
+            self.stats.resumed += 1
+            self._drop_speculation("turn resumed")
+            callback_result = _call(self.on_resumed, turn)
+        elif event == "EndOfTurn":
+            speculation = self._finish(turn)
+            if self.on_end_of_turn is not None:
+                self._last_end_of_turn = asyncio.ensure_future(
+                    self._run_end_of_turn(self._last_end_of_turn, turn, speculation)
+                )
+            callback_result = None
+        else:
+            callback_result = None
+        await _await_callback(callback_result)
+
+    async def join(self) -> None:
+        """Wait for the pending ``on_end_of_turn`` callbacks."""
+        if self._last_end_of_turn is not None:
+            await asyncio.wait([self._last_end_of_turn])
+
+    def close(self) -> None:
+        """Cancel any pending speculation."""
+        self._drop_speculation("closed")
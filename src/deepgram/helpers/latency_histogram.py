@@ -0,0 +1,159 @@
+"""
+Streaming Latency Histogram
+
+A small, dependency-free log-bucketed histogram for recording latency-style
+values and reading streaming percentiles with bounded relative error.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, Optional
+
+# Bucket key shared by zero and negative values (which have no logarithm).
+_NON_POSITIVE_BUCKET = -(2**62)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram with O(1) recording and bounded memory.
+
+    Values are grouped into buckets whose width grows geometrically, so each
+    reported percentile is within ``relative_error`` of the true value
+    (HDR-histogram style). Non-positive values share a single bucket. Recording
+    is thread-safe.
+
+    Example:
+        histogram = LatencyHistogram()
+        for value in (120.0, 95.5, 310.2):
+            histogram.record(value)
+        histogram.percentile(95)
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            relative_error: Maximum relative error of reported percentiles (0 < relative_error < 1)
+
+        Raises:
+            ValueError: If relative_error is out of range
+        """
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be between 0 and 1")
+        self.relative_error = relative_error
+        self._log_base = math.log1p(2 * relative_error)
+        self._buckets: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, value: float) -> int:
+        if value <= 0:
+            return _NON_POSITIVE_BUCKET
+        return math.floor(math.log(value) / self._log_base)
+
+    def _bucket_value(self, index: int) -> float:
+        if index == _NON_POSITIVE_BUCKET:
+            return 0.0
+        # Geometric midpoint of [base^i, base^(i+1)) is within relative_error of any value in it.
+        return math.exp((index + 0.5) * self._log_base)
+
+    def record(self, value: float) -> None:
+        """Record one value."""
+        key = self._index(value)
+        with self._lock:
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def record_many(self, values: Iterable[float]) -> None:
+        """Record every value from an iterable."""
+        for value in values:
+            self.record(value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Arithmetic mean of recorded values, or None when empty."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Return the value at a percentile.
+
+        Args:
+            percentile: Percentile in the range 0-100
+
+        Returns:
+            The estimated value, clamped to the observed min/max, or None when empty
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, math.ceil(percentile / 100 * self.count))
+            seen = 0
+            for key in sorted(self._buckets):
+                seen += self._buckets[key]
+                if seen >= rank:
+                    estimate = self._bucket_value(key)
+                    return min(max(estimate, self.min), self.max)  # type: ignore[type-var]
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add every value recorded in another histogram with the same relative_error.
+
+        Raises:
+            ValueError: If the histograms use different bucket layouts
+        """
+        if other.relative_error != self.relative_error:
+            raise ValueError("Cannot merge histograms with different relative_error")
+        with other._lock:
+            buckets = dict(other._buckets)
+            count, total, low, high = other.count, other.total, other.min, other.max
+        with self._lock:
+            for key, bucket_count in buckets.items():
+                self._buckets[key] = self._buckets.get(key, 0) + bucket_count
+            self.count += count
+            self.total += total
+            if low is not None and (self.min is None or low < self.min):
+                self.min = low
+            if high is not None and (self.max is None or high > self.max):
+                self.max = high
+
+    def reset(self) -> None:
+        """Discard every recorded value."""
+        with self._lock:
+            self._buckets.clear()
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = None
+
+    def snapshot(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, Optional[float]]:
+        """
+        Summarize the histogram as a plain dict.
+
+        Args:
+            percentiles: Percentiles to include, reported as ``p50``, ``p95``, ...
+
+        Returns:
+            Dict with ``count``, ``min``, ``max``, ``mean`` and one key per percentile
+        """
+        summary: Dict[str, Optional[float]] = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+        }
+        for percentile in percentiles:
+            summary[f"p{percentile:g}"] = self.percentile(percentile)
+        return summary
@@ -0,0 +1,389 @@
+"""
+Multichannel Stream Fan-In
+
+Streams interleaved multichannel PCM (for example a stereo call recording)
+over one ``listen.v1`` connection opened with ``multichannel=true`` and
+splits the ``Results`` messages back into one ordered transcript per channel
+using ``channel_index``. Audio is sent as frame-aligned ``memoryview`` slices
+of the caller's buffer, so channels are never split mid-frame and the audio
+is not copied on its way to the socket.
+"""
+
+import bisect
+import dataclasses
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Sequence
+
+from ._utils import SAMPLE_WIDTHS, get_field, load_numpy
+from .agent_audio import BytesLike, agent_frame_bytes
+
+_logger = logging.getLogger(__name__)
+
+_SampleFormat = Literal["h", "i", "B"]
+
+# memoryview formats of one sample per encoding.
+_SAMPLE_FORMATS: Dict[str, _SampleFormat] = {
+    "linear16": "h",
+    "linear32": "i",
+    "mulaw": "B",
+    "alaw": "B",
+}
+
+
+def _sample_format(encoding: str) -> _SampleFormat:
+    try:
+        return _SAMPLE_FORMATS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported encoding '{encoding}'. Expected one of: {', '.join(sorted(_SAMPLE_FORMATS))}"
+        ) from None
+
+
+def channel_view(data: BytesLike, channel: int, channels: int, encoding: str = "linear16") -> memoryview:
+    """
+    Return a strided, zero-copy view of one channel of interleaved audio.
+
+    Args:
+        data: Interleaved audio made of whole frames
+        channel: Zero-based channel to select
+        channels: Channel count of ``data``
+        encoding: Sample encoding
+
+    Returns:
+        memoryview of the channel's samples (one item per sample)
+
+    Raises:
+        ValueError: If the channel is out of range or ``data`` is not frame aligned
+    """
+    if not 0 <= channel < channels:
+        raise ValueError(f"channel must be between 0 and {channels - 1}")
+    fmt = _sample_format(encoding)
+    view = memoryview(data).cast("B")
+    if len(view) % (SAMPLE_WIDTHS[encoding] * channels):
+        raise ValueError("data is not a whole number of frames")
+    return view.cast(fmt)[channel::channels]
+
+
+def interleave(channel_data: Sequence[BytesLike], encoding: str = "linear16") -> bytearray:
+    """
+    Interleave equally long mono buffers into one multichannel buffer.
+
+    Uses NumPy when it is installed and strided ``memoryview`` assignment otherwise.
+
+    Args:
+        channel_data: One buffer per channel, in channel order
+        encoding: Sample encoding of every buffer
+
+    Returns:
+        Interleaved audio
+
+    Raises:
+        ValueError: If no buffers are given or their lengths differ
+    """
+    fmt = _sample_format(encoding)
+    views = [memoryview(data).cast("B") for data in channel_data]
+    if not views:
+        raise ValueError("at least one channel is required")
+    length = len(views[0])
+    if any(len(view) != length for view in views) or length % SAMPLE_WIDTHS[encoding]:
+        raise ValueError("every channel must hold the same whole number of samples")
+    channels = len(views)
+    out = bytearray(length * channels)
+    np = load_numpy()
+    if np is not None:
+        frames = np.frombuffer(out, dtype=fmt).reshape(-1, channels)
+        for channel, view in enumerate(views):
+            frames[:, channel] = np.frombuffer(view, dtype=fmt)
+        return out
+    samples = memoryview(out).cast(fmt)
+    for channel, view in enumerate(views):
+        samples[channel::channels] = view.cast(fmt)
+    return out
+
+
+@dataclasses.dataclass
+class MultichannelFeederStats:
+    """Counters for a ``MultichannelAudioFeeder``."""
+
+    chunks_sent: int = 0
+    bytes_sent: int = 0
+    bytes_staged: int = 0
+    bytes_dropped: int = 0
+
+
+class _ChunkState:
+    def __init__(self, *, channels: int, sample_rate: int, encoding: str, chunk_ms: int):
+        if channels < 1:
+            raise ValueError("channels must be at least 1")
+        _sample_format(encoding)
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self.frame_bytes = SAMPLE_WIDTHS[encoding] * channels
+        self.chunk_bytes = agent_frame_bytes(encoding, sample_rate, chunk_ms, channels)
+        self.stats = MultichannelFeederStats()
+        # Fixed-size staging buffer for the tail of a write that does not fill a chunk;
+        # it is never resized, so views handed out earlier stay valid.
+        self._staging = bytearray(self.chunk_bytes)
+        self._staged = 0
+
+    @property
+    def staged_bytes(self) -> int:
+        """Bytes held back until the next write completes a chunk."""
+        return self._staged
+
+    def chunks(self, data: BytesLike) -> Iterator[memoryview]:
+        """
+        Split audio into ``chunk_ms`` chunks of whole frames.
+
+        Chunks are views of ``data`` (or of the internal staging buffer for a
+        chunk that spans two writes) and must be consumed before the next
+        chunk is requested. A tail shorter than a chunk is staged.
+        """
+        view = memoryview(data).cast("B")
+        offset = 0
+        if self._staged:
+            take = min(self.chunk_bytes - self._staged, len(view))
+            self._staging[self._staged : self._staged + take] = view[:take]
+            self._staged += take
+            offset = take
+            if self._staged < self.chunk_bytes:
+                self.stats.bytes_staged += take
+                return
+            self._staged = 0
+            yield memoryview(self._staging)
+        while len(view) - offset >= self.chunk_bytes:
+            yield view[offset : offset + self.chunk_bytes]
+            offset += self.chunk_bytes
+        tail = len(view) - offset
+        if tail:
+            self._staging[:tail] = view[offset:]
+            self._staged = tail
+            self.stats.bytes_staged += tail
+
+    def _take_remainder(self) -> Optional[memoryview]:
+        whole = self._staged - self._staged % self.frame_bytes
+        dropped = self._staged - whole
+        if dropped:
+            self.stats.bytes_dropped += dropped
+            _logger.warning("Dropping %d bytes of an incomplete multichannel frame", dropped)
+        self._staged = 0
+        return memoryview(self._staging)[:whole] if whole else None
+
+    def _sent(self, chunk: memoryview) -> None:
+        self.stats.chunks_sent += 1
+        self.stats.bytes_sent += len(chunk)
+
+
+class MultichannelAudioFeeder(_ChunkState):
+    """
+    Feeds interleaved multichannel audio to a sync ``listen.v1`` socket in frame-aligned chunks.
+
+    Open the connection with ``multichannel="true"`` and ``channels`` matching
+    the audio. Each ``send_media`` call carries exactly ``chunk_ms`` of audio
+    for every channel; whole chunks are sent straight from the caller's
+    buffer and only a tail that does not fill a chunk is copied.
+
+    Example:
+        with client.listen.v1.connect(model="nova-3", encoding="linear16", sample_rate=8000,
+                                      channels=2, multichannel="true") as connection:
+            transcripts = MultichannelTranscripts(2).attach(connection)
+            feeder = MultichannelAudioFeeder(connection, channels=2, sample_rate=8000)
+            threading.Thread(target=connection.start_listening, daemon=True).start()
+            for block in recording:
+                feeder.feed(block)
+            feeder.flush()
+            connection.send_finalize()
+    """
+
+    def __init__(
+        self,
+        socket_client: Any,
+        *,
+        channels: int,
+        sample_rate: int,
+        encoding: str = "linear16",
+        chunk_ms: int = 50,
+    ):
+        """
+        Initialize the feeder.
+
+        Args:
+            socket_client: ``V1SocketClient`` from ``listen.v1.connect``
+            channels: Channel count of the interleaved audio
+            sample_rate: Sample rate in Hz
+            encoding: Sample encoding (``linear16``, ``linear32``, ``mulaw`` or ``alaw``)
+            chunk_ms: Audio duration per ``send_media`` call
+
+        Raises:
+            ValueError: If the encoding is not fixed-width PCM or the chunk is empty
+        """
+        super().__init__(channels=channels, sample_rate=sample_rate, encoding=encoding, chunk_ms=chunk_ms)
+        self._socket = socket_client
+
+    def feed(self, data: BytesLike) -> None:
+        """Send every complete chunk in ``data`` and stage the rest."""
+        for chunk in self.chunks(data):
+            self._socket.send_media(chunk)
+            self._sent(chunk)
+
+    def flush(self) -> None:
+        """Send the staged whole frames; an incomplete trailing frame is dropped."""
+        chunk = self._take_remainder()
+        if chunk is not None:
+            self._socket.send_media(chunk)
+            self._sent(chunk)
+
+
+class AsyncMultichannelAudioFeeder(_ChunkState):
+    """Async counterpart of :class:`MultichannelAudioFeeder` for ``AsyncV1SocketClient``."""
+
+    def __init__(
+        self,
+        socket_client: Any,
+        *,
+        channels: int,
+        sample_rate: int,
+        encoding: str = "linear16",
+        chunk_ms: int = 50,
+    ):
+        """Initialize the feeder; arguments as for :class:`MultichannelAudioFeeder`."""
+        super().__init__(channels=channels, sample_rate=sample_rate, encoding=encoding, chunk_ms=chunk_ms)
+        self._socket = socket_client
+
+    async def feed(self, data: BytesLike) -> None:
+        """Send every complete chunk in ``data`` and stage the rest."""
+        for chunk in self.chunks(data):
+            await self._socket.send_media(chunk)
+            self._sent(chunk)
+
+    async def flush(self) -> None:
+        """Send the staged whole frames; an incomplete trailing frame is dropped."""
+        chunk = self._take_remainder()
+        if chunk is not None:
+            await self._socket.send_media(chunk)
+            self._sent(chunk)
+
+
+@dataclasses.dataclass
+class ChannelSegment:
+    """One final transcript segment of a single channel."""
+
+    channel: int
+    start: float
+    end: float
+    transcript: str
+    confidence: Optional[float] = None
+    speech_final: bool = False
+    words: List[Any] = dataclasses.field(default_factory=list)
+
+
+class ChannelTranscript:
+    """Ordered final segments and the latest interim text of one channel."""
+
+    def __init__(self, channel: int):
+        self.channel = channel
+        self.segments: List[ChannelSegment] = []
+        self.interim: Optional[str] = None
+        self._starts: List[float] = []
+
+    @property
+    def text(self) -> str:
+        """Final transcript of the channel so far."""
+        return " ".join(segment.transcript for segment in self.segments if segment.transcript)
+
+    def _add(self, segment: ChannelSegment) -> None:
+        # Results normally arrive in order; insort keeps the stream ordered if they do not.
+        index = bisect.bisect_right(self._starts, segment.start)
+        self._starts.insert(index, segment.start)
+        self.segments.insert(index, segment)
+        self.interim = None
+
+
+class MultichannelTranscripts:
+    """
+    Demultiplexes ``listen.v1`` ``Results`` into one ordered transcript per channel.
+
+    Results are routed by ``channel_index[0]``. Final results become
+    :class:`ChannelSegment` entries (ordered by start time); interim results
+    only update the channel's ``interim`` text. Works with sync and async
+    sockets, and with messages delivered as models or dicts.
+
+    Example:
+        transcripts = MultichannelTranscripts(2, on_segment=lambda s: print(s.channel, s.transcript))
+        transcripts.attach(connection)
+        ...
+        for segment in transcripts.conversation():
+            print(f"[{segment.start:7.2f}] ch{segment.channel}: {segment.transcript}")
+    """
+
+    def __init__(self, channels: int, on_segment: Optional[Callable[[ChannelSegment], Any]] = None):
+        """
+        Initialize the router.
+
+        Args:
+            channels: Channel count of the connection
+            on_segment: Optional callback invoked with each final segment
+        """
+        if channels < 1:
+            raise ValueError("channels must be at least 1")
+        self.channels = [ChannelTranscript(channel) for channel in range(channels)]
+        self.unrouted = 0
+        self._on_segment = on_segment
+        self._lock = threading.Lock()
+
+    def __getitem__(self, channel: int) -> ChannelTranscript:
+        return self.channels[channel]
+
+    def attach(self, socket_client: Any) -> "MultichannelTranscripts":
+        """Subscribe to ``Results`` on a ``listen.v1`` socket. Returns self for chaining."""
+        socket_client.on("Results", self.on_results)
+        return self
+
+    def on_results(self, message: Any) -> Optional[ChannelSegment]:
+        """
+        Route one ``Results`` message.
+
+        Returns:
+            The final segment it produced, if any
+        """
+        index = get_field(message, "channel_index") or [0]
+        channel = index[0]
+        if not 0 <= channel < len(self.channels):
+            self.unrouted += 1
+            return None
+        alternatives = get_field(get_field(message, "channel"), "alternatives") or []
+        best = alternatives[0] if alternatives else None
+        transcript = (get_field(best, "transcript") or "") if best is not None else ""
+        target = self.channels[channel]
+        if not get_field(message, "is_final"):
+            with self._lock:
+                target.interim = transcript
+            return None
+        start = float(get_field(message, "start") or 0.0)
+        segment = ChannelSegment(
+            channel=channel,
+            start=start,
+            end=start + float(get_field(message, "duration") or 0.0),
+            transcript=transcript,
+            confidence=get_field(best, "confidence") if best is not None else None,
+            speech_final=bool(get_field(message, "speech_final")),
+            words=list(get_field(best, "words") or []) if best is not None else [],
+        )
+        with self._lock:
+            target._add(segment)
+        if self._on_segment is not None:
+            self._on_segment(segment)
+        return segment
+
+    def conversation(self, include_empty: bool = False) -> List[ChannelSegment]:
+        """Return the final segments of every channel merged by start time (ties in channel order)."""
+        with self._lock:
+            segments = [
+                segment
+                for transcript in self.channels
+                for segment in transcript.segments
+                if include_empty or segment.transcript
+            ]
+        return sorted(segments, key=lambda segment: (segment.start, segment.channel))
@@ -0,0 +1,281 @@
+"""
+Request Log Iteration
+
+Streams ``ProjectRequestResponse`` items from
+``manage.v1.projects.requests.list`` across pages, instead of looping over
+``page`` by hand. Large date ranges can be split into time windows that are
+fetched concurrently, and the next page of each window is fetched while the
+current one is being consumed.
+"""
+
+import asyncio
+import datetime as dt
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, List, Optional, Set, Tuple
+
+from ..types.project_request_response import ProjectRequestResponse
+
+# Largest ``limit`` the requests endpoint accepts.
+MAX_PAGE_SIZE = 1000
+
+# Index of the first page of results.
+_FIRST_PAGE = 0
+
+# How often a blocked producer thread checks whether the consumer went away.
+_PUT_POLL_SECONDS = 0.1
+
+Window = Tuple[Optional[dt.datetime], Optional[dt.datetime]]
+
+
+def _requests_client(client: Any) -> Any:
+    """Accept a ``DeepgramClient`` / ``AsyncDeepgramClient`` or a requests client."""
+    manage = getattr(client, "manage", None)
+    return manage.v1.projects.requests if manage is not None else client
+
+
+def _check_page_size(page_size: int) -> None:
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+
+def split_time_range(start: dt.datetime, end: dt.datetime, window: dt.timedelta) -> List[Window]:
+    """
+    Split ``[start, end)`` into consecutive windows of at most ``window``.
+
+    Args:
+        start: Start of the range
+        end: End of the range
+        window: Maximum length of each window
+
+    Returns:
+        List of ``(window_start, window_end)`` pairs, oldest first
+
+    Raises:
+        ValueError: If the window is not positive or ``end`` is before ``start``
+    """
+    if window <= dt.timedelta(0):
+        raise ValueError("window must be positive")
+    if end < start:
+        raise ValueError("end must not be before start")
+    windows: List[Window] = []
+    cursor = start
+    while cursor < end:
+        upper = min(cursor + window, end)
+        windows.append((cursor, upper))
+        cursor = upper
+    return windows or [(start, end)]
+
+
+def _windows(start: Optional[dt.datetime], end: Optional[dt.datetime], window: Optional[dt.timedelta]) -> List[Window]:
+    if window is None:
+        return [(start, end)]
+    if start is None or end is None:
+        raise ValueError("start and end are required when splitting by window")
+    return split_time_range(start, end, window)
+
+
+class _Deduplicator:
+    """Drops items repeated at window boundaries (both windows may include the boundary instant)."""
+
+    def __init__(self) -> None:
+        self._previous: Set[str] = set()
+        self._current: Set[str] = set()
+
+    def next_window(self) -> None:
+        self._previous, self._current = self._current, set()
+
+    def keep(self, item: ProjectRequestResponse) -> bool:
+        request_id = item.request_id
+        if request_id is None:
+            return True
+        if request_id in self._previous:
+            return False
+        self._current.add(request_id)
+        return True
+
+
+def iter_requests(
+    client: Any,
+    project_id: str,
+    *,
+    start: Optional[dt.datetime] = None,
+    end: Optional[dt.datetime] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    window: Optional[dt.timedelta] = None,
+    concurrency: int = 4,
+    prefetch: int = 1,
+    **filters: Any,
+) -> Iterator[ProjectRequestResponse]:
+    """
+    Iterate over every request log entry of a project, across pages.
+
+    Pages are fetched by background threads: each window's pages are fetched
+    up to ``prefetch`` pages ahead of the consumer, and up to ``concurrency``
+    windows are fetched at the same time. Items are always yielded in window
+    order (oldest window first), keeping the API's order within a window.
+
+    Example:
+        for request in iter_requests(client, project_id, start=start, end=end, window=timedelta(days=1)):
+            exporter.write(request)
+
+    Args:
+        client: ``DeepgramClient`` or ``client.manage.v1.projects.requests``
+        project_id: The unique identifier of the project
+        start: Start of the date range
+        end: End of the date range
+        page_size: Results per page (1 to 1000)
+        window: Split ``[start, end)`` into windows of this length
+        concurrency: Maximum number of windows fetched at the same time
+        prefetch: Pages buffered ahead of the consumer per window
+        **filters: Other ``requests.list`` arguments (``accessor``,
+            ``endpoint``, ``status``, ``request_options``, ...)
+
+    Yields:
+        ProjectRequestResponse items
+
+    Raises:
+        ValueError: If ``page_size``, ``concurrency`` or ``window`` is invalid
+    """
+    _check_page_size(page_size)
+    if concurrency < 1 or prefetch < 1:
+        raise ValueError("concurrency and prefetch must be at least 1")
+    requests = _requests_client(client)
+    windows = _windows(start, end, window)
+    stop = threading.Event()
+
+    def _put(pages: "queue.Queue[Any]", value: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(value, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(bounds: Window, pages: "queue.Queue[Any]") -> None:
+        page = _FIRST_PAGE
+        try:
+            while not stop.is_set():
+                response = requests.list(
+                    project_id, start=bounds[0], end=bounds[1], limit=page_size, page=page, **filters
+                )
+                items = response.requests or []
+                if not _put(pages, items) or len(items) < page_size:
+                    break
+                page += 1
+        except Exception as exc:
+            _put(pages, exc)
+            return
+        _put(pages, None)
+
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(windows)), thread_name_prefix="deepgram-requests")
+    queues: List["queue.Queue[Any]"] = []
+    dedupe = _Deduplicator()
+    try:
+        for index in range(len(windows)):
+            while len(queues) < min(index + concurrency, len(windows)):
+                pages: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+                queues.append(pages)
+                executor.submit(_produce, windows[len(queues) - 1], pages)
+            dedupe.next_window()
+            while True:
+                items = queues[index].get()
+                if items is None:
+                    break
+                if isinstance(items, Exception):
+                    raise items
+                for item in items:
+                    if dedupe.keep(item):
+                        yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_requests(
+    client: Any,
+    project_id: str,
+    *,
+    start: Optional[dt.datetime] = None,
+    end: Optional[dt.datetime] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    window: Optional[dt.timedelta] = None,
+    concurrency: int = 4,
+    prefetch: int = 1,
+    **filters: Any,
+) -> AsyncIterator[ProjectRequestResponse]:
+    """
+    Async variant of :func:`iter_requests` for ``AsyncDeepgramClient``.
+
+    Each window is fetched by its own task, which requests the next page
+    while the consumer processes the current one; up to ``concurrency``
+    windows are in flight. Items are yielded in window order.
+
+    Example:
+        async for request in aiter_requests(client, project_id, start=start, end=end, window=timedelta(days=1)):
+            await exporter.write(request)
+
+    Args:
+        client: ``AsyncDeepgramClient`` or its ``manage.v1.projects.requests``
+        project_id: The unique identifier of the project
+        start: Start of the date range
+        end: End of the date range
+        page_size: Results per page (1 to 1000)
+        window: Split ``[start, end)`` into windows of this length
+        concurrency: Maximum number of windows fetched at the same time
+        prefetch: Pages buffered ahead of the consumer per window
+        **filters: Other ``requests.list`` arguments
+
+    Yields:
+        ProjectRequestResponse items
+
+    Raises:
+        ValueError: If ``page_size``, ``concurrency`` or ``window`` is invalid
+    """
+    _check_page_size(page_size)
+    if concurrency < 1 or prefetch < 1:
+        raise ValueError("concurrency and prefetch must be at least 1")
+    requests = _requests_client(client)
+    windows = _windows(start, end, window)
+
+    async def _produce(bounds: Window, pages: "asyncio.Queue[Any]") -> None:
+        page = _FIRST_PAGE
+        try:
+            while True:
+                response = await requests.list(
+                    project_id, start=bounds[0], end=bounds[1], limit=page_size, page=page, **filters
+                )
+                items = response.requests or []
+                await pages.put(items)
+                if len(items) < page_size:
+                    break
+                page += 1
+        except Exception as exc:
+            await pages.put(exc)
+            return
+        await pages.put(None)
+
+    tasks: List["asyncio.Task[None]"] = []
+    queues: List["asyncio.Queue[Any]"] = []
+    dedupe = _Deduplicator()
+    try:
+        for index in range(len(windows)):
+            while len(queues) < min(index + concurrency, len(windows)):
+                pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+                queues.append(pages)
+                tasks.append(asyncio.ensure_future(_produce(windows[len(queues) - 1], pages)))
+            dedupe.next_window()
+            while True:
+                items = await queues[index].get()
+                if items is None:
+                    break
+                if isinstance(items, Exception):
+                    raise items
+                for item in items:
+                    if dedupe.keep(item):
+                        yield item
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,239 @@
+"""
+HTTP Response Cache
+
+Opt-in TTL cache for GET requests made by ``DeepgramClient`` /
+``AsyncDeepgramClient`` (``DeepgramClient(response_cache=ResponseCache())``).
+Read-mostly management endpoints such as ``manage.v1.models.list``,
+``manage.v1.projects.get`` or ``agent.v1.settings.think.models.list`` are
+answered from memory until their TTL expires, after which a cached response
+with an ``ETag`` is revalidated with ``If-None-Match``. Mutating requests
+(POST / PUT / PATCH / DELETE) invalidate the cached entries of the same
+resource path.
+"""
+
+import dataclasses
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+CacheKey = Tuple[int, str, str, str]
+
+
+@dataclasses.dataclass
+class ResponseCacheStats:
+    """Counters for a ``ResponseCache``."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    invalidated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered without a full response (hits and 304 revalidations)."""
+        lookups = self.hits + self.misses
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+@dataclasses.dataclass
+class _Entry:
+    path: str
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    etag: Optional[str]
+    expires_at: float
+    request: Optional[httpx.Request] = None
+
+
+@dataclasses.dataclass
+class CacheLookup:
+    """Outcome of :meth:`ResponseCache.lookup` for one GET request."""
+
+    key: Optional[CacheKey]
+    ttl: float = 0.0
+    response: Optional[httpx.Response] = None
+    etag: Optional[str] = None
+
+
+def _request_of(response: httpx.Response) -> Optional[httpx.Request]:
+    try:
+        return response.request
+    except RuntimeError:  # responses built without a request
+        return None
+
+
+def _parent(path: str) -> str:
+    return path.rsplit("/", 1)[0] if "/" in path else ""
+
+
+class ResponseCache:
+    """
+    In-memory cache of successful GET responses, keyed by client, URL and query.
+
+    Every GET is cached for ``ttl`` seconds unless a pattern in ``endpoints``
+    matches its path (``fnmatch`` syntax, without the leading slash), in which
+    case that TTL applies; a TTL of 0 disables caching for the endpoint.
+    Responses sent with ``Cache-Control: no-store`` are never cached.
+
+    A successful or failed mutating request on a path invalidates cached
+    entries for the path itself, everything below it and its parent
+    collection, so ``keys.delete(project_id, key_id)`` also drops the cached
+    ``keys.list(project_id)``.
+
+    Entries are scoped to the client that made the request, so one cache can
+    be shared between clients with different credentials.
+
+    Example:
+        cache = ResponseCache(ttl=60, endpoints={"v1/models*": 3600, "v1/projects/*/requests*": 0})
+        client = DeepgramClient(response_cache=cache)
+        client.manage.v1.models.list()  # network
+        client.manage.v1.models.list()  # cache
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        *,
+        endpoints: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Default time to live in seconds for cached GET responses
+            endpoints: Per-endpoint TTL overrides as ``{path_pattern: seconds}``;
+                the first matching pattern wins
+            max_entries: Maximum number of cached responses (least recently used are evicted)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if ttl < 0 or max_entries < 1:
+            raise ValueError("ttl must be non-negative and max_entries at least 1")
+        self.ttl = ttl
+        self.endpoints: Dict[str, float] = dict(endpoints or {})
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self.stats = ResponseCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL that applies to a request path."""
+        path = path.lstrip("/")
+        for pattern, ttl in self.endpoints.items():
+            if fnmatch.fnmatchcase(path, pattern.lstrip("/")):
+                return ttl
+        return self.ttl
+
+    def lookup(self, http_client: Any, path: Optional[str], kwargs: Mapping[str, Any]) -> CacheLookup:
+        """
+        Look up a GET request made through an SDK ``HttpClient``.
+
+        Returns a lookup whose ``response`` is set on a fresh hit, or whose
+        ``etag`` is set when a stale entry can be revalidated.
+        """
+        path = (path or "").lstrip("/")
+        ttl = self.ttl_for(path)
+        request_options = kwargs.get("request_options") or {}
+        if ttl <= 0 or kwargs.get("content") is not None or request_options.get("additional_headers"):
+            return CacheLookup(key=None)
+        params = {
+            **(kwargs.get("params") or {}),
+            **(request_options.get("additional_query_parameters") or {}),
+        }
+        query = repr(sorted((name, value) for name, value in params.items() if value is not None))
+        key: CacheKey = (id(http_client), http_client.get_base_url(kwargs.get("base_url")), path, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return CacheLookup(key=key, ttl=ttl, response=self._response(entry))
+            self.stats.misses += 1
+            return CacheLookup(key=key, ttl=ttl, etag=entry.etag if entry is not None else None)
+
+    def store(self, lookup: CacheLookup, response: httpx.Response) -> httpx.Response:
+        """
+        Record the response to a looked-up request and return the response to use.
+
+        A ``304 Not Modified`` answer to a revalidation renews the cached entry
+        and returns a copy of the cached response.
+        """
+        if lookup.key is None:
+            return response
+        with self._lock:
+            if response.status_code == 304:
+                entry = self._entries.get(lookup.key)
+                if entry is None:
+                    return response
+                entry.expires_at = self._clock() + lookup.ttl
+                self._entries.move_to_end(lookup.key)
+                self.stats.revalidated += 1
+                return self._response(entry, _request_of(response))
+            if response.status_code != 200 or "no-store" in response.headers.get("cache-control", ""):
+                return response
+            response.read()
+            headers = response.headers.copy()
+            # The stored content is already decoded.
+            for name in ("content-encoding", "content-length", "transfer-encoding"):
+                headers.pop(name, None)
+            self._entries[lookup.key] = _Entry(
+                path=lookup.key[2],
+                status_code=response.status_code,
+                headers=headers,
+                content=response.content,
+                etag=response.headers.get("etag"),
+                expires_at=self._clock() + lookup.ttl,
+                request=_request_of(response),
+            )
+            self._entries.move_to_end(lookup.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Drop cached entries for a resource path, its sub-resources and its parent collection.
+
+        Args:
+            path: Request path such as ``v1/projects/<id>/keys``; None clears the cache
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                path = path.strip("/")
+                parent = _parent(path)
+                stale = [
+                    key
+                    for key, entry in self._entries.items()
+                    if entry.path == path or entry.path.startswith(path + "/") or entry.path == parent
+                ]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+            self.stats.invalidated += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self.invalidate()
+
+    @staticmethod
+    def _response(entry: _Entry, request: Optional[httpx.Request] = None) -> httpx.Response:
+        return httpx.Response(
+            entry.status_code, headers=entry.headers, content=entry.content, request=request or entry.request
+        )
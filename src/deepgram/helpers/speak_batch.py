@@ -0,0 +1,393 @@
+"""
+Callback-Mode TTS Batch Submission
+
+Submits many ``speak.v1.audio.generate`` / ``speak.v2.audio.generate`` requests
+with a ``callback`` URL under bounded concurrency, records the ``request_id`` of
+every accepted job, and provides a small ASGI/WSGI receiver that matches the
+audio Deepgram posts back to its job and streams it into pluggable storage.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+_logger = logging.getLogger(__name__)
+
+# Query parameter appended to the callback URL so each callback can be matched to its job.
+DEFAULT_JOB_PARAM = "dg_job_id"
+
+# Response header Deepgram sets on callback requests.
+_REQUEST_ID_HEADER = "dg-request-id"
+
+ManifestEntry = Union[str, Mapping[str, Any]]
+
+
+@dataclasses.dataclass
+class SpeakBatchJob:
+    """
+    One synthesis job of a callback-mode batch.
+
+    ``status`` moves from ``pending`` to ``submitted`` (accepted, ``request_id``
+    known) or ``failed``, and then to ``completed`` once the callback arrives.
+    """
+
+    job_id: str
+    text: str
+    options: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    status: str = "pending"
+    request_id: Optional[str] = None
+    error: Optional[str] = None
+    submitted_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    location: Optional[str] = None
+    audio_bytes: int = 0
+
+
+class SpeakBatchRegistry:
+    """
+    Thread-safe index of batch jobs by ``job_id`` and ``request_id``.
+
+    Share one registry between a submitter and a receiver, or persist it with
+    :meth:`dump` / :meth:`load` when they run in different processes.
+    """
+
+    def __init__(self, jobs: Optional[Iterable[SpeakBatchJob]] = None):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, SpeakBatchJob] = {}
+        self._by_request_id: Dict[str, str] = {}
+        for job in jobs or ():
+            self.add(job)
+
+    def add(self, job: SpeakBatchJob) -> None:
+        """Register (or replace) a job."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            if job.request_id:
+                self._by_request_id[job.request_id] = job.job_id
+
+    def set_request_id(self, job: SpeakBatchJob, request_id: str) -> None:
+        """Record the request id the API assigned to a job."""
+        with self._lock:
+            job.request_id = request_id
+            self._by_request_id[request_id] = job.job_id
+
+    def get(self, job_id: Optional[str] = None, request_id: Optional[str] = None) -> Optional[SpeakBatchJob]:
+        """Look a job up by job id, falling back to the request id."""
+        with self._lock:
+            if job_id is not None and job_id in self._jobs:
+                return self._jobs[job_id]
+            if request_id is not None and request_id in self._by_request_id:
+                return self._jobs[self._by_request_id[request_id]]
+        return None
+
+    def jobs(self, status: Optional[str] = None) -> List[SpeakBatchJob]:
+        """Return every job, optionally filtered by status."""
+        with self._lock:
+            return [job for job in self._jobs.values() if status is None or job.status == status]
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def dump(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write every job to a JSON Lines file."""
+        with open(path, "w", encoding="utf-8") as handle:
+            for job in self.jobs():
+                handle.write(json.dumps(dataclasses.asdict(job)) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"]) -> "SpeakBatchRegistry":
+        """Read a registry written by :meth:`dump`."""
+        with open(path, encoding="utf-8") as handle:
+            return cls(SpeakBatchJob(**json.loads(line)) for line in handle if line.strip())
+
+
+class DirectoryAudioStorage:
+    """
+    Stores callback audio as one file per job in a directory.
+
+    Files are named ``<job_id><extension>``.
+
+    Args:
+        directory: Target directory (created if missing)
+        extension: File extension for stored audio
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], *, extension: str = ".mp3"):
+        self.directory = os.fspath(directory)
+        self.extension = extension
+        os.makedirs(self.directory, exist_ok=True)
+
+    def open(self, job: SpeakBatchJob, content_type: Optional[str] = None) -> IO[bytes]:
+        """Open a writable binary file for a job's audio."""
+        return open(self.location(job), "wb")
+
+    def location(self, job: SpeakBatchJob) -> str:
+        """Path the audio for a job is written to."""
+        return os.path.join(self.directory, f"{job.job_id}{self.extension}")
+
+
+def _build_jobs(manifest: Iterable[ManifestEntry]) -> List[SpeakBatchJob]:
+    jobs = []
+    for entry in manifest:
+        if isinstance(entry, str):
+            jobs.append(SpeakBatchJob(job_id=uuid.uuid4().hex, text=entry))
+            continue
+        options = dict(entry)
+        text = options.pop("text")
+        job_id = str(options.pop("job_id", None) or uuid.uuid4().hex)
+        jobs.append(SpeakBatchJob(job_id=job_id, text=text, options=options))
+    return jobs
+
+
+def _callback_url(base_url: str, job_param: str, job_id: str) -> str:
+    parts = urllib.parse.urlsplit(base_url)
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    query.append((job_param, job_id))
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def _parse_acknowledgement(body: bytes) -> str:
+    try:
+        return str(json.loads(body)["request_id"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Expected a JSON acknowledgement with request_id, got {body[:200]!r}") from None
+
+
+class _SpeakBatchSubmitterBase:
+    def __init__(
+        self,
+        audio_client: Any,
+        callback_url: str,
+        *,
+        registry: Optional[SpeakBatchRegistry] = None,
+        max_concurrency: int = 8,
+        job_param: str = DEFAULT_JOB_PARAM,
+        on_submitted: Optional[Callable[[SpeakBatchJob], Any]] = None,
+        **generate_options: Any,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._audio_client = audio_client
+        self._callback_url = callback_url
+        self.registry = registry if registry is not None else SpeakBatchRegistry()
+        self._max_concurrency = max_concurrency
+        self._job_param = job_param
+        self._on_submitted = on_submitted
+        self._generate_options = generate_options
+
+    def _prepare(self, manifest: Iterable[ManifestEntry]) -> List[SpeakBatchJob]:
+        jobs = _build_jobs(manifest)
+        for job in jobs:
+            self.registry.add(job)
+        return jobs
+
+    def _request_kwargs(self, job: SpeakBatchJob) -> Dict[str, Any]:
+        return {
+            **self._generate_options,
+            **job.options,
+            "text": job.text,
+            "callback": _callback_url(self._callback_url, self._job_param, job.job_id),
+        }
+
+    def _accepted(self, job: SpeakBatchJob, body: bytes) -> None:
+        self.registry.set_request_id(job, _parse_acknowledgement(body))
+        job.status = "submitted"
+        job.submitted_at = time.time()
+        if self._on_submitted is not None:
+            self._on_submitted(job)
+
+    @staticmethod
+    def _failed(job: SpeakBatchJob, exc: Exception) -> None:
+        _logger.warning("Speak batch job %s failed to submit: %s", job.job_id, exc)
+        job.status = "failed"
+        job.error = str(exc)
+
+
+class SpeakBatchSubmitter(_SpeakBatchSubmitterBase):
+    """
+    Submits a manifest of texts as callback-mode TTS requests on a thread pool.
+
+    Each manifest entry is either a string or a mapping with ``text`` and any
+    per-job ``generate`` options (plus an optional ``job_id``). Failed
+    submissions are recorded on the job rather than raised.
+
+    Example:
+        submitter = SpeakBatchSubmitter(
+            client.speak.v1.audio,
+            "https://example.com/tts-callback",
+            model="aura-2-thalia-en",
+            max_concurrency=16,
+        )
+        jobs = submitter.submit(["Chapter one ...", {"text": "Chapter two ...", "job_id": "ch2"}])
+        submitter.registry.dump("jobs.jsonl")
+    """
+
+    def __init__(self, audio_client: Any, callback_url: str, **kwargs: Any):
+        """
+        Initialize the submitter.
+
+        Args:
+            audio_client: ``client.speak.v1.audio`` or ``client.speak.v2.audio``
+            callback_url: URL the receiver is reachable at
+            **kwargs: ``registry``, ``max_concurrency``, ``job_param``, ``on_submitted``,
+                and default ``generate`` options (model, encoding, ...)
+        """
+        super().__init__(audio_client, callback_url, **kwargs)
+
+    def submit(self, manifest: Iterable[ManifestEntry]) -> List[SpeakBatchJob]:
+        """
+        Submit every manifest entry and wait until all have been accepted or failed.
+
+        Returns:
+            The jobs in manifest order
+        """
+        jobs = self._prepare(manifest)
+        with ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="deepgram-speak-batch") as pool:
+            list(pool.map(self._submit_one, jobs))
+        return jobs
+
+    def _submit_one(self, job: SpeakBatchJob) -> None:
+        try:
+            body = b"".join(self._audio_client.generate(**self._request_kwargs(job)))
+            self._accepted(job, body)
+        except Exception as exc:
+            self._failed(job, exc)
+
+
+class AsyncSpeakBatchSubmitter(_SpeakBatchSubmitterBase):
+    """
+    Async analogue of :class:`SpeakBatchSubmitter` for ``AsyncDeepgramClient``.
+
+    Concurrency is bounded with an ``asyncio.Semaphore``.
+    """
+
+    async def submit(self, manifest: Iterable[ManifestEntry]) -> List[SpeakBatchJob]:
+        """Submit every manifest entry and wait until all have been accepted or failed."""
+        jobs = self._prepare(manifest)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _submit_one(job: SpeakBatchJob) -> None:
+            async with semaphore:
+                try:
+                    chunks = [chunk async for chunk in self._audio_client.generate(**self._request_kwargs(job))]
+                    self._accepted(job, b"".join(chunks))
+                except Exception as exc:
+                    self._failed(job, exc)
+
+        await asyncio.gather(*(_submit_one(job) for job in jobs))
+        return jobs
+
+
+class SpeakCallbackReceiver:
+    """
+    Receives Deepgram TTS callbacks and streams the audio into storage.
+
+    Exposes both an ASGI app (:meth:`asgi_app`) and a WSGI app
+    (:meth:`wsgi_app`) that accept the callback request on any path, match it
+    to a job by the ``job_param`` query parameter (falling back to the
+    ``dg-request-id`` header) and answer ``200``, or ``404`` for unknown jobs.
+
+    Example:
+        receiver = SpeakCallbackReceiver(submitter.registry, DirectoryAudioStorage("audio/"))
+        # uvicorn: uvicorn.run(receiver.asgi_app, port=8080)
+        # wsgiref: make_server("", 8080, receiver.wsgi_app).serve_forever()
+    """
+
+    def __init__(
+        self,
+        registry: SpeakBatchRegistry,
+        storage: Any,
+        *,
+        job_param: str = DEFAULT_JOB_PARAM,
+        on_completed: Optional[Callable[[SpeakBatchJob], Any]] = None,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        Initialize the receiver.
+
+        Args:
+            registry: Registry the submitter recorded jobs in
+            storage: Object with ``open(job, content_type) -> writable binary file``
+                and optionally ``location(job) -> str`` (e.g. DirectoryAudioStorage)
+            job_param: Query parameter carrying the job id
+            on_completed: Called with each completed job
+            chunk_size: Read size when streaming WSGI request bodies
+        """
+        self.registry = registry
+        self.storage = storage
+        self._job_param = job_param
+        self._on_completed = on_completed
+        self._chunk_size = chunk_size
+
+    def _match(self, query_string: str, headers: Mapping[str, str]) -> Optional[SpeakBatchJob]:
+        job_ids = urllib.parse.parse_qs(query_string).get(self._job_param)
+        return self.registry.get(job_id=job_ids[0] if job_ids else None, request_id=headers.get(_REQUEST_ID_HEADER))
+
+    def _complete(self, job: SpeakBatchJob, size: int) -> None:
+        job.audio_bytes = size
+        job.status = "completed"
+        job.completed_at = time.time()
+        location = getattr(self.storage, "location", None)
+        job.location = location(job) if callable(location) else None
+        if self._on_completed is not None:
+            self._on_completed(job)
+
+    async def asgi_app(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """ASGI 3 application handling one callback request."""
+        if scope["type"] != "http":
+            return
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        job = self._match(scope.get("query_string", b"").decode("latin-1"), headers)
+        status = 404
+        if job is not None:
+            size = 0
+            with self.storage.open(job, headers.get("content-type")) as handle:
+                more_body = True
+                while more_body:
+                    message = await receive()
+                    chunk = message.get("body", b"")
+                    if chunk:
+                        handle.write(chunk)
+                        size += len(chunk)
+                    more_body = message.get("more_body", False)
+            self._complete(job, size)
+            status = 200
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
+
+    def wsgi_app(self, environ: Dict[str, Any], start_response: Callable) -> List[bytes]:
+        """WSGI application handling one callback request."""
+        headers = {
+            key[5:].replace("_", "-").lower(): value for key, value in environ.items() if key.startswith("HTTP_")
+        }
+        job = self._match(environ.get("QUERY_STRING", ""), headers)
+        if job is None:
+            start_response("404 Not Found", [("Content-Length", "0")])
+            return [b""]
+        # Without a Content-Length the body is empty (PEP 3333), unless the server
+        # marks the input as terminated, e.g. for a chunked request.
+        remaining: Optional[int] = int(environ.get("CONTENT_LENGTH") or 0)
+        if not remaining and environ.get("wsgi.input_terminated"):
+            remaining = None
+        stream = environ["wsgi.input"]
+        size = 0
+        with self.storage.open(job, environ.get("CONTENT_TYPE")) as handle:
+            while remaining is None or remaining > 0:
+                chunk = stream.read(self._chunk_size if remaining is None else min(self._chunk_size, remaining))
+                if not chunk:
+                    break
+                handle.write(chunk)
+                size += len(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+        self._complete(job, size)
+        start_response("200 OK", [("Content-Length", "0")])
+        return [b""]
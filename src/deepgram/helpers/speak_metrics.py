@@ -0,0 +1,272 @@
+"""
+Speak V2 Per-Utterance Latency Metrics
+
+Correlates every ``send_speak`` on a ``speak.v2`` socket with the server's
+``SpeechStarted``, first audio byte, ``SpeechMetadata`` and ``Flushed`` messages
+and reports time-to-first-byte, synthesis real-time factor and throughput per
+utterance, plus aggregated histograms across utterances and sessions.
+"""
+
+import dataclasses
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from ..core.events import EventType
+from .latency_histogram import LatencyHistogram
+
+
+@dataclasses.dataclass
+class SpeakUtteranceMetrics:
+    """
+    Timing and size data for one speak v2 utterance (one Speak ... Flush turn).
+
+    Timestamps are ``time.monotonic()`` seconds.
+    """
+
+    sent_at: float
+    input_characters: int = 0
+    speech_id: Optional[str] = None
+    speech_started_at: Optional[float] = None
+    first_audio_at: Optional[float] = None
+    last_audio_at: Optional[float] = None
+    flushed_at: Optional[float] = None
+    audio_bytes: int = 0
+    audio_duration_ms: Optional[int] = None
+    billable_character_count: Optional[int] = None
+
+    @property
+    def time_to_first_byte_ms(self) -> Optional[float]:
+        """Milliseconds from the first ``send_speak`` to the first audio byte."""
+        if self.first_audio_at is None:
+            return None
+        return (self.first_audio_at - self.sent_at) * 1000
+
+    @property
+    def time_to_speech_started_ms(self) -> Optional[float]:
+        """Milliseconds from the first ``send_speak`` to ``SpeechStarted``."""
+        if self.speech_started_at is None:
+            return None
+        return (self.speech_started_at - self.sent_at) * 1000
+
+    @property
+    def synthesis_ms(self) -> Optional[float]:
+        """Milliseconds from the first ``send_speak`` to ``Flushed``."""
+        if self.flushed_at is None:
+            return None
+        return (self.flushed_at - self.sent_at) * 1000
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """Synthesis wall time divided by the audio duration (< 1.0 is faster than real time)."""
+        synthesis_ms = self.synthesis_ms
+        if synthesis_ms is None or not self.audio_duration_ms:
+            return None
+        return synthesis_ms / self.audio_duration_ms
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        """Audio bytes received per second between the first and last audio byte."""
+        if self.first_audio_at is None or self.last_audio_at is None:
+            return None
+        elapsed = self.last_audio_at - self.first_audio_at
+        if elapsed <= 0:
+            return None
+        return self.audio_bytes / elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the raw fields and derived metrics as a plain dict."""
+        data = dataclasses.asdict(self)
+        data.update(
+            time_to_first_byte_ms=self.time_to_first_byte_ms,
+            time_to_speech_started_ms=self.time_to_speech_started_ms,
+            synthesis_ms=self.synthesis_ms,
+            real_time_factor=self.real_time_factor,
+            bytes_per_second=self.bytes_per_second,
+        )
+        return data
+
+
+class SpeakLatencyStats:
+    """
+    Aggregated histograms of speak v2 utterance metrics.
+
+    Share one instance between many trackers to aggregate across sessions.
+    """
+
+    METRICS = ("time_to_first_byte_ms", "time_to_speech_started_ms", "real_time_factor", "bytes_per_second")
+
+    def __init__(self, relative_error: float = 0.01):
+        self.histograms: Dict[str, LatencyHistogram] = {name: LatencyHistogram(relative_error) for name in self.METRICS}
+
+    def record(self, utterance: SpeakUtteranceMetrics) -> None:
+        """Record every available metric of a completed utterance."""
+        for name, histogram in self.histograms.items():
+            value = getattr(utterance, name)
+            if value is not None:
+                histogram.record(value)
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return ``{metric: {count, min, max, mean, p50, p95, p99}}``."""
+        return {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+
+
+class SpeakV2LatencyTracker:
+    """
+    Tracks per-utterance latency on a ``speak.v2`` socket client (sync or async).
+
+    ``attach`` wraps the socket's ``send_speak`` / ``send_flush`` to timestamp
+    each turn and registers a ``EventType.MESSAGE`` handler. All ``send_speak``
+    calls up to a ``send_flush`` form one utterance. Turns are matched to
+    ``SpeechStarted`` in order, audio bytes are attributed to the oldest
+    unflushed turn, and ``SpeechMetadata`` / ``Flushed`` are matched by
+    ``speech_id``. An utterance completes once both ``Flushed`` and
+    ``SpeechMetadata`` have arrived (or when a later turn completes, or the
+    socket closes).
+
+    Example:
+        stats = SpeakLatencyStats()
+        with client.speak.v2.connect(model="flux-alexis-en", encoding="linear16", sample_rate=24000) as socket:
+            SpeakV2LatencyTracker(stats=stats, on_utterance=print).attach(socket)
+            ...
+        stats.snapshot()["time_to_first_byte_ms"]["p95"]
+    """
+
+    def __init__(
+        self,
+        *,
+        on_utterance: Optional[Callable[[SpeakUtteranceMetrics], Any]] = None,
+        stats: Optional[SpeakLatencyStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            on_utterance: Called with each completed SpeakUtteranceMetrics
+            stats: Aggregate to record into (a new one is created if omitted)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.on_utterance = on_utterance
+        self.stats = stats if stats is not None else SpeakLatencyStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._open: Optional[SpeakUtteranceMetrics] = None
+        self._inflight: Deque[SpeakUtteranceMetrics] = deque()
+        self._by_speech_id: Dict[str, SpeakUtteranceMetrics] = {}
+        self.completed: Deque[SpeakUtteranceMetrics] = deque(maxlen=100)
+
+    def attach(self, socket_client: Any) -> "SpeakV2LatencyTracker":
+        """
+        Instrument a speak v2 socket client. Returns self for chaining.
+
+        Args:
+            socket_client: ``V2SocketClient`` or ``AsyncV2SocketClient`` from ``speak.v2.connect``
+
+        Returns:
+            Self for method chaining
+        """
+        send_speak = socket_client.send_speak
+        send_flush = socket_client.send_flush
+
+        def _send_speak(message: Any) -> Any:
+            self.on_speak(message)
+            return send_speak(message)
+
+        def _send_flush(message: Any = None) -> Any:
+            self.on_flush()
+            return send_flush(message)
+
+        socket_client.send_speak = _send_speak
+        socket_client.send_flush = _send_flush
+        socket_client.on(EventType.MESSAGE, self.on_message)
+        socket_client.on(EventType.CLOSE, lambda _: self.finish())
+        return self
+
+    def on_speak(self, message: Any) -> None:
+        """Record an outgoing Speak message."""
+        text = getattr(message, "text", None)
+        if text is None and isinstance(message, dict):
+            text = message.get("text")
+        with self._lock:
+            if self._open is None:
+                self._open = SpeakUtteranceMetrics(sent_at=self._clock())
+                self._inflight.append(self._open)
+            self._open.input_characters += len(text or "")
+
+    def on_flush(self) -> None:
+        """Record an outgoing Flush, closing the current utterance."""
+        with self._lock:
+            self._open = None
+
+    def on_message(self, message: Any) -> None:
+        """Handle one message from the socket's MESSAGE event."""
+        now = self._clock()
+        if isinstance(message, (bytes, bytearray)):
+            with self._lock:
+                utterance = next((u for u in self._inflight if u.flushed_at is None), None)
+                if utterance is not None:
+                    if utterance.first_audio_at is None:
+                        utterance.first_audio_at = now
+                    utterance.last_audio_at = now
+                    utterance.audio_bytes += len(message)
+            return
+
+        message_type = getattr(message, "type", None)
+        speech_id = getattr(message, "speech_id", None)
+        completed: List[SpeakUtteranceMetrics] = []
+        with self._lock:
+            if message_type == "SpeechStarted":
+                utterance = next((u for u in self._inflight if u.speech_id is None), None)
+                if utterance is not None:
+                    utterance.speech_id = speech_id
+                    utterance.speech_started_at = now
+                    if speech_id is not None:
+                        self._by_speech_id[speech_id] = utterance
+            elif message_type == "SpeechMetadata":
+                utterance = self._by_speech_id.get(speech_id) if speech_id is not None else None
+                if utterance is not None:
+                    utterance.audio_duration_ms = getattr(message, "audio_duration_ms", None)
+                    utterance.billable_character_count = getattr(message, "billable_character_count", None)
+                    if utterance.flushed_at is not None:
+                        completed = self._pop_completed(utterance)
+            elif message_type == "Flushed":
+                utterance = self._by_speech_id.get(speech_id) if speech_id is not None else None
+                if utterance is None:
+                    utterance = next((u for u in self._inflight if u.flushed_at is None), None)
+                if utterance is not None:
+                    utterance.flushed_at = now
+                    if utterance.audio_duration_ms is not None:
+                        completed = self._pop_completed(utterance)
+        self._report(completed)
+
+    def finish(self) -> None:
+        """Report every flushed utterance still waiting for metadata (called on CLOSE)."""
+        with self._lock:
+            completed = [u for u in self._inflight if u.flushed_at is not None]
+            self._inflight.clear()
+            self._by_speech_id.clear()
+            self._open = None
+        self._report(completed)
+
+    def _pop_completed(self, utterance: SpeakUtteranceMetrics) -> List[SpeakUtteranceMetrics]:
+        # Completing a turn also completes older flushed turns whose metadata never arrived.
+        completed = []
+        for candidate in self._inflight:
+            if candidate is utterance or candidate.flushed_at is not None:
+                completed.append(candidate)
+            if candidate is utterance:
+                break
+        for candidate in completed:
+            self._inflight.remove(candidate)
+            if candidate.speech_id is not None:
+                self._by_speech_id.pop(candidate.speech_id, None)
+        return completed
+
+    def _report(self, completed: List[SpeakUtteranceMetrics]) -> None:
+        for utterance in completed:
+            self.completed.append(utterance)
+            self.stats.record(utterance)
+            if self.on_utterance is not None:
+                self.on_utterance(utterance)
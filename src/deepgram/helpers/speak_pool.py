@@ -0,0 +1,456 @@
+"""
+Pre-warmed Speak WebSocket Session Pools
+
+Keeps open ``speak.v1.connect`` / ``speak.v2.connect`` sessions ready per
+connection key (model, encoding, sample_rate, ...) so that time-to-first-audio
+does not include the TLS/WebSocket handshake.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Set
+
+from ._pooling import PooledSession, SessionKey, run_with_timeout
+
+_logger = logging.getLogger(__name__)
+
+# Reply the server sends once a reset control message has been processed.
+_RESET_ACKS = {"Cleared", "Flushed"}
+
+
+def _session_key(connect_kwargs: Dict[str, Any]) -> SessionKey:
+    return tuple(sorted((name, value) for name, value in connect_kwargs.items() if value is not None))
+
+
+class SpeakSessionPool:
+    """
+    Pool of pre-opened sync speak WebSocket sessions.
+
+    Sessions are grouped by the keyword arguments passed to ``connect`` and up to
+    ``size`` idle sessions are kept warm for every key that has been used or
+    warmed. Leasing a session hands out an idle one (opening a new one only if
+    none is ready) and schedules a replacement in the background. On return the
+    session is reset (``send_clear`` on speak v1, ``send_flush`` on speak v2) and
+    drained up to the server's acknowledgement (waiting at most ``reset_timeout``)
+    before being reused. Sessions that raise, fail to reset in time or exceed
+    ``max_age`` / ``max_idle`` are closed.
+
+    Example:
+        pool = SpeakSessionPool(client.speak.v1, size=2)
+        pool.warm(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000)
+
+        with pool.session(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000) as socket:
+            socket.send_text(SpeakV1Text(text="Hello"))
+            socket.send_flush()
+            ...
+
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        speak_client: Any,
+        *,
+        size: int = 1,
+        max_age: Optional[float] = 300.0,
+        max_idle: Optional[float] = 60.0,
+        max_workers: int = 4,
+        reset_timeout: float = 5.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            speak_client: ``client.speak.v1`` or ``client.speak.v2`` (anything with a ``connect`` context manager)
+            size: Number of idle sessions to keep warm per key
+            max_age: Close sessions older than this many seconds (None to disable)
+            max_idle: Close sessions idle for longer than this many seconds (None to disable)
+            max_workers: Threads used to open replacement sessions in the background
+            reset_timeout: Seconds to wait for the server to acknowledge a reset
+        """
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self._speak_client = speak_client
+        self._size = size
+        self._max_age = max_age
+        self._max_idle = max_idle
+        self._reset_timeout = reset_timeout
+        self._idle: Dict[SessionKey, Deque[PooledSession]] = {}
+        self._kwargs: Dict[SessionKey, Dict[str, Any]] = {}
+        self._opening: Dict[SessionKey, int] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deepgram-speak-pool")
+        self._closed = False
+
+    def warm(self, **connect_kwargs: Any) -> None:
+        """
+        Open sessions for a key until ``size`` idle sessions are available.
+
+        Blocks until the sessions are open.
+
+        Args:
+            **connect_kwargs: Keyword arguments for ``connect`` (model, encoding, sample_rate, ...)
+        """
+        key = self._register(connect_kwargs)
+        with self._lock:
+            missing = self._size - len(self._idle[key]) - self._opening[key]
+            self._opening[key] += max(missing, 0)
+        futures = [self._executor.submit(self._open_into_pool, key) for _ in range(max(missing, 0))]
+        for future in futures:
+            future.result()
+
+    @contextlib.contextmanager
+    def session(self, **connect_kwargs: Any) -> Iterator[Any]:
+        """
+        Lease a session for the duration of the ``with`` block.
+
+        Args:
+            **connect_kwargs: Keyword arguments for ``connect`` (model, encoding, sample_rate, ...)
+
+        Yields:
+            An open speak socket client
+        """
+        pooled = self.acquire(**connect_kwargs)
+        try:
+            yield pooled.socket
+        except BaseException:
+            self.discard(pooled)
+            raise
+        else:
+            self.release(pooled)
+
+    def acquire(self, **connect_kwargs: Any) -> PooledSession:
+        """
+        Take a session out of the pool, opening one if none is ready.
+
+        Pair every call with :meth:`release` or :meth:`discard`; prefer :meth:`session`.
+        """
+        if self._closed:
+            raise RuntimeError("SpeakSessionPool is closed")
+        key = self._register(connect_kwargs)
+        pooled: Optional[PooledSession] = None
+        stale = []
+        with self._lock:
+            idle = self._idle[key]
+            while idle:
+                candidate = idle.popleft()
+                if candidate.is_stale(self._max_age, self._max_idle):
+                    stale.append(candidate)
+                    continue
+                pooled = candidate
+                break
+        for candidate in stale:
+            self._close_session(candidate)
+        if pooled is None:
+            pooled = self._open(key)
+        self._replenish(key)
+        return pooled
+
+    def release(self, pooled: PooledSession) -> None:
+        """Reset a leased session and return it to the pool."""
+        if self._closed or pooled.is_stale(self._max_age, None):
+            self._close_session(pooled)
+            return
+        try:
+            _reset_socket(pooled.socket, self._reset_timeout)
+        except Exception as exc:
+            _logger.debug("Discarding speak session that failed to reset: %s", exc)
+            self._close_session(pooled)
+            self._replenish(pooled.key)
+            return
+        pooled.idle_since = time.monotonic()
+        with self._lock:
+            idle = self._idle[pooled.key]
+            if len(idle) < self._size:
+                idle.append(pooled)
+                pooled = None  # type: ignore[assignment]
+        if pooled is not None:
+            self._close_session(pooled)
+
+    def discard(self, pooled: PooledSession) -> None:
+        """Close a leased session instead of returning it (e.g. after an error)."""
+        self._close_session(pooled)
+        self._replenish(pooled.key)
+
+    def idle_count(self, **connect_kwargs: Any) -> int:
+        """Number of idle sessions currently held for a key."""
+        with self._lock:
+            return len(self._idle.get(_session_key(connect_kwargs), ()))
+
+    def close(self) -> None:
+        """Close every idle session and stop background warming."""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            sessions = [pooled for idle in self._idle.values() for pooled in idle]
+            self._idle.clear()
+        for pooled in sessions:
+            self._close_session(pooled)
+
+    def __enter__(self) -> "SpeakSessionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _register(self, connect_kwargs: Dict[str, Any]) -> SessionKey:
+        key = _session_key(connect_kwargs)
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = deque()
+                self._kwargs[key] = dict(connect_kwargs)
+                self._opening[key] = 0
+        return key
+
+    def _open(self, key: SessionKey) -> PooledSession:
+        exit_stack = contextlib.ExitStack()
+        try:
+            socket = exit_stack.enter_context(self._speak_client.connect(**self._kwargs[key]))
+        except BaseException:
+            exit_stack.close()
+            raise
+        return PooledSession(socket, key, exit_stack)
+
+    def _open_into_pool(self, key: SessionKey) -> None:
+        try:
+            pooled = self._open(key)
+        except Exception as exc:
+            _logger.warning("Failed to pre-open speak session: %s", exc)
+            with self._lock:
+                self._opening[key] -= 1
+            return
+        with self._lock:
+            self._opening[key] -= 1
+            if not self._closed and len(self._idle[key]) < self._size:
+                self._idle[key].append(pooled)
+                pooled = None  # type: ignore[assignment]
+        if pooled is not None:
+            self._close_session(pooled)
+
+    def _replenish(self, key: SessionKey) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            missing = self._size - len(self._idle[key]) - self._opening[key]
+            if missing <= 0:
+                return
+            self._opening[key] += missing
+        for _ in range(missing):
+            self._executor.submit(self._open_into_pool, key)
+
+    @staticmethod
+    def _close_session(pooled: PooledSession) -> None:
+        try:
+            pooled._exit_stack.close()
+        except Exception as exc:
+            _logger.debug("Error while closing pooled speak session: %s", exc)
+
+
+class AsyncSpeakSessionPool:
+    """
+    Async analogue of :class:`SpeakSessionPool` for ``AsyncDeepgramClient``.
+
+    Replacement sessions are opened as background tasks on the running event
+    loop; resets are bounded by ``reset_timeout``.
+
+    Example:
+        pool = AsyncSpeakSessionPool(client.speak.v1, size=2)
+        await pool.warm(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000)
+
+        async with pool.session(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000) as socket:
+            await socket.send_text(SpeakV1Text(text="Hello"))
+            ...
+
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        speak_client: Any,
+        *,
+        size: int = 1,
+        max_age: Optional[float] = 300.0,
+        max_idle: Optional[float] = 60.0,
+        reset_timeout: float = 5.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            speak_client: ``client.speak.v1`` or ``client.speak.v2`` of an ``AsyncDeepgramClient``
+            size: Number of idle sessions to keep warm per key
+            max_age: Close sessions older than this many seconds (None to disable)
+            max_idle: Close sessions idle for longer than this many seconds (None to disable)
+            reset_timeout: Seconds to wait for the server to acknowledge a reset
+        """
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self._speak_client = speak_client
+        self._size = size
+        self._max_age = max_age
+        self._max_idle = max_idle
+        self._reset_timeout = reset_timeout
+        self._idle: Dict[SessionKey, Deque[PooledSession]] = {}
+        self._kwargs: Dict[SessionKey, Dict[str, Any]] = {}
+        self._opening: Dict[SessionKey, int] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+
+    async def warm(self, **connect_kwargs: Any) -> None:
+        """Open sessions for a key until ``size`` idle sessions are available."""
+        key = self._register(connect_kwargs)
+        missing = max(self._size - len(self._idle[key]) - self._opening[key], 0)
+        self._opening[key] += missing
+        await asyncio.gather(*(self._open_into_pool(key) for _ in range(missing)))
+
+    @contextlib.asynccontextmanager
+    async def session(self, **connect_kwargs: Any) -> AsyncIterator[Any]:
+        """Lease a session for the duration of the ``async with`` block."""
+        pooled = await self.acquire(**connect_kwargs)
+        try:
+            yield pooled.socket
+        except BaseException:
+            await self.discard(pooled)
+            raise
+        else:
+            await self.release(pooled)
+
+    async def acquire(self, **connect_kwargs: Any) -> PooledSession:
+        """Take a session out of the pool, opening one if none is ready."""
+        if self._closed:
+            raise RuntimeError("AsyncSpeakSessionPool is closed")
+        key = self._register(connect_kwargs)
+        idle = self._idle[key]
+        pooled: Optional[PooledSession] = None
+        while idle:
+            candidate = idle.popleft()
+            if candidate.is_stale(self._max_age, self._max_idle):
+                await self._close_session(candidate)
+                continue
+            pooled = candidate
+            break
+        if pooled is None:
+            pooled = await self._open(key)
+        self._replenish(key)
+        return pooled
+
+    async def release(self, pooled: PooledSession) -> None:
+        """Reset a leased session and return it to the pool."""
+        if self._closed or pooled.is_stale(self._max_age, None):
+            await self._close_session(pooled)
+            return
+        try:
+            await asyncio.wait_for(_reset_socket_async(pooled.socket), timeout=self._reset_timeout)
+        except Exception as exc:
+            _logger.debug("Discarding speak session that failed to reset: %s", exc)
+            await self._close_session(pooled)
+            self._replenish(pooled.key)
+            return
+        pooled.idle_since = time.monotonic()
+        idle = self._idle[pooled.key]
+        if len(idle) < self._size:
+            idle.append(pooled)
+        else:
+            await self._close_session(pooled)
+
+    async def discard(self, pooled: PooledSession) -> None:
+        """Close a leased session instead of returning it (e.g. after an error)."""
+        await self._close_session(pooled)
+        self._replenish(pooled.key)
+
+    def idle_count(self, **connect_kwargs: Any) -> int:
+        """Number of idle sessions currently held for a key."""
+        return len(self._idle.get(_session_key(connect_kwargs), ()))
+
+    async def close(self) -> None:
+        """Close every idle session and cancel background warming."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        sessions = [pooled for idle in self._idle.values() for pooled in idle]
+        self._idle.clear()
+        for pooled in sessions:
+            await self._close_session(pooled)
+
+    async def __aenter__(self) -> "AsyncSpeakSessionPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _register(self, connect_kwargs: Dict[str, Any]) -> SessionKey:
+        key = _session_key(connect_kwargs)
+        if key not in self._idle:
+            self._idle[key] = deque()
+            self._kwargs[key] = dict(connect_kwargs)
+            self._opening[key] = 0
+        return key
+
+    async def _open(self, key: SessionKey) -> PooledSession:
+        exit_stack = contextlib.AsyncExitStack()
+        try:
+            socket = await exit_stack.enter_async_context(self._speak_client.connect(**self._kwargs[key]))
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+        return PooledSession(socket, key, exit_stack)
+
+    async def _open_into_pool(self, key: SessionKey) -> None:
+        try:
+            pooled = await self._open(key)
+        except Exception as exc:
+            _logger.warning("Failed to pre-open speak session: %s", exc)
+            return
+        finally:
+            self._opening[key] -= 1
+        if not self._closed and len(self._idle[key]) < self._size:
+            self._idle[key].append(pooled)
+        else:
+            await self._close_session(pooled)
+
+    def _replenish(self, key: SessionKey) -> None:
+        if self._closed:
+            return
+        missing = self._size - len(self._idle[key]) - self._opening[key]
+        for _ in range(max(missing, 0)):
+            self._opening[key] += 1
+            task = asyncio.ensure_future(self._open_into_pool(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _close_session(pooled: PooledSession) -> None:
+        try:
+            await pooled._exit_stack.aclose()
+        except Exception as exc:
+            _logger.debug("Error while closing pooled speak session: %s", exc)
+
+
+def _reset_socket(socket: Any, timeout: float) -> None:
+    """Clear (v1) or flush (v2) a sync socket and drain until the server acknowledges, within ``timeout``."""
+
+    def _drain() -> None:
+        if hasattr(socket, "send_clear"):
+            socket.send_clear()
+        else:
+            socket.send_flush()
+        while getattr(socket.recv(), "type", None) not in _RESET_ACKS:
+            pass
+
+    run_with_timeout(_drain, timeout, "speak session reset not acknowledged")
+
+
+async def _reset_socket_async(socket: Any) -> None:
+    """Async analogue of :func:`_reset_socket`."""
+    if hasattr(socket, "send_clear"):
+        await socket.send_clear()
+    else:
+        await socket.send_flush()
+    while getattr(await socket.recv(), "type", None) not in _RESET_ACKS:
+        pass
@@ -0,0 +1,379 @@
+"""
+Streaming Transcript Assembler
+
+Builds a running transcript from ``listen.v1`` ``Results`` and ``listen.v2``
+(Flux) ``TurnInfo`` messages. Final segments are appended once; the latest
+interim segment is held separately and replaced when its final arrives.
+Every final word is recorded in a column-oriented :class:`WordTimeline`
+(``array`` columns for start, end, confidence and speaker) that answers
+time-range queries with binary search. Snapshots share the underlying
+storage and cost O(1) to take.
+"""
+
+import bisect
+import dataclasses
+import threading
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+
+from ._utils import get_field
+
+_NO_SPEAKER = -1
+
+# word, start, end, confidence, speaker, punctuated word
+_WordRow = Tuple[str, float, float, float, Optional[int], Optional[str]]
+
+# Slack for floating point drift between one final's end and the next one's start.
+_OVERLAP_TOLERANCE = 0.01
+
+# Flux events that carry the in-progress (not yet final) transcript of a turn.
+_INTERIM_EVENTS = ("StartOfTurn", "Update", "EagerEndOfTurn", "TurnResumed")
+
+
+@dataclasses.dataclass(frozen=True)
+class TimelineWord:
+    """One word of a :class:`WordTimeline`."""
+
+    word: str
+    start: float
+    end: float
+    confidence: float
+    speaker: Optional[int] = None
+    punctuated_word: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """The punctuated word when available, otherwise the raw word."""
+        return self.punctuated_word or self.word
+
+
+class WordTimeline:
+    """
+    Append-only word timeline stored as parallel columns.
+
+    Numeric fields live in ``array`` columns (``start``, ``end``,
+    ``confidence``, ``speaker``; a speaker of -1 means none) and strings in
+    lists, so appending a word is O(1) and no per-word objects are kept.
+    Words are expected in time order, which ``listen`` results guarantee;
+    :meth:`between` and :meth:`index_at` then run in O(log n).
+    """
+
+    def __init__(self) -> None:
+        self.start = array("d")
+        self.end = array("d")
+        self.confidence = array("d")
+        self.speaker = array("i")
+        self.words: List[str] = []
+        self.punctuated_words: List[Optional[str]] = []
+        self._length = 0
+        self._frozen = False
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> TimelineWord:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("timeline index out of range")
+        speaker = self.speaker[index]
+        return TimelineWord(
+            word=self.words[index],
+            start=self.start[index],
+            end=self.end[index],
+            confidence=self.confidence[index],
+            speaker=None if speaker == _NO_SPEAKER else speaker,
+            punctuated_word=self.punctuated_words[index],
+        )
+
+    def __iter__(self) -> Iterator[TimelineWord]:
+        return (self[index] for index in range(self._length))
+
+    def append(
+        self,
+        word: str,
+        start: float,
+        end: float,
+        confidence: float = 0.0,
+        speaker: Optional[int] = None,
+        punctuated_word: Optional[str] = None,
+    ) -> None:
+        """Append one word after the current last word."""
+        if self._frozen:
+            raise RuntimeError("timeline snapshots are read-only")
+        self.start.append(start)
+        self.end.append(end)
+        self.confidence.append(confidence)
+        self.speaker.append(_NO_SPEAKER if speaker is None else speaker)
+        self.words.append(word)
+        self.punctuated_words.append(punctuated_word)
+        self._length += 1
+
+    def between(self, start: float, end: float) -> range:
+        """Return the indices of the words that overlap ``[start, end)``."""
+        low = bisect.bisect_right(self.end, start, 0, self._length)
+        high = bisect.bisect_left(self.start, end, low, self._length)
+        return range(low, high)
+
+    def words_between(self, start: float, end: float) -> List[TimelineWord]:
+        """Return the words that overlap ``[start, end)``."""
+        return [self[index] for index in self.between(start, end)]
+
+    def index_at(self, time: float) -> Optional[int]:
+        """Return the index of the word spoken at ``time``, if any."""
+        index = bisect.bisect_right(self.start, time, 0, self._length) - 1
+        if index >= 0 and time < self.end[index]:
+            return index
+        return None
+
+    def text(self, start: Optional[float] = None, end: Optional[float] = None) -> str:
+        """Join the (punctuated) words in a time range, or all words."""
+        indices = (
+            range(self._length)
+            if start is None and end is None
+            else self.between(float("-inf") if start is None else start, float("inf") if end is None else end)
+        )
+        return " ".join(self.punctuated_words[index] or self.words[index] for index in indices)
+
+    def _view(self) -> "WordTimeline":
+        # Columns are only ever appended to (truncation swaps in new columns),
+        # so a length-limited view of the same columns stays valid.
+        view = WordTimeline.__new__(WordTimeline)
+        view.__dict__.update(self.__dict__)
+        view._frozen = True
+        return view
+
+    def _truncate(self, length: int) -> None:
+        # Copy on write: snapshots keep the old columns.
+        self.start = self.start[:length]
+        self.end = self.end[:length]
+        self.confidence = self.confidence[:length]
+        self.speaker = self.speaker[:length]
+        self.words = self.words[:length]
+        self.punctuated_words = self.punctuated_words[:length]
+        self._length = length
+
+
+@dataclasses.dataclass(frozen=True)
+class TranscriptSegment:
+    """A final result or Flux turn, with its slice of the word timeline."""
+
+    start: float
+    end: float
+    transcript: str
+    first_word: int
+    word_count: int
+    speech_final: bool = False
+    turn_index: Optional[int] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class InterimSegment:
+    """The latest non-final result or in-progress Flux turn."""
+
+    start: float
+    end: float
+    transcript: str
+    turn_index: Optional[int] = None
+
+
+class TranscriptSnapshot:
+    """Read-only view of a :class:`TranscriptAssembler` at one point in time."""
+
+    def __init__(self, segments: List[TranscriptSegment], count: int, timeline: WordTimeline, interim: Any):
+        self._segments = segments
+        self._count = count
+        self.timeline = timeline
+        self.interim: Optional[InterimSegment] = interim
+        self._text: Optional[str] = None
+
+    @property
+    def segments(self) -> List[TranscriptSegment]:
+        """Final segments in the snapshot."""
+        return self._segments[: self._count]
+
+    @property
+    def text(self) -> str:
+        """Final transcript (joined on first access)."""
+        if self._text is None:
+            self._text = " ".join(segment.transcript for segment in self._segments[: self._count] if segment.transcript)
+        return self._text
+
+    @property
+    def full_text(self) -> str:
+        """Final transcript followed by the interim text, if any."""
+        if self.interim is None or not self.interim.transcript:
+            return self.text
+        return f"{self.text} {self.interim.transcript}" if self.text else self.interim.transcript
+
+
+class TranscriptAssembler:
+    """
+    Incremental transcript for ``listen.v1`` and ``listen.v2`` socket clients.
+
+    For ``listen.v1``, ``Results`` with ``is_final`` become final segments and
+    others replace the interim segment. A final that starts before the end of
+    the previous finals (for example after ``Finalize``) replaces the finals
+    and words it overlaps instead of duplicating them. For ``listen.v2``,
+    ``EndOfTurn`` finalizes a turn and the other ``TurnInfo`` events update the
+    interim segment. Flux words without timestamps use the turn's audio window.
+
+    Example:
+        assembler = TranscriptAssembler().attach(connection)
+        connection.start_listening()
+        print(assembler.text)
+        for word in assembler.timeline.words_between(60.0, 65.0):
+            print(word.start, word.text)
+    """
+
+    def __init__(self, channel: Optional[int] = None):
+        """
+        Initialize the assembler.
+
+        Args:
+            channel: For multichannel ``listen.v1`` connections, the only channel
+                to assemble (None accepts every result)
+        """
+        self.channel = channel
+        self.timeline = WordTimeline()
+        self.interim: Optional[InterimSegment] = None
+        self._segments: List[TranscriptSegment] = []
+        self._segment_ends = array("d")
+        self._lock = threading.Lock()
+        self._text_cache: Tuple[Any, int, str] = (None, 0, "")
+
+    def attach(self, socket_client: Any) -> "TranscriptAssembler":
+        """Subscribe to ``Results`` and ``TurnInfo`` on a listen socket. Returns self for chaining."""
+        socket_client.on("Results", self.on_results)
+        socket_client.on("TurnInfo", self.on_turn_info)
+        return self
+
+    @property
+    def segments(self) -> List[TranscriptSegment]:
+        """Final segments in time order."""
+        return list(self._segments)
+
+    @property
+    def text(self) -> str:
+        """Final transcript; only segments added since the last call are joined."""
+        with self._lock:
+            segments, count = self._segments, len(self._segments)
+            cached_list, cached_count, cached = self._text_cache
+            if cached_list is not segments or cached_count > count:
+                cached_count, cached = 0, ""
+            if cached_count < count:
+                new = " ".join(s.transcript for s in segments[cached_count:count] if s.transcript)
+                cached = f"{cached} {new}" if cached and new else cached or new
+                self._text_cache = (segments, count, cached)
+            return cached
+
+    @property
+    def full_text(self) -> str:
+        """Final transcript followed by the interim text, if any."""
+        interim = self.interim
+        text = self.text
+        if interim is None or not interim.transcript:
+            return text
+        return f"{text} {interim.transcript}" if text else interim.transcript
+
+    def snapshot(self) -> TranscriptSnapshot:
+        """Return an O(1) read-only snapshot that later messages do not change."""
+        with self._lock:
+            return TranscriptSnapshot(self._segments, len(self._segments), self.timeline._view(), self.interim)
+
+    def on_results(self, message: Any) -> None:
+        """Handle one ``listen.v1`` ``Results`` message."""
+        if self.channel is not None:
+            index = get_field(message, "channel_index") or [0]
+            if index[0] != self.channel:
+                return
+        alternatives = get_field(get_field(message, "channel"), "alternatives") or []
+        best = alternatives[0] if alternatives else None
+        transcript = (get_field(best, "transcript") or "") if best is not None else ""
+        start = float(get_field(message, "start") or 0.0)
+        end = start + float(get_field(message, "duration") or 0.0)
+        if not get_field(message, "is_final"):
+            self.interim = InterimSegment(start=start, end=end, transcript=transcript)
+            return
+        words: List[_WordRow] = [
+            (
+                get_field(word, "word") or "",
+                float(get_field(word, "start") or 0.0),
+                float(get_field(word, "end") or 0.0),
+                float(get_field(word, "confidence") or 0.0),
+                get_field(word, "speaker"),
+                get_field(word, "punctuated_word"),
+            )
+            for word in ((get_field(best, "words") or []) if best is not None else [])
+        ]
+        self._add_final(start, end, transcript, words, bool(get_field(message, "speech_final")), None)
+
+    def on_turn_info(self, message: Any) -> None:
+        """Handle one ``listen.v2`` ``TurnInfo`` message."""
+        event = get_field(message, "event")
+        turn_index = get_field(message, "turn_index")
+        start = float(get_field(message, "audio_window_start") or 0.0)
+        end = float(get_field(message, "audio_window_end") or start)
+        transcript = get_field(message, "transcript") or ""
+        if event in _INTERIM_EVENTS:
+            self.interim = InterimSegment(start=start, end=end, transcript=transcript, turn_index=turn_index)
+            return
+        if event != "EndOfTurn":
+            return
+        words: List[_WordRow] = []
+        for word in get_field(message, "words") or []:
+            word_start = get_field(word, "start")
+            word_end = get_field(word, "end")
+            text = get_field(word, "word") or ""
+            words.append(
+                (
+                    text,
+                    start if word_start is None else float(word_start),
+                    end if word_end is None else float(word_end),
+                    float(get_field(word, "confidence") or 0.0),
+                    None,
+                    text,
+                )
+            )
+        self._add_final(start, end, transcript, words, True, turn_index)
+
+    def _add_final(
+        self,
+        start: float,
+        end: float,
+        transcript: str,
+        words: List[_WordRow],
+        speech_final: bool,
+        turn_index: Optional[int],
+    ) -> None:
+        with self._lock:
+            timeline = self.timeline
+            if turn_index is None:
+                # A final that starts inside already finalized audio replaces it.
+                keep = bisect.bisect_right(self._segment_ends, start + _OVERLAP_TOLERANCE)
+            else:
+                # A repeated EndOfTurn for the last turn replaces it.
+                keep = len(self._segments)
+                if keep and self._segments[-1].turn_index == turn_index:
+                    keep -= 1
+            if keep < len(self._segments):
+                first_word = self._segments[keep].first_word
+                self._segments = self._segments[:keep]
+                self._segment_ends = self._segment_ends[:keep]
+                timeline._truncate(first_word)
+            first_word = len(timeline)
+            for word in words:
+                timeline.append(*word)
+            self._segments.append(
+                TranscriptSegment(
+                    start=start,
+                    end=end,
+                    transcript=transcript,
+                    first_word=first_word,
+                    word_count=len(words),
+                    speech_final=speech_final,
+                    turn_index=turn_index,
+                )
+            )
+            self._segment_ends.append(end)
+            self.interim = None
@@ -0,0 +1,436 @@
+"""
+Usage and Billing Breakdown Reports
+
+Fetches ``manage.v1.projects.usage.breakdown.get`` and
+``manage.v1.projects.billing.breakdown.list`` for many projects over long date
+ranges by splitting the work into (project, date slice) requests that run
+concurrently, and merges the results into a small columnar table with
+group-by, filtering and CSV / Arrow export.
+"""
+
+import asyncio
+import csv
+import dataclasses
+import datetime as dt
+from array import array
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+DateLike = Union[str, dt.date]
+
+# Grouping columns that hold lists in the API response; they are stored comma-joined.
+_LIST_KEYS = ("models", "tags")
+
+
+class BreakdownTable:
+    """
+    Columnar table of breakdown rows.
+
+    Key columns (``project_id``, ``start``, ``end`` and the grouping fields)
+    are lists of strings; value columns are ``array('d')``. List-valued
+    groupings (``models``, ``tags``) are stored comma-joined so every key is
+    hashable and CSV-safe.
+
+    Example:
+        by_project = table.group_by("project_id")
+        for row in by_project.rows():
+            print(row["project_id"], row["hours"])
+        table.to_csv("usage.csv")
+    """
+
+    def __init__(self, key_columns: Sequence[str], value_columns: Sequence[str]):
+        """
+        Create an empty table.
+
+        Args:
+            key_columns: Names of the string-valued grouping columns
+            value_columns: Names of the numeric columns
+        """
+        self.key_columns: Tuple[str, ...] = tuple(key_columns)
+        self.value_columns: Tuple[str, ...] = tuple(value_columns)
+        self._keys: Dict[str, List[Optional[str]]] = {name: [] for name in self.key_columns}
+        self._values: Dict[str, "array[float]"] = {name: array("d") for name in self.value_columns}
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """All column names, keys first."""
+        return self.key_columns + self.value_columns
+
+    def __len__(self) -> int:
+        return len(self._values[self.value_columns[0]]) if self.value_columns else 0
+
+    def append(self, keys: Mapping[str, Optional[str]], values: Mapping[str, float]) -> None:
+        """Append one row; missing keys are None and missing values 0."""
+        for name in self.key_columns:
+            self._keys[name].append(keys.get(name))
+        for name in self.value_columns:
+            self._values[name].append(float(values.get(name) or 0.0))
+
+    def extend(self, other: "BreakdownTable") -> None:
+        """Append all rows of a table with the same columns."""
+        if other.columns != self.columns:
+            raise ValueError("Cannot extend a table with different columns")
+        for name in self.key_columns:
+            self._keys[name].extend(other._keys[name])
+        for name in self.value_columns:
+            self._values[name].extend(other._values[name])
+
+    def column(self, name: str) -> Union[List[Optional[str]], "array[float]"]:
+        """
+        Return a column (the underlying list or array, not a copy).
+
+        Raises:
+            KeyError: If the table has no such column
+        """
+        if name in self._values:
+            return self._values[name]
+        return self._keys[name]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over rows as dicts."""
+        columns = [(name, self.column(name)) for name in self.columns]
+        for index in range(len(self)):
+            yield {name: values[index] for name, values in columns}
+
+    def totals(self) -> Dict[str, float]:
+        """Sum of every value column."""
+        return {name: sum(values) for name, values in self._values.items()}
+
+    def group_by(self, *keys: str) -> "BreakdownTable":
+        """
+        Sum the value columns per distinct combination of ``keys``.
+
+        Args:
+            *keys: Key columns to group by (none gives a single totals row)
+
+        Returns:
+            A new table with ``keys`` as its key columns, in first-seen order
+
+        Raises:
+            KeyError: If a key is not a key column of this table
+        """
+        for key in keys:
+            if key not in self._keys:
+                raise KeyError(key)
+        grouped = BreakdownTable(keys, self.value_columns)
+        index_of: Dict[Tuple[Optional[str], ...], int] = {}
+        key_lists = [self._keys[key] for key in keys]
+        source = [(grouped._values[name], self._values[name]) for name in self.value_columns]
+        for row in range(len(self)):
+            group = tuple(column[row] for column in key_lists)
+            target = index_of.get(group)
+            if target is None:
+                target = index_of[group] = len(index_of)
+                for key, value in zip(keys, group):
+                    grouped._keys[key].append(value)
+                for values, column in source:
+                    values.append(column[row])
+            else:
+                for values, column in source:
+                    values[target] += column[row]
+        return grouped
+
+    def where(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, **equals: Any) -> "BreakdownTable":
+        """
+        Return the rows matching every ``column=value`` and the optional predicate.
+
+        Example:
+            table.where(endpoint="listen", project_id=project_id)
+        """
+        selected = BreakdownTable(self.key_columns, self.value_columns)
+        checks = [(self.column(name), value) for name, value in equals.items()]
+        for index, row in enumerate(self.rows()):
+            if all(column[index] == value for column, value in checks) and (predicate is None or predicate(row)):
+                selected.append(row, row)
+        return selected
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Return ``{column: list}``, ready for ``pandas.DataFrame(...)`` or
+        ``pyarrow.Table.from_pydict(...)``.
+        """
+        return {name: list(self.column(name)) for name in self.columns}
+
+    def to_csv(self, target: Union[str, IO[str]]) -> None:
+        """
+        Write the table as CSV with a header row.
+
+        Args:
+            target: File path or text file object
+        """
+        if isinstance(target, str):
+            with open(target, "w", newline="", encoding="utf-8") as handle:
+                self._write_csv(handle)
+        else:
+            self._write_csv(target)
+
+    def _write_csv(self, handle: IO[str]) -> None:
+        writer = csv.writer(handle)
+        writer.writerow(self.columns)
+        columns = [self.column(name) for name in self.columns]
+        for index in range(len(self)):
+            writer.writerow(["" if column[index] is None else column[index] for column in columns])
+
+    def to_arrow(self) -> Any:
+        """
+        Return a ``pyarrow.Table`` (for example to write Parquet).
+
+        Raises:
+            RuntimeError: If ``pyarrow`` is not installed
+        """
+        try:
+            import pyarrow  # type: ignore[import-not-found]
+        except ImportError:
+            raise RuntimeError("To export breakdown tables to Arrow, install pyarrow: pip install pyarrow") from None
+        return pyarrow.Table.from_pydict(self.to_dict())
+
+
+@dataclasses.dataclass(frozen=True)
+class _BreakdownKind:
+    keys: Tuple[str, ...]
+    values: Tuple[str, ...]
+    method: str
+
+
+_USAGE = _BreakdownKind(
+    keys=(
+        "project_id",
+        "start",
+        "end",
+        "accessor",
+        "endpoint",
+        "feature_set",
+        "models",
+        "method",
+        "tags",
+        "deployment",
+    ),
+    values=("hours", "total_hours", "agent_hours", "tokens_in", "tokens_out", "tts_characters", "requests"),
+    method="usage",
+)
+
+_BILLING = _BreakdownKind(
+    keys=("project_id", "start", "end", "accessor", "deployment", "line_item", "tags"),
+    values=("dollars",),
+    method="billing",
+)
+
+
+def _as_date(value: DateLike) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    return dt.date.fromisoformat(value)
+
+
+def _date_slices(start: DateLike, end: DateLike, slice_days: int) -> List[Tuple[str, str]]:
+    """Split the inclusive date range ``[start, end]`` into inclusive slices of ``slice_days``."""
+    if slice_days < 1:
+        raise ValueError("slice_days must be at least 1")
+    first, last = _as_date(start), _as_date(end)
+    if last < first:
+        raise ValueError("end must not be before start")
+    slices: List[Tuple[str, str]] = []
+    while first <= last:
+        upper = min(first + dt.timedelta(days=slice_days - 1), last)
+        slices.append((first.isoformat(), upper.isoformat()))
+        first = upper + dt.timedelta(days=1)
+    return slices
+
+
+def _key_value(grouping: Any, name: str) -> Optional[str]:
+    value = getattr(grouping, name, None)
+    if name in _LIST_KEYS and value is not None:
+        return ",".join(str(item) for item in value if item is not None)
+    return value
+
+
+def _to_table(kind: _BreakdownKind, project_id: str, response: Any) -> BreakdownTable:
+    table = BreakdownTable(kind.keys, kind.values)
+    for result in response.results or ():
+        grouping = result.grouping
+        keys = {name: _key_value(grouping, name) for name in kind.keys[3:]}
+        keys["project_id"] = project_id
+        keys["start"] = getattr(grouping, "start", None) or response.start
+        keys["end"] = getattr(grouping, "end", None) or response.end
+        table.append(keys, {name: getattr(result, name, 0.0) for name in kind.values})
+    return table
+
+
+def _call(kind: _BreakdownKind, client: Any, project_id: str, start: str, end: str, filters: Dict[str, Any]) -> Any:
+    manage = getattr(client, "manage", None)
+    projects = manage.v1.projects if manage is not None else client
+    if kind is _USAGE:
+        return projects.usage.breakdown.get(project_id, start=start, end=end, **filters)
+    return projects.billing.breakdown.list(project_id, start=start, end=end, **filters)
+
+
+def _jobs(project_ids: Sequence[str], start: DateLike, end: DateLike, slice_days: int) -> List[Tuple[str, str, str]]:
+    if isinstance(project_ids, str):
+        project_ids = [project_ids]
+    return [(project, lower, upper) for project in project_ids for lower, upper in _date_slices(start, end, slice_days)]
+
+
+def _fetch(
+    kind: _BreakdownKind,
+    client: Any,
+    project_ids: Sequence[str],
+    start: DateLike,
+    end: DateLike,
+    slice_days: int,
+    concurrency: int,
+    filters: Dict[str, Any],
+) -> BreakdownTable:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    jobs = _jobs(project_ids, start, end, slice_days)
+    table = BreakdownTable(kind.keys, kind.values)
+    if not jobs:
+        return table
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs)), thread_name_prefix="deepgram-breakdown") as pool:
+        futures = [
+            pool.submit(lambda job: _to_table(kind, job[0], _call(kind, client, *job, filters)), job) for job in jobs
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            if future in done and future.exception() is not None:
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()  # type: ignore[misc]
+        for future in futures:
+            table.extend(future.result())
+    return table
+
+
+async def _afetch(
+    kind: _BreakdownKind,
+    client: Any,
+    project_ids: Sequence[str],
+    start: DateLike,
+    end: DateLike,
+    slice_days: int,
+    concurrency: int,
+    filters: Dict[str, Any],
+) -> BreakdownTable:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    jobs = _jobs(project_ids, start, end, slice_days)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(job: Tuple[str, str, str]) -> BreakdownTable:
+        async with semaphore:
+            response = await _call(kind, client, *job, filters)
+        return _to_table(kind, job[0], response)
+
+    tasks = [asyncio.ensure_future(_one(job)) for job in jobs]
+    try:
+        parts = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    table = BreakdownTable(kind.keys, kind.values)
+    for part in parts:
+        table.extend(part)
+    return table
+
+
+def fetch_usage_breakdown(
+    client: Any,
+    project_ids: Sequence[str],
+    *,
+    start: DateLike,
+    end: DateLike,
+    slice_days: int = 7,
+    concurrency: int = 8,
+    **filters: Any,
+) -> BreakdownTable:
+    """
+    Fetch the usage breakdown of many projects over a date range.
+
+    The inclusive range ``[start, end]`` is split into slices of
+    ``slice_days`` days, and every (project, slice) request runs on a thread
+    pool of ``concurrency`` workers. Rows are merged in (project, slice)
+    order, whatever order the requests complete in.
+
+    Example:
+        table = fetch_usage_breakdown(client, project_ids, start="2026-09-01", end="2026-09-30", grouping="models")
+        table.group_by("project_id", "models").to_csv("usage.csv")
+
+    Args:
+        client: ``DeepgramClient`` or ``client.manage.v1.projects``
+        project_ids: Project ids to fetch
+        start: First day (``YYYY-MM-DD`` or a date)
+        end: Last day, inclusive
+        slice_days: Days per request
+        concurrency: Maximum number of requests in flight
+        **filters: Other ``usage.breakdown.get`` arguments (``grouping``,
+            ``endpoint``, ``model``, ``request_options``, ...)
+
+    Returns:
+        BreakdownTable with the usage value columns
+
+    Raises:
+        ValueError: If the range, ``slice_days`` or ``concurrency`` is invalid
+    """
+    return _fetch(_USAGE, client, project_ids, start, end, slice_days, concurrency, filters)
+
+
+def fetch_billing_breakdown(
+    client: Any,
+    project_ids: Sequence[str],
+    *,
+    start: DateLike,
+    end: DateLike,
+    slice_days: int = 7,
+    concurrency: int = 8,
+    **filters: Any,
+) -> BreakdownTable:
+    """
+    Fetch the billing breakdown of many projects over a date range.
+
+    Same slicing and concurrency as :func:`fetch_usage_breakdown`; the table
+    has a single ``dollars`` value column.
+
+    Args:
+        client: ``DeepgramClient`` or ``client.manage.v1.projects``
+        project_ids: Project ids to fetch
+        start: First day (``YYYY-MM-DD`` or a date)
+        end: Last day, inclusive
+        slice_days: Days per request
+        concurrency: Maximum number of requests in flight
+        **filters: Other ``billing.breakdown.list`` arguments (``grouping``,
+            ``line_item``, ``request_options``, ...)
+
+    Returns:
+        BreakdownTable with a ``dollars`` column
+    """
+    return _fetch(_BILLING, client, project_ids, start, end, slice_days, concurrency, filters)
+
+
+async def afetch_usage_breakdown(
+    client: Any,
+    project_ids: Sequence[str],
+    *,
+    start: DateLike,
+    end: DateLike,
+    slice_days: int = 7,
+    concurrency: int = 8,
+    **filters: Any,
+) -> BreakdownTable:
+    """Async variant of :func:`fetch_usage_breakdown` for ``AsyncDeepgramClient``."""
+    return await _afetch(_USAGE, client, project_ids, start, end, slice_days, concurrency, filters)
+
+
+async def afetch_billing_breakdown(
+    client: Any,
+    project_ids: Sequence[str],
+    *,
+    start: DateLike,
+    end: DateLike,
+    slice_days: int = 7,
+    concurrency: int = 8,
+    **filters: Any,
+) -> BreakdownTable:
+    """Async variant of :func:`fetch_billing_breakdown` for ``AsyncDeepgramClient``."""
+    return await _afetch(_BILLING, client, project_ids, start, end, slice_days, concurrency, filters)
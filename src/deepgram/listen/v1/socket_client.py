@@ -59,6 +59,8 @@ class AsyncV1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -164,6 +166,8 @@ class V1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -59,6 +59,8 @@ class AsyncV2SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V2SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -157,6 +159,8 @@ class V2SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V2SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
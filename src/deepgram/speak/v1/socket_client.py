@@ -60,6 +60,8 @@ class AsyncV1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -165,6 +167,8 @@ class V1SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V1SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -71,6 +71,8 @@ class AsyncV2SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V2SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -169,6 +171,8 @@ class V2SocketClient(EventEmitterMixin):
                     parsed = raw_message
                 else:
                     json_data = json.loads(raw_message)
+                    if not self._wants_message(json_data):
+                        continue
                     try:
                         parsed = construct_type(type_=V2SocketClientResponse, object_=json_data)  # type: ignore
                     except Exception:
@@ -3,7 +3,34 @@
 Custom transports can be passed to ``AsyncDeepgramClient(transport_factory=...)``
 or ``DeepgramClient(transport_factory=...)``.
 
+- ``replay``: record live sessions (``SessionRecorder``) and replay them
+  offline (``ReplayTransport``, ``ReplayBenchmark``)
+
 See ``deepgram.transport_interface`` for the protocol definitions.
 """
 
-__all__: list = []
+from .replay import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    AsyncSessionRecorder,
+    RecordedFrame,
+    RecordingTransport,
+    ReplayBenchmark,
+    ReplayBenchmarkReport,
+    ReplayTransport,
+    SessionRecorder,
+    SessionRecording,
+)
+
+__all__ = [
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
+    "AsyncSessionRecorder",
+    "RecordedFrame",
+    "RecordingTransport",
+    "ReplayBenchmark",
+    "ReplayBenchmarkReport",
+    "ReplayTransport",
+    "SessionRecorder",
+    "SessionRecording",
+]
@@ -0,0 +1,667 @@
+"""Record/replay transports and an offline load benchmark for WebSocket sessions.
+
+Record live agent, listen or speak sessions by passing a
+:class:`SessionRecorder` as the ``transport_factory``::
+
+    recorder = SessionRecorder(directory="recordings")
+    client = DeepgramClient(api_key="...", transport_factory=recorder)
+
+Each connection is captured frame by frame (direction, timestamp, text or
+binary payload) and written to a compact gzipped JSON-lines file when it
+closes. Request headers, including the ``Authorization`` header, are never
+recorded.
+
+Replay a recording offline with :class:`ReplayTransport` /
+:class:`AsyncReplayTransport` (original timing, or scaled by ``speed``), or
+load-test the SDK's receive path with :class:`ReplayBenchmark`, which runs N
+concurrent fake sessions and reports SDK-side CPU per message and callback
+latency percentiles.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..helpers.latency_histogram import LatencyHistogram
+
+__all__ = [
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
+    "AsyncSessionRecorder",
+    "RecordedFrame",
+    "RecordingTransport",
+    "ReplayBenchmark",
+    "ReplayBenchmarkReport",
+    "ReplayTransport",
+    "SessionRecorder",
+    "SessionRecording",
+]
+
+INBOUND = "in"
+OUTBOUND = "out"
+
+_FORMAT_VERSION = 1
+
+
+class RecordedFrame(NamedTuple):
+    """One WebSocket frame: seconds since the session opened, direction and payload."""
+
+    offset: float
+    direction: str
+    data: Union[str, bytes]
+
+
+class SessionRecording:
+    """Frames of one WebSocket session in the order they were sent or received."""
+
+    def __init__(self, url: str = "", frames: Optional[List[RecordedFrame]] = None):
+        self.url = url
+        self.frames: List[RecordedFrame] = list(frames or [])
+
+    def add(self, direction: str, data: Union[str, bytes], offset: float) -> None:
+        """Append a frame."""
+        self.frames.append(RecordedFrame(offset, direction, data))
+
+    @property
+    def inbound(self) -> List[RecordedFrame]:
+        """Frames received from the server."""
+        return [frame for frame in self.frames if frame.direction == INBOUND]
+
+    @property
+    def outbound(self) -> List[RecordedFrame]:
+        """Frames sent by the client."""
+        return [frame for frame in self.frames if frame.direction == OUTBOUND]
+
+    @property
+    def duration(self) -> float:
+        """Offset of the last frame in seconds."""
+        return self.frames[-1].offset if self.frames else 0.0
+
+    def save(self, path: str) -> None:
+        """
+        Write the recording as JSON lines (gzipped when ``path`` ends in ``.gz``).
+
+        The first line is a header; each following line is
+        ``[offset_ms, "i"|"o", "t"|"b", payload]`` with binary payloads base64-encoded.
+        """
+        opener: Callable[..., Any] = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps({"version": _FORMAT_VERSION, "url": self.url}) + "\n")
+            for frame in self.frames:
+                if isinstance(frame.data, str):
+                    kind, payload = "t", frame.data
+                else:
+                    kind, payload = "b", base64.b64encode(frame.data).decode("ascii")
+                row = [round(frame.offset * 1000, 3), frame.direction[0], kind, payload]
+                file.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> "SessionRecording":
+        """
+        Read a recording written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a supported recording
+        """
+        opener: Callable[..., Any] = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline() or "{}")
+            if header.get("version") != _FORMAT_VERSION:
+                raise ValueError(f"{path} is not a session recording (version {header.get('version')!r})")
+            recording = cls(url=header.get("url", ""))
+            for line in file:
+                offset_ms, direction, kind, payload = json.loads(line)
+                data = payload if kind == "t" else base64.b64decode(payload)
+                recording.add(INBOUND if direction == "i" else OUTBOUND, data, offset_ms / 1000)
+        return recording
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+
+class RecordingTransport:
+    """Sync transport that records every frame passing through an inner transport."""
+
+    def __init__(
+        self,
+        inner: Any,
+        recording: SessionRecording,
+        on_close: Optional[Callable[[SessionRecording], Any]] = None,
+    ):
+        self._inner = inner
+        self.recording = recording
+        self._on_close = on_close
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _record(self, direction: str, data: Any) -> None:
+        if isinstance(data, (str, bytes)):
+            with self._lock:
+                self.recording.add(direction, data, time.monotonic() - self._started)
+
+    def send(self, data: Any) -> None:
+        self._record(OUTBOUND, data)
+        self._inner.send(data)
+
+    def recv(self) -> Any:
+        data = self._inner.recv()
+        self._record(INBOUND, data)
+        return data
+
+    def __iter__(self) -> Iterator[Any]:
+        for data in self._inner:
+            self._record(INBOUND, data)
+            yield data
+
+    def close(self) -> None:
+        try:
+            self._inner.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self.recording)
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """Async transport that records every frame passing through an inner transport."""
+
+    async def send(self, data: Any) -> None:  # type: ignore[override]
+        self._record(OUTBOUND, data)
+        await self._inner.send(data)
+
+    async def recv(self) -> Any:  # type: ignore[override]
+        data = await self._inner.recv()
+        self._record(INBOUND, data)
+        return data
+
+    def __iter__(self) -> Iterator[Any]:
+        raise TypeError("Use 'async for' with an async transport")
+
+    async def __aiter__(self) -> Any:
+        async for data in self._inner:
+            self._record(INBOUND, data)
+            yield data
+
+    async def close(self) -> None:  # type: ignore[override]
+        try:
+            await self._inner.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self.recording)
+
+
+class _LazyAsyncWebSocket:
+    """Opens a ``websockets`` connection on first use, since transport factories cannot await."""
+
+    def __init__(self, url: str, headers: Dict[str, str]):
+        self._url = url
+        self._headers = headers
+        self._connection: Any = None
+
+    async def _open(self) -> Any:
+        if self._connection is None:
+            try:
+                from websockets.legacy.client import connect as legacy_connect  # type: ignore
+            except ImportError:
+                # The new asyncio client names the argument ``additional_headers``
+                from websockets import connect  # type: ignore
+
+                self._connection = await connect(self._url, additional_headers=self._headers)
+            else:
+                self._connection = await legacy_connect(self._url, extra_headers=self._headers)
+        return self._connection
+
+    async def send(self, data: Any) -> None:
+        await (await self._open()).send(data)
+
+    async def recv(self) -> Any:
+        return await (await self._open()).recv()
+
+    async def __aiter__(self) -> Any:
+        async for data in await self._open():
+            yield data
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+
+
+def _default_sync_connect(url: str, headers: Dict[str, str]) -> Any:
+    # Imported here rather than at module level: install_transport() patches the
+    # generated modules' reference, and recording must reach the real network.
+    import websockets.sync.client
+
+    return websockets.sync.client.connect(url, additional_headers=headers)
+
+
+class SessionRecorder:
+    """
+    Transport factory that records every sync session it opens.
+
+    Args:
+        inner_factory: ``factory(url, headers)`` for the real transport
+            (defaults to a ``websockets`` connection)
+        directory: If set, each recording is saved there as
+            ``session-<n>.jsonl.gz`` when its connection closes
+        on_recording: Called with each finished SessionRecording
+
+    Example:
+        recorder = SessionRecorder(directory="recordings")
+        client = DeepgramClient(api_key="...", transport_factory=recorder)
+    """
+
+    _transport_class: Any = RecordingTransport
+
+    def __init__(
+        self,
+        inner_factory: Optional[Callable[[str, Dict[str, str]], Any]] = None,
+        *,
+        directory: Optional[str] = None,
+        on_recording: Optional[Callable[[SessionRecording], Any]] = None,
+    ):
+        self._inner_factory = inner_factory or self._default_inner_factory()
+        self.directory = directory
+        self._on_recording = on_recording
+        self.recordings: List[SessionRecording] = []
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _default_inner_factory() -> Callable[[str, Dict[str, str]], Any]:
+        return _default_sync_connect
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> Any:
+        return self._transport_class(self._inner_factory(url, headers), SessionRecording(url), self._finished)
+
+    def _finished(self, recording: SessionRecording) -> None:
+        with self._lock:
+            self.recordings.append(recording)
+            index = len(self.recordings)
+        if self.directory is not None:
+            recording.save(os.path.join(self.directory, f"session-{index:04d}.jsonl.gz"))
+        if self._on_recording is not None:
+            self._on_recording(recording)
+
+
+class AsyncSessionRecorder(SessionRecorder):
+    """Transport factory that records every async session it opens (see :class:`SessionRecorder`)."""
+
+    _transport_class = AsyncRecordingTransport
+
+    @staticmethod
+    def _default_inner_factory() -> Callable[[str, Dict[str, str]], Any]:
+        return _LazyAsyncWebSocket
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+
+def _schedule(recording: SessionRecording) -> List[Tuple[int, float, Union[str, bytes]]]:
+    """
+    Return ``(outbound_count, delay, data)`` for every inbound frame.
+
+    Each server frame is timed relative to the last client frame before it
+    (or the session start), so replayed responses follow the client's sends.
+    """
+    schedule = []
+    sent = 0
+    anchor = 0.0
+    for frame in recording.frames:
+        if frame.direction == OUTBOUND:
+            sent += 1
+            anchor = frame.offset
+        else:
+            schedule.append((sent, max(0.0, frame.offset - anchor), frame.data))
+    return schedule
+
+
+class _ReplayState:
+    def __init__(self, recording: SessionRecording, speed: float, wait_for_client: bool):
+        if speed <= 0:
+            raise ValueError("speed must be positive (use float('inf') to disable delays)")
+        self.recording = recording
+        self.speed = speed
+        self.wait_for_client = wait_for_client
+        self.schedule = _schedule(recording)
+        self.sent: List[Any] = []
+        self.closed = False
+        self.last_delivery = 0.0
+        self.last_delivery_cpu = 0.0
+        self._started = time.monotonic()
+        # Monotonic time of each client send; index i anchors frames that follow the (i+1)-th send.
+        self._send_times: List[float] = []
+
+    def _anchor(self, required: int) -> Optional[float]:
+        if not self.wait_for_client or required == 0:
+            return self._started
+        if len(self._send_times) >= required:
+            return self._send_times[required - 1]
+        return None
+
+    def _due(self, anchor: float, delay: float) -> float:
+        return anchor if self.speed == float("inf") else anchor + delay / self.speed
+
+    def _delivered(self) -> None:
+        self.last_delivery = time.perf_counter()
+        self.last_delivery_cpu = time.thread_time()
+
+
+class ReplayTransport(_ReplayState):
+    """
+    Sync transport that plays a recorded session's server frames.
+
+    Server frames are delivered with their recorded delay after the client
+    frame that preceded them, divided by ``speed`` (``float("inf")`` delivers
+    as fast as possible). With ``wait_for_client`` (the default), a server
+    frame is not delivered before the client has sent as many frames as it
+    had when the frame was recorded; otherwise timing is relative to when the
+    transport was created. Iteration ends after the last recorded frame.
+
+    Example:
+        recording = SessionRecording.load("recordings/session-0001.jsonl.gz")
+        client = DeepgramClient(api_key="offline", transport_factory=lambda url, headers: ReplayTransport(recording))
+    """
+
+    def __init__(self, recording: SessionRecording, *, speed: float = 1.0, wait_for_client: bool = True):
+        super().__init__(recording, speed, wait_for_client)
+        self._cond = threading.Condition()
+        self._next = 0
+
+    def send(self, data: Any) -> None:
+        with self._cond:
+            self.sent.append(data)
+            self._send_times.append(time.monotonic())
+            self._cond.notify_all()
+
+    def recv(self) -> Any:
+        if self._next >= len(self.schedule):
+            raise EOFError("The recorded session has no more server frames")
+        required, delay, data = self.schedule[self._next]
+        with self._cond:
+            self._cond.wait_for(lambda: self.closed or self._anchor(required) is not None)
+            if self.closed:
+                raise EOFError("Replay transport closed")
+            due = self._due(self._anchor(required), delay)  # type: ignore[arg-type]
+            remaining = due - time.monotonic()
+            if remaining > 0 and self._cond.wait_for(lambda: self.closed, timeout=remaining):
+                raise EOFError("Replay transport closed")
+        self._next += 1
+        self._delivered()
+        return data
+
+    def __iter__(self) -> Iterator[Any]:
+        while self._next < len(self.schedule):
+            try:
+                yield self.recv()
+            except EOFError:
+                return
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class AsyncReplayTransport(_ReplayState):
+    """Async transport that plays a recorded session's server frames (see :class:`ReplayTransport`)."""
+
+    def __init__(self, recording: SessionRecording, *, speed: float = 1.0, wait_for_client: bool = True):
+        super().__init__(recording, speed, wait_for_client)
+        self._changed = asyncio.Event()
+        self._next = 0
+
+    async def send(self, data: Any) -> None:
+        self.sent.append(data)
+        self._send_times.append(time.monotonic())
+        self._changed.set()
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def recv(self) -> Any:
+        if self._next >= len(self.schedule):
+            raise EOFError("The recorded session has no more server frames")
+        required, delay, data = self.schedule[self._next]
+        while not self.closed and self._anchor(required) is None:
+            await self._wait(None)
+        while not self.closed:
+            remaining = self._due(self._anchor(required), delay) - time.monotonic()  # type: ignore[arg-type]
+            if remaining <= 0:
+                break
+            await self._wait(remaining)
+        if self.closed:
+            raise EOFError("Replay transport closed")
+        self._next += 1
+        self._delivered()
+        return data
+
+    async def __aiter__(self) -> Any:
+        while self._next < len(self.schedule):
+            try:
+                yield await self.recv()
+            except EOFError:
+                return
+
+    async def close(self) -> None:
+        self.closed = True
+        self._changed.set()
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+_SOCKET_CLIENTS = {
+    "/v1/agent/converse": "deepgram.agent.v1.socket_client",
+    "/v1/listen": "deepgram.listen.v1.socket_client",
+    "/v2/listen": "deepgram.listen.v2.socket_client",
+    "/v1/speak": "deepgram.speak.v1.socket_client",
+    "/v2/speak": "deepgram.speak.v2.socket_client",
+}
+
+
+def _socket_client_module(url: str) -> Any:
+    import importlib
+    import urllib.parse
+
+    path = urllib.parse.urlparse(url).path.rstrip("/")
+    for suffix, module in _SOCKET_CLIENTS.items():
+        if path.endswith(suffix):
+            return importlib.import_module(module)
+    raise ValueError(f"Cannot tell which socket client handles {url!r}; pass socket_client_class")
+
+
+@dataclasses.dataclass
+class ReplayBenchmarkReport:
+    """Results of a :class:`ReplayBenchmark` run."""
+
+    sessions: int
+    messages: int
+    errors: int
+    wall_seconds: float
+    process_cpu_seconds: float
+    sdk_cpu_us: Dict[str, Optional[float]]
+    callback_latency_ms: Dict[str, Optional[float]]
+
+    @property
+    def messages_per_second(self) -> float:
+        """Messages delivered to callbacks per wall-clock second."""
+        return self.messages / self.wall_seconds if self.wall_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the report as a plain dict."""
+        return {**dataclasses.asdict(self), "messages_per_second": self.messages_per_second}
+
+
+class ReplayBenchmark:
+    """
+    Replays a recording to N concurrent fake sessions through the real socket clients.
+
+    Each session gets its own replay transport wrapped in the socket client
+    for the recorded endpoint; the recorded client frames are sent back with
+    their original timing (scaled by ``speed``) so server frames are released
+    as they were live. For every message delivered to the ``EventType.MESSAGE``
+    callback the benchmark records:
+
+    - ``sdk_cpu_us``: thread CPU time from the transport handing the frame to
+      the SDK until the callback runs (JSON parsing, model construction and
+      dispatch)
+    - ``callback_latency_ms``: wall time over the same span, which also
+      includes scheduling delay under load
+
+    Example:
+        recording = SessionRecording.load("recordings/session-0001.jsonl.gz")
+        report = ReplayBenchmark(recording, sessions=50, speed=4.0).run()
+        print(report.as_dict())
+    """
+
+    def __init__(
+        self,
+        recording: SessionRecording,
+        *,
+        sessions: int = 10,
+        speed: float = 1.0,
+        socket_client_class: Optional[Any] = None,
+        async_socket_client_class: Optional[Any] = None,
+        on_message: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize the benchmark.
+
+        Args:
+            recording: Session to replay
+            sessions: Number of concurrent fake sessions
+            speed: Replay speed factor (``float("inf")`` for no delays)
+            socket_client_class: Sync socket client class (inferred from the recording's URL)
+            async_socket_client_class: Async socket client class (inferred from the recording's URL)
+            on_message: Extra per-message work to include in the measurement (e.g. your handler)
+        """
+        if sessions < 1:
+            raise ValueError("sessions must be at least 1")
+        self.recording = recording
+        self.sessions = sessions
+        self.speed = speed
+        self._socket_client_class = socket_client_class
+        self._async_socket_client_class = async_socket_client_class
+        self._on_message = on_message
+
+    def _client_classes(self) -> Tuple[Any, Any]:
+        sync_class, async_class = self._socket_client_class, self._async_socket_client_class
+        if sync_class is None or async_class is None:
+            module = _socket_client_module(self.recording.url)
+            names = [name for name in dir(module) if name.endswith("SocketClient")]
+            sync_class = sync_class or getattr(module, next(n for n in names if not n.startswith("Async")))
+            async_class = async_class or getattr(module, next(n for n in names if n.startswith("Async")))
+        return sync_class, async_class
+
+    def _callback(self, transport: _ReplayState, histograms: Tuple[LatencyHistogram, LatencyHistogram]) -> Callable:
+        cpu, latency = histograms
+
+        def _on_message(message: Any) -> None:
+            if self._on_message is not None:
+                self._on_message(message)
+            latency.record((time.perf_counter() - transport.last_delivery) * 1000)
+            cpu.record((time.thread_time() - transport.last_delivery_cpu) * 1_000_000)
+
+        return _on_message
+
+    def _outbound_delays(self) -> List[Tuple[float, Union[str, bytes]]]:
+        factor = 0.0 if self.speed == float("inf") else 1.0 / self.speed
+        return [(frame.offset * factor, frame.data) for frame in self.recording.outbound]
+
+    def _report(self, histograms: Tuple[LatencyHistogram, LatencyHistogram], errors: int, wall: float, cpu: float):
+        cpu_histogram, latency_histogram = histograms
+        return ReplayBenchmarkReport(
+            sessions=self.sessions,
+            messages=latency_histogram.count,
+            errors=errors,
+            wall_seconds=wall,
+            process_cpu_seconds=cpu,
+            sdk_cpu_us=cpu_histogram.snapshot(),
+            callback_latency_ms=latency_histogram.snapshot(),
+        )
+
+    def run(self) -> ReplayBenchmarkReport:
+        """Run the sessions on threads (two per session) and return the report."""
+        from ..core.events import EventType
+
+        socket_class, _ = self._client_classes()
+        histograms = (LatencyHistogram(), LatencyHistogram())
+        errors: List[BaseException] = []
+        outbound = self._outbound_delays()
+        threads = []
+
+        def _session() -> None:
+            transport = ReplayTransport(self.recording, speed=self.speed)
+            socket = socket_class(websocket=transport)
+            socket.on(EventType.MESSAGE, self._callback(transport, histograms))
+            socket.on(EventType.ERROR, errors.append)
+            stop = threading.Event()
+            sender = threading.Thread(target=_send_all, args=(transport, stop), daemon=True)
+            sender.start()
+            socket.start_listening()
+            stop.set()
+            transport.close()
+            sender.join()
+
+        def _send_all(transport: ReplayTransport, stop: threading.Event) -> None:
+            started = time.monotonic()
+            for delay, data in outbound:
+                if stop.wait(max(0.0, started + delay - time.monotonic())):
+                    return
+                transport.send(data)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        for index in range(self.sessions):
+            thread = threading.Thread(target=_session, name=f"deepgram-replay-{index}", daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        return self._report(histograms, len(errors), time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    async def arun(self) -> ReplayBenchmarkReport:
+        """Run the sessions as tasks on the current event loop and return the report."""
+        from ..core.events import EventType
+
+        _, socket_class = self._client_classes()
+        histograms = (LatencyHistogram(), LatencyHistogram())
+        errors: List[BaseException] = []
+        outbound = self._outbound_delays()
+
+        async def _send_all(transport: AsyncReplayTransport) -> None:
+            started = time.monotonic()
+            for delay, data in outbound:
+                remaining = started + delay - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                await transport.send(data)
+
+        async def _session() -> None:
+            transport = AsyncReplayTransport(self.recording, speed=self.speed)
+            socket = socket_class(websocket=transport)
+            socket.on(EventType.MESSAGE, self._callback(transport, histograms))
+            socket.on(EventType.ERROR, errors.append)
+            sender = asyncio.ensure_future(_send_all(transport))
+            await socket.start_listening()
+            sender.cancel()
+            await transport.close()
+            await asyncio.gather(sender, return_exceptions=True)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        await asyncio.gather(*(_session() for _ in range(self.sessions)))
+        return self._report(histograms, len(errors), time.perf_counter() - wall_start, time.process_time() - cpu_start)
@@ -0,0 +1,167 @@
+"""
+Tests for the auto-refreshing access token provider and the client's 401 retry
+"""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from deepgram import AsyncDeepgramClient, DeepgramClient
+from deepgram.helpers import AccessTokenProvider
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Grants:
+    def __init__(self, expires_in=30.0, delay=0.0):
+        self.calls = 0
+        self._expires_in = expires_in
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self._delay)
+        with self._lock:
+            self.calls += 1
+            return {"access_token": f"token-{self.calls}", "expires_in": self._expires_in}
+
+
+def _handler(seen, reject=("token-1",)):
+    def _handle(request):
+        token = request.headers["Authorization"].split(" ", 1)[1]
+        seen.append(token)
+        if token in reject:
+            return httpx.Response(401, json={"err_msg": "expired"})
+        return httpx.Response(200, json={"projects": []})
+
+    return _handle
+
+
+class TestAccessTokenProvider:
+    def test_reads_reuse_token_and_refresh_in_background_when_due(self):
+        clock = _Clock()
+        grants = _Grants()
+        provider = AccessTokenProvider(grants, refresh_before=5, proactive=False, clock=clock)
+
+        assert provider.token() == "token-1"
+        clock.now = 10
+        assert provider() == "token-1"
+        assert grants.calls == 1
+
+        clock.now = 26  # inside the refresh window: current token returned, refresh started
+        assert provider.token() == "token-1"
+        deadline = time.monotonic() + 2
+        while provider.grants < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert provider.token() == "token-2"
+
+    def test_concurrent_refreshes_share_one_grant(self):
+        grants = _Grants(delay=0.05)
+        provider = AccessTokenProvider(grants, proactive=False)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(provider.token())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["token-1"] * 8
+        assert grants.calls == 1
+
+    def test_invalidate_only_affects_the_rejected_token(self):
+        grants = _Grants()
+        provider = AccessTokenProvider(grants, proactive=False)
+        provider.token()
+        provider.invalidate("some-older-token")
+        assert provider.token() == "token-1"
+        provider.invalidate("token-1")
+        assert provider.token() == "token-2"
+
+    def test_proactive_timer_refreshes_used_tokens(self):
+        grants = _Grants(expires_in=0.1)
+        provider = AccessTokenProvider(grants, refresh_before=0.05)
+        provider.token()
+        deadline = time.monotonic() + 2
+        while grants.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        provider.close()
+        assert grants.calls == 2
+
+    async def test_atoken_grants_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        grant_threads = []
+
+        def _grant():
+            grant_threads.append(threading.current_thread())
+            return {"access_token": "token-1", "expires_in": 30}
+
+        provider = AccessTokenProvider(_grant, proactive=False)
+        assert await provider.atoken() == "token-1"
+        assert await provider.atoken() == "token-1"
+        assert len(grant_threads) == 1 and grant_threads[0] is not loop_thread
+
+    def test_failed_blocking_refresh_raises(self):
+        def _fail():
+            raise RuntimeError("grant failed")
+
+        with pytest.raises(RuntimeError):
+            AccessTokenProvider(_fail, proactive=False).token()
+
+
+class TestClientWithTokenProvider:
+    def test_401_forces_one_refresh_and_retry(self):
+        seen = []
+        provider = AccessTokenProvider(_Grants(), proactive=False)
+        client = DeepgramClient(
+            access_token=provider, httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(seen)))
+        )
+        client.manage.v1.projects.list()
+        assert seen == ["token-1", "token-2"]
+
+        client.manage.v1.projects.list()
+        assert seen[-1] == "token-2"
+
+    def test_fixed_token_is_not_retried(self):
+        seen = []
+        client = DeepgramClient(
+            access_token="token-1", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(seen)))
+        )
+        with pytest.raises(Exception):
+            client.manage.v1.projects.list()
+        assert seen == ["token-1"]
+
+    async def test_async_client_retries_after_refresh(self):
+        seen = []
+        provider = AccessTokenProvider(_Grants(), proactive=False)
+        client = AsyncDeepgramClient(
+            access_token=provider,
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(seen))),
+        )
+        await client.manage.v1.projects.list()
+        assert seen == ["token-1", "token-2"]
+        assert client._client_wrapper.get_headers()["Authorization"] == "bearer token-2"
+
+    async def test_async_client_reads_token_off_the_event_loop(self):
+        seen = []
+        loop_thread = threading.current_thread()
+        grants = _Grants()
+        grant_threads = []
+
+        def _grant():
+            grant_threads.append(threading.current_thread())
+            return grants()
+
+        client = AsyncDeepgramClient(
+            access_token=AccessTokenProvider(_grant, proactive=False),
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(seen, reject=()))),
+        )
+        await client.manage.v1.projects.list()
+        assert seen == ["token-1"]
+        assert grant_threads and loop_thread not in grant_threads
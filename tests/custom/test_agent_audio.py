@@ -0,0 +1,124 @@
+"""
+Tests for the full-duplex agent audio pump and its ring buffer
+"""
+
+import time
+
+import pytest
+
+from deepgram.agent.v1.socket_client import V1SocketClient
+from deepgram.agent.v1.types import AgentV1AgentAudioDone, AgentV1UserStartedSpeaking
+from deepgram.helpers import AgentAudioPump, AudioRingBuffer, agent_frame_bytes
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestAudioRingBuffer:
+    def test_wraps_and_reports_overrun(self):
+        ring = AudioRingBuffer(8)
+        assert ring.write(b"abcdef") == 6
+        out = bytearray(4)
+        assert ring.readinto(out) == 4 and out == b"abcd"
+        assert ring.write(b"ghijklmn") == 6
+        out = bytearray(10)
+        count = ring.readinto(out)
+        assert out[:count] == b"efghijkl"
+        assert not ring.readable.is_set()
+
+    def test_discard_from_writer_side(self):
+        ring = AudioRingBuffer(8)
+        ring.write(b"old")
+        ring.discard()
+        ring.write(b"new")
+        out = bytearray(8)
+        assert out[: ring.readinto(out)] == b"new"
+
+
+def test_frame_bytes():
+    assert agent_frame_bytes("linear16", 16000, 20) == 640
+    assert agent_frame_bytes("mulaw", 8000, 20) == 160
+    with pytest.raises(ValueError):
+        agent_frame_bytes("opus", 48000, 20)
+
+
+class TestAgentAudioPump:
+    def test_capture_is_framed_and_sent_on_its_own_worker(self):
+        ws = _FakeWebSocket()
+        chunks = [b"\x01" * 100, b"\x02" * 700, b"\x03" * 20]
+
+        def capture(size):
+            return chunks.pop(0) if chunks else b""
+
+        settings = {"audio": {"input": {"encoding": "linear16", "sample_rate": 16000}}}
+        pump = AgentAudioPump.from_settings(V1SocketClient(websocket=ws), settings, capture=capture)
+        assert pump.input_frame_bytes == 640
+        assert pump.output_frame_bytes == 960  # linear16 @ 24 kHz default output
+        pump.start()
+        # Capture ending flushes the final partial frame without waiting for stop().
+        _wait_until(lambda: len(ws.sent) == 2)
+        pump.stop()
+
+        assert [len(frame) for frame in ws.sent] == [640, 180]
+        assert b"".join(ws.sent) == b"\x01" * 100 + b"\x02" * 700 + b"\x03" * 20
+        assert pump.stats.frames_sent == 2
+
+    def test_playback_frames_agent_audio_and_counts_underruns(self):
+        socket = V1SocketClient(websocket=_FakeWebSocket())
+        played = []
+
+        def playback(frame):
+            played.append(bytes(frame))
+
+        pump = AgentAudioPump(
+            socket,
+            playback=playback,
+            output_encoding="mulaw",
+            output_sample_rate=8000,
+            frame_ms=10,
+            prebuffer_ms=20,
+        ).start()
+        pump.on_message(b"\x10" * 200)
+        _wait_until(lambda: len(played) == 2)
+        # Mid-response starvation is an underrun.
+        _wait_until(lambda: pump.stats.playback_underruns == 1)
+        pump.on_message(b"\x20" * 30)
+        pump.on_message(AgentV1AgentAudioDone(type="AgentAudioDone"))
+        _wait_until(lambda: len(played) == 3)
+        pump.stop()
+
+        assert [len(frame) for frame in played] == [80, 80, 70]
+        assert played[2] == b"\x10" * 40 + b"\x20" * 30
+        assert pump.stats.playback_underruns == 1
+
+    def test_barge_in_discards_queued_playback_and_overrun_is_counted(self):
+        socket = V1SocketClient(websocket=_FakeWebSocket())
+        pump = AgentAudioPump(
+            socket, output_encoding="mulaw", output_sample_rate=8000, frame_ms=10, playback_buffer_ms=20
+        )
+        pump.on_message(b"\x00" * 200)
+        assert pump.stats.playback_overrun_bytes == 40
+        pump.on_message(AgentV1UserStartedSpeaking(type="UserStartedSpeaking"))
+        assert pump.playback_ring.available == 0
+        assert pump.stats.barge_ins == 1
+
+    def test_push_capture_overrun(self):
+        ws = _FakeWebSocket()
+        pump = AgentAudioPump(V1SocketClient(websocket=ws), frame_ms=10, capture_buffer_ms=10)
+        pump.push_capture(b"\x00" * 400)
+        assert pump.stats.capture_overrun_bytes == 80
+        pump.start()
+        pump.stop()
+        assert b"".join(ws.sent) == b"\x00" * 320
@@ -0,0 +1,132 @@
+"""
+Tests for the concurrent agent function-call routers
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from deepgram.agent.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.agent.v1.types import AgentV1FunctionCallRequest
+from deepgram.helpers import AgentFunctionRouter, AsyncAgentFunctionRouter
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.cond = threading.Condition()
+
+    def send(self, data):
+        with self.cond:
+            self.sent.append(json.loads(data))
+            self.cond.notify_all()
+
+    def wait_for(self, count, timeout=2.0):
+        with self.cond:
+            assert self.cond.wait_for(lambda: len(self.sent) >= count, timeout=timeout)
+        return self.sent
+
+
+class _FakeAsyncWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+def _request(*calls):
+    return AgentV1FunctionCallRequest(
+        type="FunctionCallRequest",
+        functions=[
+            {"id": call_id, "name": name, "arguments": json.dumps(args), "client_side": client_side}
+            for call_id, name, args, client_side in calls
+        ],
+    )
+
+
+class TestAgentFunctionRouter:
+    def test_calls_run_concurrently_and_answer_as_they_complete(self):
+        ws = _FakeWebSocket()
+        router = AgentFunctionRouter(max_workers=4)
+        release_slow = threading.Event()
+
+        @router.register("slow")
+        def slow(arguments):
+            release_slow.wait(2)
+            return {"slow": arguments["n"]}
+
+        router.register("fast", lambda arguments: "fast-result")
+        router.attach(V1SocketClient(websocket=ws))
+
+        router.on_message(_request(("1", "slow", {"n": 1}, True), ("2", "fast", {}, True)))
+        # The fast answer is sent while the slow handler is still running.
+        first = ws.wait_for(1)[0]
+        assert first == {"type": "FunctionCallResponse", "id": "2", "name": "fast", "content": "fast-result"}
+        release_slow.set()
+        second = ws.wait_for(2)[1]
+        assert second["id"] == "1"
+        assert json.loads(second["content"]) == {"slow": 1}
+        router.close()
+
+    def test_server_side_calls_are_ignored(self):
+        ws = _FakeWebSocket()
+        router = AgentFunctionRouter().attach(V1SocketClient(websocket=ws))
+        router.on_message(_request(("1", "anything", {}, False)))
+        router.close()
+        assert ws.sent == []
+
+    def test_unknown_function_errors_and_timeouts_are_answered(self):
+        ws = _FakeWebSocket()
+        errors = []
+        router = AgentFunctionRouter(default_timeout=0.05, on_error=lambda name, exc: errors.append(name))
+        router.register("boom", lambda arguments: 1 / 0)
+        router.register("hang", lambda arguments: time.sleep(0.5))
+        router.attach(V1SocketClient(websocket=ws))
+
+        router.on_message(_request(("1", "missing", {}, True), ("2", "boom", {}, True), ("3", "hang", {}, True)))
+        sent = {message["id"]: json.loads(message["content"]) for message in ws.wait_for(3)}
+        assert "Unknown function" in sent["1"]["error"]
+        assert "division" in sent["2"]["error"]
+        assert "timed out" in sent["3"]["error"]
+        assert sorted(errors) == ["boom", "hang"]
+        router.close()
+
+    def test_async_handler_on_sync_router(self):
+        ws = _FakeWebSocket()
+        router = AgentFunctionRouter().attach(V1SocketClient(websocket=ws))
+
+        @router.register("lookup")
+        async def lookup(arguments):
+            return arguments["city"].upper()
+
+        router.on_message(_request(("1", "lookup", {"city": "london"}, True)))
+        assert ws.wait_for(1)[0]["content"] == "LONDON"
+        router.close()
+
+
+class TestAsyncAgentFunctionRouter:
+    async def test_sync_and_async_handlers_with_timeout(self):
+        ws = _FakeAsyncWebSocket()
+        router = AsyncAgentFunctionRouter(default_timeout=1.0)
+
+        @router.register("async_fn")
+        async def async_fn(arguments):
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        router.register("sync_fn", lambda arguments: "sync")
+
+        @router.register("slow", timeout=0.01)
+        async def slow(arguments):
+            await asyncio.sleep(1)
+
+        router.attach(AsyncV1SocketClient(websocket=ws))
+        router.on_message(_request(("1", "async_fn", {}, True), ("2", "sync_fn", {}, True), ("3", "slow", {}, True)))
+        await router.wait()
+
+        contents = {message["id"]: message["content"] for message in ws.sent}
+        assert json.loads(contents["1"]) == {"ok": True}
+        assert contents["2"] == "sync"
+        assert "timed out" in json.loads(contents["3"])["error"]
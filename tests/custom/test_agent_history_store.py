@@ -0,0 +1,100 @@
+"""
+Tests for the bounded agent conversation-history store
+"""
+
+import json
+
+import pytest
+
+from deepgram.agent.v1.socket_client import V1SocketClient, V1SocketClientResponse
+from deepgram.agent.v1.types import AgentV1Settings
+from deepgram.core.unchecked_base_model import construct_type
+from deepgram.helpers import AgentHistoryStore
+
+
+def _message(payload):
+    return construct_type(type_=V1SocketClientResponse, object_=payload)
+
+
+_SETTINGS = AgentV1Settings(
+    audio={"input": {"encoding": "linear16", "sample_rate": 16000}},
+    agent={
+        "greeting": "Hello!",
+        "think": {"provider": {"type": "open_ai", "model": "gpt-4o-mini"}, "prompt": "Be brief."},
+    },
+)
+
+
+class TestAgentHistoryStore:
+    def test_records_text_and_function_calls_without_duplicates(self):
+        history = AgentHistoryStore()
+        history.on_message(_message({"type": "ConversationText", "role": "user", "content": "Weather?"}))
+        history.on_message(_message({"type": "History", "role": "user", "content": "Weather?"}))
+        history.on_message(
+            _message(
+                {
+                    "type": "History",
+                    "function_calls": [
+                        {"id": "1", "name": "weather", "client_side": True, "arguments": "{}", "response": "sunny"}
+                    ],
+                }
+            )
+        )
+        history.on_message(_message({"type": "History", "role": "assistant", "content": "Sunny."}))
+        history.on_message(_message({"type": "ConversationText", "role": "assistant", "content": "Sunny."}))
+        history.on_message(_message({"type": "ConversationText", "role": "user", "content": "Thanks"}))
+
+        entries = history.entries()
+        assert len(entries) == 4
+        assert [getattr(entry, "content", None) for entry in entries] == ["Weather?", None, "Sunny.", "Thanks"]
+        assert entries[1].function_calls[0].response == "sunny"
+
+    def test_budget_evicts_oldest_and_summarizes(self):
+        calls = []
+
+        def summarize(evicted, previous):
+            calls.append(([entry.content for entry in evicted], previous))
+            return (previous or "") + "".join(entry.content[0] for entry in evicted)
+
+        history = AgentHistoryStore(budget=10, summarize=summarize, keep_recent=1)
+        for text in ("aaaa", "bbbb", "cccc", "dddd"):
+            history.add_text("user", text)
+
+        assert [entry.content for entry in history.entries()] == ["cccc", "dddd"]
+        assert history.size == 8
+        assert history.evicted == 2
+        assert calls == [(["aaaa"], None), (["bbbb"], "a")]
+        assert history.summary == "ab"
+
+        messages = history.context_messages()
+        assert messages[0].content == "Summary of the conversation so far: ab"
+        assert len(messages) == 3
+
+    def test_keep_recent_protects_oversized_turns(self):
+        history = AgentHistoryStore(budget=5, keep_recent=1)
+        history.add_text("assistant", "x" * 50)
+        assert len(history.entries()) == 1
+
+    def test_reconnect_settings_carries_context_and_drops_greeting(self):
+        history = AgentHistoryStore()
+        history.add_text("user", "Hi")
+        history.add_text("assistant", "Hello there")
+        ws_sent = []
+
+        class _FakeWebSocket:
+            def send(self, data):
+                ws_sent.append(json.loads(data))
+
+        V1SocketClient(websocket=_FakeWebSocket()).send_settings(history.reconnect_settings(_SETTINGS))
+
+        agent = ws_sent[0]["agent"]
+        assert "greeting" not in agent
+        assert agent["think"]["prompt"] == "Be brief."
+        assert agent["context"]["messages"] == [
+            {"type": "History", "role": "user", "content": "Hi"},
+            {"type": "History", "role": "assistant", "content": "Hello there"},
+        ]
+
+    def test_reconnect_requires_inline_agent(self):
+        with pytest.raises(ValueError):
+            AgentHistoryStore().reconnect_settings({"agent": "agent-id"})
@@ -0,0 +1,145 @@
+"""
+Tests for the ordered agent message injection queues
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from deepgram.agent.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.agent.v1.types import (
+    AgentV1AgentAudioDone,
+    AgentV1AgentStartedSpeaking,
+    AgentV1ConversationText,
+    AgentV1InjectionRefused,
+)
+from deepgram.helpers import AgentInjectionQueue, AsyncAgentInjectionQueue, InjectionRefusedError
+
+_STARTED = AgentV1AgentStartedSpeaking(type="AgentStartedSpeaking", total_latency=0, tts_latency=0, ttt_latency=0)
+_DONE = AgentV1AgentAudioDone(type="AgentAudioDone")
+
+
+def _refused():
+    return AgentV1InjectionRefused(type="InjectionRefused", message="Agent is speaking")
+
+
+class _ReplyingWebSocket:
+    """Records sent frames and answers each with the next scripted reply."""
+
+    def __init__(self, replies):
+        self.sent = []
+        self.queue = None
+        self._replies = list(replies)
+
+    def send(self, data):
+        self.sent.append(json.loads(data))
+        reply = self._replies.pop(0) if self._replies else None
+        if reply is not None:
+            self.queue.on_message(reply(json.loads(data)))
+
+
+class _AsyncReplyingWebSocket(_ReplyingWebSocket):
+    async def send(self, data):
+        super().send(data)
+
+
+def _echo(role):
+    return lambda sent: AgentV1ConversationText(
+        type="ConversationText", role=role, content=sent.get("content") or sent.get("message")
+    )
+
+
+def _queue(**kwargs):
+    kwargs.setdefault("initial_backoff", 0.01)
+    kwargs.setdefault("max_backoff", 0.02)
+    kwargs.setdefault("refusal_window", 0.2)
+    return AgentInjectionQueue(**kwargs)
+
+
+class TestAgentInjectionQueue:
+    def test_injections_are_sent_in_order_and_confirmed(self):
+        ws = _ReplyingWebSocket([_echo("user"), _echo("assistant")])
+        queue = _queue()
+        ws.queue = queue
+        queue.attach(V1SocketClient(websocket=ws))
+
+        first = queue.inject_user_message("What is my balance?")
+        second = queue.inject_agent_message("One moment please.")
+
+        assert first.result(timeout=2).content == "What is my balance?"
+        assert second.result(timeout=2).role == "assistant"
+        assert [frame["type"] for frame in ws.sent] == ["InjectUserMessage", "InjectAgentMessage"]
+        queue.close()
+
+    def test_waits_for_agent_to_finish_speaking(self):
+        ws = _ReplyingWebSocket([_echo("assistant")])
+        queue = _queue()
+        ws.queue = queue
+        queue.attach(V1SocketClient(websocket=ws))
+        queue.on_message(_STARTED)
+
+        future = queue.inject_agent_message("Your order shipped.")
+        time.sleep(0.1)
+        assert ws.sent == []
+
+        queue.on_message(_DONE)
+        assert future.result(timeout=2) is not None
+        assert len(ws.sent) == 1
+        queue.close()
+
+    def test_refusals_are_retried_then_fail(self):
+        ws = _ReplyingWebSocket([lambda _: _refused(), _echo("assistant")])
+        queue = _queue()
+        ws.queue = queue
+        queue.attach(V1SocketClient(websocket=ws))
+        assert queue.inject_agent_message("Hello").result(timeout=2).content == "Hello"
+        assert len(ws.sent) == 2
+
+        ws = _ReplyingWebSocket([lambda _: _refused()] * 3)
+        queue = _queue(max_attempts=3)
+        ws.queue = queue
+        queue.attach(V1SocketClient(websocket=ws))
+        with pytest.raises(InjectionRefusedError) as info:
+            queue.inject_user_message("Hi").result(timeout=2)
+        assert info.value.attempts == 3
+        assert info.value.reason == "Agent is speaking"
+        queue.close()
+
+    def test_interrupt_skips_idle_wait_and_close_cancels_pending(self):
+        ws = _ReplyingWebSocket([])
+        queue = _queue(refusal_window=0.01)
+        ws.queue = queue
+        queue.attach(V1SocketClient(websocket=ws))
+        queue.on_message(_STARTED)
+
+        interrupt = queue.inject_agent_message("Stop!", behavior="interrupt")
+        assert interrupt.result(timeout=2) is None
+        assert ws.sent[0]["behavior"] == "interrupt"
+
+        pending = queue.inject_agent_message("Later")
+        queue.close()
+        with pytest.raises(Exception):
+            pending.result(timeout=2)
+        with pytest.raises(RuntimeError):
+            queue.inject_user_message("too late")
+
+
+class TestAsyncAgentInjectionQueue:
+    async def test_refusal_retry_after_idle(self):
+        ws = _AsyncReplyingWebSocket([lambda _: _refused(), _echo("user")])
+        queue = AsyncAgentInjectionQueue(initial_backoff=0.01, refusal_window=0.2)
+        ws.queue = queue
+        queue.attach(AsyncV1SocketClient(websocket=ws))
+        queue.on_message(_STARTED)
+
+        future = queue.inject_user_message("Transfer me")
+        await asyncio.sleep(0.05)
+        assert ws.sent == []
+        queue.on_message(_DONE)
+
+        confirmation = await asyncio.wait_for(future, timeout=2)
+        assert confirmation.content == "Transfer me"
+        assert len(ws.sent) == 2
+        await queue.close()
@@ -0,0 +1,140 @@
+"""
+Tests for the voice agent latency telemetry aggregator
+"""
+
+import json
+
+import pytest
+
+from deepgram.agent.v1.socket_client import V1SocketClient
+from deepgram.agent.v1.types import (
+    AgentV1AgentStartedSpeaking,
+    AgentV1LatencyReport,
+    AgentV1Settings,
+    AgentV1SettingsApplied,
+)
+from deepgram.helpers import AgentLatencyAggregator, AgentLatencyStats, AgentLatencyTracker
+from deepgram.helpers.agent_latency import think_labels
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+_SETTINGS = {
+    "type": "Settings",
+    "audio": {"input": {"encoding": "linear16", "sample_rate": 16000}},
+    "agent": {"think": [{"provider": {"type": "open_ai", "model": "gpt-4o-mini"}}, {"provider": {"type": "groq"}}]},
+}
+
+
+def _report(total):
+    return AgentV1LatencyReport(type="LatencyReport", ttt_token_latency=0.2, tts_latency=0.1, total_latency=total)
+
+
+class TestAgentLatencyTracker:
+    def test_records_reports_and_sdk_timings_per_session_and_label(self):
+        clock = _Clock()
+        aggregator = AgentLatencyAggregator()
+        reports = []
+        tracker = AgentLatencyTracker(aggregator=aggregator, on_report=reports.append, clock=clock)
+        ws = _FakeWebSocket()
+        socket = V1SocketClient(websocket=ws)
+        tracker.attach(socket)
+
+        socket.send_settings(AgentV1Settings(**_SETTINGS))
+        clock.now = 0.05
+        tracker.on_message(AgentV1SettingsApplied(type="SettingsApplied"))
+        clock.now = 1.0
+        socket.send_media(b"\x00\x00")
+        clock.now = 1.4
+        tracker.on_message(AgentV1AgentStartedSpeaking(total_latency=0.4, tts_latency=0.1, ttt_latency=0.3))
+        clock.now = 1.5
+        tracker.on_message(b"audio")
+        clock.now = 1.6
+        tracker.on_message(b"more audio")
+        tracker.on_message(_report(0.5))
+
+        assert json.loads(ws.sent[0])["agent"]["think"][0]["provider"]["model"] == "gpt-4o-mini"
+        assert ws.sent[1] == b"\x00\x00"
+        assert tracker.labels == {"think_provider": "open_ai", "think_model": "gpt-4o-mini"}
+        assert reports == [{"ttt_token_latency_ms": 200.0, "tts_latency_ms": 100.0, "total_latency_ms": 500.0}]
+
+        session = tracker.session.snapshot()
+        assert session["settings_applied_ms"]["count"] == 1
+        assert session["media_to_first_audio_ms"]["p50"] == pytest.approx(500, rel=0.02)
+        assert session["started_speaking_to_first_audio_ms"]["p50"] == pytest.approx(100, rel=0.02)
+        assert session["ttt_text_latency_ms"]["count"] == 0
+
+        (entry,) = aggregator.snapshot()
+        assert entry["labels"] == tracker.labels
+        assert entry["metrics"]["total_latency_ms"]["count"] == 1
+        assert entry["metrics"]["media_to_first_audio_ms"]["count"] == 1
+
+    def test_new_response_after_audio_done(self):
+        clock = _Clock()
+        tracker = AgentLatencyTracker(labels={"region": "eu"}, clock=clock)
+        tracker.on_media()
+        clock.now = 0.3
+        tracker.on_message(b"a")
+        tracker.on_message(AgentV1AgentStartedSpeaking.model_construct(type="AgentAudioDone"))
+        clock.now = 0.4
+        tracker.on_message(b"b")
+        assert tracker.session.snapshot()["media_to_first_audio_ms"]["count"] == 2
+        assert tracker.labels == {"region": "eu"}
+
+
+class TestAgentLatencyAggregator:
+    def test_sessions_aggregate_by_labels_and_combine(self):
+        aggregator = AgentLatencyAggregator()
+        for model, total in (("a", 0.5), ("a", 0.7), ("b", 2.0)):
+            tracker = AgentLatencyTracker(aggregator=aggregator, labels={"think_model": model})
+            tracker.on_message(_report(total))
+
+        assert aggregator.stats_for({"think_model": "a"}).snapshot()["total_latency_ms"]["count"] == 2
+        assert aggregator.stats_for({"think_model": "b"}).snapshot()["total_latency_ms"]["max"] == pytest.approx(
+            2000, rel=0.02
+        )
+        assert aggregator.combined().snapshot()["total_latency_ms"]["count"] == 3
+
+    def test_opentelemetry_export_with_meter(self):
+        class _Histogram:
+            def __init__(self):
+                self.points = []
+
+            def record(self, value, attributes=None):
+                self.points.append((value, attributes))
+
+        class _Meter:
+            def __init__(self):
+                self.instruments = {}
+
+            def create_histogram(self, name, unit="", description=""):
+                self.instruments[name] = _Histogram()
+                return self.instruments[name]
+
+        meter = _Meter()
+        aggregator = AgentLatencyAggregator()
+        aggregator.instrument_opentelemetry(meter)
+        aggregator.record("total_latency_ms", 420.0, {"think_provider": "open_ai"})
+
+        assert len(meter.instruments) == len(AgentLatencyStats.METRICS)
+        assert meter.instruments["deepgram.agent.total_latency"].points == [(420.0, {"think_provider": "open_ai"})]
+
+
+def test_think_labels_handles_models_and_missing_think():
+    assert think_labels(_SETTINGS) == {"think_provider": "open_ai", "think_model": "gpt-4o-mini"}
+    assert think_labels({"agent": {}}) == {}
+    assert think_labels({"agent": "agent-id"}) == {}
@@ -0,0 +1,151 @@
+"""
+Tests for the pre-negotiated agent session pools
+"""
+
+import contextlib
+import threading
+import time
+import types
+
+import pytest
+
+from deepgram.helpers import AgentSessionPool, AgentSettingsError, AsyncAgentSessionPool
+
+
+class _FakeAgentSocket:
+    def __init__(self, reject=False, silent=False):
+        self.sent = []
+        self.closed = False
+        self.closed_event = threading.Event()
+        self._silent = silent
+        self._replies = [
+            types.SimpleNamespace(type="Welcome", request_id="req-1"),
+            types.SimpleNamespace(type="Error", code="BAD", description="nope")
+            if reject
+            else types.SimpleNamespace(type="SettingsApplied"),
+        ]
+
+    def send_settings(self, message):
+        self.sent.append(("Settings", message))
+
+    def recv(self):
+        if self._silent and len(self._replies) == 1:
+            # SettingsApplied never arrives; recv blocks until the socket is closed.
+            self.closed_event.wait()
+            raise ConnectionError("closed")
+        return self._replies.pop(0)
+
+    def send_keep_alive(self):
+        self.sent.append(("KeepAlive", None))
+
+    def send_update_prompt(self, message):
+        self.sent.append(("UpdatePrompt", message.prompt))
+
+
+class _FakeAgentClient:
+    def __init__(self, reject=False, silent=False):
+        self.opened = []
+        self._reject = reject
+        self._silent = silent
+
+    @contextlib.contextmanager
+    def connect(self, **kwargs):
+        socket = _FakeAgentSocket(self._reject, self._silent)
+        self.opened.append(socket)
+        try:
+            yield socket
+        finally:
+            socket.closed = True
+            socket.closed_event.set()
+
+
+class _FakeAsyncAgentSocket(_FakeAgentSocket):
+    async def send_settings(self, message):
+        self.sent.append(("Settings", message))
+
+    async def recv(self):
+        return self._replies.pop(0)
+
+    async def send_keep_alive(self):
+        self.sent.append(("KeepAlive", None))
+
+    async def send_update_prompt(self, message):
+        self.sent.append(("UpdatePrompt", message.prompt))
+
+
+class _FakeAsyncAgentClient:
+    def __init__(self):
+        self.opened = []
+
+    @contextlib.asynccontextmanager
+    async def connect(self, **kwargs):
+        socket = _FakeAsyncAgentSocket()
+        self.opened.append(socket)
+        try:
+            yield socket
+        finally:
+            socket.closed = True
+
+
+_SETTINGS = {"type": "Settings"}
+
+
+class TestAgentSessionPool:
+    def test_lease_hands_out_applied_session_and_updates_prompt(self):
+        agent = _FakeAgentClient()
+        with AgentSessionPool(agent, _SETTINGS, size=1, keep_alive_interval=None) as pool:
+            pool.warm()
+            assert pool.ready_count() == 1
+            warmed = agent.opened[0]
+            assert warmed.sent == [("Settings", _SETTINGS)]
+
+            pooled = pool.acquire(prompt="Help Alice.")
+            assert pooled.socket is warmed
+            assert pooled.request_id == "req-1"
+            assert warmed.sent[-1] == ("UpdatePrompt", "Help Alice.")
+            pool.release(pooled)
+            assert warmed.closed
+
+            # A replacement is opened in the background after the lease.
+            deadline = time.monotonic() + 2
+            while pool.ready_count() < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.ready_count() == 1
+            assert len(agent.opened) == 2
+
+    def test_rejected_settings_raise(self):
+        with AgentSessionPool(_FakeAgentClient(reject=True), _SETTINGS, size=0, keep_alive_interval=None) as pool:
+            with pytest.raises(AgentSettingsError) as info:
+                pool.acquire()
+            assert info.value.code == "BAD"
+
+    def test_settings_timeout_closes_half_open_session(self):
+        agent = _FakeAgentClient(silent=True)
+        with AgentSessionPool(agent, _SETTINGS, size=0, keep_alive_interval=None, settings_timeout=0.05) as pool:
+            with pytest.raises(TimeoutError):
+                pool.acquire()
+            assert agent.opened[0].closed
+
+    def test_maintain_keeps_alive_and_recycles_stale_sessions(self):
+        agent = _FakeAgentClient()
+        with AgentSessionPool(agent, _SETTINGS, size=1, max_age=0.2, keep_alive_interval=None) as pool:
+            pool.warm()
+            first = agent.opened[0]
+            pool.maintain()
+            assert first.sent[-1] == ("KeepAlive", None)
+
+            time.sleep(0.25)
+            pool.maintain()
+            assert first.closed
+
+
+class TestAsyncAgentSessionPool:
+    async def test_warm_lease_and_replenish(self):
+        agent = _FakeAsyncAgentClient()
+        pool = AsyncAgentSessionPool(agent, _SETTINGS, size=1, keep_alive_interval=None)
+        await pool.warm()
+        async with pool.session(prompt="Hi") as socket:
+            assert socket is agent.opened[0]
+            assert socket.sent[-1] == ("UpdatePrompt", "Hi")
+        assert agent.opened[0].closed
+        await pool.close()
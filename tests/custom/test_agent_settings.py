@@ -0,0 +1,96 @@
+"""
+Tests for precompiled agent settings and update diffing
+"""
+
+import json
+
+import pytest
+
+from deepgram.agent.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.agent.v1.types import AgentV1Settings
+from deepgram.helpers import CompiledAgentMessage, CompiledAgentSettings, compile_updates
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+class _FakeAsyncWebSocket(_FakeWebSocket):
+    async def send(self, data):
+        self.sent.append(data)
+
+
+_SETTINGS = AgentV1Settings(
+    type="Settings",
+    audio={"input": {"encoding": "linear16", "sample_rate": 24000.0}},
+    agent={
+        "greeting": "Hello!",
+        "think": {"provider": {"type": "open_ai", "model": "gpt-4o-mini"}, "prompt": "Be helpful."},
+        "speak": {"provider": {"type": "deepgram", "model": "aura-2-thalia-en"}},
+    },
+)
+
+
+class TestCompiledAgentSettings:
+    def test_compiles_once_and_socket_sends_frame_verbatim(self):
+        compiled = CompiledAgentSettings(_SETTINGS)
+        assert compiled.payload["audio"]["input"]["sample_rate"] == 24000
+        assert compiled.payload == json.loads(compiled.wire_frame)
+
+        ws = _FakeWebSocket()
+        V1SocketClient(websocket=ws).send_settings(compiled)
+        assert ws.sent == [compiled.wire_frame]
+
+    async def test_async_socket_sends_frame_verbatim(self):
+        compiled = CompiledAgentSettings(_SETTINGS)
+        ws = _FakeAsyncWebSocket()
+        await compiled.send(AsyncV1SocketClient(websocket=ws))
+        assert ws.sent == [compiled.wire_frame]
+
+    def test_derive_shares_unchanged_sections(self):
+        template = CompiledAgentSettings(_SETTINGS)
+        variant = template.derive(prompt="Help Alice.", greeting="Hi Alice!")
+
+        assert variant.agent["think"]["prompt"] == "Help Alice."
+        assert variant.agent["greeting"] == "Hi Alice!"
+        assert variant.agent["speak"] is template.agent["speak"]
+        assert template.agent["think"]["prompt"] == "Be helpful."
+
+    def test_prompt_only_change_is_a_single_update_prompt(self):
+        template = CompiledAgentSettings(_SETTINGS)
+        updates = template.updates_to(template.derive(prompt="Be brief.", greeting="Hey"))
+        assert [update.payload for update in updates] == [{"type": "UpdatePrompt", "prompt": "Be brief."}]
+        assert template.updates_to(template) == []
+
+    def test_provider_changes_become_think_and_speak_updates(self):
+        template = CompiledAgentSettings(_SETTINGS)
+        target = template.derive(
+            think={"provider": {"type": "anthropic", "model": "claude"}, "prompt": "Be helpful."},
+            speak={"provider": {"type": "deepgram", "model": "aura-2-zeus-en"}},
+        )
+        ws = _FakeWebSocket()
+        socket = V1SocketClient(websocket=ws)
+        for update in template.updates_to(target):
+            update.send(socket)
+
+        assert [json.loads(frame)["type"] for frame in ws.sent] == ["UpdateThink", "UpdateSpeak"]
+        assert json.loads(ws.sent[0])["think"]["provider"]["type"] == "anthropic"
+
+    def test_non_updatable_differences_raise_when_strict(self):
+        template = CompiledAgentSettings(_SETTINGS)
+        changed = CompiledAgentSettings({**template.payload, "audio": {"input": {"encoding": "mulaw"}}})
+        with pytest.raises(ValueError, match="audio"):
+            template.updates_to(changed)
+        assert template.updates_to(changed, strict=False) == []
+
+    def test_compile_updates(self):
+        prompt, speak = compile_updates(("prompt", "Be brief."), ("speak", {"provider": {"type": "deepgram"}}))
+        assert isinstance(prompt, CompiledAgentMessage)
+        assert prompt.type == "UpdatePrompt"
+        assert speak.payload == {"type": "UpdateSpeak", "speak": {"provider": {"type": "deepgram"}}}
+        with pytest.raises(ValueError):
+            compile_updates(("audio", {}))
@@ -0,0 +1,120 @@
+"""
+Tests for the voice activity gate in front of send_media
+"""
+
+import json
+import struct
+
+import pytest
+
+from deepgram.agent.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.helpers import VoiceActivityGate
+from deepgram.listen.v2.socket_client import V2SocketClient as ListenV2SocketClient
+
+# 16 kHz linear16, 10 ms frames -> 320 bytes per frame.
+_FRAME = 320
+
+
+def _tone(frames, amplitude=8000):
+    samples = [amplitude if i % 2 else -amplitude for i in range(frames * _FRAME // 2)]
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+def _silence(frames):
+    return bytes(frames * _FRAME)
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+class _FakeAsyncWebSocket(_FakeWebSocket):
+    async def send(self, data):
+        self.sent.append(data)
+
+
+def _gate(**kwargs):
+    kwargs.setdefault("frame_ms", 10)
+    kwargs.setdefault("hangover_ms", 20)
+    kwargs.setdefault("pre_roll_ms", 20)
+    return VoiceActivityGate(**kwargs)
+
+
+class TestVoiceActivityGate:
+    def test_levels(self):
+        gate = _gate(use_numpy=False)
+        assert gate.level_db(_silence(1)) == -120.0
+        assert gate.level_db(_tone(1, amplitude=32767)) == pytest.approx(0.0, abs=0.01)
+        assert gate.level_db(_tone(1, amplitude=100)) < -45
+
+    def test_pre_roll_speech_and_hangover(self):
+        gate = _gate(silence="drop")
+        pre_roll = _silence(5)[: 2 * _FRAME]
+        out = gate.process(_silence(5) + _tone(3) + _silence(5))
+
+        # Two pre-roll frames, three speech frames and two hangover frames, coalesced into one send.
+        assert out == [pre_roll + _tone(3) + _silence(2)]
+        assert not gate.is_open
+        assert gate.stats.speech_segments == 1
+        assert gate.stats.frames_sent == 7
+        assert gate.stats.reduction == pytest.approx(6 / 13)
+
+    def test_reframes_partial_chunks_and_flushes_tail_when_open(self):
+        gate = _gate(silence="drop", pre_roll_ms=0)
+        speech = _tone(2)
+        assert gate.process(speech[:100]) == []
+        assert gate.process(speech[100:400]) == [speech[:_FRAME]]
+        assert gate.flush() == [speech[_FRAME:400]]
+        assert gate.flush() == []
+
+    def test_keep_alive_during_silence_on_agent_socket(self):
+        ws = _FakeWebSocket()
+        socket = V1SocketClient(websocket=ws)
+        gate = _gate(keep_alive_interval=0.05).attach(socket)
+
+        socket.send_media(_silence(12))
+        assert [json.loads(frame)["type"] for frame in ws.sent] == ["KeepAlive", "KeepAlive"]
+
+        socket.send_media(_tone(1))
+        assert ws.sent[-1] == _silence(2) + _tone(1)
+        assert gate.stats.keep_alives == 2
+
+    def test_comfort_noise_on_listen_v2_socket_without_keep_alive(self):
+        socket = ListenV2SocketClient(websocket=_FakeWebSocket())
+        with pytest.raises(ValueError):
+            _gate().attach(socket)
+
+        ws = _FakeWebSocket()
+        socket = ListenV2SocketClient(websocket=ws)
+        gate = _gate(silence="comfort_noise", comfort_noise_interval=0.05, pre_roll_ms=0).attach(socket)
+        socket.send_media(_silence(10))
+
+        assert len(ws.sent) == 2
+        assert all(len(frame) == _FRAME for frame in ws.sent)
+        assert gate.level_db(ws.sent[0]) < gate.threshold_db
+
+    def test_mulaw_and_alaw_levels(self):
+        assert _gate(encoding="mulaw", use_numpy=False).level_db(b"\xff" * 160) == -120.0
+        assert _gate(encoding="mulaw", use_numpy=False).level_db(b"\x00" * 160) > -1
+        assert _gate(encoding="alaw", use_numpy=False).level_db(b"\xd5" * 160) < -70
+        with pytest.raises(ValueError):
+            _gate(encoding="opus")
+
+    def test_from_settings(self):
+        gate = VoiceActivityGate.from_settings(
+            {"audio": {"input": {"encoding": "mulaw", "sample_rate": 8000.0}}}, frame_ms=20
+        )
+        assert (gate.encoding, gate.sample_rate, gate.frame_bytes) == ("mulaw", 8000, 160)
+
+    async def test_async_socket(self):
+        ws = _FakeAsyncWebSocket()
+        socket = AsyncV1SocketClient(websocket=ws)
+        gate = _gate(silence="drop", pre_roll_ms=0).attach(socket)
+
+        await socket.send_media(_silence(3) + _tone(1) + _tone(1)[:10])
+        await gate.finish()
+        assert ws.sent == [_tone(1), _tone(1)[:10]]
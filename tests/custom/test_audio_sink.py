@@ -0,0 +1,183 @@
+"""
+Tests for the speak WebSocket audio frame assembler and sinks
+"""
+
+import io
+import wave
+
+import pytest
+
+from deepgram.core.events import EventType
+from deepgram.helpers import (
+    AudioFrameAssembler,
+    RawFileSink,
+    SpeakAudioSink,
+    WavFileSink,
+    aiter_audio_frames,
+    iter_audio_frames,
+    sample_width_for_encoding,
+)
+from deepgram.speak.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+
+
+class _FakeWebSocket:
+    """Replays ``incoming`` on iteration."""
+
+    def __init__(self, incoming=None):
+        self._incoming = list(incoming or [])
+
+    def __iter__(self):
+        yield from self._incoming
+
+
+class _FakeAsyncWebSocket:
+    def __init__(self, incoming=None):
+        self._incoming = list(incoming or [])
+
+    def __aiter__(self):
+        incoming = self._incoming
+
+        async def _gen():
+            for message in incoming:
+                yield message
+
+        return _gen()
+
+
+class _ListSink:
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+
+    def write(self, frame):
+        self.frames.append(bytes(frame))
+
+    def close(self):
+        self.closed = True
+
+
+def _pcm(n_bytes, start=0):
+    return bytes((start + i) % 256 for i in range(n_bytes))
+
+
+class TestAudioFrameAssembler:
+    def test_frame_size_is_sample_aligned(self):
+        assembler = AudioFrameAssembler(sample_rate=24000, frame_duration_ms=20)
+        assert assembler.frame_bytes == 960
+        assert assembler.frame_bytes % assembler.block_align == 0
+
+    def test_whole_frames_are_views_of_input(self):
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)  # 20 bytes per frame
+        data = _pcm(45)
+        frames = list(assembler.feed(data))
+        assert [bytes(f) for f in frames] == [data[:20], data[20:40]]
+        assert all(f.obj is data for f in frames)
+        assert frames[0].readonly
+        assert assembler.pending_bytes == 5
+
+    def test_odd_byte_split_reassembles_samples(self):
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)
+        stream = _pcm(60)
+        chunks = [stream[:7], stream[7:33], stream[33:34], stream[34:60]]
+        out = b"".join(bytes(f) for chunk in chunks for f in assembler.feed(chunk))
+        assert out == stream
+        assert assembler.pending_bytes == 0
+
+    def test_flush_truncates_partial_sample(self):
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)
+        list(assembler.feed(_pcm(7)))
+        tail = assembler.flush()
+        assert bytes(tail) == _pcm(6)
+        assert assembler.flush() is None
+
+    def test_reset_drops_staged_audio(self):
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)
+        list(assembler.feed(_pcm(11)))
+        assembler.reset()
+        assert assembler.pending_bytes == 0
+        assert assembler.flush() is None
+
+    def test_for_encoding(self):
+        assert AudioFrameAssembler.for_encoding("mulaw", 8000).frame_bytes == 160
+        assert sample_width_for_encoding("linear16") == 2
+        with pytest.raises(ValueError):
+            sample_width_for_encoding("mp3")
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            AudioFrameAssembler(sample_rate=0)
+        with pytest.raises(ValueError):
+            AudioFrameAssembler(sample_rate=16000, ring_frames=1)
+
+
+class TestSinks:
+    def test_raw_file_sink(self):
+        buffer = io.BytesIO()
+        sink = RawFileSink(buffer)
+        sink.write(memoryview(b"\x01\x02"))
+        sink.close()
+        assert buffer.getvalue() == b"\x01\x02"
+        assert sink.bytes_written == 2
+
+    def test_wav_file_sink_header(self, tmp_path):
+        path = tmp_path / "out.wav"
+        sink = WavFileSink(path, sample_rate=16000)
+        sink.write(memoryview(_pcm(320)))
+        sink.close()
+        with wave.open(str(path), "rb") as reader:
+            assert reader.getframerate() == 16000
+            assert reader.getsampwidth() == 2
+            assert reader.getnframes() == 160
+            assert reader.readframes(160) == _pcm(320)
+
+    def test_wav_file_sink_rejects_companded_audio(self, tmp_path):
+        with pytest.raises(ValueError):
+            WavFileSink(tmp_path / "out.wav", sample_rate=8000, encoding="mulaw")
+
+
+class TestSpeakAudioSink:
+    def test_attach_to_socket_client(self):
+        stream = _pcm(50)
+        ws = _FakeWebSocket([stream[:15], stream[15:50], '{"type": "Flushed", "sequence_id": 0}'])
+        socket = V1SocketClient(websocket=ws)
+        target = _ListSink()
+        SpeakAudioSink(target, sample_rate=1000, frame_duration_ms=10).attach(socket)
+        socket.start_listening()
+        assert b"".join(target.frames) == stream
+        assert [len(f) for f in target.frames] == [20, 20, 10]
+        assert target.closed
+
+    def test_cleared_drops_tail(self):
+        target = _ListSink()
+        sink = SpeakAudioSink(target, sample_rate=1000, frame_duration_ms=10)
+        sink.on_message(_pcm(10))
+
+        class _Cleared:
+            type = "Cleared"
+
+        sink.on_message(_Cleared())
+        sink.close()
+        assert target.frames == []
+
+    async def test_attach_to_async_socket_client(self):
+        ws = _FakeAsyncWebSocket([_pcm(40)])
+        socket = AsyncV1SocketClient(websocket=ws)
+        target = _ListSink()
+        sink = SpeakAudioSink(target, sample_rate=1000, frame_duration_ms=10)
+        socket.on(EventType.MESSAGE, sink.on_message)
+        await socket.start_listening()
+        assert len(target.frames) == 2
+
+
+class TestFrameIterators:
+    def test_iter_audio_frames(self):
+        ws = _FakeWebSocket([_pcm(25), '{"type": "Flushed", "sequence_id": 0}', _pcm(4)])
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)
+        sizes = [len(f) for f in iter_audio_frames(V1SocketClient(websocket=ws), assembler)]
+        assert sizes == [20, 4, 4]
+
+    async def test_aiter_audio_frames(self):
+        ws = _FakeAsyncWebSocket([_pcm(25)])
+        assembler = AudioFrameAssembler(sample_rate=1000, frame_duration_ms=10)
+        sizes = [len(f) async for f in aiter_audio_frames(AsyncV1SocketClient(websocket=ws), assembler)]
+        assert sizes == [20, 4]
@@ -0,0 +1,111 @@
+"""
+Tests for the streamed TTS response policy (chunk size, read-ahead, readinto)
+"""
+
+import threading
+
+import pytest
+
+from deepgram.helpers import AudioStreamPolicy
+
+
+class _FakeAudioClient:
+    def __init__(self, chunks, error=None):
+        self.calls = []
+        self.closed = threading.Event()
+        self._chunks = chunks
+        self._error = error
+
+    def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        try:
+            yield from self._chunks
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.closed.set()
+
+
+class _FakeAsyncAudioClient:
+    def __init__(self, chunks):
+        self.calls = []
+        self._chunks = chunks
+
+    async def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        for chunk in self._chunks:
+            yield chunk
+
+
+_CHUNKS = [b"abc", b"defgh", b"i", b"jklmnop"]
+
+
+class TestAudioStreamPolicy:
+    def test_default_chunk_size_is_applied_without_overriding(self):
+        policy = AudioStreamPolicy(chunk_size=4096)
+        audio = _FakeAudioClient(_CHUNKS)
+        policy.stream(audio, text="hi").read()
+        policy.stream(audio, text="hi", request_options={"chunk_size": 10, "max_retries": 1}).read()
+        assert audio.calls[0]["request_options"] == {"chunk_size": 4096}
+        assert audio.calls[1]["request_options"] == {"chunk_size": 10, "max_retries": 1}
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            AudioStreamPolicy(chunk_size=0)
+        with pytest.raises(ValueError):
+            AudioStreamPolicy(read_ahead_bytes=-1)
+
+    @pytest.mark.parametrize("read_ahead_bytes", [0, 4])
+    def test_readinto_fills_caller_buffer(self, read_ahead_bytes):
+        policy = AudioStreamPolicy(read_ahead_bytes=read_ahead_bytes)
+        buffer = bytearray(4)
+        out = []
+        with policy.stream(_FakeAudioClient(_CHUNKS), text="hi") as audio:
+            while True:
+                n = audio.readinto(buffer)
+                if not n:
+                    break
+                out.append(bytes(buffer[:n]))
+        assert out == [b"abcd", b"efgh", b"ijkl", b"mnop"]
+        assert audio.bytes_read == 16
+
+    @pytest.mark.parametrize("read_ahead_bytes", [0, 1, 1024])
+    def test_iteration(self, read_ahead_bytes):
+        policy = AudioStreamPolicy(read_ahead_bytes=read_ahead_bytes)
+        assert list(policy.stream(_FakeAudioClient(_CHUNKS), text="hi")) == _CHUNKS
+
+    def test_read_ahead_surfaces_errors_after_buffered_data(self):
+        policy = AudioStreamPolicy(read_ahead_bytes=1024)
+        stream = policy.stream(_FakeAudioClient([b"ab"], error=RuntimeError("reset")), text="hi")
+        assert stream.read(2) == b"ab"
+        with pytest.raises(RuntimeError):
+            stream.read(1)
+
+    def test_close_releases_source(self):
+        audio = _FakeAudioClient(_CHUNKS)
+        stream = AudioStreamPolicy(read_ahead_bytes=2).stream(audio, text="hi")
+        assert stream.read(1) == b"a"
+        stream.close()
+        assert audio.closed.wait(timeout=2)
+
+
+class TestAsyncAudioStream:
+    @pytest.mark.parametrize("read_ahead_bytes", [0, 4])
+    async def test_readinto(self, read_ahead_bytes):
+        policy = AudioStreamPolicy(read_ahead_bytes=read_ahead_bytes)
+        buffer = bytearray(5)
+        out = []
+        async with policy.astream(_FakeAsyncAudioClient(_CHUNKS), text="hi") as audio:
+            while True:
+                n = await audio.readinto(buffer)
+                if not n:
+                    break
+                out.append(bytes(buffer[:n]))
+        assert b"".join(out) == b"".join(_CHUNKS)
+        assert [len(chunk) for chunk in out] == [5, 5, 5, 1]
+
+    async def test_iteration(self):
+        policy = AudioStreamPolicy(read_ahead_bytes=3)
+        audio = _FakeAsyncAudioClient(_CHUNKS)
+        assert [chunk async for chunk in policy.astream(audio, text="hi")] == _CHUNKS
+        assert audio.calls[0]["request_options"] == {"chunk_size": 8192}
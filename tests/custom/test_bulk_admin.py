@@ -0,0 +1,135 @@
+"""Tests for concurrent bulk key and member administration."""
+
+import itertools
+import threading
+
+import httpx
+import pytest
+
+from deepgram import AsyncDeepgramClient, DeepgramClient
+from deepgram.helpers import AsyncBulkProjectAdmin, BulkOperationError, BulkProjectAdmin
+
+
+class _Keys:
+    """Fake key and member endpoints; requests for ``fail_projects`` get a 403."""
+
+    def __init__(self, fail_projects=(), fail_deletes=()):
+        self.fail_projects = set(fail_projects)
+        self.fail_deletes = set(fail_deletes)
+        self.keys = {}
+        self.scopes = {}
+        self.delete_headers = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        parts = request.url.path.strip("/").split("/")
+        project = parts[2]
+        if project in self.fail_projects:
+            return httpx.Response(403, json={"err_msg": "forbidden"})
+        with self._lock:
+            if request.method == "POST" and parts[-1] == "keys":
+                key_id = f"k{next(self._ids)}"
+                self.keys[key_id] = project
+                return httpx.Response(200, json={"api_key_id": key_id, "key": f"secret-{key_id}"})
+            if request.method == "DELETE":
+                self.delete_headers.append(request.headers.get("x-trace"))
+                if parts[-1] in self.fail_deletes:
+                    return httpx.Response(403, json={"err_msg": "forbidden"})
+                self.keys.pop(parts[-1], None)
+                return httpx.Response(200, json={"message": "deleted"})
+            if request.method == "PUT":
+                self.scopes[(project, parts[4])] = request.read().decode()
+                return httpx.Response(200, json={"message": "updated"})
+        return httpx.Response(404, json={})
+
+
+def _client(server):
+    return DeepgramClient(api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(server)))
+
+
+_REQUEST = {"comment": "bulk", "scopes": ["member"]}
+
+
+class TestBulkProjectAdmin:
+    def test_create_keys_reports_every_project(self):
+        server = _Keys(fail_projects={"p3"})
+        report = BulkProjectAdmin(_client(server), concurrency=2).create_keys(["p1", "p2", "p3"], _REQUEST)
+        assert [item.status for item in report.results] == ["succeeded", "succeeded", "failed"]
+        assert {item.target for item in report.succeeded} == set(server.keys)
+        with pytest.raises(BulkOperationError):
+            report.raise_for_failures()
+
+    def test_create_keys_rollback_deletes_created_keys(self):
+        server = _Keys(fail_projects={"p2"})
+        report = BulkProjectAdmin(_client(server), concurrency=1).create_keys(
+            ["p1", "p2", "p3"], _REQUEST, rollback=True
+        )
+        assert report.summary() == {"succeeded": 0, "failed": 1, "rolled_back": 1, "skipped": 1}
+        assert server.keys == {}
+
+    def test_rollback_uses_request_options(self):
+        server = _Keys(fail_projects={"p2"})
+        BulkProjectAdmin(_client(server), concurrency=1).create_keys(
+            ["p1", "p2"], _REQUEST, rollback=True, request_options={"additional_headers": {"x-trace": "t1"}}
+        )
+        assert server.delete_headers == ["t1"]
+
+    def test_duplicate_projects_are_separate_items(self):
+        server = _Keys()
+        report = BulkProjectAdmin(_client(server)).create_keys(["p1", "p1"], _REQUEST)
+        assert len(report.results) == 2 and report.ok
+        assert sorted(server.keys.values()) == ["p1", "p1"]
+
+    def test_delete_keys_and_update_scopes(self):
+        server = _Keys()
+        server.keys = {"a": "p1", "b": "p2"}
+        admin = BulkProjectAdmin(_client(server))
+        assert admin.delete_keys([("p1", "a"), ("p2", "b")]).ok
+        assert server.keys == {}
+        report = admin.update_member_scopes([("p1", "m1", "admin"), ("p2", "m2", "member")])
+        assert report.ok
+        assert '"admin"' in server.scopes[("p1", "m1")]
+
+    def test_rotate_keys_distributes_and_deletes_old_key(self):
+        server = _Keys()
+        server.keys = {"old1": "p1", "old2": "p2"}
+        distributed = {}
+
+        def _distribute(project_id, key):
+            if project_id == "p2":
+                raise RuntimeError("vault unavailable")
+            distributed[project_id] = key.key
+
+        report = BulkProjectAdmin(_client(server)).rotate_keys(
+            {"p1": "old1", "p2": "old2"}, request=_REQUEST, distribute=_distribute
+        )
+        assert [item.status for item in report.results] == ["succeeded", "failed"]
+        assert isinstance(report.results[1].error, RuntimeError)
+        assert report.results[1].cleaned_up and report.results[1].rollback_error is None
+        with pytest.raises(BulkOperationError):
+            report.raise_for_failures()
+        assert sorted(server.keys.values()) == ["p1", "p2"]
+        assert "old2" in server.keys and "old1" not in server.keys
+        assert distributed["p1"].startswith("secret-")
+
+
+class TestAsyncBulkProjectAdmin:
+    async def test_rollback_and_rotation(self):
+        server = _Keys(fail_projects={"p2"})
+        client = AsyncDeepgramClient(
+            api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server))
+        )
+        admin = AsyncBulkProjectAdmin(client, concurrency=1)
+        report = await admin.create_keys({"p1": _REQUEST, "p2": _REQUEST}, rollback=True)
+        assert [item.status for item in report.results] == ["rolled_back", "failed"]
+        assert server.keys == {}
+
+        server.keys = {"old": "p1"}
+
+        async def _distribute(project_id, key):
+            pass
+
+        report = await admin.rotate_keys({"p1": "old"}, request=_REQUEST, distribute=_distribute)
+        assert report.ok
+        assert list(server.keys) == [report.results[0].result.api_key_id]
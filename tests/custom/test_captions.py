@@ -0,0 +1,182 @@
+"""Tests for SRT / WebVTT caption generation."""
+
+import asyncio
+import json
+
+import pytest
+
+from deepgram.core.unchecked_base_model import construct_type
+from deepgram.helpers import (
+    CaptionBuilder,
+    astream_captions,
+    response_captions,
+    stream_captions,
+    to_srt,
+    to_webvtt,
+)
+from deepgram.listen.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.types.listen_v1response import ListenV1Response
+
+
+def _word(text, start, end, speaker=None):
+    word = {"word": text.lower().strip(".,?"), "punctuated_word": text, "start": start, "end": end, "confidence": 0.9}
+    if speaker is not None:
+        word["speaker"] = speaker
+    return word
+
+
+def _response(words, utterances=None):
+    return {
+        "metadata": {
+            "request_id": "r1",
+            "sha256": "s",
+            "created": "2024-01-01T00:00:00Z",
+            "duration": 10.0,
+            "channels": 1,
+            "models": ["m"],
+            "model_info": {},
+        },
+        "results": {
+            "channels": [{"alternatives": [{"transcript": "", "confidence": 0.9, "words": words}]}],
+            **({"utterances": utterances} if utterances is not None else {}),
+        },
+    }
+
+
+def _results(words, speech_final=False, is_final=True, start=0.0):
+    return json.dumps(
+        {
+            "type": "Results",
+            "channel_index": [0, 1],
+            "duration": 1.0,
+            "start": start,
+            "is_final": is_final,
+            "speech_final": speech_final,
+            "channel": {
+                "alternatives": [
+                    {"transcript": " ".join(w["punctuated_word"] for w in words), "confidence": 0.9, "words": words}
+                ]
+            },
+            "metadata": {
+                "request_id": "r1",
+                "model_info": {"name": "n", "version": "1", "arch": "a"},
+                "model_uuid": "m",
+            },
+        }
+    )
+
+
+class _FakeWebSocket:
+    def __init__(self, frames):
+        self._frames = frames
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+
+class TestCaptionBuilder:
+    def test_wraps_lines_and_splits_cues(self):
+        builder = CaptionBuilder(max_line_length=10, max_lines=2)
+        cues = []
+        for i, text in enumerate(["one", "two", "three", "four", "five", "six"]):
+            cues += builder.add_word(text, i * 0.5, i * 0.5 + 0.4)
+        cues += builder.flush()
+        assert [cue.lines for cue in cues] == [["one two", "three four"], ["five six"]]
+        assert [cue.index for cue in cues] == [1, 2]
+        assert (cues[1].start, cues[1].end) == (2.0, 2.9)
+
+    def test_gap_duration_and_speaker_change_start_new_cues(self):
+        builder = CaptionBuilder(max_gap=1.0, max_cue_duration=3.0)
+        cues = builder.add_word("a", 0.0, 0.5, speaker=0)
+        cues += builder.add_word("b", 2.0, 2.5, speaker=0)  # gap
+        cues += builder.add_word("c", 2.6, 5.2, speaker=0)  # duration
+        cues += builder.add_word("d", 5.3, 5.5, speaker=1)  # speaker
+        cues += builder.flush()
+        assert [cue.text for cue in cues] == ["a", "b", "c", "d"]
+        assert [cue.label for cue in cues] == ["Speaker 0", None, None, "Speaker 1"]
+
+    def test_speaker_label_modes(self):
+        builder = CaptionBuilder(max_gap=0.1, speaker_labels="always")
+        cues = builder.add_word("a", 0.0, 0.5, speaker=0) + builder.add_word("b", 2.0, 2.5, speaker=0)
+        assert [cue.label for cue in cues + builder.flush()] == ["Speaker 0", "Speaker 0"]
+        with pytest.raises(ValueError):
+            CaptionBuilder(speaker_labels="sometimes")
+
+
+class TestFormats:
+    def test_srt_and_webvtt(self):
+        builder = CaptionBuilder()
+        cues = builder.add_word("Hi", 3661.5, 3662.0, speaker=2) + builder.add_word("<there>", 3662.1, 3662.25)
+        cues += builder.flush()
+        assert to_srt(cues) == "1\n01:01:01,500 --> 01:01:02,250\n[Speaker 2] Hi <there>\n\n"
+        assert to_webvtt(cues) == "WEBVTT\n\n1\n01:01:01.500 --> 01:01:02.250\n<v Speaker 2>Hi &lt;there&gt;\n\n"
+
+
+class TestResponseCaptions:
+    def test_words_of_the_channel(self):
+        words = [_word("Hello", 0.0, 0.4), _word("world.", 0.5, 0.9), _word("Again.", 5.0, 5.5)]
+        response = construct_type(type_=ListenV1Response, object_=_response(words))
+        cues = list(response_captions(response))
+        assert [cue.text for cue in cues] == ["Hello world.", "Again."]
+
+    def test_utterances_start_new_cues_and_carry_speakers(self):
+        utterances = [
+            {"start": 0.0, "end": 0.9, "channel": 0, "speaker": 0, "words": [_word("Hi.", 0.0, 0.4, 0)]},
+            {"start": 1.0, "end": 1.9, "channel": 0, "speaker": 0, "words": [_word("Bye.", 1.0, 1.4, 0)]},
+        ]
+        cues = list(response_captions(_response([], utterances)))
+        assert [(cue.text, cue.label) for cue in cues] == [("Hi.", "Speaker 0"), ("Bye.", None)]
+
+    def test_rejects_responses_without_results(self):
+        with pytest.raises(ValueError):
+            list(response_captions({"request_id": "r1"}))
+
+
+class TestStreamCaptions:
+    def _frames(self):
+        return [
+            _results([_word("Hello", 0.0, 0.4)], is_final=False),
+            _results([_word("Hello", 0.0, 0.4), _word("there.", 0.5, 0.9)], speech_final=True),
+            _results([_word("More", 1.0, 1.3)]),
+        ]
+
+    def test_cues_are_yielded_when_final(self):
+        socket = V1SocketClient(websocket=_FakeWebSocket(self._frames()))
+        cues = stream_captions(socket)
+        first = next(cues)
+        assert first.text == "Hello there."
+        assert [cue.text for cue in cues] == ["More"]
+
+    def test_async_stream(self):
+        socket = AsyncV1SocketClient(websocket=_FakeWebSocket(self._frames()))
+
+        async def collect():
+            return [cue.text async for cue in astream_captions(socket)]
+
+        assert asyncio.run(collect()) == ["Hello there.", "More"]
+
+    def test_attach_delivers_last_cue_on_close(self):
+        cues = []
+        socket = V1SocketClient(websocket=_FakeWebSocket(self._frames()))
+        CaptionBuilder().attach(socket, on_cue=cues.append)
+        socket.start_listening()
+        assert [cue.text for cue in cues] == ["Hello there.", "More"]
+
+    def test_flux_end_of_turn(self):
+        turn = {
+            "type": "TurnInfo",
+            "event": "EndOfTurn",
+            "audio_window_start": 2.0,
+            "audio_window_end": 3.0,
+            "words": [
+                {"word": "Hi", "confidence": 0.9},
+                {"word": "there.", "confidence": 0.9, "start": 2.4, "end": 2.8},
+            ],
+        }
+        update = dict(turn, event="Update")
+        cues = list(stream_captions([update, turn]))
+        assert [(cue.text, cue.start, cue.end) for cue in cues] == [("Hi there.", 2.0, 3.0)]
@@ -0,0 +1,121 @@
+"""Tests for Flux end-of-turn threshold auto-tuning."""
+
+import json
+
+import pytest
+
+from deepgram.helpers import AsyncFluxThresholdTuner, FluxThresholdTuner
+from deepgram.listen.v2.socket_client import AsyncV2SocketClient, V2SocketClient
+
+
+def _turn_info(sequence_id, event, turn_index, last_word_end=0.9, window_end=1.0):
+    return json.dumps(
+        {
+            "type": "TurnInfo",
+            "request_id": "r1",
+            "sequence_id": sequence_id,
+            "event": event,
+            "turn_index": turn_index,
+            "audio_window_start": 0.0,
+            "audio_window_end": window_end,
+            "transcript": "hi",
+            "words": [{"word": "hi", "confidence": 0.9, "start": 0.5, "end": last_word_end}],
+            "end_of_turn_confidence": 0.9,
+        }
+    )
+
+
+def _turns(count, resumed_every=0, latency=0.4):
+    """Frames for ``count`` turns with an eager end of turn each; every ``resumed_every``-th is resumed first."""
+    frames, sequence = [], 0
+    for turn in range(count):
+        events = ["EagerEndOfTurn"]
+        if resumed_every and turn % resumed_every == 0:
+            events += ["TurnResumed", "EagerEndOfTurn"]
+        for event in events + ["EndOfTurn"]:
+            frames.append(_turn_info(sequence, event, turn, last_word_end=1.0 - latency))
+            sequence += 1
+    return frames
+
+
+class _FakeWebSocket:
+    def __init__(self, frames):
+        self._frames = frames
+        self.sent = []
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+class _FakeAsyncWebSocket(_FakeWebSocket):
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+def _success(eot, eager):
+    return json.dumps(
+        {
+            "type": "ConfigureSuccess",
+            "request_id": "r1",
+            "sequence_id": 999,
+            "keyterms": [],
+            "thresholds": {"eot_threshold": eot, "eager_eot_threshold": eager},
+        }
+    )
+
+
+class TestFluxThresholdTuner:
+    def _run(self, frames, **kwargs):
+        websocket = _FakeWebSocket(frames)
+        socket = V2SocketClient(websocket=websocket)
+        tuner = FluxThresholdTuner(window=4, **kwargs).attach(socket)
+        socket.start_listening()
+        return tuner, websocket.sent
+
+    def test_wasted_speculation_raises_eager_threshold(self):
+        tuner, sent = self._run(_turns(4, resumed_every=1), eot_threshold=0.7, eager_eot_threshold=0.4)
+        assert sent == [{"type": "Configure", "thresholds": {"eot_threshold": 0.7, "eager_eot_threshold": 0.45}}]
+        assert tuner.stats.wasted_rate == pytest.approx(0.5)
+        assert tuner.thresholds["eager_eot_threshold"] == 0.4  # not applied until confirmed
+
+    def test_confirmed_changes_are_adopted(self):
+        frames = _turns(4, resumed_every=1) + [_success(0.7, 0.45)]
+        tuner, _ = self._run(frames, eot_threshold=0.7, eager_eot_threshold=0.4)
+        assert tuner.thresholds == {"eot_threshold": 0.7, "eager_eot_threshold": 0.45}
+        assert tuner.stats.configures_applied == 1
+
+    def test_slow_end_of_turn_lowers_eot_threshold_within_bounds(self):
+        tuner, sent = self._run(_turns(4, latency=0.9), eot_threshold=0.62, eot_bounds=(0.6, 0.9))
+        assert sent == [{"type": "Configure", "thresholds": {"eot_threshold": 0.6}}]
+
+    def test_eager_never_exceeds_eot(self):
+        tuner, sent = self._run(_turns(4, resumed_every=1), eot_threshold=0.7, eager_eot_threshold=0.7)
+        assert sent == []
+
+    def test_failure_keeps_thresholds(self):
+        failure = json.dumps({"type": "ConfigureFailure", "request_id": "r1", "sequence_id": 1})
+        frames = _turns(4, resumed_every=1) + [failure]
+        tuner, sent = self._run(frames, eot_threshold=0.7, eager_eot_threshold=0.4)
+        assert tuner.stats.configures_failed == 1
+        assert tuner.thresholds["eager_eot_threshold"] == 0.4
+
+    def test_rejects_out_of_range_bounds(self):
+        with pytest.raises(ValueError):
+            FluxThresholdTuner(eot_bounds=(0.4, 0.9))
+
+
+class TestAsyncFluxThresholdTuner:
+    async def test_sends_configure(self):
+        websocket = _FakeAsyncWebSocket(_turns(4, latency=0.0) + [_success(0.75, None)])
+        socket = AsyncV2SocketClient(websocket=websocket)
+        tuner = AsyncFluxThresholdTuner(window=4, eot_threshold=0.7).attach(socket)
+        await socket.start_listening()
+        assert websocket.sent == [{"type": "Configure", "thresholds": {"eot_threshold": 0.75}}]
+        assert tuner.thresholds == {"eot_threshold": 0.75}
@@ -0,0 +1,200 @@
+"""Tests for the Flux (listen.v2) turn assembler and its eager end-of-turn speculation."""
+
+import asyncio
+import json
+import threading
+
+from deepgram.helpers import AsyncFluxTurnAssembler, FluxTurnAssembler
+from deepgram.listen.v2.socket_client import AsyncV2SocketClient, V2SocketClient
+
+
+def _turn_info(sequence_id, event, turn_index=0, transcript="hello there"):
+    return json.dumps(
+        {
+            "type": "TurnInfo",
+            "request_id": "r1",
+            "sequence_id": sequence_id,
+            "event": event,
+            "turn_index": turn_index,
+            "audio_window_start": 0.0,
+            "audio_window_end": 1.0,
+            "transcript": transcript,
+            "words": [],
+            "end_of_turn_confidence": 0.9,
+        }
+    )
+
+
+class _FakeWebSocket:
+    def __init__(self, frames):
+        self._frames = frames
+
+    def __iter__(self):
+        return iter(self._frames)
+
+
+class _FakeAsyncWebSocket(_FakeWebSocket):
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+
+class TestFluxTurnAssembler:
+    def _run(self, frames, **kwargs):
+        socket = V2SocketClient(websocket=_FakeWebSocket(frames))
+        assembler = FluxTurnAssembler(**kwargs).attach(socket)
+        socket.start_listening()
+        assert assembler.join(2)
+        return assembler
+
+    def test_speculation_is_reused_when_transcript_matches(self):
+        finals = []
+        assembler = self._run(
+            [
+                _turn_info(0, "StartOfTurn"),
+                _turn_info(1, "Update", transcript="hello"),
+                _turn_info(2, "EagerEndOfTurn"),
+                _turn_info(3, "EndOfTurn"),
+            ],
+            speculate=lambda turn, token: f"reply to {turn.transcript}",
+            on_end_of_turn=lambda turn, speculation: finals.append((turn.turn_index, speculation.result(1))),
+        )
+        assert finals == [(0, "reply to hello there")]
+        assert assembler.stats.reused == 1
+
+    def test_turn_resumed_cancels_speculation(self):
+        tokens = []
+        started = threading.Event()
+        finals = []
+
+        def speculate(turn, token):
+            tokens.append(token)
+            started.set()
+            token.wait(2)
+            token.raise_if_cancelled()
+            return "stale"
+
+        assembler = self._run(
+            [
+                _turn_info(0, "EagerEndOfTurn", transcript="I want"),
+                _turn_info(1, "TurnResumed", transcript="I want"),
+                _turn_info(2, "EndOfTurn", transcript="I want a pizza"),
+            ],
+            speculate=speculate,
+            on_end_of_turn=lambda turn, speculation: finals.append((turn.transcript, speculation)),
+        )
+        assert started.wait(1)
+        assert tokens[0].cancelled and tokens[0].reason == "turn resumed"
+        assert finals == [("I want a pizza", None)]
+        assert assembler.stats.resumed == 1 and assembler.stats.discarded == 1
+
+    def test_changed_final_transcript_discards_speculation(self):
+        finals = []
+        assembler = self._run(
+            [
+                _turn_info(0, "EagerEndOfTurn", transcript="book a"),
+                _turn_info(1, "EndOfTurn", transcript="book a table"),
+            ],
+            speculate=lambda turn, token: "x",
+            on_end_of_turn=lambda turn, speculation: finals.append(speculation),
+        )
+        assert finals == [None]
+        assert assembler.stats.discarded == 1
+
+    def test_stale_and_replayed_messages_are_ignored(self):
+        finals = []
+        assembler = self._run(
+            [
+                _turn_info(0, "EndOfTurn", turn_index=0),
+                _turn_info(1, "Update", turn_index=0),
+                _turn_info(1, "StartOfTurn", turn_index=1),
+                _turn_info(2, "EndOfTurn", turn_index=1),
+            ],
+            on_end_of_turn=lambda turn, speculation: finals.append(turn.turn_index),
+        )
+        assert finals == [0, 1]
+        assert assembler.stats.stale_messages == 2
+
+    def test_callback_errors_do_not_stop_listening(self):
+        finals = []
+
+        def on_update(turn):
+            raise RuntimeError("boom")
+
+        self._run(
+            [_turn_info(0, "Update"), _turn_info(1, "EndOfTurn")],
+            on_update=on_update,
+            on_end_of_turn=lambda turn, speculation: finals.append(turn.sequence_id),
+        )
+        assert finals == [1]
+
+    def test_final_callback_does_not_block_the_receive_thread(self):
+        next_turn = threading.Event()
+        finals = []
+
+        def on_end_of_turn(turn, speculation):
+            finals.append(next_turn.wait(2))
+
+        self._run(
+            [_turn_info(0, "EndOfTurn"), _turn_info(1, "StartOfTurn", turn_index=1)],
+            on_start_of_turn=lambda turn: next_turn.set(),
+            on_end_of_turn=on_end_of_turn,
+        )
+        assert finals == [True]
+
+
+class TestAsyncFluxTurnAssembler:
+    async def test_async_speculation_and_cancellation(self):
+        tokens = []
+        replies = []
+
+        async def speculate(turn, token):
+            tokens.append(token)
+            if turn.transcript == "wait":
+                await asyncio.sleep(10)
+            return f"reply to {turn.transcript}"
+
+        async def on_end_of_turn(turn, speculation):
+            replies.append(await speculation if speculation else "fresh")
+
+        socket = AsyncV2SocketClient(
+            websocket=_FakeAsyncWebSocket(
+                [
+                    _turn_info(0, "EagerEndOfTurn", transcript="wait"),
+                    _turn_info(1, "TurnResumed", transcript="wait"),
+                    _turn_info(2, "EndOfTurn", transcript="wait for me"),
+                    _turn_info(3, "EagerEndOfTurn", turn_index=1, transcript="thanks"),
+                    _turn_info(4, "EndOfTurn", turn_index=1, transcript="thanks"),
+                ]
+            )
+        )
+        assembler = AsyncFluxTurnAssembler(speculate=speculate, on_end_of_turn=on_end_of_turn).attach(socket)
+        await socket.start_listening()
+        await assembler.join()
+        assert replies == ["fresh", "reply to thanks"]
+        assert assembler.stats.resumed == 1 and assembler.stats.reused == 1
+
+    async def test_final_callbacks_run_off_the_receive_loop_in_turn_order(self):
+        next_turn = asyncio.Event()
+        finals = []
+
+        async def on_end_of_turn(turn, speculation):
+            if turn.turn_index == 0:
+                await asyncio.wait_for(next_turn.wait(), 2)
+            finals.append(turn.turn_index)
+
+        socket = AsyncV2SocketClient(
+            websocket=_FakeAsyncWebSocket(
+                [
+                    _turn_info(0, "EndOfTurn", turn_index=0),
+                    _turn_info(1, "StartOfTurn", turn_index=1),
+                    _turn_info(2, "EndOfTurn", turn_index=1),
+                ]
+            )
+        )
+        assembler = AsyncFluxTurnAssembler(
+            on_start_of_turn=lambda turn: next_turn.set(), on_end_of_turn=on_end_of_turn
+        ).attach(socket)
+        await socket.start_listening()
+        await assembler.join()
+        assert finals == [0, 1]
@@ -0,0 +1,188 @@
+"""Tests for multichannel audio fan-in and per-channel result routing."""
+
+import asyncio
+import json
+from array import array
+
+import pytest
+
+from deepgram.helpers import (
+    AsyncMultichannelAudioFeeder,
+    MultichannelAudioFeeder,
+    MultichannelTranscripts,
+    channel_view,
+    interleave,
+)
+from deepgram.listen.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+
+
+def _results(channel, start, transcript, is_final=True, duration=1.0):
+    return json.dumps(
+        {
+            "type": "Results",
+            "channel_index": [channel, 2],
+            "duration": duration,
+            "start": start,
+            "is_final": is_final,
+            "speech_final": is_final,
+            "channel": {
+                "alternatives": [
+                    {
+                        "transcript": transcript,
+                        "confidence": 0.9,
+                        "words": [
+                            {"word": w, "start": start, "end": start + 0.5, "confidence": 0.9}
+                            for w in transcript.split()
+                        ],
+                    }
+                ]
+            },
+            "metadata": {
+                "request_id": "r1",
+                "model_info": {"name": "nova-3", "version": "1", "arch": "nova"},
+                "model_uuid": "m1",
+            },
+        }
+    )
+
+
+class _FakeWebSocket:
+    def __init__(self, frames=()):
+        self._frames = list(frames)
+        self.sent = []
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+
+
+class _FakeAsyncWebSocket(_FakeWebSocket):
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+    async def send(self, data):
+        self.sent.append(bytes(data))
+
+
+def _stereo(frames):
+    left = array("h", range(frames))
+    right = array("h", range(1000, 1000 + frames))
+    return left, right, interleave([left, right])
+
+
+class TestInterleave:
+    def test_interleave_and_channel_view_round_trip(self):
+        left, right, stereo = _stereo(6)
+        assert array("h", bytes(stereo)).tolist()[:4] == [0, 1000, 1, 1001]
+        assert channel_view(stereo, 0, 2).tolist() == left.tolist()
+        assert channel_view(stereo, 1, 2).tolist() == right.tolist()
+
+    def test_channel_view_does_not_copy(self):
+        _, _, stereo = _stereo(4)
+        view = channel_view(stereo, 1, 2)
+        stereo[2:4] = array("h", [7]).tobytes()
+        assert view[0] == 7
+
+    def test_rejects_mismatched_or_partial_input(self):
+        with pytest.raises(ValueError):
+            interleave([b"\x00\x00", b"\x00\x00\x00\x00"])
+        with pytest.raises(ValueError):
+            channel_view(b"\x00\x00\x00", 0, 2)
+        with pytest.raises(ValueError):
+            channel_view(b"\x00\x00\x00\x00", 2, 2)
+
+
+class TestMultichannelAudioFeeder:
+    def test_sends_frame_aligned_chunks_and_stages_the_tail(self):
+        websocket = _FakeWebSocket()
+        # 8 kHz stereo linear16, 10 ms chunks: 80 frames of 4 bytes.
+        feeder = MultichannelAudioFeeder(V1SocketClient(websocket=websocket), channels=2, sample_rate=8000, chunk_ms=10)
+        assert feeder.chunk_bytes == 320
+        feeder.feed(bytes(700))
+        assert [len(chunk) for chunk in websocket.sent] == [320, 320]
+        assert feeder.staged_bytes == 60
+        feeder.feed(bytes(262))
+        assert [len(chunk) for chunk in websocket.sent] == [320, 320, 320]
+        assert feeder.staged_bytes == 2
+        feeder.feed(bytes(5))
+        feeder.flush()
+        # 7 staged bytes: one whole 4-byte frame is sent, the partial frame is dropped.
+        assert [len(chunk) for chunk in websocket.sent][-1] == 4
+        assert feeder.stats.bytes_dropped == 3
+        assert feeder.stats.bytes_sent == 964
+
+    def test_chunks_are_views_of_the_input(self):
+        feeder = MultichannelAudioFeeder(None, channels=2, sample_rate=8000, chunk_ms=10)
+        data = bytearray(640)
+        chunks = list(feeder.chunks(data))
+        data[320] = 1
+        assert chunks[1][0] == 1
+
+    def test_stream_is_reassembled_exactly(self):
+        websocket = _FakeWebSocket()
+        feeder = MultichannelAudioFeeder(V1SocketClient(websocket=websocket), channels=2, sample_rate=8000, chunk_ms=10)
+        _, _, stereo = _stereo(500)
+        for offset in range(0, len(stereo), 333):
+            feeder.feed(memoryview(stereo)[offset : offset + 333])
+        feeder.flush()
+        assert b"".join(websocket.sent) == bytes(stereo)
+
+    def test_async_feeder(self):
+        websocket = _FakeAsyncWebSocket()
+        feeder = AsyncMultichannelAudioFeeder(
+            AsyncV1SocketClient(websocket=websocket), channels=2, sample_rate=8000, chunk_ms=10
+        )
+
+        async def run():
+            await feeder.feed(bytes(400))
+            await feeder.flush()
+
+        asyncio.run(run())
+        assert [len(chunk) for chunk in websocket.sent] == [320, 80]
+
+    def test_rejects_unsupported_encoding(self):
+        with pytest.raises(ValueError):
+            MultichannelAudioFeeder(None, channels=2, sample_rate=8000, encoding="opus")
+
+
+class TestMultichannelTranscripts:
+    def test_routes_results_by_channel(self):
+        frames = [
+            _results(0, 0.0, "hello there"),
+            _results(1, 0.5, "hi", is_final=False),
+            _results(1, 0.5, "hi how are you"),
+            _results(0, 1.0, "good thanks"),
+        ]
+        segments = []
+        socket = V1SocketClient(websocket=_FakeWebSocket(frames))
+        transcripts = MultichannelTranscripts(2, on_segment=segments.append).attach(socket)
+        socket.start_listening()
+        assert transcripts[0].text == "hello there good thanks"
+        assert transcripts[1].text == "hi how are you"
+        assert transcripts[1].interim is None
+        assert [(s.channel, s.start) for s in transcripts.conversation()] == [(0, 0.0), (1, 0.5), (0, 1.0)]
+        assert len(segments) == 3
+        assert segments[0].words[0].word == "hello"
+
+    def test_out_of_order_finals_are_ordered(self):
+        transcripts = MultichannelTranscripts(2)
+        transcripts.on_results(json.loads(_results(0, 2.0, "second")))
+        transcripts.on_results(json.loads(_results(0, 1.0, "first")))
+        assert transcripts[0].text == "first second"
+
+    def test_interim_and_unrouted(self):
+        transcripts = MultichannelTranscripts(1)
+        transcripts.on_results(json.loads(_results(0, 0.0, "hel", is_final=False)))
+        transcripts.on_results(json.loads(_results(1, 0.0, "other")))
+        assert transcripts[0].interim == "hel"
+        assert transcripts.unrouted == 1
+
+    def test_async_socket(self):
+        frames = [_results(1, 0.0, "right"), _results(0, 0.2, "left")]
+        socket = AsyncV1SocketClient(websocket=_FakeAsyncWebSocket(frames))
+        transcripts = MultichannelTranscripts(2).attach(socket)
+        asyncio.run(socket.start_listening())
+        assert [s.transcript for s in transcripts.conversation()] == ["right", "left"]
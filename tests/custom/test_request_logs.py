@@ -0,0 +1,103 @@
+"""Tests for the paginated request log iterators."""
+
+import datetime as dt
+import threading
+
+import httpx
+import pytest
+
+from deepgram import AsyncDeepgramClient, DeepgramClient
+from deepgram.helpers import aiter_requests, iter_requests, split_time_range
+
+_START = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+
+class _RequestLogs:
+    """Serves ``total`` request log entries per window, ``limit`` per page."""
+
+    def __init__(self, total=25, fail_page=None):
+        self.total = total
+        self.fail_page = fail_page
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        params = request.url.params
+        page, limit = int(float(params["page"])), int(float(params["limit"]))
+        with self._lock:
+            self.calls.append((params.get("start"), page))
+        if page == self.fail_page:
+            return httpx.Response(500, json={"err_msg": "boom"})
+        prefix = params.get("start", "all")
+        ids = [f"{prefix}-{i}" for i in range(page * limit, min((page + 1) * limit, self.total))]
+        return httpx.Response(200, json={"page": page, "limit": limit, "requests": [{"request_id": i} for i in ids]})
+
+
+def _client(handler):
+    return DeepgramClient(api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+class TestSplitTimeRange:
+    def test_windows_cover_range(self):
+        windows = split_time_range(_START, _START + dt.timedelta(hours=25), dt.timedelta(hours=12))
+        assert [(b - a).total_seconds() / 3600 for a, b in windows] == [12, 12, 1]
+        assert windows[0][0] == _START and windows[-1][1] == _START + dt.timedelta(hours=25)
+
+    def test_rejects_non_positive_window(self):
+        with pytest.raises(ValueError):
+            split_time_range(_START, _START, dt.timedelta(0))
+
+
+class TestIterRequests:
+    def test_streams_all_pages(self):
+        logs = _RequestLogs(total=25)
+        items = list(iter_requests(_client(logs), "project", page_size=10))
+        assert [item.request_id for item in items] == [f"all-{i}" for i in range(25)]
+        assert sorted(page for _, page in logs.calls) == [0, 1, 2]
+
+    def test_windows_are_yielded_in_order(self):
+        logs = _RequestLogs(total=3)
+        end = _START + dt.timedelta(days=4)
+        items = list(iter_requests(_client(logs), "project", start=_START, end=end, window=dt.timedelta(days=1)))
+        starts = [item.request_id.rsplit("-", 1)[0] for item in items]
+        assert len(items) == 12
+        assert starts == sorted(starts)
+        assert len({start for start, _ in logs.calls}) == 4
+
+    def test_window_requires_bounds(self):
+        with pytest.raises(ValueError):
+            list(iter_requests(_client(_RequestLogs()), "project", window=dt.timedelta(days=1)))
+
+    def test_page_size_is_bounded(self):
+        with pytest.raises(ValueError):
+            list(iter_requests(_client(_RequestLogs()), "project", page_size=1001))
+
+    def test_errors_are_raised_to_the_consumer(self):
+        logs = _RequestLogs(total=25, fail_page=1)
+        iterator = iter_requests(_client(logs), "project", page_size=10)
+        with pytest.raises(Exception):
+            for _ in iterator:
+                pass
+
+
+class TestAiterRequests:
+    async def test_streams_all_pages_and_windows(self):
+        logs = _RequestLogs(total=15)
+        client = AsyncDeepgramClient(api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(logs)))
+        end = _START + dt.timedelta(days=2)
+        items = [
+            item
+            async for item in aiter_requests(
+                client, "project", start=_START, end=end, window=dt.timedelta(days=1), page_size=10
+            )
+        ]
+        assert len(items) == 30
+        assert len(logs.calls) == 4
+
+    async def test_early_exit_cancels_producers(self):
+        logs = _RequestLogs(total=100)
+        client = AsyncDeepgramClient(api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(logs)))
+        iterator = aiter_requests(client, "project", page_size=10)
+        assert (await iterator.__anext__()).request_id == "all-0"
+        await iterator.aclose()
+        assert len(logs.calls) < 10
@@ -0,0 +1,114 @@
+"""Tests for the opt-in GET response cache."""
+
+import httpx
+import pytest
+
+from deepgram import AsyncDeepgramClient, DeepgramClient
+from deepgram.helpers import ResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Server:
+    """Serves a project and its keys, with an ETag on GET responses."""
+
+    def __init__(self):
+        self.requests = []
+        self.version = 1
+
+    def __call__(self, request):
+        self.requests.append((request.method, request.url.path, request.headers.get("if-none-match")))
+        etag = f'"v{self.version}"'
+        if request.method != "GET":
+            self.version += 1
+            return httpx.Response(200, json={"message": "ok"})
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        if request.url.path.endswith("/keys"):
+            return httpx.Response(200, headers={"ETag": etag}, json={"api_keys": []})
+        return httpx.Response(200, headers={"ETag": etag}, json={"project_id": "p1", "name": f"v{self.version}"})
+
+
+def _client(server, cache):
+    return DeepgramClient(
+        api_key="key", response_cache=cache, httpx_client=httpx.Client(transport=httpx.MockTransport(server))
+    )
+
+
+class TestResponseCache:
+    def test_fresh_entries_skip_the_network(self):
+        server, cache = _Server(), ResponseCache(ttl=60)
+        client = _client(server, cache)
+        assert client.manage.v1.projects.get("p1").name == "v1"
+        assert client.manage.v1.projects.get("p1").name == "v1"
+        assert len(server.requests) == 1
+        assert cache.stats.hits == 1
+
+    def test_query_parameters_are_part_of_the_key(self):
+        server = _Server()
+        client = _client(server, ResponseCache())
+        client.manage.v1.projects.keys.list("p1", status="active")
+        client.manage.v1.projects.keys.list("p1", status="expired")
+        client.manage.v1.projects.keys.list("p1", status="active")
+        assert len(server.requests) == 2
+
+    def test_stale_entries_are_revalidated_with_etag(self):
+        server, clock = _Server(), _Clock()
+        cache = ResponseCache(ttl=10, clock=clock)
+        client = _client(server, cache)
+        client.manage.v1.projects.get("p1")
+        clock.now = 11
+        assert client.manage.v1.projects.get("p1").name == "v1"
+        assert server.requests[-1] == ("GET", "/v1/projects/p1", '"v1"')
+        assert cache.stats.revalidated == 1
+        client.manage.v1.projects.get("p1")
+        assert len(server.requests) == 2
+
+    def test_mutations_invalidate_path_and_parent(self):
+        server = _Server()
+        client = _client(server, ResponseCache())
+        client.manage.v1.projects.keys.list("p1")
+        client.manage.v1.projects.get("p1")
+        client.manage.v1.projects.keys.delete("p1", "k1")
+        client.manage.v1.projects.keys.list("p1")
+        client.manage.v1.projects.get("p1")  # grandparent stays cached
+        assert [method for method, _, _ in server.requests] == ["GET", "GET", "DELETE", "GET"]
+        assert server.requests[-1] == ("GET", "/v1/projects/p1/keys", None)
+
+    def test_endpoint_ttl_overrides(self):
+        cache = ResponseCache(ttl=60, endpoints={"v1/projects/*/keys": 0, "v1/models*": 3600})
+        assert cache.ttl_for("v1/projects/p1/keys") == 0
+        assert cache.ttl_for("/v1/models") == 3600
+        assert cache.ttl_for("v1/projects/p1") == 60
+        server = _Server()
+        client = _client(server, cache)
+        client.manage.v1.projects.keys.list("p1")
+        client.manage.v1.projects.keys.list("p1")
+        assert len(server.requests) == 2
+
+    def test_entries_are_bounded(self):
+        server = _Server()
+        cache = ResponseCache(max_entries=2)
+        client = _client(server, cache)
+        for project in ("p1", "p2", "p3"):
+            client.manage.v1.projects.get(project)
+        assert len(cache) == 2
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+    async def test_async_client(self):
+        server, cache = _Server(), ResponseCache()
+        client = AsyncDeepgramClient(
+            api_key="key", response_cache=cache, httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server))
+        )
+        await client.manage.v1.projects.get("p1")
+        await client.manage.v1.projects.get("p1")
+        await client.manage.v1.projects.update("p1", name="renamed")
+        await client.manage.v1.projects.get("p1")
+        assert [method for method, _, _ in server.requests] == ["GET", "PATCH", "GET"]
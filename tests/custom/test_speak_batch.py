@@ -0,0 +1,156 @@
+"""
+Tests for callback-mode TTS batch submission and the callback receiver
+"""
+
+import io
+import json
+import urllib.parse
+
+import pytest
+
+from deepgram.helpers import (
+    AsyncSpeakBatchSubmitter,
+    DirectoryAudioStorage,
+    SpeakBatchRegistry,
+    SpeakBatchSubmitter,
+    SpeakCallbackReceiver,
+)
+
+
+class _FakeAudioClient:
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self._fail_on = fail_on
+
+    def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs["text"] == self._fail_on:
+            raise RuntimeError("rejected")
+        yield json.dumps({"request_id": f"req-{len(self.calls)}"}).encode()[:5]
+        yield json.dumps({"request_id": f"req-{len(self.calls)}"}).encode()[5:]
+
+
+class _FakeAsyncAudioClient:
+    def __init__(self):
+        self.calls = []
+
+    async def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        yield json.dumps({"request_id": f"req-{kwargs['text']}"}).encode()
+
+
+def _job_param(callback_url):
+    return urllib.parse.parse_qs(urllib.parse.urlsplit(callback_url).query)
+
+
+class TestSpeakBatchSubmitter:
+    def test_submits_manifest_with_callback_and_records_request_ids(self):
+        audio = _FakeAudioClient()
+        submitter = SpeakBatchSubmitter(
+            audio, "https://example.com/cb?token=abc", model="aura-2-thalia-en", max_concurrency=2
+        )
+        jobs = submitter.submit(["one", {"text": "two", "job_id": "j2", "encoding": "linear16"}])
+
+        assert [job.status for job in jobs] == ["submitted", "submitted"]
+        assert {job.request_id for job in jobs} == {"req-1", "req-2"}
+        call = next(c for c in audio.calls if c["text"] == "two")
+        assert call["model"] == "aura-2-thalia-en"
+        assert call["encoding"] == "linear16"
+        assert _job_param(call["callback"]) == {"token": ["abc"], "dg_job_id": ["j2"]}
+        assert submitter.registry.get(request_id=jobs[1].request_id) is jobs[1]
+
+    def test_failures_are_recorded_not_raised(self):
+        submitter = SpeakBatchSubmitter(_FakeAudioClient(fail_on="bad"), "https://example.com/cb")
+        good, bad = submitter.submit(["good", "bad"])
+        assert good.status == "submitted"
+        assert bad.status == "failed"
+        assert "rejected" in bad.error
+
+    async def test_async_submitter(self):
+        submitter = AsyncSpeakBatchSubmitter(_FakeAsyncAudioClient(), "https://example.com/cb", max_concurrency=1)
+        jobs = await submitter.submit(["a", "b"])
+        assert [job.request_id for job in jobs] == ["req-a", "req-b"]
+
+    def test_registry_round_trip(self, tmp_path):
+        submitter = SpeakBatchSubmitter(_FakeAudioClient(), "https://example.com/cb")
+        submitter.submit(["one"])
+        path = tmp_path / "jobs.jsonl"
+        submitter.registry.dump(path)
+        loaded = SpeakBatchRegistry.load(path)
+        (job,) = loaded.jobs()
+        assert loaded.get(request_id=job.request_id) is job
+
+
+class TestSpeakCallbackReceiver:
+    def _registry_with_job(self):
+        submitter = SpeakBatchSubmitter(_FakeAudioClient(), "https://example.com/cb")
+        (job,) = submitter.submit([{"text": "hello", "job_id": "job-1"}])
+        return submitter.registry, job
+
+    def test_wsgi_streams_audio_into_storage(self, tmp_path):
+        registry, job = self._registry_with_job()
+        completed = []
+        receiver = SpeakCallbackReceiver(
+            registry, DirectoryAudioStorage(tmp_path), on_completed=completed.append, chunk_size=3
+        )
+        statuses = []
+        environ = {
+            "QUERY_STRING": "dg_job_id=job-1",
+            "CONTENT_LENGTH": "10",
+            "CONTENT_TYPE": "audio/mpeg",
+            "wsgi.input": io.BytesIO(b"0123456789"),
+        }
+        receiver.wsgi_app(environ, lambda status, headers: statuses.append(status))
+
+        assert statuses == ["200 OK"]
+        assert completed == [job]
+        assert job.status == "completed"
+        assert job.audio_bytes == 10
+        with open(job.location, "rb") as handle:
+            assert handle.read() == b"0123456789"
+
+    @pytest.mark.parametrize("extra, expected", [({}, b""), ({"wsgi.input_terminated": True}, b"chunked")])
+    def test_wsgi_without_content_length(self, tmp_path, extra, expected):
+        class _Input(io.BytesIO):
+            def read(self, size=-1):
+                if not extra:
+                    raise AssertionError("body read without a Content-Length")
+                return super().read(size)
+
+        registry, job = self._registry_with_job()
+        receiver = SpeakCallbackReceiver(registry, DirectoryAudioStorage(tmp_path))
+        environ = {"QUERY_STRING": "dg_job_id=job-1", "wsgi.input": _Input(b"chunked"), **extra}
+        receiver.wsgi_app(environ, lambda status, headers: None)
+        assert job.audio_bytes == len(expected)
+        with open(job.location, "rb") as handle:
+            assert handle.read() == expected
+
+    def test_wsgi_unknown_job(self, tmp_path):
+        registry, _ = self._registry_with_job()
+        receiver = SpeakCallbackReceiver(registry, DirectoryAudioStorage(tmp_path))
+        statuses = []
+        receiver.wsgi_app({"QUERY_STRING": "", "wsgi.input": io.BytesIO(b"")}, lambda s, h: statuses.append(s))
+        assert statuses == ["404 Not Found"]
+
+    async def test_asgi_matches_by_request_id_header(self, tmp_path):
+        registry, job = self._registry_with_job()
+        receiver = SpeakCallbackReceiver(registry, DirectoryAudioStorage(tmp_path, extension=".wav"))
+        bodies = [
+            {"type": "http.request", "body": b"abc", "more_body": True},
+            {"type": "http.request", "body": b"def", "more_body": False},
+        ]
+        sent = []
+
+        async def receive():
+            return bodies.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "query_string": b"", "headers": [(b"dg-request-id", job.request_id.encode())]}
+        await receiver.asgi_app(scope, receive, send)
+
+        assert sent[0]["status"] == 200
+        assert job.location.endswith("job-1.wav")
+        with open(job.location, "rb") as handle:
+            assert handle.read() == b"abcdef"
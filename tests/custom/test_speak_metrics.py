@@ -0,0 +1,136 @@
+"""
+Tests for speak v2 per-utterance latency metrics and the latency histogram
+"""
+
+import json
+
+import pytest
+
+from deepgram.core.unchecked_base_model import construct_type
+from deepgram.helpers import LatencyHistogram, SpeakLatencyStats, SpeakV2LatencyTracker
+from deepgram.speak.v2.socket_client import V2SocketClient, V2SocketClientResponse
+from deepgram.speak.v2.types.speak_v2speak import SpeakV2Speak
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.incoming = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def __iter__(self):
+        yield from self.incoming
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _metadata(speech_id, duration_ms):
+    return {
+        "type": "SpeechMetadata",
+        "speech_id": speech_id,
+        "audio_duration_ms": duration_ms,
+        "input_character_count": 5,
+        "billable_character_count": 5,
+        "controls_applied": {},
+    }
+
+
+def _parse(payload):
+    return construct_type(type_=V2SocketClientResponse, object_=payload)
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_relative_error(self):
+        histogram = LatencyHistogram(relative_error=0.01)
+        histogram.record_many(range(1, 1001))
+        for percentile, expected in ((50, 500), (95, 950), (99, 990)):
+            assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.01)
+        assert histogram.min == 1
+        assert histogram.max == 1000
+        assert histogram.mean == pytest.approx(500.5)
+
+    def test_empty_and_non_positive(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        histogram.record(0)
+        assert histogram.percentile(50) == 0
+
+    def test_merge_and_snapshot(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(10)
+        b.record(20)
+        a.merge(b)
+        snapshot = a.snapshot()
+        assert snapshot["count"] == 2
+        assert set(snapshot) == {"count", "min", "max", "mean", "p50", "p95", "p99"}
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(relative_error=0.05))
+
+
+class TestSpeakV2LatencyTracker:
+    def test_correlates_turn_lifecycle(self):
+        ws = _FakeWebSocket()
+        socket = V2SocketClient(websocket=ws)
+        clock = _FakeClock()
+        reported = []
+        tracker = SpeakV2LatencyTracker(on_utterance=reported.append, clock=clock).attach(socket)
+
+        socket.send_speak(SpeakV2Speak(text="Hello"))
+        socket.send_speak(SpeakV2Speak(text=" world"))
+        socket.send_flush()
+        # The wrapped sends still reach the wire.
+        assert [json.loads(m)["type"] for m in ws.sent] == ["Speak", "Speak", "Flush"]
+
+        clock.now = 0.1
+        tracker.on_message(_parse({"type": "SpeechStarted", "speech_id": "dg_sp_1"}))
+        clock.now = 0.2
+        tracker.on_message(b"\x00" * 4800)
+        clock.now = 0.5
+        tracker.on_message(b"\x00" * 4800)
+        clock.now = 0.6
+        tracker.on_message(_parse({"type": "Flushed", "speech_id": "dg_sp_1"}))
+        assert reported == []  # waits for SpeechMetadata
+        tracker.on_message(_parse(_metadata("dg_sp_1", 1200)))
+
+        (utterance,) = reported
+        assert utterance.speech_id == "dg_sp_1"
+        assert utterance.input_characters == 11
+        assert utterance.time_to_first_byte_ms == pytest.approx(200)
+        assert utterance.time_to_speech_started_ms == pytest.approx(100)
+        assert utterance.real_time_factor == pytest.approx(0.5)
+        assert utterance.bytes_per_second == pytest.approx(9600 / 0.3)
+        assert tracker.stats.histograms["time_to_first_byte_ms"].count == 1
+
+    def test_metadata_before_flushed(self):
+        socket = V2SocketClient(websocket=_FakeWebSocket())
+        reported = []
+        tracker = SpeakV2LatencyTracker(on_utterance=reported.append).attach(socket)
+        socket.send_speak(SpeakV2Speak(text="Hi"))
+        socket.send_flush()
+        tracker.on_message(_parse({"type": "SpeechStarted", "speech_id": "a"}))
+        tracker.on_message(_parse(_metadata("a", 500)))
+        tracker.on_message(_parse({"type": "Flushed", "speech_id": "a"}))
+        assert len(reported) == 1
+
+    def test_close_reports_flushed_turns_and_shares_stats(self):
+        stats = SpeakLatencyStats()
+        ws = _FakeWebSocket()
+        ws.incoming = [
+            json.dumps({"type": "SpeechStarted", "speech_id": "a"}),
+            b"\x00\x00",
+            json.dumps({"type": "Flushed", "speech_id": "a"}),
+        ]
+        socket = V2SocketClient(websocket=ws)
+        SpeakV2LatencyTracker(stats=stats).attach(socket)
+        socket.send_speak(SpeakV2Speak(text="Hi"))
+        socket.send_flush()
+        socket.start_listening()
+        assert stats.snapshot()["time_to_first_byte_ms"]["count"] == 1
@@ -0,0 +1,175 @@
+"""
+Tests for the pre-warmed speak WebSocket session pools
+"""
+
+import contextlib
+import threading
+import time
+import types
+
+import pytest
+
+from deepgram.helpers import AsyncSpeakSessionPool, SpeakSessionPool
+
+
+class _FakeV2Socket:
+    """Speak v2 has no Clear; the pool flushes and waits for Flushed."""
+
+    def __init__(self, key):
+        self.key = key
+        self.sent = []
+        self.closed = False
+
+    def send_flush(self):
+        self.sent.append("Flush")
+
+    def recv(self):
+        return types.SimpleNamespace(type="Flushed")
+
+
+class _FakeSocket(_FakeV2Socket):
+    def send_clear(self):
+        self.sent.append("Clear")
+
+    def recv(self):
+        return types.SimpleNamespace(type="Cleared")
+
+
+class _SilentSocket(_FakeSocket):
+    """Never acknowledges the reset; recv blocks until the connection is closed."""
+
+    def __init__(self, key):
+        super().__init__(key)
+        self._closed_event = threading.Event()
+
+    def recv(self):
+        self._closed_event.wait()
+        raise ConnectionError("closed")
+
+
+class _FakeSpeakClient:
+    def __init__(self, socket_cls=_FakeSocket):
+        self.opened = []
+        self._socket_cls = socket_cls
+
+    @contextlib.contextmanager
+    def connect(self, **kwargs):
+        socket = self._socket_cls(kwargs)
+        self.opened.append(socket)
+        try:
+            yield socket
+        finally:
+            socket.closed = True
+            if isinstance(socket, _SilentSocket):
+                socket._closed_event.set()
+
+
+class _FakeAsyncSocket(_FakeSocket):
+    async def send_clear(self):
+        self.sent.append("Clear")
+
+    async def recv(self):
+        return types.SimpleNamespace(type="Cleared")
+
+
+class _FakeAsyncSpeakClient:
+    def __init__(self):
+        self.opened = []
+
+    @contextlib.asynccontextmanager
+    async def connect(self, **kwargs):
+        socket = _FakeAsyncSocket(kwargs)
+        self.opened.append(socket)
+        try:
+            yield socket
+        finally:
+            socket.closed = True
+
+
+_KEY = dict(model="aura-2-asteria-en", encoding="linear16", sample_rate=24000)
+
+
+class TestSpeakSessionPool:
+    def test_warm_then_lease_reuses_open_session(self):
+        speak = _FakeSpeakClient()
+        with SpeakSessionPool(speak, size=1) as pool:
+            pool.warm(**_KEY)
+            assert len(speak.opened) == 1
+            warm_socket = speak.opened[0]
+
+            with pool.session(**_KEY) as socket:
+                assert socket is warm_socket
+            # Reset on return before it can be handed out again.
+            assert socket.sent == ["Clear"]
+        assert all(s.closed for s in speak.opened)
+
+    def test_keys_are_isolated(self):
+        speak = _FakeSpeakClient()
+        with SpeakSessionPool(speak, size=1) as pool:
+            pool.warm(**_KEY)
+            with pool.session(model="aura-2-asteria-en", encoding="mulaw", sample_rate=8000) as socket:
+                assert socket.key["encoding"] == "mulaw"
+
+    def test_error_discards_session(self):
+        speak = _FakeSpeakClient()
+        with SpeakSessionPool(speak, size=1) as pool:
+            pool.warm(**_KEY)
+            with pytest.raises(RuntimeError):
+                with pool.session(**_KEY) as socket:
+                    raise RuntimeError("boom")
+            assert socket.closed
+
+    def test_stale_sessions_are_recycled(self):
+        speak = _FakeSpeakClient()
+        with SpeakSessionPool(speak, size=1, max_idle=0.0) as pool:
+            pool.warm(**_KEY)
+            stale = speak.opened[0]
+            time.sleep(0.01)
+            with pool.session(**_KEY) as socket:
+                assert socket is not stale
+            assert stale.closed
+
+    def test_v2_sockets_are_flushed_on_return(self):
+        speak = _FakeSpeakClient(_FakeV2Socket)
+        with SpeakSessionPool(speak, size=1) as pool:
+            with pool.session(**_KEY) as socket:
+                pass
+            assert socket.sent == ["Flush"]
+
+    def test_unacknowledged_reset_discards_session(self):
+        speak = _FakeSpeakClient(_SilentSocket)
+        with SpeakSessionPool(speak, size=0, reset_timeout=0.05) as pool:
+            started = time.monotonic()
+            with pool.session(**_KEY):
+                pass
+            assert time.monotonic() - started < 2
+            assert speak.opened[0].closed
+            assert pool.idle_count(**_KEY) == 0
+
+    def test_closed_pool_rejects_leases(self):
+        pool = SpeakSessionPool(_FakeSpeakClient())
+        pool.close()
+        with pytest.raises(RuntimeError):
+            pool.acquire(**_KEY)
+
+
+class TestAsyncSpeakSessionPool:
+    async def test_warm_then_lease_reuses_open_session(self):
+        speak = _FakeAsyncSpeakClient()
+        pool = AsyncSpeakSessionPool(speak, size=1)
+        await pool.warm(**_KEY)
+        warm_socket = speak.opened[0]
+        async with pool.session(**_KEY) as socket:
+            assert socket is warm_socket
+        assert socket.sent == ["Clear"]
+        await pool.close()
+        assert all(s.closed for s in speak.opened)
+
+    async def test_error_discards_session(self):
+        speak = _FakeAsyncSpeakClient()
+        pool = AsyncSpeakSessionPool(speak, size=1)
+        with pytest.raises(ValueError):
+            async with pool.session(**_KEY) as socket:
+                raise ValueError("boom")
+        assert socket.closed
+        await pool.close()
@@ -0,0 +1,176 @@
+"""Tests for the streaming transcript assembler and word timeline."""
+
+import asyncio
+import json
+
+import pytest
+
+from deepgram.helpers import TranscriptAssembler, WordTimeline
+from deepgram.listen.v1.socket_client import V1SocketClient
+from deepgram.listen.v2.socket_client import AsyncV2SocketClient
+
+
+def _results(start, words, is_final=True, channel=0, duration=1.0):
+    return {
+        "type": "Results",
+        "channel_index": [channel, 1],
+        "duration": duration,
+        "start": start,
+        "is_final": is_final,
+        "speech_final": is_final,
+        "channel": {
+            "alternatives": [
+                {
+                    "transcript": " ".join(word for word, _ in words),
+                    "confidence": 0.9,
+                    "words": [
+                        {
+                            "word": word.lower().strip(".?"),
+                            "punctuated_word": word,
+                            "start": word_start,
+                            "end": word_start + 0.2,
+                            "confidence": 0.8,
+                            "speaker": 1,
+                        }
+                        for word, word_start in words
+                    ],
+                }
+            ]
+        },
+        "metadata": {"request_id": "r1", "model_info": {"name": "n", "version": "1", "arch": "a"}, "model_uuid": "m"},
+    }
+
+
+def _turn_info(event, turn_index, transcript, start=0.0, end=1.0, timed=True):
+    words = [
+        {"word": word, "confidence": 0.9, **({"start": start + i * 0.3, "end": start + i * 0.3 + 0.2} if timed else {})}
+        for i, word in enumerate(transcript.split())
+    ]
+    return {
+        "type": "TurnInfo",
+        "request_id": "r1",
+        "sequence_id": 0,
+        "event": event,
+        "turn_index": turn_index,
+        "audio_window_start": start,
+        "audio_window_end": end,
+        "transcript": transcript,
+        "words": words,
+        "end_of_turn_confidence": 0.9,
+    }
+
+
+class _FakeWebSocket:
+    def __init__(self, frames):
+        self._frames = [json.dumps(frame) for frame in frames]
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+
+class TestWordTimeline:
+    def _timeline(self, count):
+        timeline = WordTimeline()
+        for i in range(count):
+            timeline.append(f"w{i}", i * 1.0, i * 1.0 + 0.5, 0.9, speaker=i % 2)
+        return timeline
+
+    def test_range_queries(self):
+        timeline = self._timeline(100)
+        assert list(timeline.between(10.2, 12.1)) == [10, 11, 12]
+        assert list(timeline.between(10.6, 10.9)) == []
+        assert timeline.index_at(42.25) == 42
+        assert timeline.index_at(42.75) is None
+        assert timeline.text(3.0, 5.0) == "w3 w4"
+        word = timeline[-1]
+        assert (word.word, word.start, word.speaker) == ("w99", 99.0, 1)
+
+    def test_missing_speaker_round_trips(self):
+        timeline = WordTimeline()
+        timeline.append("a", 0.0, 0.1)
+        assert timeline[0].speaker is None
+        with pytest.raises(IndexError):
+            timeline[1]
+
+
+class TestTranscriptAssemblerV1:
+    def test_finals_append_and_interim_is_replaced(self):
+        frames = [
+            _results(0.0, [("Hello", 0.0)], is_final=False),
+            _results(0.0, [("Hello", 0.0), ("world.", 0.5)]),
+            _results(1.0, [("How", 1.0)], is_final=False),
+        ]
+        socket = V1SocketClient(websocket=_FakeWebSocket(frames))
+        assembler = TranscriptAssembler().attach(socket)
+        socket.start_listening()
+        assert assembler.text == "Hello world."
+        assert assembler.full_text == "Hello world. How"
+        assert [word.text for word in assembler.timeline] == ["Hello", "world."]
+        assert assembler.timeline[1].word == "world"
+        assembler.on_results(_results(1.0, [("How", 1.0), ("are", 1.3), ("you?", 1.6)]))
+        assert assembler.full_text == "Hello world. How are you?"
+        assert assembler.interim is None
+        assert assembler.segments[1].first_word == 2 and assembler.segments[1].word_count == 3
+
+    def test_overlapping_final_replaces_finalized_audio(self):
+        assembler = TranscriptAssembler()
+        assembler.on_results(_results(0.0, [("one", 0.0)]))
+        assembler.on_results(_results(1.0, [("two", 1.0)]))
+        before = assembler.snapshot()
+        assert assembler.text == "one two"
+        assembler.on_results(_results(1.0, [("too", 1.0), ("three", 1.5)]))
+        assert assembler.text == "one too three"
+        assert len(assembler.timeline) == 3
+        # The earlier snapshot still sees the replaced words.
+        assert before.text == "one two"
+        assert [word.word for word in before.timeline] == ["one", "two"]
+
+    def test_snapshots_are_unaffected_by_later_messages(self):
+        assembler = TranscriptAssembler()
+        assembler.on_results(_results(0.0, [("a", 0.0)]))
+        snapshot = assembler.snapshot()
+        assembler.on_results(_results(1.0, [("b", 1.0)]))
+        assert snapshot.text == "a"
+        assert len(snapshot.timeline) == 1
+        assert snapshot.timeline.index_at(1.1) is None
+        with pytest.raises(RuntimeError):
+            snapshot.timeline.append("x", 2.0, 2.1)
+
+    def test_channel_filter(self):
+        assembler = TranscriptAssembler(channel=1)
+        assembler.on_results(_results(0.0, [("left", 0.0)], channel=0))
+        assembler.on_results(_results(0.0, [("right", 0.0)], channel=1))
+        assert assembler.text == "right"
+
+
+class TestTranscriptAssemblerV2:
+    def test_turns(self):
+        frames = [
+            _turn_info("StartOfTurn", 0, "hi"),
+            _turn_info("Update", 0, "hi there"),
+            _turn_info("EndOfTurn", 0, "hi there", end=1.0),
+            _turn_info("Update", 1, "next", start=1.0, end=2.0),
+        ]
+        socket = AsyncV2SocketClient(websocket=_FakeWebSocket(frames))
+        assembler = TranscriptAssembler().attach(socket)
+        asyncio.run(socket.start_listening())
+        assert assembler.text == "hi there"
+        assert assembler.full_text == "hi there next"
+        assert assembler.segments[0].turn_index == 0
+        assert assembler.timeline.text(0.0, 0.1) == "hi"
+
+    def test_untimed_words_use_the_audio_window(self):
+        assembler = TranscriptAssembler()
+        assembler.on_turn_info(_turn_info("EndOfTurn", 0, "a b", start=2.0, end=3.0, timed=False))
+        assert [(word.start, word.end) for word in assembler.timeline] == [(2.0, 3.0), (2.0, 3.0)]
+
+    def test_repeated_end_of_turn_replaces_the_turn(self):
+        assembler = TranscriptAssembler()
+        assembler.on_turn_info(_turn_info("EndOfTurn", 0, "a"))
+        assembler.on_turn_info(_turn_info("EndOfTurn", 0, "a b"))
+        assert assembler.text == "a b"
+        assert len(assembler.timeline) == 2
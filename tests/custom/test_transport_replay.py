@@ -0,0 +1,181 @@
+"""Tests for the record/replay transports and the replay benchmark."""
+
+import json
+import sys
+import time
+
+import pytest
+
+from deepgram.agent.v1.socket_client import V1SocketClient
+from deepgram.core.events import EventType
+from deepgram.transports import (
+    AsyncReplayTransport,
+    AsyncSessionRecorder,
+    ReplayBenchmark,
+    ReplayTransport,
+    SessionRecorder,
+    SessionRecording,
+)
+
+_URL = "wss://agent.deepgram.com/v1/agent/converse"
+
+
+def _recording():
+    recording = SessionRecording(_URL)
+    recording.add("in", json.dumps({"type": "Welcome", "request_id": "r1"}), 0.0)
+    recording.add("out", json.dumps({"type": "Settings"}), 0.01)
+    recording.add("in", json.dumps({"type": "SettingsApplied"}), 0.05)
+    recording.add("out", b"\x00\x01" * 8, 0.06)
+    recording.add("in", b"\x10\x20", 0.09)
+    return recording
+
+
+class _LiveTransport:
+    """Stands in for the network connection behind a recorder."""
+
+    def __init__(self, url, headers):
+        self.headers = headers
+        self.sent = []
+        self.closed = False
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def recv(self):
+        return json.dumps({"type": "Welcome", "request_id": "r1"})
+
+    def __iter__(self):
+        return iter([json.dumps({"type": "Welcome", "request_id": "r1"}), b"\x01\x02"])
+
+    def close(self):
+        self.closed = True
+
+
+class _AsyncLiveTransport(_LiveTransport):
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def __aiter__(self):
+        for frame in _LiveTransport.__iter__(self):
+            yield frame
+
+    async def close(self):
+        self.closed = True
+
+
+class TestSessionRecording:
+    def test_save_and_load_round_trip(self, tmp_path):
+        recording = _recording()
+        path = str(tmp_path / "session.jsonl.gz")
+        recording.save(path)
+
+        loaded = SessionRecording.load(path)
+        assert loaded.url == _URL
+        assert [(f.direction, f.data) for f in loaded.frames] == [(f.direction, f.data) for f in recording.frames]
+        assert loaded.duration == pytest.approx(0.09)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.jsonl"
+        path.write_text('{"hello": 1}\n')
+        with pytest.raises(ValueError):
+            SessionRecording.load(str(path))
+
+
+class TestSessionRecorder:
+    def test_records_both_directions_without_headers(self, tmp_path):
+        recorder = SessionRecorder(_LiveTransport, directory=str(tmp_path))
+        transport = recorder(_URL, {"Authorization": "Token secret"})
+        transport.send(json.dumps({"type": "Settings"}))
+        list(transport)
+        transport.close()
+
+        (recording,) = recorder.recordings
+        assert [frame.direction for frame in recording.frames] == ["out", "in", "in"]
+        saved = (tmp_path / "session-0001.jsonl.gz").read_bytes()
+        assert b"secret" not in saved
+        assert SessionRecording.load(str(tmp_path / "session-0001.jsonl.gz")).frames[2].data == b"\x01\x02"
+
+    async def test_async_recorder(self):
+        recorder = AsyncSessionRecorder(_AsyncLiveTransport)
+        transport = recorder(_URL, {})
+        await transport.send("hello")
+        received = [frame async for frame in transport]
+        await transport.close()
+        assert len(received) == 2
+        assert len(recorder.recordings[0].frames) == 3
+
+    @pytest.mark.parametrize("legacy_available, argument", [(True, "extra_headers"), (False, "additional_headers")])
+    async def test_default_async_connection_passes_headers(self, monkeypatch, legacy_available, argument):
+        import websockets
+        import websockets.legacy.client
+
+        calls = []
+
+        async def connect(url, **kwargs):
+            calls.append((url, kwargs))
+            return _AsyncLiveTransport(url, {})
+
+        if legacy_available:
+            monkeypatch.setattr(websockets.legacy.client, "connect", connect)
+        else:
+            monkeypatch.setitem(sys.modules, "websockets.legacy.client", None)
+            monkeypatch.setattr(websockets, "connect", connect)
+        transport = AsyncSessionRecorder()(_URL, {"Authorization": "token x"})
+        await transport.send("hello")
+        assert calls == [(_URL, {argument: {"Authorization": "token x"}})]
+
+
+class TestReplayTransport:
+    def test_server_frames_wait_for_client_frames(self):
+        transport = ReplayTransport(_recording(), speed=float("inf"))
+        socket = V1SocketClient(websocket=transport)
+        received = []
+        socket.on(EventType.MESSAGE, received.append)
+
+        assert json.loads(transport.recv())["type"] == "Welcome"
+        socket.send_media(b"settings stand-in")
+        socket.send_media(b"audio")
+        socket.start_listening()
+
+        assert [getattr(m, "type", m) for m in received] == ["SettingsApplied", b"\x10\x20"]
+        assert transport.sent == [b"settings stand-in", b"audio"]
+
+    def test_original_timing_scaled_by_speed(self):
+        recording = SessionRecording(_URL)
+        recording.add("in", "{}", 0.2)
+        transport = ReplayTransport(recording, speed=4.0)
+        started = time.monotonic()
+        transport.recv()
+        assert 0.04 <= time.monotonic() - started < 0.2
+
+    def test_close_unblocks_and_ends_iteration(self):
+        transport = ReplayTransport(_recording(), speed=float("inf"))
+        transport.recv()
+        transport.close()
+        assert list(transport) == []
+
+    async def test_async_replay(self):
+        transport = AsyncReplayTransport(_recording(), speed=float("inf"), wait_for_client=False)
+        frames = [frame async for frame in transport]
+        assert len(frames) == 3
+
+
+class TestReplayBenchmark:
+    def test_sync_run_reports_every_message(self):
+        report = ReplayBenchmark(_recording(), sessions=4, speed=10.0).run()
+        assert report.sessions == 4
+        assert report.messages == 12
+        assert report.errors == 0
+        assert report.callback_latency_ms["count"] == 12
+        assert report.sdk_cpu_us["p50"] is not None
+        assert report.as_dict()["messages_per_second"] > 0
+
+    async def test_async_run(self):
+        report = await ReplayBenchmark(_recording(), sessions=3, speed=float("inf")).arun()
+        assert report.messages == 9
+        assert report.errors == 0
+
+    def test_unknown_endpoint_requires_socket_class(self):
+        recording = SessionRecording("wss://example.com/v9/unknown")
+        with pytest.raises(ValueError):
+            ReplayBenchmark(recording).run()
@@ -0,0 +1,116 @@
+"""
+Tests for typed per-message-type subscriptions on the socket clients
+(``EventEmitterMixin`` and the pre-construction skip in ``start_listening``,
+both frozen in .fernignore).
+"""
+
+import json
+
+import pytest
+
+from deepgram.agent.v1 import socket_client as agent_socket_module
+from deepgram.agent.v1.socket_client import AsyncV1SocketClient, V1SocketClient
+from deepgram.agent.v1.types import (
+    AgentV1ConversationText,
+    ConversationHistoryMessage,
+    FunctionCallHistoryMessage,
+)
+from deepgram.core.events import EventType
+
+_FRAMES = [
+    json.dumps({"type": "Welcome", "request_id": "abc"}),
+    json.dumps({"type": "UserStartedSpeaking"}),
+    json.dumps({"type": "ConversationText", "role": "user", "content": "hi"}),
+    b"\x00\x01",
+    json.dumps({"type": "History", "role": "assistant", "content": "hello"}),
+    json.dumps({"type": "AgentAudioDone"}),
+]
+
+
+class _FakeWebSocket:
+    def __init__(self, frames):
+        self._frames = frames
+
+    def __iter__(self):
+        return iter(self._frames)
+
+
+class _FakeAsyncWebSocket:
+    def __init__(self, frames):
+        self._frames = frames
+
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+
+@pytest.fixture
+def constructed(monkeypatch):
+    """Record the wire type of every message the agent socket client constructs."""
+    types = []
+    original = agent_socket_module.construct_type
+
+    def _construct_type(*, type_, object_):
+        types.append(object_.get("type"))
+        return original(type_=type_, object_=object_)
+
+    monkeypatch.setattr(agent_socket_module, "construct_type", _construct_type)
+    return types
+
+
+class TestTypedSubscriptions:
+    def test_dispatch_by_model_name_and_bytes_skips_unsubscribed(self, constructed):
+        socket = V1SocketClient(websocket=_FakeWebSocket(_FRAMES))
+        received = []
+        socket.on(AgentV1ConversationText, lambda message: received.append(("model", message.content)))
+        socket.on("Welcome", lambda message: received.append(("name", message.request_id)))
+        socket.on(bytes, lambda data: received.append(("audio", data)))
+        socket.start_listening()
+
+        assert received == [("name", "abc"), ("model", "hi"), ("audio", b"\x00\x01")]
+        assert constructed == ["Welcome", "ConversationText"]
+
+    def test_message_callback_still_receives_everything(self, constructed):
+        socket = V1SocketClient(websocket=_FakeWebSocket(_FRAMES))
+        everything = []
+        typed = []
+        socket.on(EventType.MESSAGE, everything.append)
+        socket.on("AgentAudioDone", typed.append)
+        socket.start_listening()
+
+        assert len(everything) == len(_FRAMES)
+        assert len(constructed) == len(_FRAMES) - 1
+        assert [message.type for message in typed] == ["AgentAudioDone"]
+
+    def test_model_subscription_filters_shared_wire_type(self):
+        socket = V1SocketClient(websocket=_FakeWebSocket(_FRAMES))
+        function_calls = []
+        texts = []
+        socket.on(FunctionCallHistoryMessage, function_calls.append)
+        socket.on(ConversationHistoryMessage, texts.append)
+        socket.start_listening()
+
+        assert function_calls == []
+        assert [message.content for message in texts] == ["hello"]
+
+    def test_lifecycle_events_by_string_and_invalid_targets(self):
+        socket = V1SocketClient(websocket=_FakeWebSocket([]))
+        closed = []
+        socket.on("close", closed.append)
+        socket.start_listening()
+        assert closed == [None]
+        with pytest.raises(TypeError):
+            socket.on(dict, print)
+
+    async def test_async_dispatch_awaits_typed_callbacks(self, constructed):
+        socket = AsyncV1SocketClient(websocket=_FakeAsyncWebSocket(_FRAMES))
+        received = []
+
+        async def on_text(message):
+            received.append(message.content)
+
+        socket.on(AgentV1ConversationText, on_text)
+        await socket.start_listening()
+
+        assert received == ["hi"]
+        assert constructed == ["ConversationText"]
@@ -0,0 +1,148 @@
+"""Tests for the sliced usage/billing breakdown fetcher and the breakdown table."""
+
+import io
+import threading
+
+import httpx
+import pytest
+
+from deepgram import AsyncDeepgramClient, DeepgramClient
+from deepgram.helpers import (
+    BreakdownTable,
+    afetch_usage_breakdown,
+    fetch_billing_breakdown,
+    fetch_usage_breakdown,
+)
+
+
+class _Breakdowns:
+    def __init__(self, fail_project=None):
+        self.fail_project = fail_project
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        project = request.url.path.split("/")[3]
+        params = request.url.params
+        with self._lock:
+            self.calls.append((project, params["start"], params["end"]))
+        if project == self.fail_project:
+            return httpx.Response(403, json={"err_msg": "forbidden"})
+        grouping = {"start": params["start"], "end": params["end"]}
+        if request.url.path.endswith("/billing/breakdown"):
+            return httpx.Response(
+                200,
+                json={
+                    "start": params["start"],
+                    "end": params["end"],
+                    "resolution": {"units": "day", "amount": 1},
+                    "results": [{"dollars": 1.5, "grouping": {**grouping, "line_item": "streaming"}}],
+                },
+            )
+        results = [
+            {
+                "hours": 1.0,
+                "total_hours": 1.0,
+                "agent_hours": 0.0,
+                "tokens_in": 10,
+                "tokens_out": 5,
+                "tts_characters": 100,
+                "requests": 2,
+                "grouping": {**grouping, "models": [model], "endpoint": "listen"},
+            }
+            for model in ("nova-3", "aura-2")
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "start": params["start"],
+                "end": params["end"],
+                "resolution": {"units": "day", "amount": 1},
+                "results": results,
+            },
+        )
+
+
+def _client(handler):
+    return DeepgramClient(api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+class TestFetchBreakdown:
+    def test_slices_projects_and_dates(self):
+        breakdowns = _Breakdowns()
+        table = fetch_usage_breakdown(
+            _client(breakdowns), ["p1", "p2"], start="2026-09-01", end="2026-09-10", slice_days=4, concurrency=3
+        )
+        assert sorted(breakdowns.calls) == sorted(
+            (project, start, end)
+            for project in ("p1", "p2")
+            for start, end in [("2026-09-01", "2026-09-04"), ("2026-09-05", "2026-09-08"), ("2026-09-09", "2026-09-10")]
+        )
+        assert len(table) == 12
+        assert table.column("project_id")[:6] == ["p1"] * 6
+        assert table.column("start")[:2] == ["2026-09-01", "2026-09-01"]
+        assert table.totals()["requests"] == 24
+
+    def test_billing_breakdown(self):
+        table = fetch_billing_breakdown(
+            _client(_Breakdowns()), "p1", start="2026-09-01", end="2026-09-02", slice_days=1
+        )
+        assert table.value_columns == ("dollars",)
+        assert list(table.column("dollars")) == [1.5, 1.5]
+        assert table.column("line_item") == ["streaming", "streaming"]
+
+    def test_failed_slice_raises(self):
+        with pytest.raises(Exception):
+            fetch_usage_breakdown(
+                _client(_Breakdowns(fail_project="p2")), ["p1", "p2"], start="2026-09-01", end="2026-09-01"
+            )
+
+    def test_rejects_reversed_range(self):
+        with pytest.raises(ValueError):
+            fetch_usage_breakdown(_client(_Breakdowns()), ["p1"], start="2026-09-02", end="2026-09-01")
+
+    async def test_async_fetch(self):
+        breakdowns = _Breakdowns()
+        client = AsyncDeepgramClient(
+            api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(breakdowns))
+        )
+        table = await afetch_usage_breakdown(client, ["p1", "p2"], start="2026-09-01", end="2026-09-14", concurrency=2)
+        assert len(breakdowns.calls) == 4
+        assert table.group_by("project_id").to_dict() == {
+            "project_id": ["p1", "p2"],
+            "hours": [4.0, 4.0],
+            "total_hours": [4.0, 4.0],
+            "agent_hours": [0.0, 0.0],
+            "tokens_in": [40.0, 40.0],
+            "tokens_out": [20.0, 20.0],
+            "tts_characters": [400.0, 400.0],
+            "requests": [8.0, 8.0],
+        }
+
+
+class TestBreakdownTable:
+    def _table(self):
+        table = BreakdownTable(("project_id", "models"), ("hours", "requests"))
+        table.append({"project_id": "p1", "models": "nova-3"}, {"hours": 1, "requests": 2})
+        table.append({"project_id": "p1", "models": "aura-2"}, {"hours": 3})
+        table.append({"project_id": "p2", "models": "nova-3"}, {"hours": 5, "requests": 1})
+        return table
+
+    def test_group_by_sums_values(self):
+        grouped = self._table().group_by("models")
+        assert grouped.to_dict() == {"models": ["nova-3", "aura-2"], "hours": [6.0, 3.0], "requests": [3.0, 0.0]}
+        assert self._table().group_by().to_dict() == {"hours": [9.0], "requests": [3.0]}
+        with pytest.raises(KeyError):
+            self._table().group_by("hours")
+
+    def test_where_filters_rows(self):
+        table = self._table()
+        assert len(table.where(project_id="p1")) == 2
+        assert len(table.where(lambda row: row["hours"] > 2)) == 2
+
+    def test_csv_export(self):
+        out = io.StringIO()
+        self._table().to_csv(out)
+        lines = out.getvalue().splitlines()
+        assert lines[0] == "project_id,models,hours,requests"
+        assert lines[2] == "p1,aura-2,3.0,0.0"